@@ -9,6 +9,7 @@ import os
 import httpx
 
 from jarvis.analytics.widgets.base import WidgetBase, WidgetData
+from jarvis.kernel.tls import tls_context
 
 
 class DiscordWidget(WidgetBase):
@@ -28,7 +29,7 @@ class DiscordWidget(WidgetBase):
 
         try:
             async with httpx.AsyncClient(
-                timeout=10, headers={"Authorization": f"Bot {token}"}
+                timeout=10, headers={"Authorization": f"Bot {token}"}, verify=tls_context()
             ) as client:
                 r = await client.get(
                     f"https://discord.com/api/v10/guilds/{guild_id}", params={"with_counts": "true"}
@@ -10,6 +10,7 @@ import os
 import httpx
 
 from jarvis.analytics.widgets.base import WidgetBase, WidgetData
+from jarvis.kernel.tls import tls_context
 
 
 class GitHubWidget(WidgetBase):
@@ -32,7 +33,9 @@ class GitHubWidget(WidgetBase):
 
         try:
             headers = {"Authorization": f"Bearer {token}", "Accept": "application/vnd.github+json"}
-            async with httpx.AsyncClient(timeout=10, headers=headers) as client:
+            async with httpx.AsyncClient(
+                timeout=10, headers=headers, verify=tls_context()
+            ) as client:
                 repo_r, prs_r = await asyncio.gather(
                     client.get(f"https://api.github.com/repos/{repo}"),
                     client.get(
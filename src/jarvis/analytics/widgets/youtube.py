@@ -9,6 +9,7 @@ import os
 import httpx
 
 from jarvis.analytics.widgets.base import WidgetBase, WidgetData
+from jarvis.kernel.tls import tls_context
 
 
 class YouTubeWidget(WidgetBase):
@@ -29,7 +30,7 @@ class YouTubeWidget(WidgetBase):
         channel_id = os.getenv("YOUTUBE_CHANNEL_ID")
 
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
+            async with httpx.AsyncClient(timeout=10, verify=tls_context()) as client:
                 # Stats de la chaîne
                 r = await client.get(
                     "https://www.googleapis.com/youtube/v3/channels",
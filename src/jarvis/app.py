@@ -26,6 +26,7 @@ import uvicorn
 from dotenv import load_dotenv
 from fastapi import Depends, FastAPI  # ── [AUTH] ──
 from fastapi.middleware.cors import CORSMiddleware  # ── [AUTH] ──
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 from loguru import logger
@@ -40,6 +41,7 @@ from jarvis.interfaces.api.admin import _ui_router as admin_ui_router
 from jarvis.interfaces.api.admin import router as admin_router
 from jarvis.interfaces.api.briefing import router as briefing_router
 from jarvis.interfaces.api.budget import router as budget_router
+from jarvis.interfaces.api.chat import close_livekit_session
 from jarvis.interfaces.api.deezer import router as deezer_router
 from jarvis.interfaces.api.globe import router as globe_router
 from jarvis.interfaces.api.google_oauth import router as google_oauth_router
@@ -51,14 +53,19 @@ from jarvis.interfaces.api.macropad_2k import router as macropad_router
 from jarvis.interfaces.api.music import router as music_router
 from jarvis.interfaces.api.projects import router as projects_router
 from jarvis.interfaces.api.routines import router as routines_router
+from jarvis.interfaces.api.spotify import close_spotify_client
 from jarvis.interfaces.api.spotify import router as spotify_router
 from jarvis.interfaces.api.websocket import router as ws_router
+from jarvis.interfaces.api.widgets import close_notion_client
 from jarvis.interfaces.api.widgets import router as widgets_router
 from jarvis.interfaces.channels.setup import setup_channels
 from jarvis.interfaces.channels.telegram_bot import get_telegram_channel
 from jarvis.kernel.paths import UI_STATIC_DIR
+from jarvis.kernel.queued_writer import console_writer
 from jarvis.kernel.settings import settings
 from jarvis.providers.audio.clap_detector import ClapDetector
+from jarvis.providers.audio.tts import tts_engine
+from jarvis.providers.llm.base import LLMProvider
 from jarvis.providers.memory.search import FTSIndex
 from jarvis.providers.vision.daemon import run_vision_daemon
 
@@ -71,10 +78,23 @@ _LOG_FORMAT = (
 )
 
 logger.remove()
-logger.add(sys.stderr, level=settings.log_level, format=_LOG_FORMAT, colorize=True)
+# Terminal via QueuedWriter : un stderr lent (pipe Electron) ne bloque pas la boucle.
+logger.add(console_writer(), level=settings.log_level, format=_LOG_FORMAT, colorize=True)
 logger.add(_log_sink, level="INFO", format="{time:HH:mm:ss} | {level: <8} | {name} — {message}")
 
 
+async def _warmup_llms(*providers: LLMProvider) -> None:
+    """Pré-ouvre les connexions des providers distincts (chat, voix) au démarrage."""
+    unique = {id(p): p for p in providers}.values()
+    await asyncio.gather(*(p.warmup() for p in unique))
+
+
+async def _close_llms(*providers: LLMProvider) -> None:
+    """Ferme les clients HTTP keep-alive des providers distincts à l'arrêt."""
+    unique = {id(p): p for p in providers}.values()
+    await asyncio.gather(*(p.aclose() for p in unique))
+
+
 async def _fts_rebuild_if_empty(fts_index: FTSIndex, sessions_dir: Path) -> None:
     if await fts_index.is_empty() and sessions_dir.exists():
         await fts_index.rebuild(sessions_dir)
@@ -167,6 +187,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             ),
             name="vector-index-reindex",
         )
+    asyncio.create_task(_warmup_llms(container.llm, container.voice_llm), name="llm-warmup")
     asyncio.create_task(
         _fts_rebuild_if_empty(container.fts_index, memory_dir / "sessions"),
         name="fts-index-reindex",
@@ -242,6 +263,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                 # Bug pré-existant : telegram.stop() lève si updater jamais démarré.
                 # Cf. BACKLOG Phase C — résolution future hors-périmètre étape 2.
                 logger.warning("Telegram shutdown ignored: %s", e)
+    await close_livekit_session()
+    await close_spotify_client()
+    await close_notion_client()
+    await tts_engine.aclose()
+    await _close_llms(container.llm, container.voice_llm, container.background_llm)
     logger.info("Jarvis arrêté")
 
 
@@ -261,6 +287,9 @@ _cors_origins: list[str] = settings.cors_allow_origins or (
     if not settings.api_auth_enabled
     else []
 )
+# Opt-in : gzip des gros JSON pour un accès distant (SSE exclus par Starlette).
+if settings.api_gzip_min_bytes:
+    app.add_middleware(GZipMiddleware, minimum_size=settings.api_gzip_min_bytes)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=_cors_origins,
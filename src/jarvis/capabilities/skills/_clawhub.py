@@ -4,21 +4,25 @@
 
 from __future__ import annotations
 
-import io
+import tempfile
 import zipfile
 from pathlib import Path
 
 import httpx
 from loguru import logger
 
+from jarvis.kernel.tls import tls_context
+
 CLAWHUB_API = "https://clawhub.ai/api"
 _TIMEOUT = 30.0
+# Archive téléchargée gardée en RAM jusqu'à 1 Mo, déversée sur disque au-delà
+_ZIP_SPOOL_MAX = 1024 * 1024
 
 
 async def search_skills(query: str) -> list[dict]:
     """Recherche des skills publics sur ClawHub."""
     try:
-        async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
+        async with httpx.AsyncClient(timeout=_TIMEOUT, verify=tls_context()) as client:
             r = await client.get(f"{CLAWHUB_API}/skills/search", params={"q": query})
             r.raise_for_status()
             return r.json()
@@ -36,28 +40,35 @@ async def install_skill(slug: str, skills_dir: Path) -> tuple[bool, str]:
     if dest.exists():
         return False, f"Le skill '{slug}' existe déjà dans {dest}."
 
-    try:
-        async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
-            r = await client.get(f"{CLAWHUB_API}/skills/{slug}/download")
-            if r.status_code == 404:
-                return False, f"Skill '{slug}' introuvable sur ClawHub."
-            r.raise_for_status()
-            content = r.content
-    except httpx.HTTPError as e:
-        return False, f"Erreur réseau ClawHub : {e}"
+    with tempfile.SpooledTemporaryFile(max_size=_ZIP_SPOOL_MAX) as archive:
+        # Flux par blocs vers le spool : un gros skill ne transite pas en entier
+        # par la mémoire (ni en bytes de réponse, ni en copie BytesIO).
+        try:
+            async with (
+                httpx.AsyncClient(timeout=_TIMEOUT, verify=tls_context()) as client,
+                client.stream("GET", f"{CLAWHUB_API}/skills/{slug}/download") as r,
+            ):
+                if r.status_code == 404:
+                    return False, f"Skill '{slug}' introuvable sur ClawHub."
+                r.raise_for_status()
+                async for chunk in r.aiter_bytes():
+                    archive.write(chunk)
+        except httpx.HTTPError as e:
+            return False, f"Erreur réseau ClawHub : {e}"
+        archive.seek(0)
 
-    dest.mkdir(parents=True, exist_ok=True)
-    try:
-        with zipfile.ZipFile(io.BytesIO(content)) as z:
-            # Sécurité : ne pas extraire de fichiers avec des chemins relatifs dangereux
-            for member in z.namelist():
-                if ".." in member or member.startswith("/"):
-                    logger.warning("Membre ZIP suspect ignoré", member=member)
-                    continue
-                z.extract(member, dest)
-    except zipfile.BadZipFile:
-        dest.rmdir()
-        return False, "Le fichier téléchargé n'est pas un ZIP valide."
+        dest.mkdir(parents=True, exist_ok=True)
+        try:
+            with zipfile.ZipFile(archive) as z:
+                # Sécurité : ne pas extraire de fichiers avec des chemins relatifs dangereux
+                for member in z.namelist():
+                    if ".." in member or member.startswith("/"):
+                        logger.warning("Membre ZIP suspect ignoré", member=member)
+                        continue
+                    z.extract(member, dest)
+        except zipfile.BadZipFile:
+            dest.rmdir()
+            return False, "Le fichier téléchargé n'est pas un ZIP valide."
 
     if not (dest / "SKILL.md").exists():
         import shutil
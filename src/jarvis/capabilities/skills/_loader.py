@@ -5,7 +5,6 @@
 from __future__ import annotations
 
 import os
-import platform
 import re
 import shutil
 from pathlib import Path
@@ -13,8 +12,13 @@ from pathlib import Path
 import yaml
 from loguru import logger
 
+from jarvis.kernel.host import SYSTEM as _SYSTEM
+
 _FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n(.*)", re.DOTALL)
 
+# Champs exposés pour un skill actif (le frontmatter brut "meta" reste interne)
+_ACTIVE_KEYS = ("name", "description", "instructions", "dir")
+
 
 def _parse_skill_md(path: Path) -> dict | None:
     """Parse un SKILL.md et retourne {name, description, instructions} ou None."""
@@ -56,7 +60,7 @@ def _check_requirements(meta: dict) -> tuple[bool, str]:
 
     os_filter = openclaw.get("os", [])
     if os_filter:
-        current = "darwin" if platform.system() == "Darwin" else platform.system().lower()
+        current = _SYSTEM
         if current not in os_filter:
             return False, f"OS {current!r} non supporté (requis: {os_filter})"
 
@@ -99,14 +103,7 @@ def load_skills(skills_dir: Path) -> list[dict]:
             continue
 
         logger.debug("Skill chargé", name=skill["name"])
-        active.append(
-            {
-                "name": skill["name"],
-                "description": skill["description"],
-                "instructions": skill["instructions"],
-                "dir": skill["dir"],
-            }
-        )
+        active.append({k: skill[k] for k in _ACTIVE_KEYS})
 
     logger.info("Skills chargés", count=len(active))
     return active
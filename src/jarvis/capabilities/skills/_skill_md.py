@@ -0,0 +1,14 @@
+# Copyright (C) 2026 Barthélemy Houot
+# This file is part of Jarvis OS, licensed under the GNU AGPL-3.0-or-later.
+# See the LICENSE file or <https://www.gnu.org/licenses/agpl-3.0.html>.
+
+"""Motifs SKILL.md partagés par l'adaptateur standard et le synthétiseur."""
+
+from __future__ import annotations
+
+import re
+
+# Frontmatter SKILL.md et version "X.Y" : compilés une fois au chargement du module.
+FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---", re.DOTALL)
+BODY_RE = re.compile(r"^---\s*\n.*?\n---\s*\n(.*)", re.DOTALL)
+SHORT_VERSION_RE = re.compile(r"^\d+\.\d+$")
@@ -8,10 +8,13 @@ Vérifie si les applications requises par un skill sont installées.
 
 from __future__ import annotations
 
-import platform
+import asyncio
+import shutil
 import subprocess
 from pathlib import Path
 
+from jarvis.kernel.host import SYSTEM as _SYSTEM
+
 
 def check_app_installed(app: dict) -> dict:
     """
@@ -19,14 +22,13 @@ def check_app_installed(app: dict) -> dict:
     app : entrée de requires_apps depuis skill.yaml
     Retourne : {name, installed, required, url, message}
     """
-    system = platform.system().lower()
     name = app.get("name", "")
     required = app.get("required", False)
     url = app.get("url", "")
 
     installed = False
 
-    if system == "darwin":
+    if _SYSTEM == "darwin":
         mac_bundle = app.get("mac_bundle", "")
         if mac_bundle:
             for prefix in ["/Applications", str(Path.home() / "Applications")]:
@@ -45,27 +47,17 @@ def check_app_installed(app: dict) -> dict:
             except Exception:
                 pass
 
-    elif system == "windows":
+    # `where` / `which` ne font que parcourir le PATH : shutil.which fait la même
+    # recherche (PATHEXT compris sous Windows) sans lancer de process.
+    elif _SYSTEM == "windows":
         windows_exe = app.get("windows_exe", "")
         if windows_exe:
-            try:
-                result = subprocess.run(
-                    ["where", windows_exe], capture_output=True, text=True, timeout=3
-                )
-                installed = result.returncode == 0
-            except Exception:
-                pass
+            installed = shutil.which(windows_exe) is not None
 
-    elif system == "linux":
+    elif _SYSTEM == "linux":
         linux_cmd = app.get("linux_cmd", "")
         if linux_cmd:
-            try:
-                result = subprocess.run(
-                    ["which", linux_cmd], capture_output=True, text=True, timeout=3
-                )
-                installed = result.returncode == 0
-            except Exception:
-                pass
+            installed = shutil.which(linux_cmd) is not None
 
     message = ""
     if not installed and required:
@@ -82,12 +74,16 @@ def check_app_installed(app: dict) -> dict:
     }
 
 
-def check_all_apps(requires_apps: list[dict]) -> dict:
+async def check_all_apps(requires_apps: list[dict]) -> dict:
     """
-    Vérifie toutes les apps requises.
+    Vérifie toutes les apps requises, en parallèle.
+    Chaque sonde (mdfind/where/which, jusqu'à 3 s) tourne dans le pool de threads
+    par défaut, qui borne déjà la concurrence ; l'ordre des résultats est conservé.
     Retourne {all_required_installed, apps: [...]}
     """
-    results = [check_app_installed(app) for app in requires_apps]
+    results = await asyncio.gather(
+        *(asyncio.to_thread(check_app_installed, app) for app in requires_apps)
+    )
 
     all_required_installed = all(r["installed"] or not r["required"] for r in results)
 
@@ -6,15 +6,50 @@
 
 from __future__ import annotations
 
-import platform
+import re
 from abc import ABC
+from functools import cached_property
 from pathlib import Path
 
 import yaml
 
 from jarvis.capabilities.tools.base import Tool
+from jarvis.kernel.host import SYSTEM as _SYSTEM
 from jarvis.kernel.paths import SKILLS_INSTALLED_DIR
 
+# Clé `platforms:` des steps de preset pour cet OS (macOS s'écrit "mac" dans les YAML)
+_PLATFORM_KEY = "mac" if _SYSTEM == "darwin" else _SYSTEM
+
+# Steps bruts de chaque skill.yaml de preset, indexés par (mtime_ns, taille) :
+# get_steps() est appelé à chaque exécution et à chaque listing des presets,
+# le YAML n'est re-parsé que si le fichier a changé.
+_steps_cache: dict[Path, tuple[tuple[int, int], tuple[dict, ...]]] = {}
+
+
+def _load_steps(yaml_file: Path) -> tuple[dict, ...]:
+    """Retourne les `steps` d'un skill.yaml (mémoïsé par stat).
+
+    Validés une fois au chargement : un `steps` absent, nul ou mal formé donne ()
+    et les entrées qui ne sont pas des mappings sont ignorées.
+    """
+    try:
+        st = yaml_file.stat()
+    except OSError:
+        return ()
+    signature = (st.st_mtime_ns, st.st_size)
+
+    cached = _steps_cache.get(yaml_file)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    with yaml_file.open() as f:
+        skill_yaml = yaml.safe_load(f)
+
+    raw = skill_yaml.get("steps") if isinstance(skill_yaml, dict) else None
+    steps = tuple(s for s in raw if isinstance(s, dict)) if isinstance(raw, list) else ()
+    _steps_cache[yaml_file] = (signature, steps)
+    return steps
+
 
 class SkillBase(ABC):  # noqa: B024 — sous-classes surchargent par convention, pas via abstractmethod
     """
@@ -84,9 +119,7 @@ class PresetStep:
             return self.command
 
         if self.platforms:
-            system = platform.system().lower()
-            key = "mac" if system == "darwin" else system
-            cmd = self.platforms.get(key)
+            cmd = self.platforms.get(_PLATFORM_KEY)
             if cmd is None:
                 return None
             return cmd
@@ -102,7 +135,9 @@ class PresetSkill(SkillBase):
     Surcharger SYSTEM_PROMPT pour un comportement vocal personnalisé.
     """
 
-    @property  # type: ignore[override]
+    # Calculé une fois par instance : les metadata ne changent plus après le
+    # chargement, et le prompt est relu (is_active + get_system_prompt) à chaque tour.
+    @cached_property  # type: ignore[override]
     def SYSTEM_PROMPT(self) -> str:
         triggers = self.metadata.get("triggers", [])
         name = self.metadata.get("name", self.name)
@@ -134,22 +169,20 @@ class PresetSkill(SkillBase):
         base_dir = self.metadata.get("__dir")
 
         skill_dir = Path(base_dir) if base_dir else SKILLS_INSTALLED_DIR / self.name
-        yaml_file = skill_dir / "skill.yaml"
-
-        if not yaml_file.exists():
-            return []
-
-        with yaml_file.open() as f:
-            skill_yaml = yaml.safe_load(f)
-
-        if not skill_yaml:
-            return []
-
-        return [PresetStep(step) for step in skill_yaml.get("steps", [])]
+        return [PresetStep(step) for step in _load_steps(skill_dir / "skill.yaml")]
 
     def get_triggers(self) -> list[str]:
         return self.metadata.get("triggers", [])
 
+    # Alternance des triggers en minuscules, compilée une fois (metadata figées) :
+    # find_preset_by_trigger parcourt le texte une fois par preset, pas par trigger.
+    @cached_property
+    def trigger_pattern(self) -> re.Pattern[str] | None:
+        triggers = self.get_triggers()
+        if not triggers:
+            return None
+        return re.compile("|".join(re.escape(t.lower()) for t in triggers))
+
     def get_platforms(self) -> list[str]:
         return self.metadata.get("platforms", [])
 
@@ -7,13 +7,59 @@
 from __future__ import annotations
 
 import asyncio
-import platform
+import re
 
 from loguru import logger
 
 from jarvis.capabilities.skills.app_checker import check_all_apps
 from jarvis.capabilities.skills.base import PresetSkill, PresetStep
+from jarvis.kernel.host import SYSTEM as _SYSTEM
 from jarvis.kernel.notifications import broadcast_audio
+from jarvis.kernel.process_group import kill_group, new_group_kwargs
+
+# Caractères significatifs dans une chaîne littérale AppleScript ("…").
+_APPLESCRIPT_ESCAPE_RE = re.compile(r'(["\\])')
+
+
+def _escape_applescript(text: str) -> str:
+    """Échappe `"` et `\\` pour une chaîne AppleScript entre guillemets doubles."""
+    return _APPLESCRIPT_ESCAPE_RE.sub(r"\\\1", text)
+
+
+def _escape_powershell(text: str) -> str:
+    """Échappe une chaîne PowerShell entre apostrophes (`'` doublé)."""
+    return text.replace("'", "''")
+
+
+_CLI_TIMEOUT_S = 30.0
+_NOTIFY_TIMEOUT_S = 10.0
+
+# Résultats de step sans donnée propre à l'appel, messages formatés une fois. Les
+# handlers en rendent une copie : l'appelant peut modifier son dict sans toucher au modèle.
+_CLI_TIMEOUT_RESULT = {"status": "failed", "message": f"Timeout après {_CLI_TIMEOUT_S:g}s"}
+_NOTIFY_TIMEOUT_RESULT = {"status": "failed", "message": f"Timeout après {_NOTIFY_TIMEOUT_S:g}s"}
+_NO_TOOLS_RESULT = {"status": "skipped", "message": "ToolRegistry non disponible"}
+_NO_TTS_RESULT = {"status": "skipped", "message": "TTS non disponible ou texte vide"}
+_NO_LLM_RESULT = {"status": "skipped", "message": "LLM non disponible ou prompt vide"}
+_NO_NOTIFY_RESULT = {"status": "skipped", "message": "Notifications non supportées sur Linux"}
+
+
+async def _communicate(
+    proc: asyncio.subprocess.Process,
+    timeout: float,  # noqa: ASYNC109
+) -> tuple[bytes, bytes] | None:
+    """(stdout, stderr) du process, ou None s'il a dépassé `timeout` (il est alors tué).
+
+    Le timeout devient un résultat que les handlers testent, au lieu d'un
+    TimeoutError sans message remonté jusqu'à _exec_step. Le process doit avoir
+    été lancé avec new_group_kwargs() : tout son groupe (pipeline incluse) est tué.
+    """
+    try:
+        return await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except TimeoutError:
+        kill_group(proc)
+        await proc.wait()
+        return None
 
 
 class PresetExecutor:
@@ -28,6 +74,16 @@ class PresetExecutor:
         self._tools = tool_registry
         self._tts = tts_engine
         self._llm = llm_client
+        # Table de dispatch step.type → handler, construite une fois par exécuteur
+        # (et non à chaque step).
+        self._handlers = {
+            "cli": self._exec_cli,
+            "spotify": self._exec_spotify,
+            "tts": self._exec_tts,
+            "ai": self._exec_ai,
+            "wait": self._exec_wait,
+            "notify": self._exec_notify,
+        }
 
     async def execute(self, preset: PresetSkill, broadcast_fn: object = None) -> dict:
         """
@@ -37,7 +93,7 @@ class PresetExecutor:
 
         requires_apps = preset.metadata.get("requires_apps", [])
         if requires_apps:
-            apps_status = check_all_apps(requires_apps)
+            apps_status = await check_all_apps(requires_apps)
             missing_required = [
                 a["name"] for a in apps_status["apps"] if not a["installed"] and a["required"]
             ]
@@ -124,18 +180,16 @@ class PresetExecutor:
         return results
 
     async def _execute_step(self, step: PresetStep, index: int, total: int) -> dict:
-        logger.debug(f"Step {index}/{total} [{step.type}] : {step.name}")
-
-        handlers = {
-            "cli": self._exec_cli,
-            "spotify": self._exec_spotify,
-            "tts": self._exec_tts,
-            "ai": self._exec_ai,
-            "wait": self._exec_wait,
-            "notify": self._exec_notify,
-        }
+        # Gabarit loguru : formaté seulement si le niveau DEBUG est actif.
+        logger.debug(
+            "Step {index}/{total} [{type}] : {name}",
+            index=index,
+            total=total,
+            type=step.type,
+            name=step.name,
+        )
 
-        handler = handlers.get(step.type)
+        handler = self._handlers.get(step.type)
         if not handler:
             return {"status": "skipped", "message": f"Type de step inconnu : {step.type}"}
 
@@ -149,25 +203,28 @@ class PresetExecutor:
         cmd = step.get_command()
 
         if cmd is None:
-            system = platform.system().lower()
-            return {"status": "skipped", "message": f"Non supporté sur {system}"}
+            return {"status": "skipped", "message": f"Non supporté sur {_SYSTEM}"}
 
-        logger.debug(f"CLI : {cmd[:80]}")
+        logger.debug("CLI : {cmd}", cmd=cmd[:80])
 
         proc = await asyncio.create_subprocess_shell(
             cmd,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
+            **new_group_kwargs(),
         )
-        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=30)
+        result = await _communicate(proc, timeout=_CLI_TIMEOUT_S)
+        if result is None:
+            return dict(_CLI_TIMEOUT_RESULT)
 
+        stdout, stderr = result
         if proc.returncode == 0:
-            return {"status": "done", "message": stdout.decode()[:200]}
-        return {"status": "failed", "message": stderr.decode()[:200]}
+            return {"status": "done", "message": stdout.decode(errors="replace")[:200]}
+        return {"status": "failed", "message": stderr.decode(errors="replace")[:200]}
 
     async def _exec_spotify(self, step: PresetStep) -> dict:
         if not self._tools:
-            return {"status": "skipped", "message": "ToolRegistry non disponible"}
+            return dict(_NO_TOOLS_RESULT)
 
         result = await self._tools.call(
             "spotify_control",
@@ -180,7 +237,7 @@ class PresetExecutor:
 
     async def _exec_tts(self, step: PresetStep) -> dict:
         if not self._tts or not step.text:
-            return {"status": "skipped", "message": "TTS non disponible ou texte vide"}
+            return dict(_NO_TTS_RESULT)
 
         audio_bytes = await self._tts.synthesize(step.text)
 
@@ -190,7 +247,7 @@ class PresetExecutor:
 
     async def _exec_ai(self, step: PresetStep) -> dict:
         if not self._llm or not step.prompt:
-            return {"status": "skipped", "message": "LLM non disponible ou prompt vide"}
+            return dict(_NO_LLM_RESULT)
 
         response = await self._llm.complete(
             messages=[{"role": "user", "content": step.prompt}],
@@ -215,24 +272,39 @@ class PresetExecutor:
     async def _exec_notify(self, step: PresetStep) -> dict:
         cmd = step.get_command()
 
-        if not cmd:
-            system = platform.system().lower()
-            if system == "darwin":
-                title = step.title.replace('"', '\\"')
-                body = step.body.replace('"', '\\"')
-                cmd = f'osascript -e \'display notification "{body}" with title "{title}"' + "'"
-            elif system == "windows":
-                cmd = (
-                    f'powershell -c "Add-Type -AssemblyName System.Windows.Forms; '
-                    f"[System.Windows.Forms.MessageBox]::Show('{step.body}','{step.title}')\""
-                )
+        if cmd:
+            # Commande fournie par le preset : ligne shell, exécutée telle quelle.
+            proc = await asyncio.create_subprocess_shell(
+                cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                **new_group_kwargs(),
+            )
+        else:
+            # Repli natif : argv direct, sans passer par /bin/sh — le titre et le
+            # corps n'ont besoin que de l'échappement de leur langage cible.
+            if _SYSTEM == "darwin":
+                title = _escape_applescript(step.title)
+                body = _escape_applescript(step.body)
+                argv = ["osascript", "-e", f'display notification "{body}" with title "{title}"']
+            elif _SYSTEM == "windows":
+                title = _escape_powershell(step.title)
+                body = _escape_powershell(step.body)
+                argv = [
+                    "powershell",
+                    "-c",
+                    "Add-Type -AssemblyName System.Windows.Forms; "
+                    f"[System.Windows.Forms.MessageBox]::Show('{body}','{title}')",
+                ]
             else:
-                return {"status": "skipped", "message": "Notifications non supportées sur Linux"}
+                return dict(_NO_NOTIFY_RESULT)
 
-        proc = await asyncio.create_subprocess_shell(
-            cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        await asyncio.wait_for(proc.communicate(), timeout=10)
+            proc = await asyncio.create_subprocess_exec(
+                *argv,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                **new_group_kwargs(),
+            )
+        if await _communicate(proc, timeout=_NOTIFY_TIMEOUT_S) is None:
+            return dict(_NOTIFY_TIMEOUT_RESULT)
         return {"status": "done", "message": f"Notification : {step.title}"}
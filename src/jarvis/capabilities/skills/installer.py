@@ -6,6 +6,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import shutil
 from pathlib import Path
@@ -15,6 +16,7 @@ from loguru import logger
 
 from jarvis.capabilities.skills.registry import SKILLS_INSTALLED_DIR, skill_registry
 from jarvis.kernel.paths import UI_STATIC_DIR
+from jarvis.kernel.tls import tls_context
 
 ENV_FILE = Path(".env")
 
@@ -24,6 +26,11 @@ SKILLS_INDEX_URL = f"{SKILLS_REPO_RAW}/index.json"
 LOCAL_CATALOG = Path(__file__).parent / "catalog.json"
 
 
+async def _get_all(client: httpx.AsyncClient, urls: list[str]) -> list[httpx.Response]:
+    """GET concurrents sur un même client ; réponses dans l'ordre des URLs."""
+    return list(await asyncio.gather(*(client.get(url) for url in urls)))
+
+
 class SkillInstaller:
     def _inject_env_vars(self, requires_env: list[str], skill_name: str) -> None:
         """Ajoute les variables requires_env manquantes dans .env avec valeur vide."""
@@ -42,7 +49,7 @@ class SkillInstaller:
         """
         offline = False
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
+            async with httpx.AsyncClient(timeout=10, verify=tls_context()) as client:
                 r = await client.get(SKILLS_INDEX_URL)
                 if r.status_code == 200:
                     data = r.json()
@@ -121,15 +128,16 @@ class SkillInstaller:
         self, skill_name: str, skill_meta: dict, skill_dir: Path, path: str
     ) -> None:
         """Installe un skill ou preset (skill.py + skill.yaml depuis GitHub)."""
-        async with httpx.AsyncClient(timeout=15) as client:
-            r = await client.get(f"{SKILLS_REPO_RAW}/{path}/skill.py")
-            if r.status_code != 200:
-                raise Exception(f"skill.py introuvable (HTTP {r.status_code})")
-            (skill_dir / "skill.py").write_text(r.text)
-
-            r = await client.get(f"{SKILLS_REPO_RAW}/{path}/skill.yaml")
-            if r.status_code == 200:
-                (skill_dir / "skill.yaml").write_text(r.text)
+        async with httpx.AsyncClient(timeout=15, verify=tls_context()) as client:
+            r_py, r_yaml = await _get_all(
+                client,
+                [f"{SKILLS_REPO_RAW}/{path}/skill.py", f"{SKILLS_REPO_RAW}/{path}/skill.yaml"],
+            )
+            if r_py.status_code != 200:
+                raise Exception(f"skill.py introuvable (HTTP {r_py.status_code})")
+            (skill_dir / "skill.py").write_text(r_py.text)
+            if r_yaml.status_code == 200:
+                (skill_dir / "skill.yaml").write_text(r_yaml.text)
 
         yaml_path = skill_dir / "skill.yaml"
         if yaml_path.exists():
@@ -145,9 +153,11 @@ class SkillInstaller:
             if static_files:
                 static_dst = UI_STATIC_DIR / "skills" / skill_name
                 static_dst.mkdir(parents=True, exist_ok=True)
-                async with httpx.AsyncClient(timeout=15) as client:
-                    for fname in static_files:
-                        r = await client.get(f"{SKILLS_REPO_RAW}/{path}/static/{fname}")
+                async with httpx.AsyncClient(timeout=15, verify=tls_context()) as client:
+                    responses = await _get_all(
+                        client, [f"{SKILLS_REPO_RAW}/{path}/static/{f}" for f in static_files]
+                    )
+                    for fname, r in zip(static_files, responses, strict=True):
                         if r.status_code == 200:
                             (static_dst / fname).write_bytes(r.content)
                         else:
@@ -172,10 +182,15 @@ class SkillInstaller:
         catalog_files = skill_meta.get("static_files") or []
         targets = catalog_files if catalog_files else ["view.js", "view.css"]
 
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with httpx.AsyncClient(timeout=15, verify=tls_context()) as client:
+            # Assets + skill.py/skill.yaml distants : requêtes indépendantes, lancées ensemble
+            *responses, r_py, r_yaml = await _get_all(
+                client,
+                [f"{SKILLS_REPO_RAW}/{path}/{fname}" for fname in targets]
+                + [f"{SKILLS_REPO_RAW}/{path}/skill.py", f"{SKILLS_REPO_RAW}/{path}/skill.yaml"],
+            )
             downloaded: list[str] = []
-            for fname in targets:
-                r = await client.get(f"{SKILLS_REPO_RAW}/{path}/{fname}")
+            for fname, r in zip(targets, responses, strict=True):
                 if r.status_code == 200:
                     (static_dst / fname).write_bytes(r.content)
                     downloaded.append(fname)
@@ -187,15 +202,13 @@ class SkillInstaller:
                 raise Exception("Aucun asset de vue téléchargé")
 
             # skill.py custom prioritaire (ex. globe-view)
-            r = await client.get(f"{SKILLS_REPO_RAW}/{path}/skill.py")
-            has_remote_skill_py = r.status_code == 200
+            has_remote_skill_py = r_py.status_code == 200
             if has_remote_skill_py:
-                (skill_dir / "skill.py").write_text(r.text)
+                (skill_dir / "skill.py").write_text(r_py.text)
 
-            r = await client.get(f"{SKILLS_REPO_RAW}/{path}/skill.yaml")
-            has_remote_yaml = r.status_code == 200
+            has_remote_yaml = r_yaml.status_code == 200
             if has_remote_yaml:
-                (skill_dir / "skill.yaml").write_text(r.text)
+                (skill_dir / "skill.yaml").write_text(r_yaml.text)
 
         if not has_remote_skill_py:
             class_name = "".join(w.capitalize() for w in skill_name.replace("-", "_").split("_"))
@@ -33,10 +33,10 @@ from __future__ import annotations
 
 import asyncio
 import json
+import secrets
 import shutil
 import sys
 import textwrap
-import uuid
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -87,8 +87,8 @@ class LabScanResult:
 
 # ── Test générique sandbox ────────────────────────────────────────────────────
 
-# Script Python générique exécuté dans la sandbox. Importé puis joué avec
-# `python /workspace/_skill_sandbox_test.py`. Exit 0 = test vert.
+# Script Python générique exécuté dans la sandbox, passé sur stdin à `python -`
+# (aucun fichier écrit dans la candidate). Exit 0 = test vert.
 _SANDBOX_TEST_SCRIPT = textwrap.dedent(
     '''
     """Test générique d'une skill candidate. Exit 0 si tout passe, ≠ 0 sinon."""
@@ -445,7 +445,7 @@ class SkillLab:
             return await self._run_direct_test(cand_dir)
 
         # Container ad-hoc : workspace tmpfs + candidate montée RO + source jarvis montée RO
-        container_name = f"jarvis-skill-lab-{uuid.uuid4().hex[:8]}"
+        container_name = f"jarvis-skill-lab-{secrets.token_hex(4)}"
         cand_abs = cand_dir.resolve()
         jarvis_root = PROJECT_ROOT / "src"
         venv_site_packages = (
@@ -456,66 +456,65 @@ class SkillLab:
             / "site-packages"
         )
 
-        # Crée le script de test dans un tmpdir local et le mount aussi
-        script_path = cand_abs / "_skill_sandbox_test.py"
-        script_path.write_text(_SANDBOX_TEST_SCRIPT, encoding="utf-8")
-
+        # Le script part sur stdin (`-i` + `python -`) : rien à écrire dans la
+        # candidate avant le montage RO, rien à nettoyer après.
+        script = _SANDBOX_TEST_SCRIPT.encode("utf-8")
+
+        cmd = [
+            "docker",
+            "run",
+            "-i",
+            "--rm",
+            "--name",
+            container_name,
+            f"--memory={settings.docker_memory_limit}",
+            f"--cpus={settings.docker_cpu_limit}",
+            "--network",
+            "none",  # pas de réseau pour le test sandbox
+            "--read-only",
+            "--tmpfs",
+            "/tmp:rw,size=50m",
+            "--security-opt",
+            "no-new-privileges",
+            "--cap-drop",
+            "ALL",
+            "-v",
+            f"{cand_abs}:/workspace/candidate:ro",
+            "-v",
+            f"{jarvis_root}:/jarvis_src:ro",
+            "-v",
+            f"{venv_site_packages}:/jarvis_deps:ro",
+            "-w",
+            "/workspace",
+            settings.docker_base_image,
+            "python",
+            "-",
+        ]
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
         try:
-            cmd = [
+            stdout, stderr = await asyncio.wait_for(
+                proc.communicate(script), timeout=_SANDBOX_TIMEOUT
+            )
+        except TimeoutError:
+            # Tue le container
+            killer = await asyncio.create_subprocess_exec(
                 "docker",
-                "run",
-                "--rm",
-                "--name",
+                "kill",
                 container_name,
-                f"--memory={settings.docker_memory_limit}",
-                f"--cpus={settings.docker_cpu_limit}",
-                "--network",
-                "none",  # pas de réseau pour le test sandbox
-                "--read-only",
-                "--tmpfs",
-                "/tmp:rw,size=50m",
-                "--security-opt",
-                "no-new-privileges",
-                "--cap-drop",
-                "ALL",
-                "-v",
-                f"{cand_abs}:/workspace/candidate:ro",
-                "-v",
-                f"{jarvis_root}:/jarvis_src:ro",
-                "-v",
-                f"{venv_site_packages}:/jarvis_deps:ro",
-                "-w",
-                "/workspace",
-                settings.docker_base_image,
-                "python",
-                "/workspace/candidate/_skill_sandbox_test.py",
-            ]
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            await killer.communicate()
+            return SandboxTestResult(
+                passed=False,
+                layer_failed="timeout",
+                notes=f"timeout après {_SANDBOX_TIMEOUT}s",
             )
-            try:
-                stdout, stderr = await asyncio.wait_for(
-                    proc.communicate(), timeout=_SANDBOX_TIMEOUT
-                )
-            except TimeoutError:
-                # Tue le container
-                killer = await asyncio.create_subprocess_exec(
-                    "docker",
-                    "kill",
-                    container_name,
-                    stdout=asyncio.subprocess.DEVNULL,
-                    stderr=asyncio.subprocess.DEVNULL,
-                )
-                await killer.communicate()
-                return SandboxTestResult(
-                    passed=False,
-                    layer_failed="timeout",
-                    notes=f"timeout après {_SANDBOX_TIMEOUT}s",
-                )
-        finally:
-            script_path.unlink(missing_ok=True)
 
         return self._parse_sandbox_output(proc.returncode, stdout, stderr)
 
@@ -535,7 +534,6 @@ class SkillLab:
             / f"python{sys.version_info.major}.{sys.version_info.minor}"
             / "site-packages"
         )
-        script_path = cand_abs / "_skill_sandbox_test.py"
         # Remplace /workspace/candidate par cand_abs et /jarvis_src par jarvis_root
         # On crée un script adapté au mode direct.
         direct_script = (
@@ -545,29 +543,26 @@ class SkillLab:
             .replace('"/jarvis_src"', f'r"{jarvis_root}"')
             .replace('"/jarvis_deps"', f'r"{venv_site_packages}"')
         )
-        script_path.write_text(direct_script, encoding="utf-8")
 
+        proc = await asyncio.create_subprocess_exec(
+            "python",
+            "-",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
         try:
-            proc = await asyncio.create_subprocess_exec(
-                "python",
-                str(script_path),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+            stdout, stderr = await asyncio.wait_for(
+                proc.communicate(direct_script.encode("utf-8")), timeout=_SANDBOX_TIMEOUT
+            )
+        except TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return SandboxTestResult(
+                passed=False,
+                layer_failed="timeout",
+                notes=f"timeout après {_SANDBOX_TIMEOUT}s (direct)",
             )
-            try:
-                stdout, stderr = await asyncio.wait_for(
-                    proc.communicate(), timeout=_SANDBOX_TIMEOUT
-                )
-            except TimeoutError:
-                proc.kill()
-                await proc.wait()
-                return SandboxTestResult(
-                    passed=False,
-                    layer_failed="timeout",
-                    notes=f"timeout après {_SANDBOX_TIMEOUT}s (direct)",
-                )
-        finally:
-            script_path.unlink(missing_ok=True)
 
         return self._parse_sandbox_output(proc.returncode, stdout, stderr)
 
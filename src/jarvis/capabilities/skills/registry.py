@@ -9,12 +9,56 @@ from __future__ import annotations
 import importlib.util
 from pathlib import Path
 
+import yaml
 from loguru import logger
 
 from jarvis.capabilities.skills.base import PresetSkill, SkillBase
 from jarvis.capabilities.skills.dev_extensions import iter_dev_skills_and_presets
 from jarvis.kernel.paths import SKILLS_INSTALLED_DIR  # noqa: F401, E402
 
+# Classe SkillBase résolue pour chaque skill.py, indexée par (mtime_ns, taille) :
+# reload() tourne au boot puis à chaque install/uninstall, seuls les skill.py
+# modifiés sont ré-exécutés. Les échecs sont mémorisés aussi (None) pour ne pas
+# relancer un import cassé tant que le fichier n'a pas changé.
+_class_cache: dict[Path, tuple[tuple[int, int], type[SkillBase] | None]] = {}
+
+
+def _resolve_skill_class(skill_dir: Path, skill_py: Path) -> type[SkillBase] | None:
+    """Importe skill.py et retourne sa sous-classe de SkillBase (mémoïsé par stat)."""
+    try:
+        st = skill_py.stat()
+    except OSError:
+        return None
+    signature = (st.st_mtime_ns, st.st_size)
+    key = skill_py.resolve()
+
+    cached = _class_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    skill_cls: type[SkillBase] | None = None
+    try:
+        spec = importlib.util.spec_from_file_location(f"skill_{skill_dir.name}", skill_py)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+        for attr_name in dir(module):
+            attr = getattr(module, attr_name)
+            if (
+                isinstance(attr, type)
+                and issubclass(attr, SkillBase)
+                and attr is not SkillBase
+                and attr is not PresetSkill
+            ):
+                skill_cls = attr
+                break
+
+    except Exception as e:
+        logger.error(f"Erreur chargement skill {skill_dir.name}: {e}")
+
+    _class_cache[key] = (signature, skill_cls)
+    return skill_cls
+
 
 class SkillRegistry:
     """
@@ -57,8 +101,6 @@ class SkillRegistry:
 
         metadata = {}
         if skill_yaml.exists():
-            import yaml
-
             with skill_yaml.open() as f:
                 metadata = yaml.safe_load(f) or {}
 
@@ -70,32 +112,17 @@ class SkillRegistry:
         # son skill.yaml sans hardcoder skills/installed/. Toujours injecté.
         metadata["__dir"] = str(skill_dir.resolve())
 
-        try:
-            spec = importlib.util.spec_from_file_location(f"skill_{skill_dir.name}", skill_py)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if (
-                    isinstance(attr, type)
-                    and issubclass(attr, SkillBase)
-                    and attr is not SkillBase
-                    and attr is not PresetSkill
-                ):
-                    skill = attr(metadata=metadata)
-                    self._skills[skill.name] = skill
-                    skill_type = metadata.get("type", "conversational")
-                    if skill_type == "preset" or isinstance(skill, PresetSkill):
-                        logger.debug(f"Preset chargé : {skill.name} v{skill.version}")
-                    else:
-                        logger.debug(
-                            f"Skill conversationnel chargé : {skill.name} v{skill.version}"
-                        )
-                    break
-
-        except Exception as e:
-            logger.error(f"Erreur chargement skill {skill_dir.name}: {e}")
+        skill_cls = _resolve_skill_class(skill_dir, skill_py)
+        if skill_cls is None:
+            return
+
+        skill = skill_cls(metadata=metadata)
+        self._skills[skill.name] = skill
+        skill_type = metadata.get("type", "conversational")
+        if skill_type == "preset" or isinstance(skill, PresetSkill):
+            logger.debug(f"Preset chargé : {skill.name} v{skill.version}")
+        else:
+            logger.debug(f"Skill conversationnel chargé : {skill.name} v{skill.version}")
 
     def get_combined_system_prompt(self) -> str:
         """Retourne tous les SYSTEM_PROMPT des skills actifs concaténés."""
@@ -159,10 +186,12 @@ class SkillRegistry:
     def find_preset_by_trigger(self, text: str) -> SkillBase | None:
         """Trouve un preset dont un trigger correspond au texte (partiel, insensible à la casse)."""
         text_lower = text.lower()
-        for skill in self.get_presets().values():
-            for trigger in skill.get_triggers():
-                if trigger.lower() in text_lower:
-                    return skill
+        for skill in self._skills.values():
+            if not self._is_preset(skill):
+                continue
+            pattern = getattr(skill, "trigger_pattern", None)
+            if pattern is not None and pattern.search(text_lower):
+                return skill
         return None
 
 
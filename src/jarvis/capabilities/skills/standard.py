@@ -18,6 +18,7 @@ from pathlib import Path
 import yaml
 from loguru import logger
 
+from jarvis.capabilities.skills._skill_md import BODY_RE, FRONTMATTER_RE, SHORT_VERSION_RE
 from jarvis.kernel.paths import SKILLS_INSTALLED_DIR  # noqa: F401, E402
 
 # ── YAML Dumper avec block scalars ────────────────────────────────────────────
@@ -35,6 +36,8 @@ def _str_representer(dumper: yaml.SafeDumper, data: str) -> yaml.ScalarNode:
 
 _BlockDumper.add_representer(str, _str_representer)
 
+_SKILL_NAME_RE = re.compile(r"^[a-z0-9](?:[a-z0-9-]*[a-z0-9])?$")
+
 
 # ── Adaptateur ────────────────────────────────────────────────────────────────
 
@@ -179,7 +182,7 @@ class AgentSkillsAdapter:
 
     @staticmethod
     def _parse_frontmatter(skill_md: str) -> dict:
-        m = re.match(r"^---\s*\n(.*?)\n---", skill_md, re.DOTALL)
+        m = FRONTMATTER_RE.match(skill_md)
         if not m:
             return {}
         try:
@@ -190,7 +193,7 @@ class AgentSkillsAdapter:
 
     @staticmethod
     def _extract_body(skill_md: str) -> str:
-        m = re.match(r"^---\s*\n.*?\n---\s*\n(.*)", skill_md, re.DOTALL)
+        m = BODY_RE.match(skill_md)
         return m.group(1).strip() if m else skill_md.strip()
 
     @staticmethod
@@ -201,7 +204,7 @@ class AgentSkillsAdapter:
         if isinstance(tags, str):
             tags = [t.strip() for t in tags.split(",")]
         version = str(metadata.get("version", "1.0.0"))
-        if re.match(r"^\d+\.\d+$", version):
+        if SHORT_VERSION_RE.match(version):
             version += ".0"
         return {
             "name": fm.get("name", "unknown-skill"),
@@ -273,7 +276,7 @@ def _is_valid_name(name: str) -> bool:
     """
     if not name or len(name) > 64:
         return False
-    if not re.match(r"^[a-z0-9](?:[a-z0-9-]*[a-z0-9])?$", name):
+    if not _SKILL_NAME_RE.match(name):
         return False
     # Interdit les tirets consécutifs
     return "--" not in name
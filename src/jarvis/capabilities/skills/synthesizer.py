@@ -13,6 +13,7 @@ from pathlib import Path
 import yaml
 from loguru import logger
 
+from jarvis.capabilities.skills._skill_md import BODY_RE, FRONTMATTER_RE, SHORT_VERSION_RE
 from jarvis.kernel.contracts import LLMProvider
 from jarvis.kernel.paths import SKILLS_CANDIDATES_DIR, SKILLS_INSTALLED_DIR  # noqa: F401, E402
 
@@ -93,6 +94,8 @@ def _str_representer(dumper: yaml.SafeDumper, data: str) -> yaml.ScalarNode:
 
 _BlockDumper.add_representer(str, _str_representer)
 
+_NAME_FIELD_RE = re.compile(r"^name:\s*([a-z0-9](?:[a-z0-9-]*[a-z0-9])?)\s*$", re.MULTILINE)
+
 
 # ── Synthétiseur ──────────────────────────────────────────────────────────────
 
@@ -244,17 +247,13 @@ class SkillSynthesizer:
     @staticmethod
     def _extract_name(skill_md: str) -> str | None:
         """Extrait le champ `name` du frontmatter YAML."""
-        m = re.search(
-            r"^name:\s*([a-z0-9](?:[a-z0-9-]*[a-z0-9])?)\s*$",
-            skill_md,
-            re.MULTILINE,
-        )
+        m = _NAME_FIELD_RE.search(skill_md)
         return m.group(1) if m else None
 
     @staticmethod
     def _parse_frontmatter(skill_md: str) -> dict:
         """Extrait et parse le frontmatter YAML entre les délimiteurs ---."""
-        m = re.match(r"^---\s*\n(.*?)\n---", skill_md, re.DOTALL)
+        m = FRONTMATTER_RE.match(skill_md)
         if not m:
             return {}
         try:
@@ -266,7 +265,7 @@ class SkillSynthesizer:
     @staticmethod
     def _extract_body(skill_md: str) -> str:
         """Extrait le corps Markdown situé après le frontmatter."""
-        m = re.match(r"^---\s*\n.*?\n---\s*\n(.*)", skill_md, re.DOTALL)
+        m = BODY_RE.match(skill_md)
         return m.group(1).strip() if m else skill_md.strip()
 
     # ── Génération fichiers Jarvis ────────────────────────────────────────────
@@ -280,7 +279,7 @@ class SkillSynthesizer:
             tags = [t.strip() for t in tags.split(",")]
         version = str(metadata.get("version", "1.0.0"))
         # Normalise la version au format semver
-        if re.match(r"^\d+\.\d+$", version):
+        if SHORT_VERSION_RE.match(version):
             version = version + ".0"
         return {
             "name": fm.get("name", "unknown-skill"),
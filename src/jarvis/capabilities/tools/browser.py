@@ -11,10 +11,12 @@ import httpx
 from loguru import logger
 
 from jarvis.capabilities.tools.base import Tool, ToolResult
+from jarvis.kernel.tls import tls_context
 
 _TIMEOUT = 20.0
 _MAX_TEXT_LEN = 8000  # chars max retournés au LLM
 _MAX_LINKS = 25
+_SPACES_RE = re.compile(r"\s{2,}")
 
 # Hôtes internes/locaux bloqués — jamais d'accès au réseau interne
 _BLOCKED_HOST_RE = re.compile(
@@ -127,6 +129,7 @@ class BrowserTool(Tool):
                 timeout=_TIMEOUT,
                 follow_redirects=True,
                 headers=_HEADERS,
+                verify=tls_context(),
             ) as client:
                 r = await client.get(url)
                 r.raise_for_status()
@@ -164,7 +167,7 @@ class BrowserTool(Tool):
             tag.decompose()
 
         text = soup.get_text(separator=" ", strip=True)
-        text = re.sub(r"\s{2,}", " ", text).strip()
+        text = _SPACES_RE.sub(" ", text).strip()
         text = text[:_MAX_TEXT_LEN]
         if len(text) == _MAX_TEXT_LEN:
             text += "\n[contenu tronqué à 8000 caractères]"
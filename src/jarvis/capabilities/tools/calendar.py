@@ -12,6 +12,7 @@ import httpx
 from loguru import logger
 
 from jarvis.capabilities.tools.base import Tool, ToolResult
+from jarvis.kernel.tls import tls_context
 
 _SCOPES = ["https://www.googleapis.com/auth/calendar"]
 _CAL_BASE = "https://www.googleapis.com/calendar/v3"
@@ -98,7 +99,7 @@ class CalendarListTool(Tool):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with httpx.AsyncClient(timeout=60.0, verify=tls_context()) as client:
                 resp = await client.get(
                     f"{_CAL_BASE}/calendars/primary/events",
                     headers={"Authorization": f"Bearer {creds.token}"},
@@ -172,7 +173,7 @@ class CalendarCreateTool(Tool):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with httpx.AsyncClient(timeout=60.0, verify=tls_context()) as client:
                 resp = await client.post(
                     f"{_CAL_BASE}/calendars/primary/events",
                     headers={
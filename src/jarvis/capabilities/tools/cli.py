@@ -8,7 +8,10 @@ import asyncio
 import re
 import shlex
 import tempfile
+from collections import deque
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
@@ -85,44 +88,106 @@ _SYSTEM_REQUIRE_APPROVAL: frozenset[str] = frozenset(
     }
 )
 
-# Patterns vraiment irréversibles — refusés même avec confirmation
-_EXEC_BLOCKED_RE = re.compile(
-    r"rm\s+(-[a-zA-Z]*f[a-zA-Z]*\s+)?/?(\.\./)*/?$"
-    r"|rm\s+--no-preserve-root"
-    r"|:\(\)\s*\{.*\}"  # fork bomb
-    r"|\bmkfs\b|\bfdisk\b|\bparted\b"
-    r"|dd\s+if=.*\bof=/dev/"
-    r"|>\s*/dev/(sda|hda|nvme|loop|disk)\d*"
-    r"|\|\s*(bash|sh|zsh|fish|dash)\b"
-    r"|curl\b[^|]*\|\s*sudo"
-    r"|wget\b[^|]*-O\s*-[^|]*\|\s*(bash|sh)",
-    re.IGNORECASE | re.DOTALL,
+# Patterns vraiment irréversibles — refusés même avec confirmation.
+# Source unique des deux blocklists ci-dessous (compilées une fois à l'import).
+_IRREVERSIBLE_PATTERNS: tuple[str, ...] = (
+    r"rm\s+(-[a-zA-Z]*f[a-zA-Z]*\s+)?/?(\.\./)*/?$",  # rm -rf / ou rm /
+    r"rm\s+--no-preserve-root",
+    r":\(\)\s*\{.*\}",  # fork bomb
+    r"\bmkfs\b",
+    r"\bfdisk\b",
+    r"\bparted\b",
+    r"dd\s+if=.*\bof=/dev/",
+    r">\s*/dev/(sda|hda|nvme|loop|disk)\d*",
+    r"\|\s*(bash|sh|zsh|fish|dash)\b",  # piping to shell
+    r"curl\b[^|]*\|\s*sudo",
+    r"wget\b[^|]*-O\s*-[^|]*\|\s*(bash|sh)",
 )
 
+
+def _compile_blocklist(patterns: tuple[str, ...] | list[str]) -> re.Pattern[str]:
+    """Une seule alternation, un groupe nommé `p<i>` par pattern.
+
+    Une recherche suffit à savoir si la commande est refusée ET quelle règle a
+    déclenché (`match.lastgroup`), sans re-balayer la commande pattern par pattern.
+    """
+    alternation = "|".join(f"(?P<p{i}>{pat})" for i, pat in enumerate(patterns))
+    return re.compile(alternation, re.IGNORECASE | re.DOTALL)
+
+
+def _matched_rule(match: re.Match[str], patterns: tuple[str, ...] | list[str]) -> str:
+    """Pattern source de la règle qui a matché (pour les logs)."""
+    return patterns[int(match.lastgroup[1:])] if match.lastgroup else "?"
+
+
+_EXEC_BLOCKED_RE = _compile_blocklist(_IRREVERSIBLE_PATTERNS)
+
 _TIMEOUT = 30.0
+_EXEC_TIMEOUT = 300.0
 _APPROVAL_TTL = timedelta(minutes=5)
 
+# Messages sans donnée propre à l'appel, formatés une fois à l'import.
+_NO_OUTPUT_MSG = "Terminé (pas de sortie)."
+_TIMEOUT_MSG = f"Timeout après {_TIMEOUT}s."
+_EXEC_TIMEOUT_MSG = f"Timeout après {_EXEC_TIMEOUT:g}s."
+_EXEC_BLOCKED_MSG = "Refusé — pattern dangereux détecté."
+
+# Sortie lue au fil de l'eau : seules les dernières lignes sont gardées (yt-dlp,
+# ffmpeg… émettent une ligne de progression toutes les ~200 ms, parfois séparées
+# par des \r sans \n — d'où le découpage sur \r, \n et \r\n).
+_OUTPUT_TAIL_LINES = 200
+_READ_CHUNK = 64 * 1024
+_LINE_SPLIT_RE = re.compile(rb"\r\n?|\n")
+
+
+async def _read_output_tail(stream: asyncio.StreamReader) -> str:
+    """Lit `stream` jusqu'à EOF en ne gardant que les _OUTPUT_TAIL_LINES dernières lignes.
+
+    Mémoire bornée quelle que soit la durée de la commande (communicate() gardait tout).
+    """
+    tail: deque[bytes] = deque(maxlen=_OUTPUT_TAIL_LINES)
+    dropped = 0
+    pending = b""
+    while chunk := await stream.read(_READ_CHUNK):
+        *lines, pending = _LINE_SPLIT_RE.split(pending + chunk)
+        if len(pending) > _READ_CHUNK:  # ligne sans fin : tronquée plutôt qu'accumulée
+            lines.append(pending)
+            pending = b""
+        for line in lines:
+            dropped += len(tail) == _OUTPUT_TAIL_LINES
+            tail.append(line)
+    if pending:
+        dropped += len(tail) == _OUTPUT_TAIL_LINES
+        tail.append(pending)
+
+    text = b"\n".join(tail).decode(errors="replace").strip()
+    if dropped:
+        return f"[… {dropped} lignes précédentes omises]\n{text}"
+    return text
+
+
 # ── Blocklist inconditionnelle ────────────────────────────────────────────────
 # Ces patterns sont refusés MÊME si le script est whitelisté et marqué "safe".
 # Contrôle de sécurité de dernier recours.
 _BLOCKED_PATTERNS: list[str] = [
-    r"rm\s+(-[a-zA-Z]*f[a-zA-Z]*\s+)?/?(\.\./)*/?$",  # rm -rf / ou rm /
-    r"rm\s+--no-preserve-root",
-    r":\(\)\s*\{.*\}",  # fork bomb
+    *_IRREVERSIBLE_PATTERNS,
     r"\bshutdown\b",
     r"\breboot\b",
     r"\bhalt\b",
-    r"\bmkfs\b",
-    r"\bfdisk\b",
-    r"\bparted\b",
-    r"dd\s+if=.*\bof=/dev/",
-    r">\s*/dev/(sda|hda|nvme|loop|disk)\d*",
-    r"\|\s*(bash|sh|zsh|fish|dash)\b",  # piping to shell
-    r"curl\b[^|]*\|\s*sudo",
-    r"wget\b[^|]*-O\s*-[^|]*\|\s*(bash|sh)",
     r"\bsudo\b",  # sudo bloqué par défaut
 ]
-_BLOCKED_RE = re.compile("|".join(_BLOCKED_PATTERNS), re.IGNORECASE | re.DOTALL)
+_BLOCKED_RE = _compile_blocklist(_BLOCKED_PATTERNS)
+
+# Libellé de la whitelist pour les messages d'erreur — trié une seule fois
+_WHITELIST_LABEL = ", ".join(sorted(CLI_WHITELIST))
+_URL_PREFIXES = ("http://", "https://")
+
+# Environnement minimal des exécutions sandboxées (HOME/TMPDIR ajoutés par appel)
+_SANDBOX_ENV: dict[str, str] = {
+    "PATH": "/usr/local/bin:/usr/bin:/bin:/usr/sbin:/sbin",
+    "LANG": "fr_FR.UTF-8",
+    "LC_ALL": "fr_FR.UTF-8",
+}
 
 
 class _PendingApproval:
@@ -223,8 +288,14 @@ class CLIRunnerTool(Tool):
         tier = str(script.get("tier", "safe")).lower()
 
         # ── Blocklist inconditionnelle ─────────────────────────────────────────
-        if _BLOCKED_RE.search(cmd_str):
-            logger.warning("CLIRunner BLOCKED by pattern", alias=alias, cmd=cmd_str)
+        blocked = _BLOCKED_RE.search(cmd_str)
+        if blocked:
+            logger.warning(
+                "CLIRunner BLOCKED by pattern",
+                alias=alias,
+                cmd=cmd_str,
+                rule=_matched_rule(blocked, _BLOCKED_PATTERNS),
+            )
             return ToolResult(
                 content=(
                     f"Commande '{alias}' refusée — pattern dangereux détecté dans : `{cmd_str}`. "
@@ -297,21 +368,16 @@ class CLIRunnerTool(Tool):
         if sandboxed:
             tmp_dir = tempfile.mkdtemp(prefix="jarvis_sandbox_")
             extra_kwargs["cwd"] = tmp_dir
-            extra_kwargs["env"] = {
-                "PATH": "/usr/local/bin:/usr/bin:/bin:/usr/sbin:/sbin",
-                "HOME": tmp_dir,
-                "TMPDIR": tmp_dir,
-                "LANG": "fr_FR.UTF-8",
-                "LC_ALL": "fr_FR.UTF-8",
-            }
+            extra_kwargs["env"] = {**_SANDBOX_ENV, "HOME": tmp_dir, "TMPDIR": tmp_dir}
             logger.info("CLIRunner sandboxed", alias=alias, cwd=tmp_dir)
         else:
             logger.info("CLIRunner executing", alias=alias, cmd=cmd)
 
         try:
             proc = await asyncio.create_subprocess_exec(*cmd, **extra_kwargs)
-            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=_TIMEOUT)
-            output = stdout.decode(errors="replace").strip() or "Terminé (pas de sortie)."
+            async with asyncio.timeout(_TIMEOUT):
+                output = await _read_output_tail(proc.stdout) or _NO_OUTPUT_MSG
+                await proc.wait()
             success = proc.returncode == 0
             logger.info("CLIRunner done", alias=alias, returncode=proc.returncode)
             return ToolResult(content=output, is_error=not success)
@@ -320,11 +386,50 @@ class CLIRunnerTool(Tool):
                 proc.kill()
             except ProcessLookupError:
                 pass
-            return ToolResult(content=f"Timeout après {_TIMEOUT}s.", is_error=True)
+            return ToolResult(content=_TIMEOUT_MSG, is_error=True)
         except OSError as e:
             return ToolResult(content=f"Erreur d'exécution : {e}", is_error=True)
 
 
+@dataclass(frozen=True, slots=True)
+class _CommandCheck:
+    """Verdict des couches 1 à 4 d'ExecuteCLITool pour une commande donnée."""
+
+    blocked: bool = False
+    rule: str = ""  # règle de blocklist déclenchée, si blocked
+    parse_error: str | None = None
+    parts: tuple[str, ...] = ()
+    binary: str = ""
+    allowed: bool = False
+    needs_approval: bool = False
+
+
+@lru_cache(maxsize=1024)
+def _classify_command(command: str) -> _CommandCheck:
+    """Blocklist, parsing, allowlist et approbation en une passe, mémoïsé par commande.
+
+    Le flux d'approbation rejoue la même commande (sans puis avec confirmed=True) :
+    le second appel réutilise le verdict. Pur — ne dépend que du texte de la commande.
+    """
+    blocked = _EXEC_BLOCKED_RE.search(command)
+    if blocked:
+        return _CommandCheck(blocked=True, rule=_matched_rule(blocked, _IRREVERSIBLE_PATTERNS))
+    try:
+        parts = shlex.split(command)
+    except ValueError as e:
+        return _CommandCheck(parse_error=str(e))
+    if not parts:
+        return _CommandCheck()
+    binary = Path(parts[0]).name
+    allowed = binary in CLI_WHITELIST
+    return _CommandCheck(
+        parts=tuple(parts),
+        binary=binary,
+        allowed=allowed,
+        needs_approval=allowed and ExecuteCLITool._requires_approval(parts),
+    )
+
+
 class ExecuteCLITool(Tool):
     """Exécute une commande shell libre depuis la whitelist de binaires autorisés.
 
@@ -400,7 +505,7 @@ class ExecuteCLITool(Tool):
         # open : approbation si lancement d'app (-a) ou URL externe
         if binary == "open":
             rest = parts[1:]
-            if "-a" in rest or any(a.startswith(("http://", "https://")) for a in rest):
+            if "-a" in rest or any(a.startswith(_URL_PREFIXES) for a in rest):
                 return True
 
         # Binaires système à effets de bord irréversibles
@@ -421,21 +526,16 @@ class ExecuteCLITool(Tool):
         if sandboxed:
             tmp_dir = tempfile.mkdtemp(prefix="jarvis_exec_")
             extra_kwargs["cwd"] = tmp_dir
-            extra_kwargs["env"] = {
-                "PATH": "/usr/local/bin:/usr/bin:/bin:/usr/sbin:/sbin",
-                "HOME": tmp_dir,
-                "TMPDIR": tmp_dir,
-                "LANG": "fr_FR.UTF-8",
-                "LC_ALL": "fr_FR.UTF-8",
-            }
+            extra_kwargs["env"] = {**_SANDBOX_ENV, "HOME": tmp_dir, "TMPDIR": tmp_dir}
             logger.info(f"ExecuteCLI sandboxed cwd={tmp_dir}: {cmd_str[:60]}")
         else:
             logger.info(f"ExecuteCLI unsandboxed (allow_unsandboxed_exec=true): {cmd_str[:60]}")
 
         try:
             proc = await asyncio.create_subprocess_exec(*parts, **extra_kwargs)
-            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=300.0)
-            output = stdout.decode(errors="replace").strip() or "Terminé (pas de sortie)."
+            async with asyncio.timeout(_EXEC_TIMEOUT):
+                output = await _read_output_tail(proc.stdout) or _NO_OUTPUT_MSG
+                await proc.wait()
             success = proc.returncode == 0
             logger.info(f"ExecuteCLI done: rc={proc.returncode}")
             return ToolResult(content=output, is_error=not success)
@@ -444,7 +544,7 @@ class ExecuteCLITool(Tool):
                 proc.kill()
             except ProcessLookupError:
                 pass
-            return ToolResult(content="Timeout après 300s.", is_error=True)
+            return ToolResult(content=_EXEC_TIMEOUT_MSG, is_error=True)
         except OSError as e:
             return ToolResult(content=f"Erreur d'exécution : {e}", is_error=True)
 
@@ -454,37 +554,33 @@ class ExecuteCLITool(Tool):
         confirmed: bool = False,
         **_: object,
     ) -> ToolResult:
+        check = _classify_command(command)
+
         # Couche 1 : blocklist irréversible — refus inconditionnel, avant tout parsing
-        if _EXEC_BLOCKED_RE.search(command):
-            logger.warning(f"ExecuteCLI BLOCKED: {command[:80]}")
-            return ToolResult(content="Refusé — pattern dangereux détecté.", is_error=True)
+        if check.blocked:
+            logger.warning(f"ExecuteCLI BLOCKED ({check.rule}): {command[:80]}")
+            return ToolResult(content=_EXEC_BLOCKED_MSG, is_error=True)
 
         # Couche 2 : parsing strict — refus si syntaxe invalide (guillemets non fermés…)
-        try:
-            parts = shlex.split(command)
-        except ValueError as e:
-            logger.warning(f"ExecuteCLI parse error ({e}): {command[:60]}")
+        if check.parse_error is not None:
+            logger.warning(f"ExecuteCLI parse error ({check.parse_error}): {command[:60]}")
             return ToolResult(
-                content=f"Commande non parsable ({e}). Vérifiez les guillemets.",
+                content=f"Commande non parsable ({check.parse_error}). Vérifiez les guillemets.",
                 is_error=True,
             )
 
-        if not parts:
+        if not check.parts:
             return ToolResult(content="Commande vide.", is_error=True)
 
         # Couche 3 : allowlist — binaire résolu (robuste aux chemins absolus)
-        binary = Path(parts[0]).name
-        if binary not in CLI_WHITELIST:
+        if not check.allowed:
             return ToolResult(
-                content=(
-                    f"Binaire '{binary}' non autorisé."
-                    f" Whitelist : {', '.join(sorted(CLI_WHITELIST))}"
-                ),
+                content=(f"Binaire '{check.binary}' non autorisé. Whitelist : {_WHITELIST_LABEL}"),
                 is_error=True,
             )
 
         # Couche 4 : approbation robuste — basée sur le binaire résolu + args
-        if self._requires_approval(parts) and not confirmed:
+        if check.needs_approval and not confirmed:
             logger.info(f"ExecuteCLI awaiting approval: {command[:60]}")
             return ToolResult(
                 content=(
@@ -497,4 +593,4 @@ class ExecuteCLITool(Tool):
 
         # Couche 5 : exécution sandboxée par défaut
         logger.info(f"ExecuteCLI running: {command[:80]}")
-        return await self._run(parts, command)
+        return await self._run(list(check.parts), command)
@@ -7,13 +7,14 @@ from __future__ import annotations
 import asyncio
 import fnmatch
 import os
-import platform
+import stat
 from collections.abc import Generator
 from pathlib import Path
 
 from loguru import logger
 
 from jarvis.capabilities.tools.base import Tool, ToolResult
+from jarvis.kernel.host import IS_MACOS as _IS_MACOS
 from jarvis.kernel.permissions import permissions as _perms
 
 _EXCLUDED_DIRS = {".git", ".venv", "venv", "node_modules", "__pycache__", ".cache", "Library"}
@@ -29,11 +30,13 @@ def _walk_filtered(root: Path) -> Generator[Path, None, None]:
             yield Path(dirpath) / filename
 
 
-async def _mdfind(pattern: str, directory: str | None = None) -> list[str]:
+async def _mdfind(pattern: str, directory: str | None = None, limit: int = 50) -> list[str]:
     """Recherche via Spotlight (mdfind) — contourne les restrictions TCC macOS.
 
     pattern : glob-style (ex: 'COUCOUJAJA.html', '*.py', 'main*')
     On passe un prédicat kMDItemFSName et on filtre post-hoc avec fnmatch.
+    La sortie est lue ligne à ligne : dès `limit` résultats, mdfind est tué
+    (un prédicat large peut lister tout le disque).
     """
     # Extrait la partie fixe du pattern pour la requête Spotlight
     stem = pattern.replace("*", "").replace("?", "").strip()
@@ -44,19 +47,34 @@ async def _mdfind(pattern: str, directory: str | None = None) -> list[str]:
         cmd += ["-onlyin", directory]
     cmd.append(predicate)
 
+    hits: list[str] = []
+    proc: asyncio.subprocess.Process | None = None
     try:
         proc = await asyncio.create_subprocess_exec(
             *cmd,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.DEVNULL,
         )
-        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=_MDFIND_TIMEOUT)
-        lines = stdout.decode(errors="replace").strip().splitlines()
-        # Post-filter avec le glob exact
-        return [line for line in lines if fnmatch.fnmatch(Path(line).name, pattern)]
-    except Exception as e:
+        if proc.stdout is None:
+            raise RuntimeError("mdfind : stdout non capturé")
+        async with asyncio.timeout(_MDFIND_TIMEOUT):
+            async for raw in proc.stdout:
+                line = raw.decode(errors="replace").rstrip("\r\n")
+                # Post-filter avec le glob exact
+                if line and fnmatch.fnmatch(Path(line).name, pattern):
+                    hits.append(line)
+                    if len(hits) >= limit:
+                        break
+    except Exception as e:  # noqa: BLE001
         logger.debug("mdfind failed", error=str(e))
-        return []
+    finally:
+        if proc is not None and proc.returncode is None:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+            await proc.wait()
+    return hits
 
 
 class ReadFileTool(Tool):
@@ -100,13 +118,16 @@ class ReadFileTool(Tool):
                 content="Accès refusé : hors des répertoires autorisés.",
                 is_error=True,
             )
-        if not p.exists():
+        # Un seul stat() pour existence, type et taille
+        try:
+            st = p.stat()
+        except OSError:
             return ToolResult(content=f"Fichier introuvable : {p}", is_error=True)
-        if not p.is_file():
+        if not stat.S_ISREG(st.st_mode):
             return ToolResult(content=f"Pas un fichier : {p}", is_error=True)
-        if p.stat().st_size > _MAX_FILE_SIZE:
+        if st.st_size > _MAX_FILE_SIZE:
             return ToolResult(
-                content=f"Fichier trop grand ({p.stat().st_size} octets, max {_MAX_FILE_SIZE}).",
+                content=f"Fichier trop grand ({st.st_size} octets, max {_MAX_FILE_SIZE}).",
                 is_error=True,
             )
         try:
@@ -174,9 +195,8 @@ class FindFilesTool(Tool):
         cap = min(max_results, 50)
 
         # Sur macOS, mdfind (Spotlight) accède à Downloads/Documents/Desktop sans restriction TCC
-        if platform.system() == "Darwin":
-            hits = await _mdfind(pattern, directory=str(root))
-            hits = hits[:cap]
+        if _IS_MACOS:
+            hits = await _mdfind(pattern, directory=str(root), limit=cap)
             if hits:
                 logger.debug("FindFiles via mdfind", pattern=pattern, count=len(hits))
                 return ToolResult(content="\n".join(hits))
@@ -13,7 +13,9 @@ API réelle (3 outils) :
 
 from __future__ import annotations
 
-import uuid
+import json
+import re
+import secrets
 from typing import Any
 
 import httpx
@@ -22,6 +24,10 @@ from loguru import logger
 from jarvis.capabilities.tools.base import Tool, ToolResult
 from jarvis.kernel.approval import get_approval_checker
 from jarvis.kernel.settings import settings
+from jarvis.kernel.tls import tls_context
+
+# Lignes `data: …` d'une réponse SSE, repérées sur le corps entier sans le découper
+_SSE_DATA_RE = re.compile(r"^data: (.*)$", re.MULTILINE)
 
 
 class _FusionClient:
@@ -49,7 +55,7 @@ class _FusionClient:
 
         payload = {"jsonrpc": "2.0", "id": self._next_id(), "method": method, "params": params}
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(verify=tls_context()) as client:
             r = await client.post(self.url, json=payload, headers=headers, timeout=30)
 
         if sid := r.headers.get("Mcp-Session-Id"):
@@ -90,14 +96,12 @@ class _FusionClient:
 
 
 def _parse_sse(body: str) -> dict:
-    import json
-
-    for line in body.splitlines():
-        if line.startswith("data: "):
-            try:
-                return json.loads(line[6:])
-            except Exception:
-                pass
+    """Premier payload JSON valide du flux SSE ; s'arrête dès qu'il est trouvé."""
+    for m in _SSE_DATA_RE.finditer(body):
+        try:
+            return json.loads(m.group(1))
+        except ValueError:
+            pass
     return {}
 
 
@@ -274,7 +278,7 @@ Cut (CutFeatureOperation) : "Aucun corps cible" = sketch sur mauvais plan
                 ok = await checker.check(
                     "fusion_create",
                     f"Exécuter script Fusion 360: {script[:80]}...",
-                    str(uuid.uuid4())[:8],
+                    secrets.token_hex(4),
                 )
                 if not ok:
                     return ToolResult(content="Script Fusion refusé.", is_error=True)
@@ -13,6 +13,7 @@ import httpx
 from loguru import logger
 
 from jarvis.capabilities.tools.base import Tool, ToolResult
+from jarvis.kernel.tls import tls_context
 
 _SCOPES = [
     "https://www.googleapis.com/auth/gmail.readonly",
@@ -95,7 +96,7 @@ class GmailListTool(Tool):
         params = {"labelIds": label_ids, "maxResults": max_results}
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with httpx.AsyncClient(timeout=60.0, verify=tls_context()) as client:
                 headers = {"Authorization": f"Bearer {creds.token}"}
 
                 # 1. Lister les IDs
@@ -202,7 +203,7 @@ async def send_gmail_draft(
     if thread_id:
         payload["threadId"] = thread_id
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with httpx.AsyncClient(timeout=30.0, verify=tls_context()) as client:
         resp = await client.post(
             "https://gmail.googleapis.com/gmail/v1/users/me/messages/send",
             headers={"Authorization": f"Bearer {creds.token}"},
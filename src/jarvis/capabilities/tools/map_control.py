@@ -9,6 +9,7 @@ from collections.abc import Callable
 import httpx
 
 from jarvis.capabilities.tools.base import Tool, ToolResult
+from jarvis.kernel.tls import tls_context
 
 CITY_COORDS: dict[str, tuple[float, float]] = {
     "paris": (48.8566, 2.3522),
@@ -123,10 +124,13 @@ class MapControlTool(Tool):
 
     async def _geocode(self, location: str) -> tuple[float, float] | None:
         key = location.lower().strip()
-        if key in CITY_COORDS:
-            return CITY_COORDS[key]
+        if not key:
+            return None
+        coords = CITY_COORDS.get(key)
+        if coords is not None:
+            return coords
         try:
-            async with httpx.AsyncClient(timeout=5) as client:
+            async with httpx.AsyncClient(timeout=5, verify=tls_context()) as client:
                 r = await client.get(
                     "https://nominatim.openstreetmap.org/search",
                     params={"q": location, "format": "json", "limit": 1},
@@ -135,6 +139,7 @@ class MapControlTool(Tool):
                 results = r.json()
                 if results:
                     return float(results[0]["lat"]), float(results[0]["lon"])
-        except Exception:
+        except (httpx.HTTPError, ValueError, LookupError, TypeError):
+            # Réseau, JSON invalide ou résultat Nominatim mal formé : lieu introuvable.
             pass
         return None
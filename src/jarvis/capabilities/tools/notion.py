@@ -9,6 +9,7 @@ from loguru import logger
 
 from jarvis.capabilities.tools.base import Tool, ToolResult
 from jarvis.kernel.settings import settings
+from jarvis.kernel.tls import tls_context
 
 
 class NotionTasksTool(Tool):
@@ -43,7 +44,7 @@ class NotionTasksTool(Tool):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with httpx.AsyncClient(timeout=10.0, verify=tls_context()) as client:
                 tasks = await self._fetch_tasks(client, headers, page_id)
         except Exception as e:
             logger.error("NotionTasksTool error", error=str(e))
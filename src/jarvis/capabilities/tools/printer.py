@@ -13,8 +13,8 @@ Outil imprimante 3D pour Jarvis — BambuLab.
 from __future__ import annotations
 
 import asyncio
+import secrets
 import time
-import uuid
 from pathlib import Path
 
 from loguru import logger
@@ -48,12 +48,18 @@ def _make_printer() -> object:
 
 
 def _wait_ready(printer: object, timeout: float = 5.0) -> None:
-    """Attend que le client MQTT soit prêt."""
-    deadline = time.time() + timeout
-    while time.time() < deadline:
+    """Attend que le client MQTT soit prêt.
+
+    Backoff 50 ms → 500 ms : le client est souvent prêt en quelques dizaines de ms,
+    inutile d'attendre 200 ms d'office ; plafonné pour ne pas spammer sinon.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while time.monotonic() < deadline:
         if printer.mqtt_client_ready():
             return
-        time.sleep(0.2)
+        time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+        delay = min(delay * 1.5, 0.5)
 
 
 class Printer3DTool(Tool):
@@ -107,7 +113,7 @@ class Printer3DTool(Tool):
     ) -> ToolResult:
 
         checker = get_approval_checker()
-        action_id = str(uuid.uuid4())[:8]
+        action_id = secrets.token_hex(4)
 
         if action == "slice":
             if checker:
@@ -15,11 +15,20 @@ class ToolRegistry:
     def __init__(self) -> None:
         self._tools: dict[str, Tool] = {}
         self._skill_tool_names: set[str] = set()
+        # Schémas construits une fois par état du registre : ils partent à chaque
+        # tour (prompt système + tool_loop), alors qu'ils ne changent qu'au
+        # register / resync des skills. Listes partagées — à ne pas muter.
+        self._schemas: list[dict] | None = None
+        self._core_schemas: list[dict] | None = None
+
+    def _invalidate(self) -> None:
+        self._schemas = self._core_schemas = None
 
     def register(self, *tools: Tool) -> None:
         for tool in tools:
             self._tools[tool.name] = tool
             logger.debug("Tool registered", name=tool.name)
+        self._invalidate()
 
     def replace_skill_tools(self, *tools: Tool) -> None:
         """Remplace atomiquement les outils venant des skills."""
@@ -30,6 +39,7 @@ class ToolRegistry:
             self._tools[tool.name] = tool
             self._skill_tool_names.add(tool.name)
             logger.debug("Skill tool registered", name=tool.name)
+        self._invalidate()
         logger.info(f"Skill tools sync: {len(tools)} outil(s)")
 
     def has_tools(self) -> bool:
@@ -37,15 +47,19 @@ class ToolRegistry:
 
     def schemas(self) -> list[dict]:
         """Retourne les schémas Claude de tous les outils enregistrés."""
-        return [t.to_claude_schema() for t in self._tools.values()]
+        if self._schemas is None:
+            self._schemas = [t.to_claude_schema() for t in self._tools.values()]
+        return self._schemas
 
     def core_schemas(self) -> list[dict]:
         """Retourne uniquement les schémas des outils natifs (hors skills)."""
-        return [
-            t.to_claude_schema()
-            for name, t in self._tools.items()
-            if name not in self._skill_tool_names
-        ]
+        if self._core_schemas is None:
+            self._core_schemas = [
+                t.to_claude_schema()
+                for name, t in self._tools.items()
+                if name not in self._skill_tool_names
+            ]
+        return self._core_schemas
 
     async def call(self, name: str, inputs: dict) -> ToolResult:
         """Exécute un outil par nom. Retourne une ToolResult d'erreur si inconnu."""
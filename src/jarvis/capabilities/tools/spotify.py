@@ -9,6 +9,7 @@ from loguru import logger
 
 from jarvis.capabilities.tools.base import Tool, ToolResult
 from jarvis.capabilities.tools.spotify_auth import _get_access_token
+from jarvis.kernel.tls import tls_context
 
 _API_BASE = "https://api.spotify.com/v1"
 
@@ -59,7 +60,7 @@ class SpotifyTool(Tool):
             )
 
         try:
-            async with httpx.AsyncClient(timeout=8.0) as client:
+            async with httpx.AsyncClient(timeout=8.0, verify=tls_context()) as client:
                 headers = {"Authorization": f"Bearer {token}"}
 
                 async def _active_device_id() -> str | None:
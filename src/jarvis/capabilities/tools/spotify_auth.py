@@ -28,22 +28,42 @@ import httpx
 from loguru import logger
 
 from jarvis.kernel.settings import settings
+from jarvis.kernel.tls import tls_context
 
 _TOKEN_URL = "https://accounts.spotify.com/api/token"
 
+# Token parsé, indexé par (chemin, mtime_ns, taille) : l'UI poll /api/spotify/player
+# en continu et chaque poll demande un access token — le JSON n'est relu que si
+# le fichier a changé.
+_token_cache: tuple[Path, tuple[int, int], dict] | None = None
+
 
 def _token_path() -> Path:
     return Path(settings.spotify_token_path)
 
 
 def _load_token() -> dict | None:
+    global _token_cache
+
     p = _token_path()
-    if not p.exists():
+    try:
+        st = p.stat()
+    except OSError:
         return None
-    return json.loads(p.read_text())
+    signature = (st.st_mtime_ns, st.st_size)
+
+    if _token_cache is not None and _token_cache[0] == p and _token_cache[1] == signature:
+        return _token_cache[2]
+
+    token = json.loads(p.read_text())
+    _token_cache = (p, signature, token)
+    return token
 
 
 def _save_token(data: dict) -> None:
+    global _token_cache
+
+    _token_cache = None
     _token_path().write_text(json.dumps(data))
 
 
@@ -61,7 +81,7 @@ async def _get_access_token() -> str | None:
         return token["access_token"]
 
     # Refresh
-    async with httpx.AsyncClient() as client:
+    async with httpx.AsyncClient(verify=tls_context()) as client:
         resp = await client.post(
             _TOKEN_URL,
             headers={
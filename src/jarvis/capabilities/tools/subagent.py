@@ -15,8 +15,8 @@ Inspiré de hermes-agent delegate_tool.py et execute_code.py
 
 from __future__ import annotations
 
+import secrets
 import tempfile
-import uuid
 from pathlib import Path
 
 from loguru import logger
@@ -140,7 +140,7 @@ class ScriptRPCTool(Tool):
             approved = await checker.check(
                 "code_write",
                 f"Script RPC : {script[:80]}…",
-                f"script-rpc-{uuid.uuid4().hex[:8]}",
+                f"script-rpc-{secrets.token_hex(4)}",
             )
             if not approved:
                 return ToolResult(content="Exécution de script refusée.", is_error=True)
@@ -7,15 +7,14 @@ from __future__ import annotations
 import asyncio
 import base64
 import io
-import platform
 import subprocess
 
 from loguru import logger
 from openai import AsyncOpenAI
-from PIL import Image, ImageGrab
 
 from jarvis.capabilities.tools.base import Tool, ToolResult
 from jarvis.kernel.contracts import VisualMemory
+from jarvis.kernel.host import IS_MACOS as _IS_MACOS
 from jarvis.kernel.permissions import permissions as _perms
 from jarvis.kernel.settings import settings
 
@@ -226,9 +225,7 @@ class VisionTool(Tool):
         try:
             import cv2  # type: ignore[import-untyped]
         except ImportError as e:
-            logger.error(
-                "Vision: dépendance manquante", error=str(e), hint="uv add opencv-python pillow"
-            )
+            logger.error("Vision: dépendance manquante", error=str(e), hint="uv add opencv-python")
             return None
 
         cap = None
@@ -247,12 +244,22 @@ class VisionTool(Tool):
                 logger.error("Frame webcam invalide")
                 return None
 
-            # BGR (OpenCV) → RGB → PIL → JPEG en RAM, zéro disque
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            pil_img = Image.fromarray(frame_rgb)
-            buf = io.BytesIO()
-            pil_img.save(buf, format="JPEG", quality=settings.vision_jpeg_quality, optimize=True)
-            return buf.getvalue()
+            # Frame BGR encodée directement en JPEG en RAM : pas de conversion RGB
+            # ni de copie PIL intermédiaires, zéro disque.
+            ok, encoded = cv2.imencode(
+                ".jpg",
+                frame,
+                [
+                    cv2.IMWRITE_JPEG_QUALITY,
+                    settings.vision_jpeg_quality,
+                    cv2.IMWRITE_JPEG_OPTIMIZE,
+                    1,
+                ],
+            )
+            if not ok:
+                logger.error("Encodage JPEG webcam échoué")
+                return None
+            return encoded.tobytes()
 
         except Exception as e:
             logger.error("Webcam capture error", error=str(e))
@@ -263,7 +270,7 @@ class VisionTool(Tool):
 
     def _capture_screen(self) -> bytes | None:
         """Capture l'écran en RAM. macOS : screencapture stdout. Fallback : PIL.ImageGrab."""
-        if platform.system() == "Darwin":
+        if _IS_MACOS:
             result = self._capture_screen_macos()
             if result:
                 return result
@@ -308,6 +315,8 @@ class VisionTool(Tool):
     def _capture_screen_pil(self) -> bytes | None:
         """PIL.ImageGrab — fallback cross-platform."""
         try:
+            from PIL import Image, ImageGrab
+
             screenshot = ImageGrab.grab()
             max_w = settings.vision_screen_max_width
             if screenshot.width > max_w:
@@ -331,6 +340,8 @@ class VisionTool(Tool):
     def _resize_jpeg(self, jpeg_bytes: bytes) -> bytes:
         """Redimensionne un JPEG si l'écran dépasse vision_screen_max_width."""
         try:
+            from PIL import Image
+
             img = Image.open(io.BytesIO(jpeg_bytes))
             max_w = settings.vision_screen_max_width
             if img.width <= max_w:
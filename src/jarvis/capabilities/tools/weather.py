@@ -8,6 +8,7 @@ import httpx
 from loguru import logger
 
 from jarvis.capabilities.tools.base import Tool, ToolResult
+from jarvis.kernel.tls import tls_context
 
 
 class WeatherTool(Tool):
@@ -32,7 +33,7 @@ class WeatherTool(Tool):
 
     async def execute(self, city: str, **_: object) -> ToolResult:
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
+            async with httpx.AsyncClient(timeout=10, verify=tls_context()) as client:
                 r = await client.get(f"https://wttr.in/{city}?format=3&lang=fr")
                 r.raise_for_status()
                 logger.debug("Weather fetched", city=city)
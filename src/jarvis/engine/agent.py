@@ -7,12 +7,14 @@ from __future__ import annotations
 import asyncio
 from collections.abc import AsyncIterator
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 from loguru import logger
 
 from jarvis.engine.session import Session
 from jarvis.kernel.contracts import (
+    SYSTEM_DYNAMIC_MARKER,
     LLMProvider,
     MemoryIndex,
     SkillRegistry,
@@ -25,6 +27,36 @@ from jarvis.kernel.settings import Settings
 
 _STATIC_PROMPT_PATH = PROMPTS_DIR / "system_static.md"
 
+_QUEBEC_MODE_PROMPT = (
+    "\n\n## Mode Québécois (ACTIF)\n"
+    "Tu parles avec un accent et du dialecte québécois authentique. "
+    "Utilise : 'ostie', 'câlice', 'tabarnak' (avec parcimonie),"
+    " 'c'est le boutte', 'en masse', 'pantoute', 'tantôt', 'maudit', 'icitte',"
+    " 'chu' (je suis), 'ben' (bien), 'toé', 'moé', 'faque', 't'sé',"
+    " 'un char' (voiture), 'magasiner' (shopping). "
+    "Garde la personnalité Jarvis (direct, efficace, ironie)"
+    " avec la couleur québécoise."
+)
+
+
+@lru_cache(maxsize=4)
+def _static_prompt(path: Path, mtime_ns: int, firstname: str, quebec_mode: bool) -> str:  # noqa: ARG001
+    """Persona statique, assemblée une fois par (version du fichier, prénom, mode).
+
+    `mtime_ns` ne sert que de clé : une édition du .md invalide l'entrée. Chaque tour
+    ne paie plus qu'un stat() au lieu d'une lecture + replace, et reçoit la même
+    chaîne — le préfixe mis en cache côté API reste identique.
+    """
+    static_system = path.read_text(encoding="utf-8")
+    # Le prompt statique est rédigé avec "Barth" comme nom par défaut ; on le
+    # remplace par le prénom configuré (USER_FIRSTNAME) pour que Jarvis appelle
+    # réellement l'utilisateur par son nom. Repli sur "Barth" si non configuré.
+    if firstname != "Barth":
+        static_system = static_system.replace("Barth", firstname)
+    if quebec_mode:
+        static_system += _QUEBEC_MODE_PROMPT
+    return static_system
+
 
 class Agent:
     """Construit le prompt (static + dynamic), appelle le LLM, retourne le stream.
@@ -70,25 +102,14 @@ class Agent:
         """Assemble le prompt système : partie statique + contexte dynamique."""
         _s = self._settings
 
-        static_system = _STATIC_PROMPT_PATH.read_text(encoding="utf-8")
-        # Le prompt statique est rédigé avec "Barth" comme nom par défaut ; on le
-        # remplace par le prénom configuré (USER_FIRSTNAME) pour que Jarvis appelle
-        # réellement l'utilisateur par son nom. Repli sur "Barth" si non configuré.
         firstname = _s.display_name
-        if firstname != "Barth":
-            static_system = static_system.replace("Barth", firstname)
-        if _s.quebec_mode:
-            static_system += (
-                "\n\n## Mode Québécois (ACTIF)\n"
-                "Tu parles avec un accent et du dialecte québécois authentique. "
-                "Utilise : 'ostie', 'câlice', 'tabarnak' (avec parcimonie),"
-                " 'c'est le boutte', 'en masse', 'pantoute', 'tantôt', 'maudit', 'icitte',"
-                " 'chu' (je suis), 'ben' (bien), 'toé', 'moé', 'faque', 't'sé',"
-                " 'un char' (voiture), 'magasiner' (shopping). "
-                "Garde la personnalité Jarvis (direct, efficace, ironie)"
-                " avec la couleur québécoise."
-            )
-        dynamic_parts: list[str] = ["=== CONTEXTE DYNAMIQUE ==="]
+        static_system = _static_prompt(
+            _STATIC_PROMPT_PATH,
+            _STATIC_PROMPT_PATH.stat().st_mtime_ns,
+            firstname,
+            bool(_s.quebec_mode),
+        )
+        dynamic_parts: list[str] = [SYSTEM_DYNAMIC_MARKER]
 
         # Identité LLM — indispensable pour les modèles locaux qui ne savent pas ce qu'ils sont
         if _s.llm_provider == "local":
@@ -102,10 +123,6 @@ class Agent:
             llm_id = _model_map.get(_s.api_backend, _s.anthropic_model)
         dynamic_parts.append(f"## Moteur LLM actif\n\nTu tournes sur **{llm_id}**.")
 
-        # Date/heure toujours injectée — utile pour le calendrier et les calculs temporels
-        now = datetime.now()
-        dynamic_parts.append(f"## Date et heure\n\n{now.strftime('%Y-%m-%d %H:%M')}")
-
         if recall_summary:
             dynamic_parts.append(f"## Rappel de sessions précédentes\n\n{recall_summary}")
 
@@ -126,7 +143,8 @@ class Agent:
         if self._topic_store is not None:
             topic_names = self._topic_store.list_all()
             if topic_names:
-                names_list = "\n".join(f"- `{name}`" for name in topic_names)
+                # Un seul join sur la liste brute : pas de f-string par élément.
+                names_list = "- `" + "`\n- `".join(topic_names) + "`"
                 dynamic_parts.append(
                     "## Fichiers thématiques disponibles\n\n"
                     "Ces fichiers ne sont PAS préchargés. Pour les consulter, utilise "
@@ -148,8 +166,15 @@ class Agent:
             if skills_prompt:
                 dynamic_parts.append("# SKILLS ACTIFS\n\n" + skills_prompt)
 
+        # Date/heure toujours injectée — utile pour le calendrier et les calculs temporels.
+        # Placée après les blocs stables (mémoire, outils, skills) : elle change chaque
+        # minute, et le cache de préfixe (OpenAI/Mistral automatique) s'arrête au
+        # premier octet différent.
+        now = datetime.now()
+        dynamic_parts.append(f"## Date et heure\n\n{now.strftime('%Y-%m-%d %H:%M')}")
+
         if notifications:
-            notif_content = "\n".join(f"- {n}" for n in notifications)
+            notif_content = "- " + "\n- ".join(notifications)
             dynamic_parts.append(
                 f"## Notifications en attente — À GLISSER EN FIN DE RÉPONSE\n\n{notif_content}"
             )
@@ -177,7 +202,9 @@ class Agent:
         """
         session.add_message("user", user_message)
         system = self._build_system(notifications=notifications)
-        logger.debug("Agent responding", session_id=str(session.id), stream=stream)
+        # Logs DEBUG du tour : arguments passés bruts ou en lazy, rien n'est formaté
+        # (str(uuid), listes de noms) quand le niveau est filtré (INFO par défaut).
+        logger.debug("Agent responding", session_id=session.id, stream=stream)
 
         result = await self._llm.complete(
             messages=session.messages,
@@ -227,7 +254,7 @@ class Agent:
         """
         session.add_message("user", user_message)
         system = self._build_system(notifications=notifications, recall_summary=recall_summary)
-        logger.debug("Agent routing stream", session_id=str(session.id))
+        logger.debug("Agent routing stream", session_id=session.id)
 
         if self.has_tools() and hasattr(self._llm, "stream_with_capture"):
             stream, capture = self._llm.stream_with_capture(  # type: ignore[union-attr]
@@ -252,7 +279,9 @@ class Agent:
         results = await asyncio.gather(
             *(self._tool_registry.call_str(name, inp) for _, name, inp in capture.calls)  # type: ignore[union-attr]
         )
-        logger.debug("Tools executed", names=[n for _, n, _ in capture.calls])
+        logger.opt(lazy=True).debug(
+            "Tools executed", names=lambda: [n for _, n, _ in capture.calls]
+        )
         return list(results)
 
     async def synthesize(
@@ -292,7 +321,9 @@ class Agent:
         ]
 
         system = self._build_system()
-        logger.debug("Agent synthesizing tool results", tools=[n for _, n, _ in capture.calls])
+        logger.opt(lazy=True).debug(
+            "Agent synthesizing tool results", tools=lambda: [n for _, n, _ in capture.calls]
+        )
 
         # Pas de tools ici : le LLM se concentre sur la synthèse, pas de chainage
         stream = await self._llm.complete(messages=messages, system=system, stream=True)
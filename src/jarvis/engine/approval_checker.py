@@ -38,7 +38,7 @@ class ApprovalChecker:
         mode = getattr(approval_config, category, ApprovalMode.ASK)
 
         if mode == ApprovalMode.ALWAYS:
-            logger.debug(f"Approval AUTO: {category}")
+            logger.debug("Approval AUTO: {category}", category=category)
             return True
 
         if mode == ApprovalMode.NEVER:
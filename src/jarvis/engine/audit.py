@@ -11,13 +11,15 @@ Le log est append-only — on ne supprime jamais une entrée.
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class AuditEntry:
     """Une décision du gate composite, immuable."""
 
@@ -34,6 +36,22 @@ class AuditEntry:
     budget_status: str | None = None
     extra: dict[str, Any] = field(default_factory=dict)
 
+    def to_dict(self) -> dict[str, Any]:
+        """Forme JSONL de l'entrée, sans la copie profonde d'`asdict` (timestamp en ISO)."""
+        return {
+            "timestamp": self.timestamp.isoformat(),
+            "decision": self.decision,
+            "context_id": self.context_id,
+            "access_level": self.access_level,
+            "action_category": self.action_category,
+            "estimated_cost_usd": self.estimated_cost_usd,
+            "risk_decision": self.risk_decision,
+            "category_decision": self.category_decision,
+            "budget_decision": self.budget_decision,
+            "budget_status": self.budget_status,
+            "extra": self.extra,
+        }
+
 
 class AuditLog:
     """Append-only JSONL des décisions du gate.
@@ -52,33 +70,37 @@ class AuditLog:
 
     def append(self, entry: AuditEntry) -> None:
         """Ajoute une entrée. Sérialise la datetime en ISO."""
-        d = asdict(entry)
-        d["timestamp"] = entry.timestamp.isoformat()
+        line = _JSON_ENCODER.encode(entry.to_dict()) + "\n"
         with self._path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(d, ensure_ascii=False) + "\n")
+            f.write(line)
 
     def read_all(self) -> list[AuditEntry]:
-        """Relit toutes les entrées (tests, curator, debug)."""
+        """Relit toutes les entrées (tests, curator, debug).
+
+        Le log ne fait que grossir : lecture ligne à ligne, sans matérialiser
+        le fichier entier en une str puis une liste de lignes.
+        """
         if not self._path.exists():
             return []
         entries: list[AuditEntry] = []
-        for line in self._path.read_text(encoding="utf-8").splitlines():
-            if not line.strip():
-                continue
-            d = json.loads(line)
-            entries.append(
-                AuditEntry(
-                    timestamp=datetime.fromisoformat(d["timestamp"]),
-                    decision=d["decision"],
-                    context_id=d["context_id"],
-                    access_level=d["access_level"],
-                    action_category=d["action_category"],
-                    estimated_cost_usd=d["estimated_cost_usd"],
-                    risk_decision=d["risk_decision"],
-                    category_decision=d["category_decision"],
-                    budget_decision=d["budget_decision"],
-                    budget_status=d.get("budget_status"),
-                    extra=d.get("extra", {}),
+        with self._path.open(encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                d = json.loads(line)
+                entries.append(
+                    AuditEntry(
+                        timestamp=datetime.fromisoformat(d["timestamp"]),
+                        decision=d["decision"],
+                        context_id=d["context_id"],
+                        access_level=d["access_level"],
+                        action_category=d["action_category"],
+                        estimated_cost_usd=d["estimated_cost_usd"],
+                        risk_decision=d["risk_decision"],
+                        category_decision=d["category_decision"],
+                        budget_decision=d["budget_decision"],
+                        budget_status=d.get("budget_status"),
+                        extra=d.get("extra", {}),
+                    )
                 )
-            )
         return entries
@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 
@@ -12,6 +13,9 @@ from loguru import logger
 
 from jarvis.kernel.settings import settings
 
+# Fallback HTTP (voice agent) : JSON compact en UTF-8, encodeur construit une fois
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
 
 @dataclass
 class Notification:
@@ -107,7 +111,6 @@ def get_broadcast_fn() -> object:
     if _proactive_queue_instance is not None:
         return _proactive_queue_instance.broadcast_event
     # Fallback process séparé (ex. voice_agent) : HTTP POST vers le serveur FastAPI
-    import json as _json
     import threading
     import urllib.request
 
@@ -115,7 +118,7 @@ def get_broadcast_fn() -> object:
 
         def _post() -> None:
             url = f"http://localhost:{settings.port}/internal/broadcast"
-            data = _json.dumps(event).encode()
+            data = _JSON_ENCODER.encode(event).encode("utf-8")
             req = urllib.request.Request(
                 url,
                 data=data,
@@ -123,7 +126,9 @@ def get_broadcast_fn() -> object:
                 method="POST",
             )
             try:
-                urllib.request.urlopen(req, timeout=2)
+                # Réponse fermée tout de suite : sinon un socket fuit par broadcast.
+                with urllib.request.urlopen(req, timeout=2):
+                    pass
             except Exception:
                 pass
 
@@ -17,7 +17,7 @@ from __future__ import annotations
 
 import json
 import os
-import uuid
+import secrets
 from collections.abc import Callable
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime, timedelta
@@ -131,6 +131,9 @@ class RoutineStore:
         self._path = path
         self._routines: dict[str, Routine] = {}
         self._runs: list[RoutineRun] = []
+        # Mêmes runs, regroupés par routine (ordre chronologique conservé) :
+        # les lookups par nom ne parcourent que l'historique de la routine.
+        self._runs_by_routine: dict[str, list[RoutineRun]] = {}
         self._load()
 
     # ── Persistance ───────────────────────────────────────────────────────────
@@ -168,7 +171,7 @@ class RoutineStore:
                     result_summary=rd.get("result_summary"),
                 )
                 run.audit_log = steps
-                self._runs.append(run)
+                self._append_run(run)
         except Exception as exc:  # noqa: BLE001
             logger.warning(f"RoutineStore: échec du chargement : {exc}")
 
@@ -200,26 +203,30 @@ class RoutineStore:
     def create_run(self, routine: Routine) -> RoutineRun:
         """Crée et persiste un nouveau RoutineRun pour la routine."""
         run = RoutineRun(
-            id=f"run_{uuid.uuid4().hex[:12]}",
+            id=f"run_{secrets.token_hex(6)}",
             routine_name=routine.name,
             trigger_type=str(routine.trigger),
             started_at=datetime.now(UTC).isoformat(),
             status=RunStatus.PENDING,
         )
         run.add_step("created", f"Routine '{routine.name}' déclenchée")
-        self._runs.append(run)
+        self._append_run(run)
         self._save()
         logger.info(f"RoutineRun créé : {run.id} pour '{routine.name}'")
         return run
 
+    def _append_run(self, run: RoutineRun) -> None:
+        self._runs.append(run)
+        self._runs_by_routine.setdefault(run.routine_name, []).append(run)
+
     def update_run(self, run: RoutineRun) -> None:
         """Persiste l'état courant d'un run existant."""
         self._save()
 
     def active_run_for(self, routine_name: str) -> RoutineRun | None:
         """Retourne le run PENDING/RUNNING pour cette routine, s'il existe."""
-        for r in reversed(self._runs):
-            if r.routine_name == routine_name and r.status in (
+        for r in reversed(self._runs_by_routine.get(routine_name, ())):
+            if r.status in (
                 RunStatus.RUNNING,
                 RunStatus.PENDING,
             ):
@@ -228,8 +235,8 @@ class RoutineStore:
 
     def last_finished_run(self, routine_name: str) -> RoutineRun | None:
         """Retourne le dernier run SUCCESS/FAILED pour cette routine."""
-        for r in reversed(self._runs):
-            if r.routine_name == routine_name and r.status in (
+        for r in reversed(self._runs_by_routine.get(routine_name, ())):
+            if r.status in (
                 RunStatus.SUCCESS,
                 RunStatus.FAILED,
             ):
@@ -241,7 +248,10 @@ class RoutineStore:
         routine_name: str | None = None,
         limit: int = 50,
     ) -> list[RoutineRun]:
-        runs = [r for r in self._runs if routine_name is None or r.routine_name == routine_name]
+        if routine_name is None:
+            runs = self._runs
+        else:
+            runs = self._runs_by_routine.get(routine_name, [])
         return list(reversed(runs[-limit:]))
 
 
@@ -96,10 +96,12 @@ class Gateway:
 
             async def _pipe() -> AsyncIterator[str]:
                 tool_task: asyncio.Task | None = None
-                ack_text = ""  # Accumule le texte streamé avant les outils
+                # Texte streamé avant les outils — joint une seule fois pour la synthèse
+                ack_parts: list[str] = []
+                ack_append = ack_parts.append
 
                 async for chunk in text_stream:
-                    ack_text += chunk
+                    ack_append(chunk)
                     yield chunk
                     # Dès que _stream_capturing peuple capture (content_block_stop tool_use),
                     # on démarre la task outil — elle tourne pendant que la voice WS fait du TTS.
@@ -120,7 +122,10 @@ class Gateway:
                 if tool_task is not None:
                     try:
                         results = await tool_task
-                        logger.debug("CF tools done", names=[n for _, n, _ in tool_capture.calls])
+                        ack_text = "".join(ack_parts)
+                        logger.opt(lazy=True).debug(
+                            "CF tools done", names=lambda: [n for _, n, _ in tool_capture.calls]
+                        )
                         if ack_text.strip():
                             yield " "
                         synth_stream = agent.synthesize(session, ack_text, tool_capture, results)
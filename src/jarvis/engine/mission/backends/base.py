@@ -6,12 +6,24 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import TypedDict
+from dataclasses import dataclass
 
+STDOUT_LIMIT = 8000
+STDERR_LIMIT = 2000
+_READ_CHUNK = 64 * 1024
+# UTF-8 : au plus 4 octets par caractère, `limit * 4` octets couvrent toujours
+# les `limit` premiers caractères décodés.
+_UTF8_MAX_BYTES = 4
 
-class BackendResult(TypedDict):
-    """Résultat normalisé retourné par tous les backends d'exécution."""
+
+@dataclass(frozen=True, slots=True)
+class BackendResult:
+    """Résultat normalisé retourné par tous les backends d'exécution.
+
+    Slots plutôt que TypedDict : accès par attribut, sans dict par résultat.
+    """
 
     success: bool
     stdout: str
@@ -19,12 +31,39 @@ class BackendResult(TypedDict):
     returncode: int
 
 
+async def read_head(stream: asyncio.StreamReader | None, limit: int) -> str:
+    """Lit `stream` jusqu'à EOF par blocs bruts et renvoie ses `limit` premiers caractères.
+
+    communicate() gardait toute la sortie en mémoire avant de la décoder puis de
+    la tronquer ; ici le surplus est lu (l'enfant ne bloque pas sur un pipe plein)
+    mais jeté, et le décodage n'a lieu qu'une fois sur la tête conservée.
+    """
+    if stream is None:
+        return ""
+    budget = limit * _UTF8_MAX_BYTES
+    head = bytearray()
+    while chunk := await stream.read(_READ_CHUNK):
+        if len(head) < budget:
+            head += chunk[: budget - len(head)]
+    return head.decode("utf-8", errors="replace")[:limit]
+
+
+async def collect_output(proc: asyncio.subprocess.Process) -> tuple[str, str]:
+    """Draine stdout et stderr en parallèle puis attend la fin du process."""
+    stdout, stderr, _ = await asyncio.gather(
+        read_head(proc.stdout, STDOUT_LIMIT),
+        read_head(proc.stderr, STDERR_LIMIT),
+        proc.wait(),
+    )
+    return stdout, stderr
+
+
 class ExecutionBackend(ABC):
     """Interface commune pour les backends d'exécution de Jarvis.
 
     Chaque backend implémente execute() et is_available().
-    Le résultat est toujours un BackendResult normalisé, compatible avec
-    les dict retournés historiquement par WorkerCLITool et DockerExecutor.
+    Le résultat est toujours un BackendResult normalisé ; WorkerCLITool le
+    convertit en dict (asdict) pour garder son contrat historique.
     """
 
     @abstractmethod
@@ -11,7 +11,8 @@ from pathlib import Path
 
 from loguru import logger
 
-from jarvis.engine.mission.backends.base import BackendResult, ExecutionBackend
+from jarvis.engine.mission.backends.base import BackendResult, ExecutionBackend, collect_output
+from jarvis.kernel.process_group import kill_group, new_group_kwargs
 from jarvis.kernel.settings import settings
 
 
@@ -23,7 +24,11 @@ class LocalBackend(ExecutionBackend):
     """
 
     def __init__(self, workspace_path: str) -> None:
-        self._workspace = Path(workspace_path).resolve()
+        # get_backend() instancie un LocalBackend par commande, avec un workspace
+        # déjà résolu par l'appelant : resolve() (un lstat par composant) n'est
+        # utile que pour un chemin relatif, le kernel fait le chdir tel quel.
+        path = Path(workspace_path)
+        self._workspace = path if path.is_absolute() else path.resolve()
 
     async def is_available(self) -> bool:
 
@@ -44,22 +49,29 @@ class LocalBackend(ExecutionBackend):
                 returncode=-1,
             )
 
+        proc: asyncio.subprocess.Process | None = None
         try:
+            # Session dédiée : au timeout, toute la pipeline du shell est tuée,
+            # pas seulement /bin/sh (le côté gauche d'un `a | b` survivait).
             proc = await asyncio.create_subprocess_shell(
                 command,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 cwd=self._workspace,
+                **new_group_kwargs(),
             )
-            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+            stdout, stderr = await asyncio.wait_for(collect_output(proc), timeout=timeout)
             logger.debug("LocalBackend exec", cmd=command[:60], rc=proc.returncode)
             return BackendResult(
                 success=proc.returncode == 0,
-                stdout=stdout.decode("utf-8", errors="replace")[:8000],
-                stderr=stderr.decode("utf-8", errors="replace")[:2000],
+                stdout=stdout,
+                stderr=stderr,
                 returncode=proc.returncode,
             )
         except TimeoutError:
+            if proc is not None:
+                kill_group(proc)
+                await proc.wait()
             return BackendResult(
                 success=False,
                 stdout="",
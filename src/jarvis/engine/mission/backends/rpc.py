@@ -6,7 +6,8 @@
 
 Architecture (transport fichiers — fonctionne local ET Docker via volume monté) :
   1. Génère jarvis_tools.py (stubs RPC) dans rpc_dir à l'intérieur du workspace
-  2. Lance le script utilisateur dans le backend sandboxé
+  2. Lance le script utilisateur dans le backend sandboxé (user_script.py lancé par
+     chemin : pas de limite E2BIG sur argv, tracebacks avec les lignes source)
   3. Dispatcher asyncio poll-lit les request files et dispatche via tool_registry
   4. Seul le stdout du script remonte au LLM — résultats intermédiaires hors contexte
 
@@ -23,9 +24,9 @@ from __future__ import annotations
 
 import asyncio
 import json
+import secrets
 import shutil
 import textwrap
-import uuid
 from pathlib import Path
 
 from loguru import logger
@@ -34,6 +35,11 @@ from jarvis.engine.approval_checker import get_approval_checker
 from jarvis.engine.mission.backends.base import ExecutionBackend
 from jarvis.kernel.contracts import ToolRegistry
 
+# Poll du dispatcher : 50 ms tant que des requêtes arrivent, backoff exponentiel
+# jusqu'à 500 ms quand le script tourne sans appeler d'outil (évite ~20 réveils/s à vide).
+_POLL_MIN_S = 0.05
+_POLL_MAX_S = 0.5
+
 # Sous-ensemble d'outils exposés dans le sandbox RPC.
 # Intersection avec les outils enregistrés au moment de l'exécution.
 RPC_ALLOWED_TOOLS: frozenset[str] = frozenset(
@@ -55,24 +61,30 @@ _STUB_TEMPLATE = textwrap.dedent("""\
 
     _RPC_DIR = {rpc_dir!r}
     _CALL_TIMEOUT = 60
+    _POLL_MIN, _POLL_MAX = 0.05, 0.5
 
 
     def _call(tool_name, **kwargs):
         req_id = _uuid.uuid4().hex
         req_path = _os.path.join(_RPC_DIR, f"req_{{req_id}}.json")
         res_path = _os.path.join(_RPC_DIR, f"res_{{req_id}}.json")
-        with open(req_path, "w") as _f:
-            _json.dump({{"tool": tool_name, "inputs": kwargs}}, _f)
+        # Un seul write() puis rename : le dispatcher ne voit jamais un JSON partiel
+        payload = _json.dumps({{"tool": tool_name, "inputs": kwargs}}).encode()
+        with open(req_path + ".part", "wb") as _f:
+            _f.write(payload)
+        _os.replace(req_path + ".part", req_path)
         deadline = _time.monotonic() + _CALL_TIMEOUT
+        delay = _POLL_MIN
         while _time.monotonic() < deadline:
             if _os.path.exists(res_path):
                 with open(res_path) as _f:
                     return _json.load(_f)
-            _time.sleep(0.05)
+            _time.sleep(delay)
+            delay = min(_POLL_MAX, delay * 2)
         raise TimeoutError(f"RPC timeout pour {{tool_name}} ({{_CALL_TIMEOUT}}s)")
 
 
-{stubs}
+    {stubs}
 """)
 
 
@@ -118,7 +130,7 @@ class ScriptRPCRunner:
             registered = frozenset(t["name"] for t in self._registry.schemas())
             allowed_tools = RPC_ALLOWED_TOOLS & registered
 
-        run_id = uuid.uuid4().hex[:8]
+        run_id = secrets.token_hex(4)
         rpc_dir = self._workspace / ".jarvis_rpc" / run_id
         rpc_dir.mkdir(parents=True, exist_ok=True)
 
@@ -138,12 +150,15 @@ class ScriptRPCRunner:
         tool_call_count = [0]  # liste mutable pour closure
 
         async def _dispatcher() -> None:
+            delay = _POLL_MIN_S
             while True:
+                dispatched = False
                 for req_path in sorted(rpc_dir.glob("req_*.json")):
                     req_id = req_path.stem[4:]  # "req_<id>" → "<id>"
                     res_path = rpc_dir / f"res_{req_id}.json"
                     if res_path.exists():
                         continue  # déjà traité
+                    dispatched = True
 
                     try:
                         data = json.loads(req_path.read_text())
@@ -186,10 +201,14 @@ class ScriptRPCRunner:
                         logger.warning("RPC dispatch error", error=str(exc))
                         response = {"error": str(exc)}
 
-                    res_path.write_text(json.dumps(response), encoding="utf-8")
+                    # Même écriture atomique que le stub : _call() lit res_* dès qu'il existe
+                    part_path = res_path.with_name(res_path.name + ".part")
+                    part_path.write_bytes(json.dumps(response).encode())
+                    part_path.replace(res_path)
                     req_path.unlink(missing_ok=True)
 
-                await asyncio.sleep(0.05)
+                delay = _POLL_MIN_S if dispatched else min(_POLL_MAX_S, delay * 2)
+                await asyncio.sleep(delay)
 
         dispatch_task = asyncio.create_task(_dispatcher())
         script_path = f"{backend_rpc}/user_script.py"
@@ -205,11 +224,12 @@ class ScriptRPCRunner:
                 await dispatch_task
             except asyncio.CancelledError:
                 pass
+            # rpc_dir (stub + user_script.py) supprimé même si l'exécution lève
             shutil.rmtree(rpc_dir, ignore_errors=True)
 
         return {
-            "success": result["success"],
-            "stdout": result["stdout"][: self.MAX_STDOUT_BYTES],
-            "stderr": result["stderr"],
+            "success": result.success,
+            "stdout": result.stdout[: self.MAX_STDOUT_BYTES],
+            "stderr": result.stderr,
             "tool_calls": tool_call_count[0],
         }
@@ -14,7 +14,7 @@ from pathlib import Path
 
 from loguru import logger
 
-from jarvis.engine.mission.backends.base import BackendResult, ExecutionBackend
+from jarvis.engine.mission.backends.base import BackendResult, ExecutionBackend, collect_output
 
 
 class SSHBackend(ExecutionBackend):
@@ -86,7 +86,7 @@ class SSHBackend(ExecutionBackend):
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
-            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+            stdout, stderr = await asyncio.wait_for(collect_output(proc), timeout=timeout)
             logger.debug(
                 "SSHBackend exec",
                 host=self._host,
@@ -95,8 +95,8 @@ class SSHBackend(ExecutionBackend):
             )
             return BackendResult(
                 success=proc.returncode == 0,
-                stdout=stdout.decode("utf-8", errors="replace")[:8000],
-                stderr=stderr.decode("utf-8", errors="replace")[:2000],
+                stdout=stdout,
+                stderr=stderr,
                 returncode=proc.returncode,
             )
         except TimeoutError:
@@ -31,6 +31,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass, field
 from enum import StrEnum
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
@@ -52,6 +53,7 @@ from jarvis.kernel.schemas import SkillRecord, SkillStatus
 # "afficher" vs "affichage" sont distincts — d'où le seuil bas.
 # Le matcher sémantique (embeddings) reviendra en PHASE 5.x si besoin.
 _MATCH_THRESHOLD = 0.2
+_TOKEN_RE = re.compile(r"[a-zA-ZÀ-ÿ0-9_-]+")
 _STOP_WORDS = frozenset(
     {
         "de",
@@ -141,6 +143,11 @@ class WhitelistDomain:
     max_access_level: str = "WRITE_LOCAL"
     allowed_categories: list[str] = field(default_factory=list)
     description_must_contain: list[str] = field(default_factory=list)
+    # Mots-clés en minuscules, calculés une fois : matches() ne re-lower plus par appel.
+    _keywords_lower: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._keywords_lower = tuple(k.lower() for k in self.description_must_contain)
 
 
 @dataclass
@@ -176,8 +183,7 @@ class Whitelist:
         """Trouve un domaine whitelisté qui matche la description (cf. PHASE 5.x)."""
         low = description.lower()
         for dom in self.domains:
-            keywords = [k.lower() for k in dom.description_must_contain]
-            if keywords and any(k in low for k in keywords):
+            if any(k in low for k in dom._keywords_lower):
                 return dom
         return None
 
@@ -185,13 +191,18 @@ class Whitelist:
 # ── Heuristique de matching textuel ──────────────────────────────────────────
 
 
-def _tokenize(text: str) -> set[str]:
-    """Tokens lowercase, sans stop-words, sans ponctuation."""
-    tokens = re.findall(r"[a-zA-ZÀ-ÿ0-9_-]+", text.lower())
-    return {t for t in tokens if t not in _STOP_WORDS and len(t) > 2}
+@lru_cache(maxsize=1024)
+def _tokenize(text: str) -> frozenset[str]:
+    """Tokens lowercase, sans stop-words, sans ponctuation.
+
+    Mémoïsé : les textes du catalogue (skills installées, tools natifs) sont les
+    mêmes à chaque détection, seule la description du besoin change.
+    """
+    tokens = _TOKEN_RE.findall(text.lower())
+    return frozenset(t for t in tokens if t not in _STOP_WORDS and len(t) > 2)
 
 
-def _jaccard(a: set[str], b: set[str]) -> float:
+def _jaccard(a: frozenset[str], b: frozenset[str]) -> float:
     if not a or not b:
         return 0.0
     return len(a & b) / len(a | b)
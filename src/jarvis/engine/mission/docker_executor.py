@@ -10,12 +10,36 @@ Un container par projet : créé au démarrage, détruit à la fin.
 from __future__ import annotations
 
 import asyncio
+import time
 from pathlib import Path
 
 from loguru import logger
 
 from jarvis.kernel.settings import settings
 
+# Résultat du dernier `docker ps` : (time.monotonic(), disponible). Sonde appelée
+# par le worker, le Lab et chaque DockerBackend — un daemon figé ne doit pas
+# bloquer ces appels, ni être re-sondé à chaque fois.
+_AVAILABLE_TTL_S = 30.0
+_AVAILABLE_PROBE_TIMEOUT_S = 5.0
+_available_cache: tuple[float, bool] | None = None
+
+# Blocs d'arguments fixes, construits une fois au chargement du module : seules
+# les parties dépendant du projet ou des settings sont assemblées à chaque appel.
+_RUN_ISOLATION_ARGS = (
+    "--rm",
+    "--read-only",
+    "--tmpfs",
+    "/tmp:rw,size=100m",
+    "--security-opt",
+    "no-new-privileges",
+    "--cap-drop",
+    "ALL",
+)
+_KEEPALIVE_CMD = ("tail", "-f", "/dev/null")
+_EXEC_WORKDIR_ARGS = ("-w", "/workspace")
+_KILL_ALL_CMD = ("sh", "-c", "kill -9 -1")
+
 
 class DockerExecutor:
     """Gère l'exécution de commandes dans un container Docker isolé par projet."""
@@ -37,26 +61,16 @@ class DockerExecutor:
             "-d",
             "--name",
             self._container_name,
-            "--rm",
+            *_RUN_ISOLATION_ARGS,
             f"--memory={settings.docker_memory_limit}",
             f"--cpus={settings.docker_cpu_limit}",
             "--network",
             self._network,
-            "--read-only",
-            "--tmpfs",
-            "/tmp:rw,size=100m",
-            "--security-opt",
-            "no-new-privileges",
-            "--cap-drop",
-            "ALL",
             "-v",
             f"{self._workspace}:/workspace:rw",
-            "-w",
-            "/workspace",
+            *_EXEC_WORKDIR_ARGS,
             settings.docker_base_image,
-            "tail",
-            "-f",
-            "/dev/null",
+            *_KEEPALIVE_CMD,
         ]
 
         proc = await asyncio.create_subprocess_exec(
@@ -98,16 +112,7 @@ class DockerExecutor:
         if not self._container_id:
             raise RuntimeError(f"Container {self._container_name} not started")
 
-        cmd = [
-            "docker",
-            "exec",
-            "-w",
-            "/workspace",
-            self._container_name,
-            "sh",
-            "-c",
-            command,
-        ]
+        cmd = ["docker", "exec", *_EXEC_WORKDIR_ARGS, self._container_name, "sh", "-c", command]
 
         try:
             proc = await asyncio.create_subprocess_exec(
@@ -133,9 +138,7 @@ class DockerExecutor:
                     "docker",
                     "exec",
                     self._container_name,
-                    "sh",
-                    "-c",
-                    "kill -9 -1",
+                    *_KILL_ALL_CMD,
                     stdout=asyncio.subprocess.DEVNULL,
                     stderr=asyncio.subprocess.DEVNULL,
                 )
@@ -170,7 +173,13 @@ class DockerExecutor:
 
     @staticmethod
     async def is_available() -> bool:
-        """Vérifie que Docker est installé et que le daemon tourne."""
+        """Vérifie que Docker est installé et que le daemon tourne (résultat gardé 30 s)."""
+        global _available_cache
+
+        now = time.monotonic()
+        if _available_cache is not None and now - _available_cache[0] < _AVAILABLE_TTL_S:
+            return _available_cache[1]
+
         try:
             proc = await asyncio.create_subprocess_exec(
                 "docker",
@@ -178,7 +187,17 @@ class DockerExecutor:
                 stdout=asyncio.subprocess.DEVNULL,
                 stderr=asyncio.subprocess.DEVNULL,
             )
-            await proc.communicate()
-            return proc.returncode == 0
         except FileNotFoundError:
-            return False
+            available = False
+        else:
+            try:
+                await asyncio.wait_for(proc.communicate(), timeout=_AVAILABLE_PROBE_TIMEOUT_S)
+                available = proc.returncode == 0
+            except TimeoutError:
+                proc.kill()
+                await proc.wait()
+                logger.warning("docker ps ne répond pas — Docker considéré indisponible")
+                available = False
+
+        _available_cache = (time.monotonic(), available)
+        return available
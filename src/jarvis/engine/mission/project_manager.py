@@ -16,6 +16,8 @@ from jarvis.engine.mission.schemas import Project, Step, StepStatus
 from jarvis.engine.vocab import AccessLevel
 from jarvis.kernel.contracts import LLMProvider
 
+_CODE_FENCE_RE = re.compile(r"```json|```")
+
 _PLANNING_SYSTEM = """\
 Tu es un chef de projet expert. Analyse la demande utilisateur et décompose-la en étapes
 précises et exécutables par un agent autonome travaillant dans un workspace isolé.
@@ -296,7 +298,7 @@ class ProjectManager:
         }
 
     def _parse_plan(self, raw: str) -> dict:
-        clean = re.sub(r"```json|```", "", raw).strip()
+        clean = _CODE_FENCE_RE.sub("", raw).strip()
         try:
             return json.loads(clean)
         except json.JSONDecodeError as e:
@@ -7,7 +7,8 @@
 from __future__ import annotations
 
 import json
-import uuid
+import os
+import secrets
 from datetime import datetime
 from pathlib import Path
 
@@ -18,13 +19,46 @@ from jarvis.kernel.paths import WORKSPACE_DIR as _WORKSPACE
 
 WORKSPACE_DIR = _WORKSPACE / "projects"
 
+# state.json est réécrit à chaque transition de step : sans indent, json.dumps
+# passe par l'encodeur C (indent impose l'encodeur Python pur).
+_STATE_ENCODER = json.JSONEncoder(default=str)
+
+_TAIL_BLOCK = 64 * 1024
+
+
+def _tail_lines(path: Path, n: int) -> list[bytes]:
+    """Les `n` dernières lignes de `path`, lues depuis la fin du fichier.
+
+    logs.jsonl ne fait que grossir pendant une mission : on recule par blocs depuis
+    la fin jusqu'à avoir assez de lignes au lieu de lire et découper tout le fichier.
+    Les lignes vides (dont les sauts de ligne finaux) ne comptent pas dans les `n`.
+    """
+    if n <= 0:
+        return []
+    lines: list[bytes] = []
+    with path.open("rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        data = b""
+        while pos > 0:
+            size = min(_TAIL_BLOCK, pos)
+            pos -= size
+            f.seek(pos)
+            data = f.read(size) + data
+            raw = data.splitlines()
+            if pos > 0:
+                raw = raw[1:]  # ligne coupée par le début du premier bloc lu
+            lines = [line for line in raw if line.strip()]
+            if len(lines) >= n:
+                break
+    return lines[-n:]
+
 
 class ProjectStore:
     def __init__(self) -> None:
         WORKSPACE_DIR.mkdir(parents=True, exist_ok=True)
 
     def create_project(self, mission: str, title: str, timeout_minutes: int = 30) -> Project:
-        project_id = f"proj_{uuid.uuid4().hex[:6]}"
+        project_id = f"proj_{secrets.token_hex(3)}"
         workspace = WORKSPACE_DIR / project_id
         (workspace / ".jarvis").mkdir(parents=True, exist_ok=True)
 
@@ -40,17 +74,14 @@ class ProjectStore:
 
     def save_project(self, project: Project) -> None:
         state_file = Path(project.workspace_path) / ".jarvis" / "state.json"
-        state_file.write_text(
-            json.dumps(self._to_dict(project), indent=2, default=str),
-            encoding="utf-8",
-        )
+        state_file.write_text(_STATE_ENCODER.encode(self._to_dict(project)), encoding="utf-8")
 
     def load_project(self, project_id: str) -> Project | None:
         state_file = WORKSPACE_DIR / project_id / ".jarvis" / "state.json"
         if not state_file.exists():
             return None
         try:
-            data = json.loads(state_file.read_text(encoding="utf-8"))
+            data = json.loads(state_file.read_bytes())
             return self._from_dict(data)
         except Exception:
             return None
@@ -83,9 +114,8 @@ class ProjectStore:
         log_file = Path(project.workspace_path) / ".jarvis" / "logs.jsonl"
         if not log_file.exists():
             return []
-        lines = log_file.read_text(encoding="utf-8").strip().splitlines()
         entries: list[LogEntry] = []
-        for line in lines[-last_n:]:
+        for line in _tail_lines(log_file, last_n):
             try:
                 d = json.loads(line)
                 entries.append(
@@ -10,10 +10,16 @@ from __future__ import annotations
 
 import ast
 import re
+import stat
 from pathlib import Path
 
 from loguru import logger
 
+# Références locales d'un HTML (compilées une fois, pas à chaque check)
+_CSS_REF_RE = re.compile(r'href=["\']([^"\']+\.css)["\']')
+_JS_REF_RE = re.compile(r'src=["\']([^"\']+\.js)["\']')
+_IMG_REF_RE = re.compile(r'src=["\']([^"\']+\.(?:png|jpg|jpeg|svg|webp|gif))["\']')
+
 
 class QualityChecker:
     def __init__(self, workspace_path: str) -> None:
@@ -22,19 +28,27 @@ class QualityChecker:
     # ── File checks ───────────────────────────────────────────────────────────
 
     def check_file_not_empty(self, file_path: str) -> bool:
-        target = self._workspace / file_path
-        return target.exists() and target.stat().st_size > 0
+        try:
+            return (self._workspace / file_path).stat().st_size > 0
+        except OSError:
+            return False
 
     def list_all_files(self) -> list[dict]:
         """Liste tous les fichiers du workspace (hors .jarvis) avec métadonnées."""
         files = []
         for f in self._workspace.rglob("*"):
-            if f.is_file() and ".jarvis" not in str(f):
+            if ".jarvis" in str(f):
+                continue
+            try:
+                st = f.stat()
+            except OSError:
+                continue
+            if stat.S_ISREG(st.st_mode):
                 rel = str(f.relative_to(self._workspace))
                 files.append(
                     {
                         "path": rel,
-                        "size": f.stat().st_size,
+                        "size": st.st_size,
                         "extension": f.suffix,
                     }
                 )
@@ -54,19 +68,19 @@ class QualityChecker:
         content = html_file.read_text(encoding="utf-8", errors="replace")
         missing = []
 
-        for ref in re.findall(r'href=["\']([^"\']+\.css)["\']', content):
+        for ref in _CSS_REF_RE.findall(content):
             if not ref.startswith(("http://", "https://", "//", "data:")):
                 target = (self._workspace / Path(html_path).parent / ref).resolve()
                 if not target.exists():
                     missing.append(f"CSS manquant: {ref}")
 
-        for ref in re.findall(r'src=["\']([^"\']+\.js)["\']', content):
+        for ref in _JS_REF_RE.findall(content):
             if not ref.startswith(("http://", "https://", "//", "data:")):
                 target = (self._workspace / Path(html_path).parent / ref).resolve()
                 if not target.exists():
                     missing.append(f"JS manquant: {ref}")
 
-        for ref, _ in re.findall(r'src=["\']([^"\']+\.(png|jpg|jpeg|svg|webp|gif))["\']', content):
+        for ref in _IMG_REF_RE.findall(content):
             if not ref.startswith(("http://", "https://", "//", "data:")):
                 target = (self._workspace / Path(html_path).parent / ref).resolve()
                 if not target.exists():
@@ -176,19 +176,18 @@ class Reflexion:
 
     @staticmethod
     def _build_prompt(project: Project) -> str:
-        steps_summary = []
+        # Toutes les lignes dans une seule liste, jointes une fois (pas de += par étape).
+        steps_summary: list[str] = []
+        append = steps_summary.append
         for s in project.steps:
-            row = (
-                f"  - [{s.status.value:<18}] {s.title}"
-                f"\n      success_criterion: {s.success_criterion[:120]}"
-            )
+            append(f"  - [{s.status.value:<18}] {s.title}")
+            append(f"      success_criterion: {s.success_criterion[:120]}")
             if s.error:
-                row += f"\n      ERROR: {s.error[:200]}"
+                append(f"      ERROR: {s.error[:200]}")
             if s.verification_notes:
-                row += f"\n      verif_notes: {s.verification_notes[:200]}"
+                append(f"      verif_notes: {s.verification_notes[:200]}")
             if s.output:
-                row += f"\n      output: {s.output[:200]}"
-            steps_summary.append(row)
+                append(f"      output: {s.output[:200]}")
         steps_text = "\n".join(steps_summary) or "  (aucune étape exécutée)"
 
         return (
@@ -256,8 +255,11 @@ class Reflexion:
 
     @staticmethod
     def _build_metadata(project: Project, lesson: MissionLesson) -> dict:
-        n_done = sum(1 for s in project.steps if s.status == StepStatus.DONE)
-        n_failed = sum(1 for s in project.steps if s.status == StepStatus.FAILED)
+        by_status: dict[StepStatus, int] = {}
+        for s in project.steps:
+            by_status[s.status] = by_status.get(s.status, 0) + 1
+        n_done = by_status.get(StepStatus.DONE, 0)
+        n_failed = by_status.get(StepStatus.FAILED, 0)
         return {
             "project_id": project.id,
             "project_status": project.status.value,
@@ -15,12 +15,13 @@ appeler le LLM ; la sémantique ne re-vérifie pas la syntaxe.
 
 from __future__ import annotations
 
-import json
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 from loguru import logger
+from pydantic import TypeAdapter, ValidationError
 
 from jarvis.engine.mission.quality_checker import QualityChecker
 from jarvis.engine.mission.schemas import Project, Step
@@ -29,6 +30,9 @@ from jarvis.kernel.contracts import LLMProvider
 # Plafond de contenu inclus dans le prompt sémantique (caractères).
 # Au-dessus, on tronque pour ne pas exploser les tokens.
 _MAX_CONTENT_CHARS = 6000
+# Validateur construit une fois : parse JSON + contrôle "objet" en une passe (pydantic-core),
+# au lieu de json.loads puis isinstance à chaque verdict.
+_VERDICT_ADAPTER: TypeAdapter[dict[str, Any]] = TypeAdapter(dict[str, Any])
 _MAX_FILES_INCLUDED = 10
 
 
@@ -233,12 +237,9 @@ class Verifier:
                 clean = clean[:-3]
             clean = clean.strip()
         try:
-            parsed = json.loads(clean)
-        except json.JSONDecodeError:
+            return _VERDICT_ADAPTER.validate_json(clean)
+        except ValidationError:
             return None
-        if not isinstance(parsed, dict):
-            return None
-        return parsed
 
     def _workspace_summary(self) -> str:
         """Liste compacte des fichiers du workspace (top 20)."""
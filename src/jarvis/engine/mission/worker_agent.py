@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import asyncio
 import json
-import uuid
+import secrets
 from collections.abc import Awaitable, Callable
 from datetime import datetime
 from pathlib import Path
@@ -234,7 +234,7 @@ class WorkerAgent:
         self._approval_cb = approval_callback
         self._llm = llm
         self._budget = budget_guard
-        self._worker_id = uuid.uuid4().hex[:8]  # identifiant unique pour les claims
+        self._worker_id = secrets.token_hex(4)  # identifiant unique pour les claims
         self._file_tool = SandboxedFileTool(project.workspace_path)
         self._cli_tool = WorkerCLITool(project.workspace_path)
         self._docker = None
@@ -751,7 +751,7 @@ class WorkerAgent:
             description=f"{name} {json.dumps(inputs)[:200]}",
         )
         decision = self._governance.gate(
-            ctx, f"tool:{name}:{self._project.id}:{uuid.uuid4().hex[:6]}"
+            ctx, f"tool:{name}:{self._project.id}:{secrets.token_hex(3)}"
         )
         if decision == GateDecision.AUTO:
             return None
@@ -762,7 +762,7 @@ class WorkerAgent:
                 f"bloquée par configuration utilisateur (catégorie NEVER ou budget hard_stop)."
             )
         # APPROVAL ou DRY_RUN → demander à l'humain
-        approval_id = f"tool-{uuid.uuid4().hex[:6]}"
+        approval_id = f"tool-{secrets.token_hex(3)}"
         approved = await self._approval_cb(
             self._project.id,
             approval_id,
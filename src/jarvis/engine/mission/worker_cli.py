@@ -7,6 +7,7 @@
 from __future__ import annotations
 
 import re
+from dataclasses import asdict
 from pathlib import Path
 
 from loguru import logger
@@ -67,6 +68,9 @@ WORKER_CLI_WHITELIST: list[str] = [
     "false",
 ]
 
+# Préfixes en tuple : un seul str.startswith par segment au lieu d'une boucle any()
+_WHITELIST_PREFIXES = tuple(WORKER_CLI_WHITELIST)
+
 # Patterns bloqués inconditionnellement dans chaque segment de commande
 _BLOCKED_RE = re.compile(
     r"rm\s+-[a-z]*r"  # suppression récursive
@@ -88,9 +92,42 @@ _BLOCKED_RE = re.compile(
     re.IGNORECASE,
 )
 
+# Désobfuscation avant la blocklist (cf. _normalize) : $'\x62ash', ${IFS}, quotes/backslashes
+_ANSI_C_RE = re.compile(r"\$'((?:[^'\\]|\\.)*)'")
+_ANSI_C_ESCAPE_RE = re.compile(r"\\(?:x([0-9A-Fa-f]{1,2})|([0-7]{1,3}))")
+_IFS_RE = re.compile(r"\$\{IFS\}|\$IFS(?![A-Za-z0-9_])")
+_STRIP_QUOTES = str.maketrans("", "", "'\"\\")
+
+
+def _decode_ansi_c(m: re.Match[str]) -> str:
+    """Contenu d'une chaîne ANSI-C $'...' avec ses échappements hexa/octaux décodés."""
+    return _ANSI_C_ESCAPE_RE.sub(
+        lambda e: chr(int(e.group(1), 16)) if e.group(1) else chr(int(e.group(2), 8)),
+        m.group(1),
+    )
+
+
+def _normalize(command: str) -> str:
+    """Approximation de ce que /bin/sh exécutera, pour la blocklist uniquement.
+
+    Défait les obfuscations qui échappent à une recherche textuelle : chaînes
+    ANSI-C hexa/octales, `ba''sh`, backslashes, `rm${IFS}-rf`, coupure
+    backslash + retour ligne.
+    """
+    if "$'" in command:
+        command = _ANSI_C_RE.sub(_decode_ansi_c, command)
+    command = command.replace("\\\n", "")
+    if "IFS" in command:
+        command = _IFS_RE.sub(" ", command)
+    return command.translate(_STRIP_QUOTES)
+
+
 # Découpe les chaînes de commandes séparées par && ou ;
 _SEP_RE = re.compile(r"\s*(?:&&|;)\s*")
 
+# Commande python/python3 suivie d'arguments
+_PYTHON_CMD_RE = re.compile(r"python3?\s")
+
 # Détecte un flag -c ou un guillemet dans une commande python/python3
 _PYTHON_INLINE_RE = re.compile(r"\s+-c\b|['\"`]")
 
@@ -105,21 +142,15 @@ class WorkerCLITool:
         self._docker = docker_executor  # None = V1 direct, DockerExecutor = V2
 
     def _check_segment(self, segment: str) -> dict | None:
-        """Valide un segment de commande individuel ; retourne un dict d'erreur ou None."""
+        """Valide un segment (whitelist, python inline) ; retourne un dict d'erreur ou None.
+
+        La blocklist est vérifiée en amont par _check, sur la commande entière.
+        """
         stripped = segment.strip()
         if not stripped:
             return None
 
-        if _BLOCKED_RE.search(stripped):
-            logger.error("WorkerCLI blocked", command=stripped[:80])
-            return {
-                "success": False,
-                "stdout": "",
-                "stderr": f"Commande bloquée par la politique de sécurité : {stripped[:60]}",
-                "returncode": -1,
-            }
-
-        if not any(stripped.startswith(w) for w in WORKER_CLI_WHITELIST):
+        if not stripped.startswith(_WHITELIST_PREFIXES):
             logger.warning("WorkerCLI not whitelisted", command=stripped[:80])
             return {
                 "success": False,
@@ -132,7 +163,7 @@ class WorkerCLITool:
             }
 
         # python/python3 : seule l'exécution de fichiers .py est autorisée
-        if re.match(r"python3?\s", stripped) and _PYTHON_INLINE_RE.search(stripped):
+        if _PYTHON_CMD_RE.match(stripped) and _PYTHON_INLINE_RE.search(stripped):
             logger.error("WorkerCLI python inline bloqué", command=stripped[:80])
             return {
                 "success": False,
@@ -147,7 +178,27 @@ class WorkerCLITool:
         return None
 
     def _check(self, command: str) -> dict | None:
-        """Valide la commande complète segment par segment (sépare && et ;)."""
+        """Valide la commande complète : blocklist en un passage, puis segment par segment.
+
+        Aucun motif de _BLOCKED_RE ne peut chevaucher un séparateur && ou ; —
+        une recherche sur la commande entière trouve exactement ce qu'aurait
+        trouvé la recherche segment par segment, en un seul scan. La forme
+        désobfusquée n'est scannée en plus que si elle diffère du texte brut :
+        elle ne peut qu'ajouter des refus.
+        """
+        blocked = _BLOCKED_RE.search(command)
+        if blocked is None:
+            normalized = _normalize(command)
+            if normalized != command:
+                blocked = _BLOCKED_RE.search(normalized)
+        if blocked:
+            logger.error("WorkerCLI blocked", command=command[:80], match=blocked.group(0))
+            return {
+                "success": False,
+                "stdout": "",
+                "stderr": f"Commande bloquée par la politique de sécurité : {command[:60]}",
+                "returncode": -1,
+            }
         for segment in _SEP_RE.split(command):
             err = self._check_segment(segment)
             if err:
@@ -180,4 +231,4 @@ class WorkerCLITool:
             }
 
         logger.debug("WorkerCLI → backend", backend=backend.name, cmd=command[:60])
-        return dict(await backend.execute(command, timeout))
+        return asdict(await backend.execute(command, timeout))
@@ -14,15 +14,13 @@ from datetime import datetime
 from pathlib import Path
 
 import httpx
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
 from loguru import logger
 
 from jarvis.engine.proactive.collectors.base import CollectorBase
 from jarvis.engine.proactive.schemas import ContextItem, ItemType, Priority
 from jarvis.kernel.connectivity import is_offline_mode
 from jarvis.kernel.settings import settings
+from jarvis.kernel.tls import tls_context
 
 _SCOPES = ["https://www.googleapis.com/auth/gmail.readonly"]
 _GMAIL_BASE = "https://gmail.googleapis.com/gmail/v1/users/me"
@@ -70,6 +68,11 @@ def _extract_text_body(payload: dict) -> str:
 
 
 def _load_gmail_creds(credentials_path: Path, token_path: Path):  # noqa: ANN202
+    # Imports Google différés : google.auth.transport.requests tire `requests`
+    # (urllib3, charset_normalizer, certifi) — inutile au boot et en mode local.
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+    from google_auth_oauthlib.flow import InstalledAppFlow
 
     creds = None
     if token_path.exists():
@@ -110,7 +113,7 @@ class EmailCollector(CollectorBase):
     async def _fetch_messages(self, access_token: str) -> list[ContextItem]:
         headers = {"Authorization": f"Bearer {access_token}"}
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
+        async with httpx.AsyncClient(timeout=60.0, verify=tls_context()) as client:
             r = await client.get(
                 f"{_GMAIL_BASE}/messages",
                 headers=headers,
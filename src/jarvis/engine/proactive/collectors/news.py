@@ -12,7 +12,6 @@ from __future__ import annotations
 import asyncio
 from datetime import datetime
 
-import feedparser
 from loguru import logger
 
 from jarvis.engine.proactive.collectors.base import CollectorBase
@@ -29,7 +28,7 @@ RSS_FEEDS = [
     {"url": "https://www.maddyness.com/feed/", "category": "business_fr"},
 ]
 
-RELEVANT_KEYWORDS = [
+RELEVANT_KEYWORDS = (
     "esp32",
     "raspberry pi",
     "arduino",
@@ -52,7 +51,7 @@ RELEVANT_KEYWORDS = [
     "levée de fonds",
     "youtube",
     "créateur",
-]
+)
 
 
 class NewsCollector(CollectorBase):
@@ -76,6 +75,9 @@ class NewsCollector(CollectorBase):
         return items[:15]
 
     def _fetch_feed(self, feed_config: dict) -> list[ContextItem]:
+        # Import différé : feedparser (~35 ms) n'est utile qu'au premier cycle de collecte
+        import feedparser
+
         try:
             feed = feedparser.parse(feed_config["url"])
             items = []
@@ -13,6 +13,7 @@ from jarvis.engine.proactive.collectors.base import CollectorBase
 from jarvis.engine.proactive.schemas import ContextItem, ItemType, Priority
 from jarvis.kernel.connectivity import is_offline_mode
 from jarvis.kernel.settings import settings
+from jarvis.kernel.tls import tls_context
 
 
 class WeatherCollector(CollectorBase):
@@ -37,7 +38,7 @@ class WeatherCollector(CollectorBase):
             f"&timezone=Europe%2FParis"
         )
 
-        async with httpx.AsyncClient(timeout=5.0) as client:
+        async with httpx.AsyncClient(timeout=5.0, verify=tls_context()) as client:
             response = await client.get(url)
             if response.status_code != 200:
                 logger.warning(f"WeatherCollector: HTTP {response.status_code}")
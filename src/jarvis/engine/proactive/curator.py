@@ -376,13 +376,12 @@ class Curator:
         except Exception as exc:  # noqa: BLE001
             logger.warning("Curator: initiatives load échec", error=str(exc))
             return
-        report.initiatives_pending = sum(1 for i in recent if i.status == "pending")
-        report.initiatives_validated_recent = sum(1 for i in recent if i.status == "approved")
-        report.initiatives_rejected_recent = sum(1 for i in recent if i.status == "rejected")
-
-        # Propose review pour initiatives pending > 3 jours (probablement obsolètes)
+        # Un seul passage : comptage par statut + review des pending > 3 jours
+        # (probablement obsolètes).
+        by_status: dict[str, int] = {}
         now = datetime.now()
         for i in recent:
+            by_status[i.status] = by_status.get(i.status, 0) + 1
             if i.status != "pending":
                 continue
             age_days = (now - i.created_at).total_seconds() / 86400.0
@@ -399,6 +398,9 @@ class Curator:
                         reason=f"pending_for={age_days:.0f}j",
                     )
                 )
+        report.initiatives_pending = by_status.get("pending", 0)
+        report.initiatives_validated_recent = by_status.get("approved", 0)
+        report.initiatives_rejected_recent = by_status.get("rejected", 0)
 
     # ── Garde-fou §11 — refus patches protégés ────────────────────────────────
 
@@ -11,7 +11,7 @@ Dispatche les initiatives selon leur mode d'exécution.
 from __future__ import annotations
 
 import asyncio
-import uuid
+import secrets
 from collections import deque
 from collections.abc import Callable
 from dataclasses import asdict, dataclass
@@ -44,17 +44,21 @@ class ProactiveAuditEvent:
     decided_at: str  # ISO UTC
 
 
+# Peu de mots courts par source : `w in text` (recherche C) bat une alternance
+# regex compilée ou un automate multi-motifs, dont le coût par appel domine ici.
+_SOURCE_KEYWORDS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("email", ("email", "mail", "inbox")),
+    ("calendrier", ("calendar", "agenda", "event", "rdv")),
+    ("notion", ("notion", "tâche", "task")),
+    ("météo", ("météo", "weather", "pluie", "soleil")),
+    ("mémoire", ("memory", "mémoire", "session")),
+)
+
+
 def _extract_sources(initiative: Initiative) -> list[str]:
     """Infère les sources d'information utilisées pour cette initiative."""
     text = f"{initiative.context} {initiative.reasoning}".lower()
-    keywords: dict[str, list[str]] = {
-        "email": ["email", "mail", "inbox"],
-        "calendrier": ["calendar", "agenda", "event", "rdv"],
-        "notion": ["notion", "tâche", "task"],
-        "météo": ["météo", "weather", "pluie", "soleil"],
-        "mémoire": ["memory", "mémoire", "session"],
-    }
-    found = [k for k, words in keywords.items() if any(w in text for w in words)]
+    found = [k for k, words in _SOURCE_KEYWORDS if any(w in text for w in words)]
     return found or ["proactive_context"]
 
 
@@ -195,7 +199,7 @@ class ProactiveEngine:
     def _dispatch(self, initiative: Initiative) -> None:
         """Dispatche une initiative selon son mode d'exécution."""
         audit = ProactiveAuditEvent(
-            event_id=f"aud_{uuid.uuid4().hex[:8]}",
+            event_id=f"aud_{secrets.token_hex(4)}",
             initiative_id=initiative.id,
             initiative_title=initiative.title,
             decision=str(initiative.execution_mode),
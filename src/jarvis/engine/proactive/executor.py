@@ -20,7 +20,7 @@ GARDE-FOU CENTRAL :
 
 from __future__ import annotations
 
-import uuid
+import secrets
 from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 from pathlib import Path
@@ -242,7 +242,7 @@ class InitiativeExecutor:
     def _audit(self, init: Initiative, step: str, result: dict) -> None:
         event = {
             "type": "initiative_audit",
-            "event_id": f"aud_{uuid.uuid4().hex[:8]}",
+            "event_id": f"aud_{secrets.token_hex(4)}",
             "initiative_id": init.id,
             "initiative_title": init.title,
             "initiative_type": str(init.type),
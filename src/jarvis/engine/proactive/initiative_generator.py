@@ -8,9 +8,10 @@ InitiativeGenerator — analyse l'état du monde et génère des initiatives.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import re
-import uuid
+import secrets
 
 from loguru import logger
 
@@ -23,13 +24,26 @@ MAX_HIGH = 3
 _PRIORITY_ORDER = {"high": 0, "medium": 1, "low": 2}
 
 
+# Pré-compilés : appelés pour chaque paire de titres lors de la déduplication
+_NON_WORD_RE = re.compile(r"\W+")
+_WORD_RE = re.compile(r"\w+")
+
+_CODE_FENCE_RE = re.compile(r"```json|```")
+# Brouillons regroupés par appel LLM : au-delà, la qualité par brouillon baisse
+# et un échec de parsing coûte plus cher à rattraper.
+_DRAFT_BATCH_MAX = 8
+# Appels brouillon simultanés (lots ou repli unitaire) : les allers-retours se
+# recouvrent sans dépasser le rate-limit du provider.
+_DRAFT_CONCURRENCY = 4
+
+
 def _title_key(title: str) -> str:
-    return re.sub(r"\W+", "", title.lower())
+    return _NON_WORD_RE.sub("", title.lower())
 
 
 def _word_overlap(a: str, b: str) -> float:
-    wa = set(re.findall(r"\w+", a.lower()))
-    wb = set(re.findall(r"\w+", b.lower()))
+    wa = set(_WORD_RE.findall(a.lower()))
+    wb = set(_WORD_RE.findall(b.lower()))
     if not wa and not wb:
         return 1.0
     if not wa or not wb:
@@ -205,6 +219,7 @@ Réponds UNIQUEMENT en JSON valide, sans markdown, sans explication :
 }
 """
 
+
 def _initiative_system(name: str, profile: str = "") -> str:
     """Prompt système du moteur d'initiatives, personnalisé au prénom + bio."""
     header = f"\nTu es le moteur d'analyse proactif de Jarvis, assistant personnel de {name}."
@@ -222,6 +237,16 @@ def _draft_system(name: str) -> str:
     )
 
 
+def _drafts_batch_system(name: str) -> str:
+    return (
+        f"\nTu es Jarvis, assistant de {name}. Tu rédiges plusieurs brouillons d'email\n"
+        "professionnels, indépendants les uns des autres : chacun direct, 3 phrases max\n"
+        "(50 mots max), sans salutation formelle inutile, en français.\n"
+        "Réponds UNIQUEMENT avec un tableau JSON de chaînes — un corps de message par\n"
+        "brouillon demandé, dans le même ordre.\n"
+    )
+
+
 def _rectify_system(name: str) -> str:
     return (
         f"\nTu es Jarvis, assistant proactif de {name}. Tu dois régénérer une initiative\n"
@@ -245,6 +270,7 @@ class InitiativeGenerator:
         self._name = user_firstname
         self._initiative_system = _initiative_system(user_firstname, user_profile)
         self._draft_system = _draft_system(user_firstname)
+        self._drafts_batch_system = _drafts_batch_system(user_firstname)
         self._rectify_system = _rectify_system(user_firstname)
 
     async def generate(self, state: WorldState) -> list[Initiative]:
@@ -277,24 +303,106 @@ class InitiativeGenerator:
         initiatives = self._parse_initiatives(response)
 
         # Générer les brouillons séparément pour ne pas saturer le JSON principal
-        for init in initiatives:
-            if init.type == InitiativeType.DRAFT_RESPONSE:
-                init.draft_content = await self._generate_draft(init)
+        drafts = [i for i in initiatives if i.type == InitiativeType.DRAFT_RESPONSE]
+        # Un seul plafond pour tout le passage : lots et replis unitaires confondus.
+        sem = asyncio.Semaphore(_DRAFT_CONCURRENCY)
+        await asyncio.gather(
+            *(
+                self._generate_drafts(drafts[start : start + _DRAFT_BATCH_MAX], sem)
+                for start in range(0, len(drafts), _DRAFT_BATCH_MAX)
+            )
+        )
 
         return initiatives
 
-    async def _generate_draft(self, init: Initiative) -> str | None:
-        """Génère le brouillon email pour une initiative draft_response."""
+    @staticmethod
+    def _draft_brief(init: Initiative) -> str:
+        return (
+            f"Initiative : {init.title}\n"
+            f"Contexte : {init.context}\n"
+            f"Action : {init.action}\n"
+            f"Destinataire : {getattr(init, '_to_email', None) or ''}\n"
+            f"Sujet de l'email original : {getattr(init, '_email_subject', None) or ''}"
+        )
+
+    @staticmethod
+    def _draft_with_header(init: Initiative, body: str) -> str:
         to_email = getattr(init, "_to_email", None) or ""
         subject = getattr(init, "_email_subject", None) or ""
         thread_id = getattr(init, "_thread_id", None) or ""
+        header = f"À: {to_email}\nSujet: RE: {subject}"
+        if thread_id:
+            header += f"\n[THREAD_ID: {thread_id}]"
+        return f"{header}\n---\n{body}"
 
+    async def _generate_drafts(
+        self, inits: list[Initiative], sem: asyncio.Semaphore | None = None
+    ) -> None:
+        """Remplit draft_content pour un lot d'initiatives en un seul appel LLM.
+
+        Un aller-retour et un prompt système pour N brouillons au lieu de N. Si la
+        réponse n'est pas un tableau JSON de N chaînes, repli brouillon par brouillon.
+        `sem` borne les appels LLM simultanés, partagé entre les lots d'un passage.
+        """
+        if sem is None:
+            sem = asyncio.Semaphore(_DRAFT_CONCURRENCY)
+        if len(inits) == 1:
+            await self._generate_drafts_one_by_one(inits, sem)
+            return
+
+        briefs = "\n\n".join(
+            f"### Brouillon {n}\n{self._draft_brief(init)}" for n, init in enumerate(inits, 1)
+        )
         prompt = (
-            f"Initiative : {init.title}\n"
-            f"Contexte : {init.context}\n"
-            f"Action : {init.action}\n"
-            f"Destinataire : {to_email}\n"
-            f"Sujet de l'email original : {subject}\n\n"
+            f"{briefs}\n\n"
+            f"Rédige le corps des {len(inits)} brouillons de réponse (50 mots max, "
+            "3 phrases chacun). Tableau JSON de chaînes, dans l'ordre."
+        )
+        try:
+            async with sem:
+                raw = await self._llm.complete(
+                    messages=[{"role": "user", "content": prompt}],
+                    system=self._drafts_batch_system,
+                    stream=False,
+                    context="proactive",
+                )
+                if not isinstance(raw, str):
+                    chunks: list[str] = []
+                    async for chunk in raw:
+                        chunks.append(chunk)
+                    raw = "".join(chunks)
+            bodies = json.loads(_CODE_FENCE_RE.sub("", raw).strip())
+        except Exception as e:
+            logger.warning(f"Batch draft generation failed: {e}")
+            bodies = None
+
+        if (
+            not isinstance(bodies, list)
+            or len(bodies) != len(inits)
+            or not all(isinstance(b, str) and b.strip() for b in bodies)
+        ):
+            logger.debug("Batch drafts unusable — fallback one by one", count=len(inits))
+            await self._generate_drafts_one_by_one(inits, sem)
+            return
+
+        for init, body in zip(inits, bodies, strict=True):
+            init.draft_content = self._draft_with_header(init, body.strip())
+
+    async def _generate_drafts_one_by_one(
+        self, inits: list[Initiative], sem: asyncio.Semaphore
+    ) -> None:
+        """Un appel par brouillon, lancés en parallèle (bornés par `sem`)."""
+
+        async def _one(init: Initiative) -> None:
+            async with sem:
+                init.draft_content = await self._generate_draft(init)
+
+        await asyncio.gather(*(_one(init) for init in inits))
+
+    async def _generate_draft(self, init: Initiative) -> str | None:
+        """Génère le brouillon email pour une initiative draft_response."""
+        prompt = (
+            f"{self._draft_brief(init)}\n\n"
             "Rédige le corps du brouillon de réponse (50 mots max, 3 phrases)."
         )
         try:
@@ -309,12 +417,7 @@ class InitiativeGenerator:
                 async for chunk in body:
                     chunks.append(chunk)
                 body = "".join(chunks)
-            body = body.strip()
-
-            header = f"À: {to_email}\nSujet: RE: {subject}"
-            if thread_id:
-                header += f"\n[THREAD_ID: {thread_id}]"
-            return f"{header}\n---\n{body}"
+            return self._draft_with_header(init, body.strip())
         except Exception as e:
             logger.warning(f"Draft generation failed for {init.id}: {e}")
             return None
@@ -348,17 +451,13 @@ class InitiativeGenerator:
                 chunks.append(chunk)
             response = "".join(chunks)
 
-        clean = re.sub(r"```json|```", "", response).strip()
-        # Accepter objet seul ou tableau d'un élément
-        if clean.startswith("["):
-            try:
-                items = json.loads(clean)
-                clean = json.dumps(items[0]) if items else clean
-            except Exception:
-                pass
+        clean = _CODE_FENCE_RE.sub("", response).strip()
 
         try:
             item = json.loads(clean)
+            # Accepter objet seul ou tableau d'un élément (un seul parse, pas de re-dump)
+            if isinstance(item, list):
+                item = item[0]
             return Initiative(
                 id=initiative.id,  # garde le même id
                 type=InitiativeType(item.get("type", initiative.type)),
@@ -377,7 +476,7 @@ class InitiativeGenerator:
             return None
 
     def _parse_initiatives(self, raw: str) -> list[Initiative]:
-        clean = re.sub(r"```json|```", "", raw).strip()
+        clean = _CODE_FENCE_RE.sub("", raw).strip()
 
         # Récupération défensive si JSON tronqué
         if clean and not _is_valid_json(clean):
@@ -393,7 +492,7 @@ class InitiativeGenerator:
             for item in data.get("initiatives", [])[:MAX_INITIATIVES]:
                 try:
                     init = Initiative(
-                        id=f"init_{uuid.uuid4().hex[:8]}",
+                        id=f"init_{secrets.token_hex(4)}",
                         type=InitiativeType(item.get("type", "info")),
                         title=item.get("title", "")[:80],
                         context=item.get("context", "")[:150],
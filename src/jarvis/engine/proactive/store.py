@@ -11,21 +11,25 @@ from __future__ import annotations
 
 import json
 import re
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
 from jarvis.engine.proactive.schemas import ExecutionMode, Initiative, InitiativeType, Priority
 from jarvis.engine.vocab import AutonomyLevel
 from jarvis.kernel.paths import MEMORY_DATA_DIR
 
+# Pré-compilés : appelés pour chaque paire de titres lors de la déduplication
+_NON_WORD_RE = re.compile(r"\W+")
+_WORD_RE = re.compile(r"\w+")
+
 
 def _title_key(title: str) -> str:
-    return re.sub(r"\W+", "", title.lower())
+    return _NON_WORD_RE.sub("", title.lower())
 
 
 def _jaccard(a: str, b: str) -> float:
-    wa = set(re.findall(r"\w+", a.lower()))
-    wb = set(re.findall(r"\w+", b.lower()))
+    wa = set(_WORD_RE.findall(a.lower()))
+    wb = set(_WORD_RE.findall(b.lower()))
     if not wa and not wb:
         return 1.0
     if not wa or not wb:
@@ -35,8 +39,8 @@ def _jaccard(a: str, b: str) -> float:
 
 def _shares_keyword(a: str, b: str, min_len: int = 7) -> bool:
     """True if both titles share at least one meaningful word of length ≥ min_len."""
-    wa = {w for w in re.findall(r"\w+", a.lower()) if len(w) >= min_len}
-    wb = {w for w in re.findall(r"\w+", b.lower()) if len(w) >= min_len}
+    wa = {w for w in _WORD_RE.findall(a.lower()) if len(w) >= min_len}
+    wb = {w for w in _WORD_RE.findall(b.lower()) if len(w) >= min_len}
     return bool(wa & wb)
 
 
@@ -68,8 +72,6 @@ class InitiativeStore:
     def _days_files(self, days: int) -> list[Path]:
         """Retourne les fichiers JSONL des N derniers jours CALENDAIRES,
         triés du plus ancien au plus récent."""
-        from datetime import date, timedelta
-
         cutoff = (date.today() - timedelta(days=days - 1)).strftime("%Y-%m-%d")
         return sorted(f for f in INITIATIVES_DIR.glob("*.jsonl") if f.stem >= cutoff)
 
@@ -104,7 +106,8 @@ class InitiativeStore:
         """Retourne le fichier JSONL qui contient l'initiative, ou None."""
         for f in reversed(self._days_files(days)):
             for line in f.read_text(encoding="utf-8").splitlines():
-                if not line:
+                # Préfiltre texte : on ne décode que les lignes qui citent l'id.
+                if not line or initiative_id not in line:
                     continue
                 try:
                     if json.loads(line).get("id") == initiative_id:
@@ -228,7 +231,7 @@ class InitiativeStore:
         """Recherche une initiative par ID sur les N derniers jours (plus récent en premier)."""
         for f in reversed(self._days_files(days)):
             for line in f.read_text(encoding="utf-8").splitlines():
-                if not line:
+                if not line or initiative_id not in line:
                     continue
                 try:
                     data = json.loads(line)
@@ -251,13 +254,16 @@ class InitiativeStore:
         for line in lines:
             if not line:
                 continue
-            try:
-                data = json.loads(line)
-                if data.get("id") == initiative_id:
-                    data.update(updates)
-                line = json.dumps(data)
-            except Exception:
-                pass
+            # Les autres lignes sont recopiées telles quelles (déjà sérialisées
+            # par save()) : seule la ligne ciblée est décodée puis réencodée.
+            if initiative_id in line:
+                try:
+                    data = json.loads(line)
+                    if data.get("id") == initiative_id:
+                        data.update(updates)
+                        line = json.dumps(data)
+                except Exception:
+                    pass
             updated.append(line)
 
         log_file.write_text("\n".join(updated) + "\n", encoding="utf-8")
@@ -273,13 +279,16 @@ class InitiativeStore:
         for line in lines:
             if not line:
                 continue
-            try:
-                data = json.loads(line)
-                if data.get("id") == initiative_id:
-                    data["status"] = status
-                line = json.dumps(data)
-            except Exception:
-                pass
+            # Les autres lignes sont recopiées telles quelles (déjà sérialisées
+            # par save()) : seule la ligne ciblée est décodée puis réencodée.
+            if initiative_id in line:
+                try:
+                    data = json.loads(line)
+                    if data.get("id") == initiative_id:
+                        data["status"] = status
+                        line = json.dumps(data)
+                except Exception:
+                    pass
             updated.append(line)
 
         log_file.write_text("\n".join(updated) + "\n", encoding="utf-8")
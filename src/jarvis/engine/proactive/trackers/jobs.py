@@ -10,7 +10,7 @@ Stockage JSON dans memory_data/jobs.json.
 from __future__ import annotations
 
 import json
-import uuid
+import secrets
 from dataclasses import asdict, dataclass
 from datetime import date, datetime
 from enum import StrEnum
@@ -77,7 +77,7 @@ class JobTracker:
 
     def add(self, company: str, role: str, notes: str = "", url: str = "") -> JobApplication:
         app = JobApplication(
-            id=f"job_{uuid.uuid4().hex[:8]}",
+            id=f"job_{secrets.token_hex(4)}",
             company=company,
             role=role,
             status=JobStatus.APPLIED,
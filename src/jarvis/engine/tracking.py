@@ -193,11 +193,13 @@ class UsageTracker:
                 total_cost += cost
                 total_tokens += tok
 
-                if prov not in prov_acc:
-                    prov_acc[prov] = {"cost": 0.0, "tokens": 0, "chars": 0}
-                prov_acc[prov]["cost"] += cost
-                prov_acc[prov]["tokens"] += tok
-                prov_acc[prov]["chars"] += chars
+                # Accumulateur du provider résolu une fois par entrée (et non 4 lookups)
+                acc = prov_acc.get(prov)
+                if acc is None:
+                    acc = prov_acc[prov] = {"cost": 0.0, "tokens": 0, "chars": 0}
+                acc["cost"] += cost
+                acc["tokens"] += tok
+                acc["chars"] += chars
 
                 # Classify by usage type
                 if prov in ("elevenlabs", "deepgram"):
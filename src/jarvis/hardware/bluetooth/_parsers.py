@@ -23,6 +23,29 @@ _BT_ID_MAP = {
     "joystick": "gamepad · BT",
 }
 
+# Nom réduit à une adresse MAC (device sans nom lisible) → ignoré
+_MAC_ONLY_RE = re.compile(r"[0-9A-Fa-f:]+")
+
+# Drivers internes listés par Get-PnpDevice, à ne pas afficher
+_BT_WINDOWS_SKIP_RE = re.compile(
+    r"(?i)enumerator|microsoft\s+bluetooth|^\s*intel\(r\)\s+wireless\s+bluetooth|"
+    r"realtek\s+bluetooth|broadcom\s+bluetooth|virtual|rfcomm|"
+    r"generic\s+attribute|device\s+association|le\s+audio|"
+    r"^bluetooth\s+device\s*\("
+)
+
+# Type d'un device Windows déduit de son FriendlyName : clé de _BT_ID_MAP → mots-clés.
+# Une seule regex (un groupe nommé par type) au lieu d'une cascade de `in`.
+_BT_WINDOWS_KINDS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("mouse", ("mouse",)),
+    ("keyboard", ("keyboard",)),
+    ("headphones", ("headphone", "headset", "airpods", "buds")),
+    ("gamepad", ("gamepad", "controller", "xbox", "dualshock")),
+)
+_BT_WINDOWS_KIND_RE = re.compile(
+    "|".join(f"(?P<{kind}>{'|'.join(map(re.escape, words))})" for kind, words in _BT_WINDOWS_KINDS)
+)
+
 
 def parse_bt_macos(out: str, devices: list) -> None:
     """Parse la sortie de `system_profiler SPBluetoothDataType` (macOS).
@@ -37,7 +60,7 @@ def parse_bt_macos(out: str, devices: list) -> None:
         if not d:
             return
         name = d["_name"]
-        if re.fullmatch(r"[0-9A-Fa-f:]+", name):
+        if _MAC_ONLY_RE.fullmatch(name):
             return
         bt_type = d["_type"] or "Device"
         connected = d["_connected"]
@@ -100,12 +123,6 @@ def parse_bt_windows(devices: list) -> None:
     Pousse dans `devices` un dict UI-shaped par device détecté. Filtre les
     drivers internes (énumérateur Microsoft, Realtek/Broadcom adapters, etc.).
     """
-    skip = re.compile(
-        r"(?i)enumerator|microsoft\s+bluetooth|^\s*intel\(r\)\s+wireless\s+bluetooth|"
-        r"realtek\s+bluetooth|broadcom\s+bluetooth|virtual|rfcomm|"
-        r"generic\s+attribute|device\s+association|le\s+audio|"
-        r"^bluetooth\s+device\s*\("
-    )
     ps = (
         "Get-PnpDevice -Class 'Bluetooth' -PresentOnly | "
         "Select-Object FriendlyName,Status | ConvertTo-Json -Compress"
@@ -121,7 +138,7 @@ def parse_bt_windows(devices: list) -> None:
     seen: set[str] = set()
     for item in items:
         name = (item.get("FriendlyName") or "").strip() or "Unknown"
-        if skip.search(name):
+        if _BT_WINDOWS_SKIP_RE.search(name):
             continue
         key = name.lower()
         if key in seen:
@@ -129,17 +146,8 @@ def parse_bt_windows(devices: list) -> None:
         seen.add(key)
         status = (item.get("Status") or "Unknown").strip()
         ok = status == "OK"
-        nl = name.lower()
-        if "mouse" in nl:
-            bt_id = _BT_ID_MAP["mouse"]
-        elif "keyboard" in nl:
-            bt_id = _BT_ID_MAP["keyboard"]
-        elif "headphone" in nl or "headset" in nl or "airpods" in nl or "buds" in nl:
-            bt_id = _BT_ID_MAP["headphones"]
-        elif "gamepad" in nl or "controller" in nl or "xbox" in nl or "dualshock" in nl:
-            bt_id = _BT_ID_MAP["gamepad"]
-        else:
-            bt_id = "bluetooth · BT"
+        kind = _BT_WINDOWS_KIND_RE.search(key)
+        bt_id = _BT_ID_MAP[kind.lastgroup] if kind else "bluetooth · BT"
         devices.append(
             {
                 "name": name,
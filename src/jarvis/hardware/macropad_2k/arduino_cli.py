@@ -5,10 +5,8 @@
 from __future__ import annotations
 
 import os
-import platform
 import shutil
 import subprocess
-import sys
 import tarfile
 import tempfile
 import urllib.request
@@ -19,6 +17,8 @@ from pathlib import Path
 from loguru import logger
 
 from jarvis.hardware.macropad_2k.paths import arduino_cli_dir, arduino_cli_executable
+from jarvis.kernel.host import IS_WINDOWS, SYSTEM
+from jarvis.kernel.host import machine as host_machine
 
 DEFAULT_VERSION = "1.4.1"
 
@@ -34,19 +34,27 @@ FQBN = (
 
 ProgressCallback = Callable[[str], None]
 
+# Au-delà de ce seuil (Content-Length), copie par blocs de 1 Mio au lieu des
+# 64 Kio par défaut de shutil — l'archive arduino-cli fait ~30 Mo.
+_LARGE_DOWNLOAD_BYTES = 16 * 1024 * 1024
+_LARGE_COPY_BUFSIZE = 1024 * 1024
+
+# Dernier arduino-cli trouvé, avec la valeur d'ARDUINO_CLI à ce moment-là.
+# Évite mkdir + recherche PATH à chaque appel (statut UI, chaque flash).
+_found_cli: tuple[str | None, Path] | None = None
+
 
 def _detect_arduino_archive_name(version: str) -> tuple[str, str]:
-    sys_name = platform.system()
-    machine = platform.machine().lower()
+    machine = host_machine()
 
-    if sys_name == "Windows":
+    if SYSTEM == "windows":
         if machine in ("amd64", "x86_64", "arm64", "aarch64"):
             base = "Windows_64bit"
             ext = "zip"
         else:
             base = "Windows_32bit"
             ext = "zip"
-    elif sys_name == "Darwin":
+    elif SYSTEM == "darwin":
         if machine in ("arm64", "aarch64"):
             base = "macOS_ARM64"
             ext = "tar.gz"
@@ -90,12 +98,14 @@ def install_arduino_cli(
     version: str = DEFAULT_VERSION,
     progress: ProgressCallback | None = None,
 ) -> Path:
+    global _found_cli
     exe = arduino_cli_executable()
     if exe.is_file():
         return exe
 
     url = arduino_cli_download_url(version)
     name, ext = _detect_arduino_archive_name(version)
+    _found_cli = None
     if progress:
         progress(f"Downloading {name} from {url}")
     logger.info("Downloading arduino-cli {}", url)
@@ -104,7 +114,11 @@ def install_arduino_cli(
     with tempfile.TemporaryDirectory() as tmp:
         archive = Path(tmp) / name
         with urllib.request.urlopen(url, timeout=120) as resp, archive.open("wb") as out:
-            shutil.copyfileobj(resp, out)
+            size = int(resp.headers.get("Content-Length") or 0)
+            if size > _LARGE_DOWNLOAD_BYTES:
+                shutil.copyfileobj(resp, out, _LARGE_COPY_BUFSIZE)
+            else:
+                shutil.copyfileobj(resp, out)
         if progress:
             progress("Extracting archive")
         _extract_archive(archive, target_dir, ext)
@@ -118,9 +132,12 @@ def install_arduino_cli(
     if not exe.is_file():
         raise RuntimeError(f"arduino-cli installed but executable not found at {exe}")
 
-    if not sys.platform.startswith("win"):
+    if not IS_WINDOWS:
+        # L'archive tar conserve en général le bit x : chmod seulement s'il manque
         try:
-            os.chmod(exe, 0o755)
+            mode = exe.stat().st_mode
+            if not mode & 0o111:
+                os.chmod(exe, mode | 0o755)
         except OSError:
             pass
 
@@ -131,7 +148,16 @@ def install_arduino_cli(
 
 
 def find_arduino_cli() -> Path | None:
+    global _found_cli
     env = os.environ.get("ARDUINO_CLI")
+    if _found_cli is not None and _found_cli[0] == env and _found_cli[1].is_file():
+        return _found_cli[1]
+    found = _resolve_arduino_cli(env)
+    _found_cli = (env, found) if found is not None else None
+    return found
+
+
+def _resolve_arduino_cli(env: str | None) -> Path | None:
     if env:
         p = Path(env)
         if p.is_file():
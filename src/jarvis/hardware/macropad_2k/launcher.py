@@ -7,16 +7,16 @@ from __future__ import annotations
 import json
 import os
 import subprocess
-import sys
 from pathlib import Path
 
 from loguru import logger
 
 from jarvis.hardware.macropad_2k.paths import launchers_dir
+from jarvis.kernel.host import IS_WINDOWS
 
 
 def is_windows() -> bool:
-    return sys.platform.startswith("win")
+    return IS_WINDOWS
 
 
 def list_installed_apps() -> list[dict[str, str]]:
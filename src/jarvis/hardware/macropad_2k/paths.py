@@ -5,9 +5,10 @@
 from __future__ import annotations
 
 import os
-import sys
 from pathlib import Path
 
+from jarvis.kernel.host import IS_WINDOWS
+
 
 def project_root() -> Path:
     return Path(__file__).resolve().parent.parent
@@ -51,7 +52,7 @@ def arduino_cli_dir() -> Path:
 
 
 def arduino_cli_executable() -> Path:
-    name = "arduino-cli.exe" if sys.platform.startswith("win") else "arduino-cli"
+    name = "arduino-cli.exe" if IS_WINDOWS else "arduino-cli"
     return arduino_cli_dir() / name
 
 
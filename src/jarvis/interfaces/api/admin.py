@@ -10,6 +10,7 @@ from pathlib import Path
 
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import Response
+from loguru import logger
 from pydantic import BaseModel
 
 from jarvis.engine.background.notifications import NotificationQueue
@@ -18,7 +19,7 @@ from jarvis.engine.background.worker import BackgroundWorker
 from jarvis.interfaces.api.ui import inject_client_config
 from jarvis.kernel.paths import PROJECT_ROOT, UI_STATIC_DIR
 from jarvis.kernel.settings import settings
-from jarvis.providers.memory.sessions import SessionStore
+from jarvis.providers.memory.sessions import SessionStore, count_entries
 
 _PROJECT_ROOT = PROJECT_ROOT
 
@@ -89,8 +90,7 @@ async def list_sessions(request: Request) -> list[SessionMeta]:
         date = parts[0] if len(parts) == 2 else "?"
         session_id = parts[1] if len(parts) == 2 else path.stem
         try:
-            lines = [ln for ln in path.read_text(encoding="utf-8").splitlines() if ln.strip()]
-            count = len(lines)
+            count = count_entries(path)
         except OSError:
             count = 0
         result.append(
@@ -239,15 +239,31 @@ async def get_tasks(request: Request) -> dict:
 # ── Mise à jour ───────────────────────────────────────────────
 
 
+_READ_CHUNK = 64 * 1024
+_OUTPUT_TAIL_BYTES = 256 * 1024
+
+
 async def _run(cmd: str) -> tuple[int, str]:
+    """Lance `cmd` à la racine du projet ; renvoie (code retour, sortie stdout+stderr).
+
+    La sortie est relayée dans les logs au fil de l'eau (un `uv sync` qui télécharge
+    ne ressemble plus à un blocage) et seuls ses _OUTPUT_TAIL_BYTES derniers octets
+    sont gardés pour le détail renvoyé à l'UI.
+    """
     proc = await asyncio.create_subprocess_shell(
         cmd,
         stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
         cwd=str(_PROJECT_ROOT),
     )
-    out, err = await proc.communicate()
-    return proc.returncode, (out + err).decode().strip()
+    if proc.stdout is None:
+        raise RuntimeError(f"{cmd} : stdout non capturé")
+    tail = bytearray()
+    while chunk := await proc.stdout.read(_READ_CHUNK):
+        logger.info("{cmd} | {out}", cmd=cmd, out=chunk.decode(errors="replace").rstrip())
+        tail += chunk
+        del tail[:-_OUTPUT_TAIL_BYTES]
+    return await proc.wait(), tail.decode(errors="replace").strip()
 
 
 @router.post("/system/update")
@@ -20,6 +20,7 @@ from fastapi import APIRouter, Request
 from jarvis.analytics.registry import analytics_registry
 from jarvis.engine.mission.project_store import ProjectStore
 from jarvis.kernel.paths import MEMORY_DATA_DIR
+from jarvis.kernel.tls import tls_context
 
 router = APIRouter()
 
@@ -53,7 +54,8 @@ async def get_jarvis_stats(days: int = 30) -> dict:
             if created:
                 if isinstance(created, str):
                     try:
-                        created = datetime.fromisoformat(created.replace("Z", "+00:00"))
+                        # fromisoformat accepte le suffixe "Z" depuis Python 3.11.
+                        created = datetime.fromisoformat(created)
                     except ValueError:
                         created = None
                 if created and created >= cutoff:
@@ -70,7 +72,9 @@ async def get_jarvis_stats(days: int = 30) -> dict:
     if conso_dir.exists():
         for f in sorted(conso_dir.glob("*.jsonl")):
             try:
-                file_date = datetime.strptime(f.stem, "%Y-%m-%d").replace(tzinfo=UTC)
+                # Parseur ISO en C : strptime repasse par une regex dépendante de la locale
+                # (verrou + cache) pour chaque fichier du dossier conso.
+                file_date = datetime.fromisoformat(f.stem).replace(tzinfo=UTC)
                 if file_date < cutoff:
                     continue
             except ValueError:
@@ -114,7 +118,7 @@ async def get_youtube_stats(days: int = 7) -> dict:
     try:
         import httpx
 
-        async with httpx.AsyncClient(timeout=10) as client:
+        async with httpx.AsyncClient(timeout=10, verify=tls_context()) as client:
             # Abonnés + vues totales
             ch_resp = await client.get(
                 "https://www.googleapis.com/youtube/v3/channels",
@@ -13,12 +13,12 @@ from __future__ import annotations
 
 import asyncio
 import os
-import sys
 
 from fastapi import APIRouter, Request
 from loguru import logger
 from pydantic import BaseModel
 
+from jarvis.kernel.host import IS_MACOS
 from jarvis.providers.youtube import get_youtube_snapshot
 
 router = APIRouter()
@@ -61,7 +61,7 @@ async def open_safari_window(url: str, bounds: list[int] | None) -> bool:
     No-op + warning hors macOS (le backend doit tourner en local sur le Mac filmé).
     Le positionnement exige les permissions Automatisation + Accessibilité.
     """
-    if sys.platform != "darwin":
+    if not IS_MACOS:
         logger.warning("[briefing] open-url ignoré (non macOS) : {}", url)
         return False
     if not url.startswith(("https://", "http://")):
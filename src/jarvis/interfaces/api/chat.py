@@ -4,9 +4,12 @@
 
 from __future__ import annotations
 
+import os
+import secrets
 from collections.abc import AsyncGenerator
 
-from fastapi import APIRouter, Request
+import aiohttp
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import StreamingResponse
 from livekit.api import (
     AccessToken,
@@ -20,7 +23,7 @@ from pydantic import BaseModel
 from jarvis.engine.background.notifications import broadcast_event
 from jarvis.engine.background.worker import BackgroundTask
 from jarvis.engine.router import RouteEnum
-from jarvis.kernel.settings import settings
+from jarvis.kernel.settings import LIVEKIT_ENV_KEYS, settings
 from jarvis.providers.audio.tts import tts_engine
 
 router = APIRouter()
@@ -108,15 +111,16 @@ async def voice_generate(body: VoiceGenerateRequest, request: Request) -> Stream
     message_original = body.message
 
     async def _stream() -> AsyncGenerator[str, None]:
-        full = ""
         try:
             if isinstance(response, str):
                 full = response
                 yield response
             else:
+                parts: list[str] = []
                 async for chunk in response:
-                    full += chunk
+                    parts.append(chunk)
                     yield chunk
+                full = "".join(parts)
         except Exception as e:
             from loguru import logger as _log
 
@@ -150,19 +154,47 @@ async def voice_generate(body: VoiceGenerateRequest, request: Request) -> Stream
     )
 
 
-@router.get("/api/voice/token")
-async def get_voice_token(session_id: str | None = None) -> dict:  # noqa: ARG001
-    """Génère un token LiveKit et dispatche l'agent jarvis dans la room."""
-    import os
-    import uuid
+# Session HTTP partagée entre les demandes de token : chaque reconnexion du micro
+# réutilise la connexion keep-alive vers le serveur LiveKit au lieu de refaire
+# le handshake TCP/TLS (LiveKitAPI ne ferme pas une session fournie).
+# Timeout explicite : le twirp LiveKit lit session.timeout.total, le défaut aiohttp
+# (300 s) laissait une demande de token pendre 5 min sur un serveur muet.
+_LIVEKIT_TIMEOUT = aiohttp.ClientTimeout(total=10)
+_livekit_http: aiohttp.ClientSession | None = None
+
+
+def _livekit_session() -> aiohttp.ClientSession:
+    """Session créée au premier appel, donc dans la boucle qui sert les requêtes."""
+    global _livekit_http
+    if _livekit_http is None or _livekit_http.closed:
+        _livekit_http = aiohttp.ClientSession(timeout=_LIVEKIT_TIMEOUT)
+    return _livekit_http
 
-    api_key = os.getenv("LIVEKIT_API_KEY")
-    api_secret = os.getenv("LIVEKIT_API_SECRET")
-    livekit_url = os.getenv("LIVEKIT_URL")
 
-    room_name = f"jarvis-{uuid.uuid4().hex[:8]}"
+async def close_livekit_session() -> None:
+    """Ferme la session LiveKit partagée (arrêt de l'app)."""
+    global _livekit_http
+    if _livekit_http is not None and not _livekit_http.closed:
+        await _livekit_http.close()
+    _livekit_http = None
 
-    async with LiveKitAPI(url=livekit_url, api_key=api_key, api_secret=api_secret) as lkapi:
+
+@router.get("/api/voice/token")
+async def get_voice_token(session_id: str | None = None) -> dict:  # noqa: ARG001
+    """Génère un token LiveKit et dispatche l'agent jarvis dans la room."""
+    # Relu à chaque appel (éditable depuis les réglages), mais validé avant tout
+    # appel réseau : une clé absente échouait loin dans le SDK LiveKit.
+    creds = {k: (os.getenv(k) or "").strip() for k in LIVEKIT_ENV_KEYS}
+    missing = [k for k, v in creds.items() if not v]
+    if missing:
+        raise HTTPException(status_code=503, detail=f"LiveKit non configuré : {', '.join(missing)}")
+    livekit_url, api_key, api_secret = creds.values()
+
+    room_name = f"jarvis-{secrets.token_hex(4)}"
+
+    async with LiveKitAPI(
+        url=livekit_url, api_key=api_key, api_secret=api_secret, session=_livekit_session()
+    ) as lkapi:
         await lkapi.room.create_room(CreateRoomRequest(name=room_name))
         await lkapi.agent_dispatch.create_dispatch(
             CreateAgentDispatchRequest(room=room_name, agent_name="jarvis")
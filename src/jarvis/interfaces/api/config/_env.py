@@ -15,6 +15,9 @@ from pathlib import Path
 
 _ENV_PATH = Path(".env")
 
+# ((chemin absolu, mtime_ns, taille), clés parsées) du dernier .env lu.
+_env_cache: tuple[tuple[str, int, int], dict[str, str]] | None = None
+
 _SENSITIVE_KEYS = {
     "ANTHROPIC_API_KEY",
     "ELEVENLABS_API_KEY",
@@ -111,20 +114,33 @@ def _mask(value: str) -> str:
 
 
 def _read_env() -> dict[str, str]:
-    if not _ENV_PATH.exists():
+    """Clés du .env. Reparse uniquement si le fichier a changé (mtime + taille).
+
+    Les pages Réglages / Appareils relisent le .env à chaque GET ; un stat()
+    suffit tant que personne ne l'a réécrit. Copie rendue : l'appelant peut muter.
+    """
+    global _env_cache
+    try:
+        st = _ENV_PATH.stat()
+    except FileNotFoundError:
+        _env_cache = None
         return {}
-    result: dict[str, str] = {}
-    for line in _ENV_PATH.read_text(encoding="utf-8-sig").splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" in line:
-            key, _, val = line.partition("=")
-            result[key.strip()] = val.strip()
-    return result
+    stamp = (str(_ENV_PATH.resolve()), st.st_mtime_ns, st.st_size)
+    if _env_cache is None or _env_cache[0] != stamp:
+        result: dict[str, str] = {}
+        for line in _ENV_PATH.read_text(encoding="utf-8-sig").splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if "=" in line:
+                key, _, val = line.partition("=")
+                result[key.strip()] = val.strip()
+        _env_cache = (stamp, result)
+    return dict(_env_cache[1])
 
 
 def _write_env(updates: dict[str, str]) -> None:
+    global _env_cache
     lines = _ENV_PATH.read_text(encoding="utf-8-sig").splitlines() if _ENV_PATH.exists() else []
     written: set[str] = set()
     new_lines: list[str] = []
@@ -144,6 +160,8 @@ def _write_env(updates: dict[str, str]) -> None:
         if key not in written:
             new_lines.append(f"{key}={val}")
     _ENV_PATH.write_text("\n".join(new_lines) + "\n", encoding="utf-8")
+    # Réécriture dans la même tranche de mtime et à taille égale : pas de faux hit.
+    _env_cache = None
 
 
 def write_env_batch(updates: dict[str, str]) -> None:
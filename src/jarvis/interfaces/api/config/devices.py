@@ -27,11 +27,18 @@ from fastapi import APIRouter
 from jarvis.hardware.bluetooth import parse_bt_macos, parse_bt_windows
 from jarvis.hardware.macropad_2k.usb import usb_status
 from jarvis.interfaces.api.config._env import _read_env
+from jarvis.interfaces.api.system import _GIB
+from jarvis.kernel.host import SYSTEM, machine
 from jarvis.kernel.settings import settings as _s
 
 router = APIRouter()
 
 
+def _ram_label(used: int, total: int) -> str:
+    """« 7.9 / 16.0 GB » en un seul formatage (équivaut à round(x / _GIB, 1))."""
+    return f"{used / _GIB:.1f} / {total / _GIB:.1f} GB"
+
+
 @router.get("/api/settings/devices")
 async def get_devices() -> list:
     import platform
@@ -40,29 +47,31 @@ async def get_devices() -> list:
     import psutil
 
     devices: list[dict] = []
-    sys_name = platform.system()
 
     cpu_pct = psutil.cpu_percent(interval=0.2)
-    mem = psutil.virtual_memory()
-    ram_used = round(mem.used / (1024**3), 1)
-    ram_total = round(mem.total / (1024**3), 1)
     battery = psutil.sensors_battery()
 
-    if sys_name == "Darwin":
+    if SYSTEM == "darwin":
         try:
             model = subprocess.check_output(  # noqa: ASYNC221
                 ["sysctl", "-n", "hw.model"], text=True, timeout=3
             ).strip()
         except Exception:
             model = platform.node().replace(".local", "") or "Mac"
-        chip = platform.processor() or platform.machine()
-        host_id = f"mac · {chip}"
-    elif sys_name == "Windows":
+        host_id = f"mac · {machine()}"
+    elif SYSTEM == "windows":
         model = platform.node()
-        host_id = f"windows · {platform.machine()}"
+        host_id = f"windows · {machine()}"
     else:
         model = platform.node().replace(".local", "") or "Linux"
-        host_id = f"linux · {platform.machine()}"
+        host_id = f"linux · {machine()}"
+
+    if battery:
+        b_host = ["Battery", f"{int(battery.percent)}%"]
+    else:
+        # La RAM n'est affichée qu'en l'absence de batterie : pas de lecture sinon.
+        mem = psutil.virtual_memory()
+        b_host = ["RAM", _ram_label(mem.used, mem.total)]
 
     devices.append(
         {
@@ -71,11 +80,7 @@ async def get_devices() -> list:
             "status": "Active",
             "col": "green",
             "a": ["CPU", f"{cpu_pct}%"],
-            "b": (
-                ["Battery", f"{int(battery.percent)}%"]
-                if battery
-                else ["RAM", f"{ram_used} / {ram_total} GB"]
-            ),
+            "b": b_host,
             "type": "host",
         }
     )
@@ -114,7 +119,7 @@ async def get_devices() -> list:
     except Exception:
         pass
 
-    if sys_name == "Darwin":
+    if SYSTEM == "darwin":
         try:
             out = subprocess.check_output(  # noqa: ASYNC221
                 ["system_profiler", "SPBluetoothDataType"], text=True, timeout=6
@@ -122,7 +127,7 @@ async def get_devices() -> list:
             parse_bt_macos(out, devices)
         except Exception:
             pass
-    elif sys_name == "Windows":
+    elif SYSTEM == "windows":
         try:
             parse_bt_windows(devices)
         except Exception:
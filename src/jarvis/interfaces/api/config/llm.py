@@ -21,6 +21,7 @@ from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from jarvis.kernel.settings import settings as _s
+from jarvis.kernel.tls import tls_context
 
 router = APIRouter()
 
@@ -68,7 +69,7 @@ async def get_ollama_models() -> dict:
     """Liste les modèles téléchargés sur le serveur Ollama local."""
     base_url = _s.ollama_base_url.rstrip("/")
     try:
-        async with httpx.AsyncClient(timeout=4.0) as client:
+        async with httpx.AsyncClient(timeout=4.0, verify=tls_context()) as client:
             resp = await client.get(f"{base_url}/api/tags")
             resp.raise_for_status()
             data = resp.json()
@@ -88,7 +89,7 @@ async def pull_ollama_model(body: OllamaPullBody) -> StreamingResponse:
 
     async def _stream() -> AsyncIterator[str]:
         try:
-            async with httpx.AsyncClient(timeout=600.0) as client:
+            async with httpx.AsyncClient(timeout=600.0, verify=tls_context()) as client:
                 async with client.stream(
                     "POST",
                     f"{base_url}/api/pull",
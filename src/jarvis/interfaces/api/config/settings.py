@@ -34,10 +34,23 @@ from jarvis.interfaces.api.config._env import (
 )
 from jarvis.kernel.approvals import approval_config as _approval_cfg
 from jarvis.kernel.settings import settings as _s
+from jarvis.kernel.tls import tls_context
 from jarvis.providers.llm.factory import create_background_llm, get_llm_provider
 
 router = APIRouter()
 
+_TRUTHY = frozenset(("true", "1", "yes", "on"))
+# Graphies que _write_env et l'UI écrivent réellement : résolues sans allouer de
+# copie en minuscules ; les autres casses retombent sur .lower().
+_BOOL_LITERALS = dict.fromkeys(("true", "True", "TRUE", "1"), True) | dict.fromkeys(
+    ("false", "False", "FALSE", "0", ""), False
+)
+
+
+def _parse_bool(raw: str) -> bool:
+    known = _BOOL_LITERALS.get(raw)
+    return raw.lower() in _TRUTHY if known is None else known
+
 
 @router.get("/api/settings/env-status")
 async def get_env_status(keys: str = Query("")) -> dict:
@@ -64,7 +77,7 @@ async def get_settings_endpoint() -> dict:
         field_info = type(_s).model_fields.get(field)
         ann = field_info.annotation if field_info else None
         if ann is bool:
-            return raw.lower() in ("true", "1", "yes", "on")
+            return _parse_bool(raw)
         if ann is int:
             try:
                 return int(raw)
@@ -154,7 +167,7 @@ async def update_setting(request: Request, body: SettingUpdateBody) -> dict:
         annotation = field.annotation if field else None
         try:
             if annotation is bool:
-                converted: Any = body.value.lower() in ("true", "1", "yes", "on")
+                converted: Any = _parse_bool(body.value)
             elif annotation is int:
                 converted = int(body.value)
             elif annotation is float:
@@ -238,7 +251,7 @@ async def get_voices() -> list[dict]:
     if not key:
         return []
     try:
-        async with httpx.AsyncClient(timeout=8.0) as client:
+        async with httpx.AsyncClient(timeout=8.0, verify=tls_context()) as client:
             r = await client.get(
                 "https://api.elevenlabs.io/v1/voices",
                 headers={"xi-api-key": key},
@@ -262,7 +275,7 @@ async def test_api_key(body: TestKeyBody) -> dict:
 
     provider = body.provider.lower()
     try:
-        async with httpx.AsyncClient(timeout=8.0) as client:
+        async with httpx.AsyncClient(timeout=8.0, verify=tls_context()) as client:
             if provider == "anthropic":
                 r = await client.get(
                     "https://api.anthropic.com/v1/models",
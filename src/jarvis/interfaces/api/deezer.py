@@ -14,6 +14,7 @@ from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, Resp
 from loguru import logger
 
 from jarvis.kernel.settings import settings
+from jarvis.kernel.tls import tls_context
 
 router = APIRouter(prefix="/api/deezer")
 
@@ -88,7 +89,7 @@ async def deezer_callback(
         logger.error("Deezer OAuth error", error=error_reason)
         return RedirectResponse("/?deezer_error=1")
 
-    async with httpx.AsyncClient() as client:
+    async with httpx.AsyncClient(verify=tls_context()) as client:
         resp = await client.get(
             _TOKEN_URL,
             params={
@@ -126,7 +127,7 @@ async def _get_player_state() -> dict:
         return {"connected": False}
 
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
+        async with httpx.AsyncClient(timeout=5.0, verify=tls_context()) as client:
             resp = await client.get(
                 f"{_API_BASE}/user/me/history",
                 params={"access_token": token, "limit": 1},
@@ -172,7 +173,7 @@ async def _action(method: str, endpoint: str) -> JSONResponse:
     if not token:
         return JSONResponse({"ok": False}, status_code=401)
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
+        async with httpx.AsyncClient(timeout=5.0, verify=tls_context()) as client:
             fn = getattr(client, method)
             resp = await fn(
                 f"{_API_BASE}/user/me/player/{endpoint}",
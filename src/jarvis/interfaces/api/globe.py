@@ -17,6 +17,7 @@ from loguru import logger
 
 from jarvis.kernel.connectivity import is_offline_mode
 from jarvis.kernel.settings import settings
+from jarvis.kernel.tls import tls_context
 
 router = APIRouter(prefix="/api/globe", tags=["globe"])
 
@@ -84,12 +85,12 @@ def _region(lat: float, lon: float) -> str:
 # ── Flights — OpenSky Network (free, no auth) ──────────────────
 @router.get("/flights")
 async def get_flights() -> dict[str, Any]:
-    now = time.time()
+    now = time.monotonic()
     if _FLIGHTS_CACHE["data"] and now - _FLIGHTS_CACHE["ts"] < FLIGHTS_TTL:
         return _FLIGHTS_CACHE["data"]
 
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
+        async with httpx.AsyncClient(timeout=15, verify=tls_context()) as client:
             r = await client.get("https://opensky-network.org/api/states/all")
             r.raise_for_status()
             data = r.json()
@@ -165,7 +166,7 @@ async def get_flights() -> dict[str, Any]:
 # ── Weather — Open-Meteo (free, no auth) ───────────────────────
 @router.get("/weather")
 async def get_weather() -> dict[str, Any]:
-    now = time.time()
+    now = time.monotonic()
     if _WEATHER_CACHE["data"] and now - _WEATHER_CACHE["ts"] < WEATHER_TTL:
         return _WEATHER_CACHE["data"]
 
@@ -199,7 +200,7 @@ async def get_weather() -> dict[str, Any]:
                 "desc": "—",
             }
 
-    async with httpx.AsyncClient(timeout=10) as client:
+    async with httpx.AsyncClient(timeout=10, verify=tls_context()) as client:
         tasks = [_fetch_city(k, v, client) for k, v in CITIES.items()]
         pairs = await asyncio.gather(*tasks)
 
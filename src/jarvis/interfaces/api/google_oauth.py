@@ -11,6 +11,7 @@ import hashlib
 import json
 import os
 import secrets
+from functools import lru_cache
 from pathlib import Path
 
 from fastapi import APIRouter, Request
@@ -36,11 +37,21 @@ _GOOGLE_CERT_URI = "https://www.googleapis.com/oauth2/v1/certs"
 _pending: dict[str, dict] = {}
 
 
+@lru_cache(maxsize=16)
+def _public_base(base_url: str) -> str:
+    """Base publique des callbacks : https forcé hors loopback.
+
+    Mémoïsée : l'hôte ne change pas d'un appel à l'autre, et le flux OAuth
+    recalcule la même base pour chaque redirect_uri.
+    """
+    base = base_url.rstrip("/")
+    if base.startswith("https://") or "127.0.0.1" in base or "localhost" in base:
+        return base
+    return base.replace("http://", "https://", 1)
+
+
 def _redirect_uri(request: Request, service: str) -> str:
-    base = str(request.base_url).rstrip("/")
-    if not base.startswith("https://") and "127.0.0.1" not in base and "localhost" not in base:
-        base = base.replace("http://", "https://", 1)
-    return f"{base}/api/google/callback/{service}"
+    return f"{_public_base(str(request.base_url))}/api/google/callback/{service}"
 
 
 def _credentials_path() -> Path:
@@ -8,13 +8,15 @@ import asyncio
 import base64
 import shutil
 import sys
+import threading
 from pathlib import Path
-from urllib.parse import unquote, urlparse
+from urllib.parse import unquote
 
 from fastapi import APIRouter
 from fastapi.responses import JSONResponse
-from jeepney import DBusAddress, Properties, new_method_call
+from jeepney import DBusAddress, DBusErrorResponse, Message, Properties, new_method_call
 from jeepney.io.blocking import DBusConnection, open_dbus_connection
+from jeepney.wrappers import unwrap_msg
 from loguru import logger
 
 router = APIRouter(prefix="/api/local-music")
@@ -30,11 +32,23 @@ _MPRIS_PREFIX = "org.mpris.MediaPlayer2."
 _MPRIS_PATH = "/org/mpris/MediaPlayer2"
 _MPRIS_IFACE = "org.mpris.MediaPlayer2.Player"
 _MPRIS_METHODS = {"play": "Play", "pause": "Pause", "next": "Next", "previous": "Previous"}
+# Propriétés lues par le widget, relues une à une quand GetAll est refusé.
+_MPRIS_PROPS = ("PlaybackStatus", "Metadata", "Position")
 
 _DBUS_DAEMON = DBusAddress(
     "/org/freedesktop/DBus", bus_name="org.freedesktop.DBus", interface="org.freedesktop.DBus"
 )
 
+# Connexion au bus de session gardée entre deux polls (le widget sonde le lecteur en
+# continu) : socket + authentification SASL une seule fois au lieu d'une par requête.
+# DBusConnection bloquante n'est pas thread-safe et chaque appel passe par to_thread,
+# d'où le verrou.
+_bus_lock = threading.Lock()
+_bus: DBusConnection | None = None
+# Plafond par appel D-Bus : un lecteur figé ne doit pas garder _bus_lock (et le
+# thread du poll) indéfiniment. Au-delà, le lecteur est traité comme indisponible.
+_DBUS_TIMEOUT_S = 1.0
+
 
 def _backend() -> str | None:
     """Stratégie "now playing" : macOS (nowplaying-cli) ou Linux (MPRIS/D-Bus)."""
@@ -123,6 +137,13 @@ def _sniff_mime(data: bytes) -> str:
     return "image/png"
 
 
+def _file_url_path(url: str) -> str:
+    """Chemin d'une URL file:// (hôte, query et fragment ignorés) sans passer par urlparse."""
+    rest = url[len("file://") :].split("#", 1)[0].split("?", 1)[0]
+    _, sep, path = rest.partition("/")
+    return unquote(sep + path)
+
+
 def _resolve_art(art_url: str) -> str | None:
     """URL de pochette utilisable par le navigateur.
 
@@ -135,7 +156,7 @@ def _resolve_art(art_url: str) -> str | None:
         return art_url
     if art_url.startswith("file://"):
         try:
-            path = Path(unquote(urlparse(art_url).path))
+            path = Path(_file_url_path(art_url))
             if not path.is_file() or path.stat().st_size > _ART_MAX_BYTES:
                 return None
             data = path.read_bytes()
@@ -174,71 +195,121 @@ def _state_from_mpris(status: str, metadata: dict, position_us: int) -> dict:
     }
 
 
+def _session_bus() -> DBusConnection:
+    """Connexion au bus de session, ouverte au premier appel (appelant : sous _bus_lock)."""
+    global _bus
+    if _bus is None:
+        _bus = open_dbus_connection(bus="SESSION")
+    return _bus
+
+
+def _drop_session_bus() -> None:
+    """Ferme la connexion (bus redémarré, socket mort) : la suivante sera rouverte."""
+    global _bus
+    if _bus is not None:
+        try:
+            _bus.close()
+        except Exception:  # noqa: BLE001
+            pass
+        _bus = None
+
+
+def _call(conn: DBusConnection, msg: Message) -> tuple:
+    """Aller-retour D-Bus borné par _DBUS_TIMEOUT_S (TimeoutError au-delà).
+
+    Renvoie le corps de la réponse ; une réponse d'erreur lève DBusErrorResponse.
+    """
+    return unwrap_msg(conn.send_and_get_reply(msg, timeout=_DBUS_TIMEOUT_S))
+
+
 def _list_players(conn: DBusConnection) -> list[str]:
-    names = conn.send_and_get_reply(new_method_call(_DBUS_DAEMON, "ListNames")).body[0]
+    names = _call(conn, new_method_call(_DBUS_DAEMON, "ListNames"))[0]
     return [n for n in names if n.startswith(_MPRIS_PREFIX)]
 
 
-def _pick_player(conn: DBusConnection, players: list[str]) -> str:
-    """Préfère un lecteur en cours de lecture, sinon le premier disponible."""
+def _player_props(conn: DBusConnection, player: str) -> dict:
+    """Toutes les propriétés Player d'un lecteur en un seul aller-retour (GetAll, déballées).
+
+    Certains lecteurs refusent tout le GetAll dès qu'une propriété lève (Position
+    hors lecture…) : repli sur un Get par propriété utile, celles en erreur restent
+    absentes. Un timeout n'est pas rattrapé : le lecteur est figé, pas capricieux.
+    """
+    props = Properties(DBusAddress(_MPRIS_PATH, bus_name=player, interface=_MPRIS_IFACE))
+    try:
+        return {k: v[1] for k, v in _call(conn, props.get_all())[0].items()}
+    except DBusErrorResponse as e:
+        logger.debug("GetAll MPRIS refusé, lecture par propriété", player=player, error=str(e))
+    found: dict = {}
+    for name in _MPRIS_PROPS:
+        try:
+            found[name] = _call(conn, props.get(name))[0][1]
+        except DBusErrorResponse:
+            continue
+    if not found:
+        raise RuntimeError(f"{player} : aucune propriété lisible")
+    return found
+
+
+def _pick_player(conn: DBusConnection, players: list[str]) -> tuple[str, dict]:
+    """Préfère un lecteur en cours de lecture, sinon le premier qui répond.
+
+    Renvoie aussi ses propriétés : l'appelant n'a pas à réinterroger le lecteur.
+    """
+    first: tuple[str, dict] | None = None
     for p in players:
         try:
-            props = Properties(DBusAddress(_MPRIS_PATH, bus_name=p, interface=_MPRIS_IFACE))
-            status = conn.send_and_get_reply(props.get("PlaybackStatus")).body[0][1]
-            if status == "Playing":
-                return p
-        except Exception:  # noqa: BLE001
+            props = _player_props(conn, p)
+        except Exception:  # noqa: BLE001 — erreur ou timeout : lecteur indisponible
             continue
-    return players[0]
+        if props.get("PlaybackStatus") == "Playing":
+            return p, props
+        if first is None:
+            first = (p, props)
+    if first is None:
+        raise RuntimeError("aucun lecteur MPRIS ne répond")
+    return first
 
 
 def _mpris_state_blocking() -> dict:
     """Lit l'état MPRIS via D-Bus (bloquant — à lancer dans un thread)."""
-    try:
-        conn = open_dbus_connection(bus="SESSION")
-    except Exception as e:  # noqa: BLE001
-        logger.debug("Session D-Bus indisponible", error=str(e))
-        return {"connected": False}
-    try:
-        players = _list_players(conn)
-        if not players:
-            return {"connected": True, "is_playing": False, "track": None}
-        props = Properties(
-            DBusAddress(_MPRIS_PATH, bus_name=_pick_player(conn, players), interface=_MPRIS_IFACE)
-        )
-        status = conn.send_and_get_reply(props.get("PlaybackStatus")).body[0][1]
-        raw_meta = conn.send_and_get_reply(props.get("Metadata")).body[0][1]
-        metadata = {k: v[1] for k, v in raw_meta.items()}
+    with _bus_lock:
         try:
-            position = conn.send_and_get_reply(props.get("Position")).body[0][1]
-        except Exception:  # noqa: BLE001
-            position = 0
-        return _state_from_mpris(status, metadata, int(position or 0))
-    except Exception as e:  # noqa: BLE001
-        logger.debug("Lecture MPRIS échouée", error=str(e))
-        return {"connected": True, "is_playing": False, "track": None}
-    finally:
-        conn.close()
+            conn = _session_bus()
+        except Exception as e:  # noqa: BLE001
+            logger.debug("Session D-Bus indisponible", error=str(e))
+            return {"connected": False}
+        try:
+            players = _list_players(conn)
+            if not players:
+                return {"connected": True, "is_playing": False, "track": None}
+            _, props = _pick_player(conn, players)
+            metadata = {k: v[1] for k, v in (props.get("Metadata") or {}).items()}
+            return _state_from_mpris(
+                str(props.get("PlaybackStatus") or ""), metadata, int(props.get("Position") or 0)
+            )
+        except Exception as e:  # noqa: BLE001
+            logger.debug("Lecture MPRIS échouée", error=str(e))
+            _drop_session_bus()
+            return {"connected": True, "is_playing": False, "track": None}
 
 
 def _mpris_control_blocking(method: str) -> None:
     """Envoie une commande MPRIS (Play/Pause/Next/Previous)."""
-    try:
-        conn = open_dbus_connection(bus="SESSION")
-    except Exception:  # noqa: BLE001
-        return
-    try:
-        players = _list_players(conn)
-        if not players:
+    with _bus_lock:
+        try:
+            conn = _session_bus()
+        except Exception:  # noqa: BLE001
             return
-        addr = DBusAddress(
-            _MPRIS_PATH, bus_name=_pick_player(conn, players), interface=_MPRIS_IFACE
-        )
-        conn.send_and_get_reply(new_method_call(addr, method))
-    except Exception as e:  # noqa: BLE001
-        logger.debug("Contrôle MPRIS échoué", error=str(e))
-    finally:
-        conn.close()
+        try:
+            players = _list_players(conn)
+            if not players:
+                return
+            player, _ = _pick_player(conn, players)
+            addr = DBusAddress(_MPRIS_PATH, bus_name=player, interface=_MPRIS_IFACE)
+            _call(conn, new_method_call(addr, method))
+        except Exception as e:  # noqa: BLE001
+            logger.debug("Contrôle MPRIS échoué", error=str(e))
+            _drop_session_bus()
 
 
 # ── Dispatch ────────────────────────────────────────────────────────────────────
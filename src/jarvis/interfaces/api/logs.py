@@ -5,15 +5,32 @@
 from __future__ import annotations
 
 from collections import deque
+from itertools import islice
 
 from fastapi import APIRouter
 
 # ── Anneau de logs en mémoire (sink branché dans main.py) ────────────────────
 _log_buffer: deque[str] = deque(maxlen=120)
+# Nombre total de lignes reçues : len(_log_buffer) plafonne à 120, ce compteur non.
+_log_seq = 0
 
 
 def _log_sink(message: object) -> None:  # loguru message object
+    global _log_seq
     _log_buffer.append(str(message).strip())
+    _log_seq += 1
+
+
+def log_lines_since(seq: int) -> tuple[int, list[str]]:
+    """(séquence courante, lignes arrivées après `seq` encore présentes dans l'anneau).
+
+    Sans nouvelle ligne, rien n'est copié : le cas courant d'un poll à vide.
+    """
+    current = _log_seq
+    missed = min(current - seq, len(_log_buffer))
+    if missed <= 0:
+        return current, []
+    return current, list(islice(_log_buffer, len(_log_buffer) - missed, None))
 
 
 router = APIRouter()
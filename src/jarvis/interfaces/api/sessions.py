@@ -59,21 +59,23 @@ async def list_sessions(request: Request) -> list[dict]:
         if len(parts) != 2:
             continue
         date_str, session_id = parts
-        lines = []
+        first_user: str | None = None
+        msg_count = 0
+        # Une seule passe sur le fichier ouvert : ni texte entier, ni liste de lignes
         try:
-            lines = [ln for ln in f.read_text(encoding="utf-8").splitlines() if ln.strip()]
+            with f.open(encoding="utf-8") as fh:
+                for line in fh:
+                    if not line.strip():
+                        continue
+                    try:
+                        e = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    msg_count += 1
+                    if first_user is None and e.get("role") == "user":
+                        first_user = (e.get("content") or "")[:60]
         except OSError:
             pass
-        first_user: str | None = None
-        msg_count = 0
-        for line in lines:
-            try:
-                e = json.loads(line)
-                msg_count += 1
-                if first_user is None and e.get("role") == "user":
-                    first_user = (e.get("content") or "")[:60]
-            except (json.JSONDecodeError, KeyError):
-                pass
         default_preview = first_user or f"Session {date_str}"
         result.append(
             {
@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import shutil
 import socket
 from typing import Literal
 
@@ -221,8 +223,14 @@ async def setup_upload_face(file: UploadFile = File(...)) -> dict:  # noqa: B008
         raise HTTPException(400, "Fichier JPG requis.")
     FACES_DIR.mkdir(parents=True, exist_ok=True)
     target = FACES_DIR / "reference.jpg"
-    content = await file.read()
-    if len(content) < 1024:
+    # Copie par blocs depuis le spool de l'upload : mémoire bornée quelle que soit
+    # la taille envoyée, et la référence existante n'est remplacée qu'une fois validée.
+    part = target.with_suffix(".jpg.part")
+    with part.open("wb") as out:
+        await asyncio.to_thread(shutil.copyfileobj, file.file, out)
+        size = out.tell()
+    if size < 1024:
+        part.unlink(missing_ok=True)
         raise HTTPException(400, "Image trop petite.")
-    target.write_bytes(content)
+    part.replace(target)
     return {"saved": str(target.relative_to(PROJECT_ROOT)).replace("\\", "/")}
@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+import os
+
 from dotenv import dotenv_values
 from fastapi import APIRouter, HTTPException, Request
 
@@ -160,7 +162,7 @@ async def get_installed_skills() -> dict:
             env_status = {k: bool(env_values.get(k, "").strip()) for k in requires_env}
             env_vals = {k: env_values.get(k, "") for k in requires_env}
 
-        apps_status = check_all_apps(requires_apps)
+        apps_status = await check_all_apps(requires_apps)
 
         configured = (all(env_status.values()) if env_status else True) and apps_status[
             "all_required_installed"
@@ -220,10 +222,11 @@ async def get_view_scripts() -> dict:
     if not base.exists():
         return {"scripts": scripts, "styles": styles}
 
-    for skill_static in sorted(base.iterdir()):
-        if not skill_static.is_dir():
-            continue
-        name = skill_static.name
+    # scandir : le type vient du DirEntry, pas de stat() par entrée
+    with os.scandir(base) as it:
+        view_dirs = sorted(e.name for e in it if e.is_dir())
+    for name in view_dirs:
+        skill_static = base / name
         yaml_path = installed / name / "skill.yaml"
         if not yaml_path.exists():
             continue
@@ -234,11 +237,14 @@ async def get_view_scripts() -> dict:
         if meta.get("type") != "view":
             continue
         for f in sorted(skill_static.iterdir()):
-            v = hashlib.md5(f.read_bytes()).hexdigest()[:8]
-            if f.suffix == ".js":
-                scripts.append(f"/skills/{name}/{f.name}?v={v}")
-            elif f.suffix == ".css":
-                styles.append(f"/skills/{name}/{f.name}?v={v}")
+            # Seuls .js/.css sont versionnés : les autres assets (textures…) ne sont
+            # pas lus, et le hash se fait en streaming plutôt que via read_bytes()
+            if f.suffix not in (".js", ".css"):
+                continue
+            with f.open("rb") as fh:
+                v = hashlib.file_digest(fh, "md5").hexdigest()[:8]
+            url = f"/skills/{name}/{f.name}?v={v}"
+            (scripts if f.suffix == ".js" else styles).append(url)
     return {"scripts": scripts, "styles": styles}
 
 
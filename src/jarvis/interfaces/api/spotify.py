@@ -19,6 +19,7 @@ from jarvis.capabilities.tools.spotify_auth import (
     _save_token,
 )
 from jarvis.kernel.settings import settings
+from jarvis.kernel.tls import tls_context
 
 router = APIRouter(prefix="/api/spotify")
 
@@ -29,6 +30,30 @@ _SCOPES = (
 _AUTH_URL = "https://accounts.spotify.com/authorize"
 _API_BASE = "https://api.spotify.com/v1"
 
+# Client partagé vers api.spotify.com : l'UI poll /player en continu, la connexion
+# TLS reste ouverte (keep-alive) au lieu d'un handshake complet par requête.
+_api_client: httpx.AsyncClient | None = None
+
+
+def _spotify_client() -> httpx.AsyncClient:
+    global _api_client
+    if _api_client is None or _api_client.is_closed:
+        _api_client = httpx.AsyncClient(
+            timeout=5.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=4),
+            verify=tls_context(),
+        )
+    return _api_client
+
+
+async def close_spotify_client() -> None:
+    """Ferme le client api.spotify.com partagé (arrêt de l'app)."""
+    global _api_client
+    if _api_client is not None:
+        await _api_client.aclose()
+    _api_client = None
+
+
 _UNCONFIGURED_HTML = (
     "<!doctype html><meta charset='utf-8'>"
     "<body style='font-family:system-ui;background:#0e0e12;color:#e8e8ec;"
@@ -69,7 +94,7 @@ async def spotify_callback(code: str | None = None, error: str | None = None) ->
         logger.error("Spotify OAuth error", error=error)
         return RedirectResponse("/?spotify_error=1")
 
-    async with httpx.AsyncClient() as client:
+    async with httpx.AsyncClient(verify=tls_context()) as client:
         resp = await client.post(
             _TOKEN_URL,
             headers={
@@ -115,12 +140,11 @@ async def transfer_playback(request: Request) -> JSONResponse:
     if not token:
         return JSONResponse({"ok": False}, status_code=401)
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            resp = await client.put(
-                f"{_API_BASE}/me/player",
-                headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
-                json={"device_ids": [device_id], "play": False},
-            )
+        resp = await _spotify_client().put(
+            f"{_API_BASE}/me/player",
+            headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
+            json={"device_ids": [device_id], "play": False},
+        )
         return JSONResponse({"ok": resp.status_code in (200, 204)})
     except httpx.RequestError as e:
         logger.warning("Spotify transfer error", error=str(e))
@@ -135,12 +159,10 @@ async def _get_player_state() -> dict:
     if not token:
         return {"connected": False}
 
+    client = _spotify_client()
+    headers = {"Authorization": f"Bearer {token}"}
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            resp = await client.get(
-                f"{_API_BASE}/me/player",
-                headers={"Authorization": f"Bearer {token}"},
-            )
+        resp = await client.get(f"{_API_BASE}/me/player", headers=headers)
     except httpx.TimeoutException:
         logger.debug("Spotify player timeout")
         return {"connected": True, "is_playing": False, "track": None}
@@ -151,24 +173,24 @@ async def _get_player_state() -> dict:
     if resp.status_code == 204:
         # Pas de lecture active — fallback sur le dernier morceau joué
         try:
-            async with httpx.AsyncClient(timeout=5.0) as rc:
-                recent = await rc.get(
-                    f"{_API_BASE}/me/player/recently-played",
-                    headers={"Authorization": f"Bearer {token}"},
-                    params={"limit": 1},
-                )
+            recent = await client.get(
+                f"{_API_BASE}/me/player/recently-played",
+                headers=headers,
+                params={"limit": 1},
+            )
             if recent.is_success:
                 items = recent.json().get("items", [])
                 if items:
                     item = items[0].get("track") or {}
+                    album = item.get("album") or {}
                     artists = ", ".join(a["name"] for a in item.get("artists", []))
-                    images = (item.get("album") or {}).get("images", [])
+                    images = album.get("images", [])
                     return {
                         "connected": True,
                         "is_playing": False,
                         "track": item.get("name", ""),
                         "artist": artists,
-                        "album": (item.get("album") or {}).get("name", ""),
+                        "album": album.get("name", ""),
                         "album_art": images[0]["url"] if images else None,
                         "progress_ms": 0,
                         "duration_ms": item.get("duration_ms", 0),
@@ -184,8 +206,9 @@ async def _get_player_state() -> dict:
 
     data = resp.json()
     item = data.get("item") or {}
+    album = item.get("album") or {}
     artists = ", ".join(a["name"] for a in item.get("artists", []))
-    images = (item.get("album") or {}).get("images", [])
+    images = album.get("images", [])
     album_art = images[0]["url"] if images else None
 
     return {
@@ -193,7 +216,7 @@ async def _get_player_state() -> dict:
         "is_playing": data.get("is_playing", False),
         "track": item.get("name", ""),
         "artist": artists,
-        "album": (item.get("album") or {}).get("name", ""),
+        "album": album.get("name", ""),
         "album_art": album_art,
         "progress_ms": data.get("progress_ms", 0),
         "duration_ms": item.get("duration_ms", 0),
@@ -214,12 +237,11 @@ async def _player_action(method: str, endpoint: str) -> JSONResponse:
     if not token:
         return JSONResponse({"ok": False}, status_code=401)
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            req = getattr(client, method)
-            resp = await req(
-                f"{_API_BASE}/me/player/{endpoint}",
-                headers={"Authorization": f"Bearer {token}"},
-            )
+        req = getattr(_spotify_client(), method)
+        resp = await req(
+            f"{_API_BASE}/me/player/{endpoint}",
+            headers={"Authorization": f"Bearer {token}"},
+        )
         return JSONResponse({"ok": resp.status_code in (200, 204)})
     except httpx.TimeoutException:
         logger.debug("Spotify action timeout", endpoint=endpoint)
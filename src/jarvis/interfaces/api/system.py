@@ -7,6 +7,7 @@ from __future__ import annotations
 import json
 import os
 import shutil
+import time
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException, Request
@@ -15,26 +16,57 @@ from jarvis.capabilities.skills.registry import skill_registry
 from jarvis.engine.mission.project_store import WORKSPACE_DIR
 from jarvis.kernel.paths import MEMORY_DATA_DIR
 from jarvis.kernel.settings import settings
+from jarvis.kernel.tls import tls_context
 
 router = APIRouter()
 
+# Les sondes cloud du doctor coûtent chacune un handshake TCP+TLS : sans cache,
+# chaque appel de /api/health (Telegram /status, UI) les refaisait en série.
+# Timeout court pour qu'un réseau cassé ne fige pas le rapport 3 × 5 s.
+_CLOUD_PROBE_TTL_S = 60.0
+_CLOUD_PROBE_TIMEOUT_S = 2.0
+_cloud_cache: tuple[float, dict[str, dict]] | None = None
+
+_KIB = 1024
+_MIB = 1024**2
+_GIB = 1024**3
+
 
 def _mem_dir(request: Request) -> Path:  # noqa: ARG001 — request ignoré, conservé pour signature API
 
     return Path(settings.memory_dir)
 
 
-@router.get("/api/health")
-async def jarvis_doctor() -> dict:
-    """Rapport de santé complet de tous les composants Jarvis."""
-    import asyncio
+def _dir_usage(directory: Path, suffix: str) -> tuple[int, int]:
+    """(nombre, taille totale en octets) des fichiers `*suffix` — un seul scandir.
+
+    Remplace glob() deux fois (compte puis tailles) + un stat() par fichier :
+    DirEntry.stat() réutilise les infos déjà lues par le listing sous Windows.
+    """
+    count = size = 0
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name.endswith(suffix) and entry.is_file():
+                    count += 1
+                    size += entry.stat().st_size
+    except FileNotFoundError:
+        pass
+    return count, size
+
+
+async def _cloud_checks() -> dict[str, dict]:
+    """Joignabilité Anthropic / ElevenLabs / Deepgram (résultat gardé _CLOUD_PROBE_TTL_S)."""
+    global _cloud_cache
+
+    now = time.monotonic()
+    if _cloud_cache is not None and now - _cloud_cache[0] < _CLOUD_PROBE_TTL_S:
+        return dict(_cloud_cache[1])
 
     import httpx
 
     checks: dict[str, dict] = {}
-    checks["fastapi"] = {"status": "ok", "detail": "En ligne"}
-
-    async with httpx.AsyncClient(timeout=5) as c:
+    async with httpx.AsyncClient(timeout=_CLOUD_PROBE_TIMEOUT_S, verify=tls_context()) as c:
         try:
             r = await c.get(
                 "https://api.anthropic.com/v1/models",
@@ -74,24 +106,44 @@ async def jarvis_doctor() -> dict:
         except Exception:
             checks["deepgram"] = {"status": "error", "detail": "Inaccessible"}
 
+    _cloud_cache = (time.monotonic(), checks)
+    return dict(checks)
+
+
+@router.get("/api/health")
+async def jarvis_doctor() -> dict:
+    """Rapport de santé complet de tous les composants Jarvis."""
+    import asyncio
+
+    checks: dict[str, dict] = {}
+    checks["fastapi"] = {"status": "ok", "detail": "En ligne"}
+
+    checks.update(await _cloud_checks())
+
     token = os.getenv("MAPBOX_TOKEN", "")
     checks["mapbox"] = {
         "status": "ok" if token else "warning",
         "detail": "Token présent" if token else "MAPBOX_TOKEN manquant",
     }
 
+    # `docker version --format` ne renvoie que la version du daemon (une ligne,
+    # code ≠ 0 s'il est injoignable) — `docker info` collectait tout l'état système.
     try:
         proc = await asyncio.create_subprocess_exec(
             "docker",
-            "info",
-            stdout=asyncio.subprocess.DEVNULL,
+            "version",
+            "--format",
+            "{{.Server.Version}}",
+            stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.DEVNULL,
         )
-        await proc.wait()
-        checks["docker"] = {
-            "status": "ok" if proc.returncode == 0 else "error",
-            "detail": "Disponible" if proc.returncode == 0 else "Non disponible",
-        }
+        stdout, _ = await proc.communicate()
+        version = stdout.decode(errors="replace").strip()
+        checks["docker"] = (
+            {"status": "ok", "detail": f"Disponible ({version})"}
+            if proc.returncode == 0 and version
+            else {"status": "error", "detail": "Non disponible"}
+        )
     except Exception:
         checks["docker"] = {"status": "error", "detail": "Non installé"}
 
@@ -139,19 +191,13 @@ async def system_stats(request: Request) -> dict:
         except Exception:
             pass
 
-    topics_count = len(list(topics_dir.glob("*.md"))) if topics_dir.exists() else 0
-    topics_size = (
-        sum(p.stat().st_size for p in topics_dir.glob("*.md")) if topics_dir.exists() else 0
-    )
-
-    sess_files = list(sessions_dir.glob("*.jsonl")) if sessions_dir.exists() else []
-    sess_total = len(sess_files)
-    sess_size = sum(p.stat().st_size for p in sess_files)
+    topics_count, topics_size = _dir_usage(topics_dir, ".md")
+    sess_total, sess_size = _dir_usage(sessions_dir, ".jsonl")
 
     return {
         "projects": {"total": proj_total, "running": proj_running, "done": proj_done},
-        "memory": {"topics": topics_count, "size_kb": round(topics_size / 1024, 1)},
-        "sessions": {"total": sess_total, "size_mb": round(sess_size / 1024 / 1024, 2)},
+        "memory": {"topics": topics_count, "size_kb": round(topics_size / _KIB, 1)},
+        "sessions": {"total": sess_total, "size_mb": round(sess_size / _MIB, 2)},
         "config": {
             "llm_provider": settings.llm_provider,
             "model": settings.anthropic_model,
@@ -187,7 +233,7 @@ async def system_perf() -> dict:
             proc_info = {
                 "pid": p.pid,
                 "cpu_pct": round(p.cpu_percent(interval=None), 1),
-                "ram_mb": round(p.memory_info().rss / 1024 / 1024, 1),
+                "ram_mb": round(p.memory_info().rss / _MIB, 1),
                 "threads": p.num_threads(),
             }
     except Exception:
@@ -197,11 +243,11 @@ async def system_perf() -> dict:
         "cpu_pct": round(cpu_pct, 1),
         "cpu_cores": psutil.cpu_count(logical=False),
         "cpu_threads": psutil.cpu_count(logical=True),
-        "ram_used_gb": round(mem.used / 1024**3, 2),
-        "ram_total_gb": round(mem.total / 1024**3, 2),
+        "ram_used_gb": round(mem.used / _GIB, 2),
+        "ram_total_gb": round(mem.total / _GIB, 2),
         "ram_pct": round(mem.percent, 1),
-        "disk_used_gb": round(disk.used / 1024**3, 1),
-        "disk_total_gb": round(disk.total / 1024**3, 1),
+        "disk_used_gb": round(disk.used / _GIB, 1),
+        "disk_total_gb": round(disk.total / _GIB, 1),
         "disk_pct": round(disk.percent, 1),
         "battery_pct": round(battery.percent) if battery else None,
         "battery_charging": battery.power_plugged if battery else None,
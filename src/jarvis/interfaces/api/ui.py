@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import json
 import re
+from functools import lru_cache
 from pathlib import Path
 
 from fastapi import APIRouter
@@ -50,20 +51,31 @@ def _ui_html_response(html_path: Path, assets: list[tuple[str, str]] | None = No
     )
 
 
+@lru_cache(maxsize=32)
+def _asset_refs_re(src_attrs: tuple[str, ...]) -> re.Pattern[str]:
+    """Une seule regex pour toutes les refs d'une page (compilée une fois par page)."""
+    alternation = "|".join(map(re.escape, src_attrs))
+    return re.compile(r'((?:href|src)=["\'])(' + alternation + r')(["\'])')
+
+
 def _versioned_html(html_path: Path, assets: list[tuple[str, str]]) -> str:
-    """Injecte ?v=<mtime> dans les refs CSS/JS pour forcer le cache-busting."""
+    """Injecte ?v=<mtime> dans les refs CSS/JS pour forcer le cache-busting.
+
+    Un seul passage sur le HTML pour tous les assets, au lieu d'un re.sub par asset.
+    """
     content = html_path.read_text(encoding="utf-8")
+    versions: dict[str, str] = {}
     for src_attr, asset_path in assets:
         try:
-            v = int(Path(asset_path).stat().st_mtime)
-            content = re.sub(
-                r'((?:href|src)=["\'])(' + re.escape(src_attr) + r')(["\'])',
-                lambda m, _v=v: m.group(1) + m.group(2) + "?v=" + str(_v) + m.group(3),
-                content,
-            )
+            versions[src_attr] = str(int(Path(asset_path).stat().st_mtime))
         except OSError:
             pass
-    return content
+    if not versions:
+        return content
+    return _asset_refs_re(tuple(versions)).sub(
+        lambda m: m.group(1) + m.group(2) + "?v=" + versions[m.group(2)] + m.group(3),
+        content,
+    )
 
 
 @router.get("/command", include_in_schema=False)
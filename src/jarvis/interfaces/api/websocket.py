@@ -6,7 +6,10 @@ from __future__ import annotations
 
 import asyncio
 import json
+import re
 import time
+from collections.abc import Awaitable, Callable
+from types import MappingProxyType
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from loguru import logger
@@ -16,7 +19,7 @@ from jarvis.engine.background.notifications import NotificationQueue, ProactiveQ
 from jarvis.engine.background.worker import BackgroundTask, BackgroundWorker
 from jarvis.engine.gateway import Gateway, _fallback
 from jarvis.engine.router import RouteEnum
-from jarvis.interfaces.api.logs import _log_buffer
+from jarvis.interfaces.api.logs import log_lines_since
 from jarvis.providers.memory.auto_dream import AutoDream
 from jarvis.providers.memory.consolidation import ConsolidationAgent
 from jarvis.providers.vision.objects_queue import get_vision_objects_queue
@@ -27,7 +30,11 @@ _spotify_tool = SpotifyTool()
 
 # Cooldown présence : évite les annonces répétées quand la caméra est rouverte
 _PRESENCE_COOLDOWN_S = 600  # 10 min entre deux annonces du même état
-_presence_last_notified: dict[bool, float] = {True: 0.0, False: 0.0}
+_presence_last_notified: dict[bool, float] = {True: float("-inf"), False: float("-inf")}
+
+# Délai avant la mémoire post-done : laisse la connexion HTTP principale se
+# libérer avant que le background_llm parte (contention sur le client Anthropic).
+_MEMORY_DEFER_S = 2.0
 
 
 # ── /ws/logs — stream log buffer to the dashboard Système › Logs panel ────────
@@ -40,49 +47,48 @@ async def websocket_logs(websocket: WebSocket) -> None:
     """
 
     await websocket.accept()
-    last_sent = 0
     try:
         # Send buffered lines on connect
-        snapshot = list(_log_buffer)
+        seq, snapshot = log_lines_since(0)
         for raw in snapshot[-50:]:
             msg = _format_log_line(raw)
             await websocket.send_json(msg)
-        last_sent = len(_log_buffer)
 
+        # Suivi par numéro de séquence : comparer len() au buffer plein (120)
+        # ne voyait plus aucune nouvelle ligne une fois l'anneau rempli.
         while True:
             await asyncio.sleep(0.8)
-            buf = list(_log_buffer)
-            new_lines = buf[last_sent:]
+            seq, new_lines = log_lines_since(seq)
             for raw in new_lines:
                 msg = _format_log_line(raw)
                 try:
                     await websocket.send_json(msg)
                 except Exception:
                     return
-            last_sent = len(buf)
     except WebSocketDisconnect:
         pass
     except Exception as e:
         logger.warning("ws/logs error", error=str(e))
 
 
+# loguru format: "HH:MM:SS | LEVEL    | name — message"
+_LOG_LINE_RE = re.compile(r"^(\d{2}:\d{2}:\d{2})\s*\|\s*(\w+)\s*\|\s*(.+?)(?:\s*—\s*(.*))?$")
+
+
+# Niveaux loguru → classes CSS de la console UI (une ligne formatée par log émis).
+_LOG_LEVELS: MappingProxyType[str, str] = MappingProxyType(
+    {"info": "info", "warning": "warn", "error": "err", "success": "ok", "debug": "info"}
+)
+
+
 def _format_log_line(raw: str) -> dict:
     """Wrap a plain loguru string line into the { lv, parts } schema."""
-    import re
-
-    # loguru format: "HH:MM:SS | LEVEL    | name — message"
-    m = re.match(r"^(\d{2}:\d{2}:\d{2})\s*\|\s*(\w+)\s*\|\s*(.+?)(?:\s*—\s*(.*))?$", raw)
+    m = _LOG_LINE_RE.match(raw)
     if m:
         level_raw = m.group(2).lower().strip()
         source = m.group(3).strip()
         message = (m.group(4) or "").strip()
-        lv = {
-            "info": "info",
-            "warning": "warn",
-            "error": "err",
-            "success": "ok",
-            "debug": "info",
-        }.get(level_raw, "info")
+        lv = _LOG_LEVELS.get(level_raw, "info")
         parts: list[dict] = [
             {"t": source, "cls": "accent"},
         ]
@@ -110,6 +116,82 @@ _PRESENCE_MSGS: dict[bool, str] = {
 }
 
 
+async def _on_presence(
+    data: dict, websocket: WebSocket, gateway: Gateway, notifications: NotificationQueue
+) -> None:
+    active: bool = bool(data.get("active", True))
+    now = time.monotonic()
+    if now - _presence_last_notified[active] >= _PRESENCE_COOLDOWN_S:
+        _presence_last_notified[active] = now
+        notifications.add(_PRESENCE_MSGS[active])
+    logger.debug("Vision presence", active=active)
+
+
+async def _on_gesture_direct(
+    data: dict, websocket: WebSocket, gateway: Gateway, notifications: NotificationQueue
+) -> None:
+    gesture = data.get("gesture", "")
+    action = _GESTURE_DIRECT_ACTIONS.get(gesture)
+    if action:
+        result = await _spotify_tool.execute(action=action)
+        logger.info("Vision gesture direct", gesture=gesture, action=action, ok=not result.is_error)
+
+
+async def _on_gesture_volume(
+    data: dict, websocket: WebSocket, gateway: Gateway, notifications: NotificationQueue
+) -> None:
+    delta = int(data.get("delta", 0))
+    if delta:
+        result = await _spotify_tool.execute(action="volume_delta", delta=delta)
+        logger.debug("Vision gesture volume", delta=delta, ok=not result.is_error)
+
+
+async def _on_gesture(
+    data: dict, websocket: WebSocket, gateway: Gateway, notifications: NotificationQueue
+) -> None:
+    gesture = data.get("gesture", "")
+    message = _GESTURE_LLM_COMMANDS.get(gesture)
+    if not message:
+        return
+    logger.info("Vision gesture LLM", gesture=gesture, message=message)
+    session_id: str | None = data.get("session_id")
+    session, route, response = await gateway.handle(
+        message=message, session_id=session_id, stream=True
+    )
+    await websocket.send_json(
+        {"type": "start", "session_id": str(session.id), "route": route.value}
+    )
+    if isinstance(response, str):
+        full = response
+        await websocket.send_json({"type": "chunk", "content": response})
+    else:
+        parts: list[str] = []
+        try:
+            async for chunk in response:
+                parts.append(chunk)
+                await websocket.send_json({"type": "chunk", "content": chunk})
+            full = "".join(parts)
+        except Exception as e:
+            logger.error("Vision gesture stream error", error=str(e))
+            full = _fallback()
+            await websocket.send_json({"type": "chunk", "content": _fallback()})
+    session.add_message("assistant", full)
+    await websocket.send_json({"type": "done"})
+
+
+# Table de dispatch event → handler : un lookup par événement MediaPipe (émis en
+# continu par le navigateur) au lieu d'une cascade de comparaisons ; un événement
+# inconnu est écarté sans autre travail.
+_VISION_HANDLERS: dict[
+    str, Callable[[dict, WebSocket, Gateway, NotificationQueue], Awaitable[None]]
+] = {
+    "presence": _on_presence,
+    "gesture_direct": _on_gesture_direct,
+    "gesture_volume": _on_gesture_volume,
+    "gesture": _on_gesture,
+}
+
+
 async def _handle_vision_event(
     data: dict,
     websocket: WebSocket,
@@ -117,62 +199,60 @@ async def _handle_vision_event(
     notifications: NotificationQueue,
 ) -> None:
     """Traite un événement MediaPipe reçu depuis le navigateur."""
-    event = data.get("event")
-
-    if event == "presence":
-        active: bool = bool(data.get("active", True))
-        now = time.time()
-        if now - _presence_last_notified[active] >= _PRESENCE_COOLDOWN_S:
-            _presence_last_notified[active] = now
-            notifications.add(_PRESENCE_MSGS[active])
-        logger.debug("Vision presence", active=active)
-        return
+    handler = _VISION_HANDLERS.get(data.get("event", ""))
+    if handler is not None:
+        await handler(data, websocket, gateway, notifications)
 
-    if event == "gesture_direct":
-        gesture = data.get("gesture", "")
-        action = _GESTURE_DIRECT_ACTIONS.get(gesture)
-        if action:
-            result = await _spotify_tool.execute(action=action)
-            logger.info(
-                "Vision gesture direct", gesture=gesture, action=action, ok=not result.is_error
-            )
-        return
 
-    if event == "gesture_volume":
-        delta = int(data.get("delta", 0))
-        if delta:
-            result = await _spotify_tool.execute(action="volume_delta", delta=delta)
-            logger.debug("Vision gesture volume", delta=delta, ok=not result.is_error)
-        return
+async def _push_proactive(websocket: WebSocket, sub_q: asyncio.Queue[str | dict]) -> None:
+    while True:
+        item = await sub_q.get()
+        try:
+            if isinstance(item, dict):
+                await websocket.send_json(item)
+            else:
+                await websocket.send_json({"type": "notification", "content": item})
+        except Exception as e:
+            logger.warning("Proactive push failed", error=str(e))
 
-    if event == "gesture":
-        gesture = data.get("gesture", "")
-        message = _GESTURE_LLM_COMMANDS.get(gesture)
-        if not message:
-            return
-        logger.info("Vision gesture LLM", gesture=gesture, message=message)
-        session_id: str | None = data.get("session_id")
-        session, route, response = await gateway.handle(
-            message=message, session_id=session_id, stream=True
-        )
-        await websocket.send_json(
-            {"type": "start", "session_id": str(session.id), "route": route.value}
+
+async def _push_vision_objects(websocket: WebSocket, objects_q: asyncio.Queue[list[dict]]) -> None:
+    while True:
+        objects = await objects_q.get()
+        try:
+            await websocket.send_json({"type": "vision_objects", "objects": objects})
+        except Exception:
+            pass
+
+
+async def _run_project(orchestrator: object, message: str, proactive: ProactiveQueue) -> None:
+    try:
+        await orchestrator.create_and_run(message)  # type: ignore[attr-defined]
+    except Exception as exc:
+        logger.error("Project creation failed", error=str(exc))
+        proactive.broadcast_event(
+            {
+                "type": "notification",
+                "content": f"Erreur création projet : {exc}",
+            }
         )
-        full = ""
-        if isinstance(response, str):
-            full = response
-            await websocket.send_json({"type": "chunk", "content": response})
-        else:
-            try:
-                async for chunk in response:
-                    full += chunk
-                    await websocket.send_json({"type": "chunk", "content": chunk})
-            except Exception as e:
-                logger.error("Vision gesture stream error", error=str(e))
-                full = _fallback()
-                await websocket.send_json({"type": "chunk", "content": _fallback()})
-        session.add_message("assistant", full)
-        await websocket.send_json({"type": "done"})
+
+
+async def _post_done_memory(state: object, user_msg: str, reply: str) -> None:
+    await asyncio.sleep(_MEMORY_DEFER_S)
+    consolidation: ConsolidationAgent = state.consolidation  # type: ignore[attr-defined]
+    auto_dream: AutoDream = state.auto_dream  # type: ignore[attr-defined]
+    asyncio.create_task(
+        consolidation._run_safe(user_message=user_msg, assistant_message=reply),
+        name="consolidation",
+    )
+    asyncio.create_task(
+        auto_dream._run_micro_safe(user_message=user_msg, assistant_message=reply),
+        name="autodream-micro",
+    )
+    _user_model = getattr(state, "user_model", None)
+    if _user_model is not None:
+        _user_model.fire(user_message=user_msg, assistant_message=reply)
 
 
 @router.websocket("/ws")
@@ -193,37 +273,19 @@ async def websocket_chat(websocket: WebSocket) -> None:
     await websocket.accept()
     logger.info("WebSocket connection opened")
 
-    gateway: Gateway = websocket.app.state.gateway
-    worker: BackgroundWorker = websocket.app.state.worker
-    consolidation: ConsolidationAgent = websocket.app.state.consolidation
-    auto_dream: AutoDream = websocket.app.state.auto_dream
-    proactive: ProactiveQueue = websocket.app.state.proactive_queue
-    notifications: NotificationQueue = websocket.app.state.notifications
+    state = websocket.app.state
+    gateway: Gateway = state.gateway
+    worker: BackgroundWorker = state.worker
+    proactive: ProactiveQueue = state.proactive_queue
+    notifications: NotificationQueue = state.notifications
 
     sub_q = proactive.subscribe()
     objects_q = get_vision_objects_queue().subscribe()
 
-    async def _push_proactive() -> None:
-        while True:
-            item = await sub_q.get()
-            try:
-                if isinstance(item, dict):
-                    await websocket.send_json(item)
-                else:
-                    await websocket.send_json({"type": "notification", "content": item})
-            except Exception as e:
-                logger.warning("Proactive push failed", error=str(e))
-
-    async def _push_vision_objects() -> None:
-        while True:
-            objects = await objects_q.get()
-            try:
-                await websocket.send_json({"type": "vision_objects", "objects": objects})
-            except Exception:
-                pass
-
-    pusher_task = asyncio.create_task(_push_proactive(), name="ws-proactive-pusher")
-    vision_pusher_task = asyncio.create_task(_push_vision_objects(), name="ws-vision-pusher")
+    pusher_task = asyncio.create_task(_push_proactive(websocket, sub_q), name="ws-proactive-pusher")
+    vision_pusher_task = asyncio.create_task(
+        _push_vision_objects(websocket, objects_q), name="ws-vision-pusher"
+    )
 
     try:
         while True:
@@ -248,7 +310,7 @@ async def websocket_chat(websocket: WebSocket) -> None:
                 continue
 
             # Signaler l'activité — le ProactiveEngine attendra avant son prochain appel LLM
-            proactive_engine = getattr(websocket.app.state, "proactive_engine", None)
+            proactive_engine = getattr(state, "proactive_engine", None)
             if proactive_engine is not None:
                 proactive_engine.signal_user_activity()
 
@@ -258,72 +320,50 @@ async def websocket_chat(websocket: WebSocket) -> None:
                 stream=True,
             )
 
-            logger.debug("Route", route=route.value, session_id=str(session.id))
-            await websocket.send_json(
-                {"type": "start", "session_id": str(session.id), "route": route.value}
-            )
+            # Valeurs réutilisées plusieurs fois par message — calculées une seule fois
+            sid = str(session.id)
+            send = websocket.send_json
+            logger.debug("Route", route=route.value, session_id=sid)
+            await send({"type": "start", "session_id": sid, "route": route.value})
 
-            full = ""
             if isinstance(response, str):
                 full = response
-                await websocket.send_json({"type": "chunk", "content": response})
+                await send({"type": "chunk", "content": response})
             else:
+                parts: list[str] = []
                 try:
                     async for chunk in response:
-                        full += chunk
-                        await websocket.send_json({"type": "chunk", "content": chunk})
+                        parts.append(chunk)
+                        await send({"type": "chunk", "content": chunk})
+                    full = "".join(parts)
                 except Exception as e:
                     logger.error("Stream error", error=str(e))
                     full = _fallback()
-                    await websocket.send_json({"type": "chunk", "content": _fallback()})
+                    await send({"type": "chunk", "content": full})
 
             session.add_message("assistant", full)
 
             # ── "done" envoyé en premier — client débloqué ────────────────────
-            await websocket.send_json({"type": "done"})
+            await send({"type": "done"})
 
             # ── BG : soumission APRÈS "done" (gateway ne soumet plus) ─────────
             if route is RouteEnum.BACKGROUND:
-                worker.submit(BackgroundTask(session_id=str(session.id), instruction=message))
-                logger.info("BackgroundTask submitted", session_id=str(session.id))
+                worker.submit(BackgroundTask(session_id=sid, instruction=message))
+                logger.info("BackgroundTask submitted", session_id=sid)
 
             # ── PROJECT : lancement orchestrateur APRÈS "done" ────────────────
             elif route is RouteEnum.PROJECT:
-                orchestrator = getattr(websocket.app.state, "orchestrator", None)
+                orchestrator = getattr(state, "orchestrator", None)
                 if orchestrator:
-
-                    async def _run_project(
-                        msg: str = message, _orch: object = orchestrator
-                    ) -> None:
-                        try:
-                            await _orch.create_and_run(msg)
-                        except Exception as exc:
-                            logger.error("Project creation failed", error=str(exc))
-                            proactive.broadcast_event(
-                                {
-                                    "type": "notification",
-                                    "content": f"Erreur création projet : {exc}",
-                                }
-                            )
-
-                    asyncio.create_task(_run_project(), name=f"project-{str(session.id)[:8]}")
-                    logger.info("Project task launched", session_id=str(session.id))
+                    asyncio.create_task(
+                        _run_project(orchestrator, message, proactive), name=f"project-{sid[:8]}"
+                    )
+                    logger.info("Project task launched", session_id=sid)
 
             # ── mémoire post-done, hors chemin critique ───────────────────────
-            # sleep(2) laisse la connexion HTTP principale se libérer avant que
-            # le background_llm parte — évite la contention sur le client Anthropic.
-            await asyncio.sleep(2)
-            asyncio.create_task(
-                consolidation._run_safe(user_message=message, assistant_message=full),
-                name="consolidation",
-            )
-            asyncio.create_task(
-                auto_dream._run_micro_safe(user_message=message, assistant_message=full),
-                name="autodream-micro",
-            )
-            _user_model = getattr(websocket.app.state, "user_model", None)
-            if _user_model is not None:
-                _user_model.fire(user_message=message, assistant_message=full)
+            # Le délai tourne dans une tâche à part : la boucle repasse tout de
+            # suite en réception au lieu de bloquer le message suivant 2 s.
+            asyncio.create_task(_post_done_memory(state, message, full), name="memory-post-done")
 
     except WebSocketDisconnect:
         logger.info("WebSocket connection closed")
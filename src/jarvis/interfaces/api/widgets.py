@@ -14,12 +14,37 @@ from loguru import logger
 from pydantic import BaseModel
 
 from jarvis.kernel.settings import settings
+from jarvis.kernel.tls import tls_context
 
 router = APIRouter(prefix="/api")
 
 _NOTION_VERSION = "2022-06-28"
 _NOTION_BASE = "https://api.notion.com/v1"
 
+# Client partagé vers api.notion.com : le widget poll /tasks et chaque coche
+# enchaîne un PATCH, la connexion TLS reste ouverte au lieu d'un handshake par appel.
+_notion_http: httpx.AsyncClient | None = None
+
+
+def _notion_client() -> httpx.AsyncClient:
+    global _notion_http
+    if _notion_http is None or _notion_http.is_closed:
+        _notion_http = httpx.AsyncClient(
+            base_url=_NOTION_BASE,
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=2),
+            verify=tls_context(),
+        )
+    return _notion_http
+
+
+async def close_notion_client() -> None:
+    """Ferme le client api.notion.com partagé (arrêt de l'app)."""
+    global _notion_http
+    if _notion_http is not None:
+        await _notion_http.aclose()
+    _notion_http = None
+
 
 # ── Models ────────────────────────────────────────────────────
 
@@ -72,12 +97,11 @@ async def get_tasks() -> TasksResponse:
         return TasksResponse(tasks=[])
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(
-                f"{_NOTION_BASE}/blocks/{page_id}/children",
-                headers=_notion_headers(),
-            )
-            resp.raise_for_status()
+        resp = await _notion_client().get(
+            f"/blocks/{page_id}/children",
+            headers=_notion_headers(),
+        )
+        resp.raise_for_status()
     except Exception as e:
         logger.error("Notion widget error", error=str(e))
         return TasksResponse(tasks=[])
@@ -120,7 +144,7 @@ async def _find_section_anchor(client: httpx.AsyncClient, page_id: str) -> str |
     Falls back to the heading ID if no to_do exists yet.
     """
     resp = await client.get(
-        f"{_NOTION_BASE}/blocks/{page_id}/children",
+        f"/blocks/{page_id}/children",
         headers=_notion_headers(),
     )
     resp.raise_for_status()
@@ -165,18 +189,18 @@ async def create_task(body: TaskCreate) -> Task:
         },
     }
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        anchor = await _find_section_anchor(client, page_id)
-        payload: dict = {"children": [new_block]}
-        if anchor:
-            payload["after"] = anchor
+    client = _notion_client()
+    anchor = await _find_section_anchor(client, page_id)
+    payload: dict = {"children": [new_block]}
+    if anchor:
+        payload["after"] = anchor
 
-        resp = await client.patch(
-            f"{_NOTION_BASE}/blocks/{page_id}/children",
-            headers=_notion_headers(),
-            json=payload,
-        )
-        resp.raise_for_status()
+    resp = await client.patch(
+        f"/blocks/{page_id}/children",
+        headers=_notion_headers(),
+        json=payload,
+    )
+    resp.raise_for_status()
 
     block = resp.json()["results"][0]
     return Task(id=block["id"], text=body.text, done=False)
@@ -196,13 +220,12 @@ async def update_task(block_id: str, body: TaskPatch) -> Task:
     if body.text is not None:
         update["to_do"]["rich_text"] = [{"type": "text", "text": {"content": body.text}}]
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        resp = await client.patch(
-            f"{_NOTION_BASE}/blocks/{block_id}",
-            headers=_notion_headers(),
-            json=update,
-        )
-        resp.raise_for_status()
+    resp = await _notion_client().patch(
+        f"/blocks/{block_id}",
+        headers=_notion_headers(),
+        json=update,
+    )
+    resp.raise_for_status()
 
     block = resp.json()
     todo = block.get("to_do", {})
@@ -218,12 +241,11 @@ async def delete_task(block_id: str) -> dict:
 
         raise HTTPException(status_code=503, detail="Notion non configuré")
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        resp = await client.delete(
-            f"{_NOTION_BASE}/blocks/{block_id}",
-            headers=_notion_headers(),
-        )
-        resp.raise_for_status()
+    resp = await _notion_client().delete(
+        f"/blocks/{block_id}",
+        headers=_notion_headers(),
+    )
+    resp.raise_for_status()
 
     return {"ok": True}
 
@@ -279,7 +301,7 @@ async def _fetch_today_events() -> list[CalEvent]:
         "orderBy": "startTime",
     }
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
+    async with httpx.AsyncClient(timeout=60.0, verify=tls_context()) as client:
         resp = await client.get(
             "https://www.googleapis.com/calendar/v3/calendars/primary/events",
             headers={"Authorization": f"Bearer {creds.token}"},
@@ -61,6 +61,7 @@ from jarvis.interfaces.channels.base import (  # noqa: E402
     MessageTarget,
     Platform,
 )
+from jarvis.kernel.tls import tls_context  # noqa: E402
 
 try:
     from telegram import Update
@@ -249,7 +250,7 @@ class TelegramChannel(ChannelAdapter):
         try:
             import httpx
 
-            async with httpx.AsyncClient(timeout=5) as client:
+            async with httpx.AsyncClient(timeout=5, verify=tls_context()) as client:
                 r = await client.get("http://localhost:8000/api/health")
                 health = r.json()
             checks = health.get("checks", {})
@@ -274,7 +275,7 @@ class TelegramChannel(ChannelAdapter):
         try:
             import httpx
 
-            async with httpx.AsyncClient(timeout=10) as client:
+            async with httpx.AsyncClient(timeout=10, verify=tls_context()) as client:
                 r = await client.get("http://localhost:8000/api/initiatives")
                 data = r.json()
             initiatives = [i for i in data.get("initiatives", []) if i.get("status") == "pending"]
@@ -312,6 +313,4 @@ class TelegramChannel(ChannelAdapter):
             '• "État de mon impression 3D ?"_\n\n'
             "📄 Code source (AGPL-3.0) : https://github.com/Grominet95/jarvis-OS"
         )
-        await update.message.reply_text(
-            text, parse_mode="Markdown", disable_web_page_preview=True
-        )
+        await update.message.reply_text(text, parse_mode="Markdown", disable_web_page_preview=True)
@@ -11,11 +11,19 @@ Test console (sans browser) : uv run python voice_agent.py console
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 import os
 import sys
+import threading
+import urllib.request
 import warnings
+from collections import ChainMap
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import dotenv_values, load_dotenv
@@ -38,7 +46,8 @@ from livekit.plugins.google.beta import gemini_tts
 from jarvis.bootstrap import build
 from jarvis.capabilities.skills.registry import SkillRegistry
 from jarvis.kernel.paths import PROJECT_ROOT  # noqa: E402
-from jarvis.kernel.settings import settings
+from jarvis.kernel.queued_writer import console_writer
+from jarvis.kernel.settings import LIVEKIT_ENV_KEYS, settings
 
 load_dotenv(PROJECT_ROOT / ".env")
 
@@ -49,7 +58,7 @@ try:
 
     _loguru.remove()
     _loguru.add(
-        sys.stderr,
+        console_writer(),
         level="INFO",
         format=(
             "<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level>"
@@ -166,21 +175,29 @@ def _make_livekit_tool(jarvis_tool: object) -> lk_llm.RawFunctionTool:
     return lk_llm.function_tool(_execute, raw_schema=raw_schema)
 
 
+# Encodeur partagé pour les POST vers l'API : compact, UTF-8 direct (pas de \uXXXX
+# pour chaque accent) et construit une seule fois plutôt qu'à chaque json.dumps.
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def _json_bytes(obj: object) -> bytes:
+    return _JSON_ENCODER.encode(obj).encode("utf-8")
+
+
 def _voice_broadcast(event: dict) -> None:
     """Envoie un événement UI via HTTP au serveur FastAPI (localhost)."""
-    import json as _json
-    import threading
-    import urllib.request
 
     def _post() -> None:
 
         url = f"http://localhost:{settings.port}/internal/broadcast"
-        data = _json.dumps(event).encode()
+        data = _json_bytes(event)
         req = urllib.request.Request(
             url, data=data, headers={"Content-Type": "application/json"}, method="POST"
         )
         try:
-            urllib.request.urlopen(req, timeout=2)
+            # Réponse fermée tout de suite : sinon un socket fuit par événement.
+            with urllib.request.urlopen(req, timeout=2):
+                pass
         except Exception as e:
             logger.debug("Voice broadcast HTTP fail: %s", e)
 
@@ -190,17 +207,14 @@ def _voice_broadcast(event: dict) -> None:
 def _call_api_memory_tool(name: str, args: dict) -> tuple[str, bool]:
     """Exécute un tool mémoire côté API via HTTP (le modèle d'embeddings y est déjà
     chargé). Synchrone — appelé dans un thread. Lève en cas d'échec réseau."""
-    import json as _json
-    import urllib.request
-
     url = f"http://localhost:{settings.port}/internal/memory_tool"
-    payload = _json.dumps({"name": name, "args": args}).encode()
+    payload = _json_bytes({"name": name, "args": args})
     headers = {"Content-Type": "application/json"}
     if settings.api_auth_enabled:
         headers["Authorization"] = f"Bearer {settings.api_token.get_secret_value()}"
     req = urllib.request.Request(url, data=payload, headers=headers, method="POST")
     with urllib.request.urlopen(req, timeout=10) as resp:
-        data = _json.loads(resp.read().decode())
+        data = json.loads(resp.read())
     return data.get("content", ""), bool(data.get("is_error", False))
 
 
@@ -218,12 +232,10 @@ class _ProxyMemoryTool:
         return self._real.to_claude_schema()  # type: ignore[attr-defined]
 
     async def execute(self, **kwargs: object) -> object:
-        import asyncio as _asyncio
-
         from jarvis.capabilities.tools.base import ToolResult
 
         try:
-            content, is_error = await _asyncio.to_thread(
+            content, is_error = await asyncio.to_thread(
                 _call_api_memory_tool, self.name, dict(kwargs)
             )
             return ToolResult(content=content, is_error=is_error)
@@ -301,17 +313,40 @@ class JarvisVoiceAgent(Agent):
 # ─── Prewarm — chargé une fois au démarrage du process ─────────────────────────
 
 
-def prewarm(proc: object) -> None:
-    """Pré-charge les skills, outils et le modèle VAD avant l'arrivée d'un job."""
-    proc.userdata["instructions"] = _build_voice_instructions()  # type: ignore[attr-defined]
-    proc.userdata["tools"] = _build_voice_tools()  # type: ignore[attr-defined]
-    # Le modèle ONNX silero met ~300-800ms à charger ; le faire ici évite de payer
-    # ce coût au premier clic micro.
-    proc.userdata["vad"] = silero.VAD.load(  # type: ignore[attr-defined]
+# Fin de parole : silero attend 250 ms de silence (au lieu de 400) avant de clore un
+# tour, Deepgram finalise ses segments après 100 ms de silence et signale la fin
+# d'énoncé à 1 s. Les deux détections se complètent au lieu de s'additionner :
+# les 25 ms par défaut de Deepgram fragmentaient les phrases en finals partiels.
+_VAD_MIN_SILENCE_S = 0.25
+_DEEPGRAM_ENDPOINTING_MS = 100
+_DEEPGRAM_UTTERANCE_END_MS = 1000
+
+
+@lru_cache(maxsize=1)
+def _load_vad() -> object:
+    """Modèle VAD silero, chargé une seule fois par process.
+
+    Le modèle ONNX silero met ~300-800ms à charger. Les poids sont partagés
+    entre sessions (l'état par flux vit dans chaque stream VAD) : un job qui
+    arrive sans prewarm, ou une reconnexion, réutilise le même.
+    """
+    return silero.VAD.load(
         min_speech_duration=0.05,
-        min_silence_duration=0.4,
+        min_silence_duration=_VAD_MIN_SILENCE_S,
         activation_threshold=0.5,
     )
+
+
+def prewarm(proc: object) -> None:
+    """Pré-charge les skills, outils et le modèle VAD avant l'arrivée d'un job."""
+    # Charger le VAD ici évite de payer son chargement au premier clic micro. L'init
+    # de la session ONNX (code C, GIL relâché) tourne dans un thread pendant que le
+    # thread principal construit le container (skills, outils) : les deux se recouvrent.
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="vad-preload") as pool:
+        vad_future = pool.submit(_load_vad)
+        proc.userdata["instructions"] = _build_voice_instructions()  # type: ignore[attr-defined]
+        proc.userdata["tools"] = _build_voice_tools()  # type: ignore[attr-defined]
+        proc.userdata["vad"] = vad_future.result()  # type: ignore[attr-defined]
     logger.info("=" * 40)
     logger.info("✓ Jarvis vocal prêt — clique sur le micro")
     logger.info("=" * 40)
@@ -320,7 +355,7 @@ def prewarm(proc: object) -> None:
 # ─── Routing LLM du pipeline LiveKit ───────────────────────────────────────────
 
 
-def _build_voice_stt(env: dict) -> object:
+def _build_voice_stt(env: Mapping[str, str | None]) -> object:
     """STT du pipeline LiveKit, sélectionné via STT_PROVIDER (cloud).
 
     'deepgram' (défaut, meilleure latence) | 'openai' (Whisper) | 'google'
@@ -335,7 +370,7 @@ def _build_voice_stt(env: dict) -> object:
             stt = lk_openai.STT(
                 model="gpt-4o-mini-transcribe",
                 language="fr",
-                api_key=env.get("OPENAI_API_KEY", os.getenv("OPENAI_API_KEY", "")),
+                api_key=env.get("OPENAI_API_KEY", ""),
             )
             logger.info("STT pipeline = OpenAI (gpt-4o-mini-transcribe)")
             return stt
@@ -346,7 +381,7 @@ def _build_voice_stt(env: dict) -> object:
     except Exception as e:
         logger.warning("STT '%s' indisponible (%s) -> repli Deepgram", provider, e)
 
-    dg_key = env.get("DEEPGRAM_API_KEY", os.getenv("DEEPGRAM_API_KEY", "")).strip()
+    dg_key = env.get("DEEPGRAM_API_KEY", "").strip()
     # A missing/corrupted key fails STT silently at runtime: the mic captures audio
     # but Jarvis never receives a transcript (mic active, no answer to voice). Surface
     # it loudly instead so the user can fix .env instead of chasing a ghost.
@@ -363,11 +398,14 @@ def _build_voice_stt(env: dict) -> object:
         language="fr",
         smart_format=True,
         interim_results=True,
+        endpointing_ms=_DEEPGRAM_ENDPOINTING_MS,
+        utterance_end_ms=_DEEPGRAM_UTTERANCE_END_MS,
+        sample_rate=16000,
         api_key=dg_key,
     )
 
 
-def _build_voice_elevenlabs(env: dict) -> object:
+def _build_voice_elevenlabs(env: Mapping[str, str | None]) -> object:
     """TTS ElevenLabs — repli fiable (quota large, faible latence avec flash)."""
     quebec = env.get("QUEBEC_MODE", "false").strip().lower() in ("true", "1", "yes")
     voice_id = env.get("QUEBEC_VOICE_ID") if quebec else env.get("ELEVENLABS_VOICE_ID", "")
@@ -375,13 +413,13 @@ def _build_voice_elevenlabs(env: dict) -> object:
     return elevenlabs.TTS(
         model=model,
         voice_id=voice_id,
-        api_key=env.get("ELEVENLABS_API_KEY", os.getenv("ELEVENLABS_API_KEY", "")),
+        api_key=env.get("ELEVENLABS_API_KEY", ""),
         encoding="pcm_24000",
         chunk_length_schedule=[50, 90, 160, 250],
     )
 
 
-def _build_voice_tts(env: dict) -> object:
+def _build_voice_tts(env: Mapping[str, str | None]) -> object:
     """TTS du pipeline LiveKit, sélectionné via TTS_PROVIDER.
 
     'gemini'     → voix Google naturelle, MAIS le free tier est très limité
@@ -392,13 +430,13 @@ def _build_voice_tts(env: dict) -> object:
     'piper'      → pas de plugin LiveKit temps réel → repli ElevenLabs.
     """
     provider = env.get("TTS_PROVIDER", "elevenlabs").strip().lower()
-    has_eleven = bool(env.get("ELEVENLABS_API_KEY", os.getenv("ELEVENLABS_API_KEY", "")))
+    has_eleven = bool(env.get("ELEVENLABS_API_KEY", ""))
 
     if provider == "gemini":
         gemini = gemini_tts.TTS(
             model=env.get("GEMINI_TTS_MODEL", "gemini-2.5-flash-preview-tts"),
             voice_name=env.get("GEMINI_TTS_VOICE", "Kore"),
-            api_key=env.get("GOOGLE_API_KEY", os.getenv("GOOGLE_API_KEY", "")),
+            api_key=env.get("GOOGLE_API_KEY", ""),
         )
         if has_eleven:
             logger.info(
@@ -417,7 +455,7 @@ def _build_voice_tts(env: dict) -> object:
     return _build_voice_elevenlabs(env)
 
 
-def _build_voice_llm(env: dict) -> object:
+def _build_voice_llm(env: Mapping[str, str | None]) -> object:
     """Construit le LLM du pipeline vocal LiveKit selon API_BACKEND.
 
     Le pipeline temps réel LiveKit utilise ses propres plugins LLM (process
@@ -449,7 +487,7 @@ def _build_voice_llm(env: dict) -> object:
                 model=model,
                 temperature=0.7,
                 base_url="https://api.mistral.ai/v1",
-                api_key=env.get("MISTRAL_API_KEY", os.getenv("MISTRAL_API_KEY", "")),
+                api_key=env.get("MISTRAL_API_KEY", ""),
             )
 
         if backend == "anthropic":
@@ -481,10 +519,20 @@ def _build_voice_llm(env: dict) -> object:
 
 async def entrypoint(ctx: object) -> None:
 
-    _env = dotenv_values(PROJECT_ROOT / ".env")
+    # .env relu à chaque session (éditable sans redémarrer), environnement du
+    # process en repli : une seule vue chaînée pour toutes les lectures de clés.
+    _env = ChainMap(dotenv_values(PROJECT_ROOT / ".env"), os.environ)
 
     # TTS sélectionné via TTS_PROVIDER (Gemini + repli ElevenLabs, ou ElevenLabs seul).
     _tts = _build_voice_tts(_env)
+    _stt = _build_voice_stt(_env)
+    _llm = _build_voice_llm(_env)
+    # Ouvre dès maintenant les connexions TLS/WebSocket vers les providers (STT,
+    # LLM, TTS) : leurs handshakes se recouvrent avec la connexion à la room au lieu
+    # de s'ajouter après session.start(). prewarm() est idempotent et non bloquant,
+    # AgentSession le rappellera sans rouvrir de connexion.
+    for _service in (_stt, _llm, _tts):
+        _service.prewarm()  # type: ignore[attr-defined]
 
     # Pré-connecte la room avec un connect_timeout étendu pour éviter les retries v0/v1 de 5s.
     # livekit-agents utilise rtc.RoomOptions() sans connect_timeout (défaut Rust ~5s),
@@ -511,19 +559,15 @@ async def entrypoint(ctx: object) -> None:
     # fraîche et le profil disponible directement (pas via memory_search).
     instructions = _dynamic_context() + "\n\n" + instructions
     tools = userdata.get("tools") or _build_voice_tools()
-    vad = userdata.get("vad") or silero.VAD.load(
-        min_speech_duration=0.05,
-        min_silence_duration=0.4,
-        activation_threshold=0.5,
-    )
+    vad = userdata.get("vad") or _load_vad()
 
     session = AgentSession(
         # VAD — détection de voix (pré-chargé dans prewarm)
         vad=vad,
         # STT — sélectionné via STT_PROVIDER (deepgram / openai / google).
-        stt=_build_voice_stt(_env),
+        stt=_stt,
         # LLM — routé selon API_BACKEND (fallback Gemini 2.5 Flash)
-        llm=_build_voice_llm(_env),
+        llm=_llm,
         # TTS — sélectionné plus haut selon TTS_PROVIDER (Gemini ou ElevenLabs).
         tts=_tts,
         # Désactive l'adaptive interruption (agent-gateway.livekit.cloud) — local dev only
@@ -543,12 +587,39 @@ async def entrypoint(ctx: object) -> None:
 
 # ─── Lancement ────────────────────────────────────────────────────────────────
 
+# Sous-commandes qui enregistrent un worker auprès du serveur LiveKit.
+_WORKER_COMMANDS = frozenset({"start", "dev", "connect"})
+# Options de la CLI livekit-agents qui remplacent chaque variable d'env.
+_LIVEKIT_CLI_FLAGS = {
+    "LIVEKIT_URL": "--url",
+    "LIVEKIT_API_KEY": "--api-key",
+    "LIVEKIT_API_SECRET": "--api-secret",
+}
+
+
+def _missing_livekit_env(argv: list[str]) -> list[str]:
+    """Identifiants absents à la fois de l'env et de la ligne de commande."""
+
+    def _passed(flag: str) -> bool:
+        return any(arg == flag or arg.startswith(f"{flag}=") for arg in argv)
+
+    return [
+        k
+        for k in LIVEKIT_ENV_KEYS
+        if not (os.getenv(k) or "").strip() and not _passed(_LIVEKIT_CLI_FLAGS[k])
+    ]
+
 
 def main() -> None:
     """Point d'entrée du process voix (LiveKit). Appelé par :
     - `python -m jarvis.interfaces.voice.agent <args>` (entry point cible)
     - `python voice_agent.py <args>` (shim racine pendant la migration)
     """
+    # Sans identifiants LiveKit, le worker pré-chauffe un process (skills, outils,
+    # VAD) puis échoue à s'enregistrer, 32 fois : on s'arrête avant, message clair.
+    argv = sys.argv[1:]
+    if _WORKER_COMMANDS.intersection(argv[:1]) and (missing := _missing_livekit_env(argv)):
+        sys.exit(f"Voice agent : {', '.join(missing)} manquant(s) dans .env")
     cli.run_app(
         WorkerOptions(
             entrypoint_fnc=entrypoint,
@@ -94,4 +94,14 @@ def save_approval_config(config: ApprovalConfig) -> None:
     )
 
 
-approval_config = load_approval_config()
+# Chargée au premier accès (PEP 562) puis figée dans le module : une seule
+# instance partagée, que `interfaces.api.config.permissions` mute sur place.
+approval_config: ApprovalConfig
+
+
+def __getattr__(name: str) -> ApprovalConfig:
+    if name == "approval_config":
+        config = load_approval_config()
+        globals()["approval_config"] = config
+        return config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -19,7 +19,9 @@ elle ne peut pas vivre ici (RÈGLE 1 : kernel ne dépend pas d'engine).
 
 from __future__ import annotations
 
+import copy
 import json
+import threading
 from dataclasses import asdict, dataclass, field
 from enum import StrEnum
 
@@ -60,20 +62,38 @@ class BackendsConfig:
 
 _CONFIG_FILE = CONFIG_DIR / "backends.json"
 
+# Dernier parse de backends.json, indexé par la signature stat du fichier
+# (mtime_ns, taille, inode) : `get_backend()` relit la config à chaque spawn de
+# worker/subagent, un simple stat suffit tant que le fichier n'a pas bougé.
+_cache_lock = threading.Lock()
+_cache: tuple[tuple[int, int, int], BackendsConfig] | None = None
+
 
 def load_backends_config() -> BackendsConfig:
-    """Charge depuis CONFIG_DIR/backends.json. Crée avec valeurs par défaut si absent."""
-    if not _CONFIG_FILE.exists():
+    """Charge depuis CONFIG_DIR/backends.json. Crée avec valeurs par défaut si absent.
+
+    Retourne toujours une copie : l'appelant peut la muter sans polluer le cache.
+    """
+    global _cache
+
+    try:
+        st = _CONFIG_FILE.stat()
+    except FileNotFoundError:
         cfg = BackendsConfig()
         save_backends_config(cfg)
         return cfg
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    with _cache_lock:
+        if _cache is not None and _cache[0] == signature:
+            return copy.deepcopy(_cache[1])
 
     try:
         raw = json.loads(_CONFIG_FILE.read_text(encoding="utf-8"))
         ssh_raw = raw.pop("ssh", {})
         bt = BackendType(raw.get("default_backend", BackendType.AUTO))
         ssh_cfg = SSHConfig(**{k: v for k, v in ssh_raw.items() if hasattr(SSHConfig, k)})
-        return BackendsConfig(
+        cfg = BackendsConfig(
             default_backend=bt,
             ssh=ssh_cfg,
             remote_provider=raw.get("remote_provider", "modal"),
@@ -82,9 +102,17 @@ def load_backends_config() -> BackendsConfig:
         logger.warning("config/backends.json illisible — utilisation des valeurs par défaut")
         return BackendsConfig()
 
+    with _cache_lock:
+        _cache = (signature, cfg)
+    return copy.deepcopy(cfg)
+
 
 def save_backends_config(config: BackendsConfig) -> None:
     """Persiste la configuration dans CONFIG_DIR/backends.json."""
+    global _cache
+
+    with _cache_lock:
+        _cache = None
     _CONFIG_FILE.parent.mkdir(exist_ok=True)
     data = asdict(config)
     data["default_backend"] = str(config.default_backend)
@@ -94,4 +122,14 @@ def save_backends_config(config: BackendsConfig) -> None:
     )
 
 
-backends_config: BackendsConfig = load_backends_config()
+# Chargée au premier accès (PEP 562) : importer le kernel ne lit ni n'écrit
+# `backends.json` tant qu'aucun appelant n'a besoin de la config.
+backends_config: BackendsConfig
+
+
+def __getattr__(name: str) -> BackendsConfig:
+    if name == "backends_config":
+        cfg = load_backends_config()
+        globals()["backends_config"] = cfg
+        return cfg
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
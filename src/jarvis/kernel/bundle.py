@@ -5,12 +5,12 @@
 from __future__ import annotations
 
 import json
-import platform
 import shutil
 import sys
 from pathlib import Path
 from typing import Any
 
+from jarvis.kernel.host import SYSTEM
 from jarvis.kernel.paths import PROJECT_ROOT
 
 BUNDLE_DIR = PROJECT_ROOT / "bundle"
@@ -132,7 +132,7 @@ def prerequisites_status() -> dict[str, Any]:
     return {
         "bundle": bundle_available(),
         "bundle_version": manifest.get("version"),
-        "platform": platform.system().lower(),
+        "platform": SYSTEM,
         "python": python_ok,
         "python_path": python_path,
         "yolo_model": yolo_ok,
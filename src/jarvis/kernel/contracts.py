@@ -48,6 +48,11 @@ from jarvis.kernel.schemas import (
 # L1 — Providers
 # ════════════════════════════════════════════════════════════════════════════
 
+# Ouvre la partie dynamique du prompt système (date, mémoire, outils…) : tout ce
+# qui précède est la persona statique, identique d'un appel à l'autre — les
+# providers peuvent y poser un point de cache distinct.
+SYSTEM_DYNAMIC_MARKER = "=== CONTEXTE DYNAMIQUE ==="
+
 
 @runtime_checkable
 class LLMProvider(Protocol):
@@ -82,6 +87,14 @@ class LLMProvider(Protocol):
         """Vérifie que le provider est joignable."""
         ...
 
+    async def warmup(self) -> None:
+        """Ouvre la connexion avant la première vraie requête (best-effort, ne lève pas)."""
+        ...
+
+    async def aclose(self) -> None:
+        """Ferme les connexions gardées ouvertes par le provider (arrêt de l'app)."""
+        ...
+
 
 @runtime_checkable
 class MemoryStore(Protocol):
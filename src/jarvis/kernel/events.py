@@ -33,7 +33,7 @@ EventHandler = Callable[[Any], Awaitable[None]]
 # ── Événements du noyau (premiers candidats — CDC §A.1.3) ──────────────────────
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MissionCompleted:
     """Une mission du Mission Engine s'est terminée (succès ou échec)."""
 
@@ -43,7 +43,7 @@ class MissionCompleted:
     completed_at: datetime = field(default_factory=datetime.now)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MemoryIngested:
     """Un fact (ou un batch) vient d'être ingéré dans la mémoire."""
 
@@ -53,7 +53,7 @@ class MemoryIngested:
     ingested_at: datetime = field(default_factory=datetime.now)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NotificationRequested:
     """Une couche basse demande qu'une notification soit envoyée à l'utilisateur."""
 
@@ -62,7 +62,7 @@ class NotificationRequested:
     priority: str = "normal"  # "low" | "normal" | "high"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BudgetThresholdReached:
     """Un seuil de budget LLM a été franchi (ratio sur le plafond de la mission/jour)."""
 
@@ -0,0 +1,31 @@
+# Copyright (C) 2026 Barthélemy Houot
+# This file is part of Jarvis OS, licensed under the GNU AGPL-3.0-or-later.
+# See the LICENSE file or <https://www.gnu.org/licenses/agpl-3.0.html>.
+
+"""OS et architecture de la machine hôte, lus une seule fois.
+
+`platform.system()` passe par `platform.uname()` (sous Windows : WMI ou un
+`cmd /c ver` externe) et `platform.processor()` lance `uname -p` sous macOS.
+`sys.platform` est une constante figée à la compilation de l'interpréteur :
+c'est elle qui sert à détecter l'OS, `platform.machine()` ne sert qu'à l'arch.
+"""
+
+from __future__ import annotations
+
+import platform
+import sys
+from functools import lru_cache
+from typing import Final
+
+# Même vocabulaire que `platform.system().lower()` : "darwin", "windows", "linux".
+SYSTEM: Final[str] = "windows" if sys.platform == "win32" else sys.platform.rstrip("0123456789")
+# Booléens figés à l'import : les tests d'OS ne coûtent plus ni appel ni comparaison.
+IS_WINDOWS: Final[bool] = SYSTEM == "windows"
+IS_MACOS: Final[bool] = SYSTEM == "darwin"
+IS_LINUX: Final[bool] = SYSTEM == "linux"
+
+
+@lru_cache(maxsize=1)
+def machine() -> str:
+    """Architecture en minuscules ("arm64", "x86_64", "amd64", …)."""
+    return platform.machine().lower()
@@ -215,7 +215,8 @@ def _check_llm_key_live(backend: str, key_name: str, key: str) -> None:
     url, headers_tmpl = entry
     headers = {k: v.replace("{key}", key) for k, v in headers_tmpl.items()}
     try:
-        urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=6)
+        with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=6):
+            pass
     except urllib.error.HTTPError as e:
         if e.code in (401, 403):
             _warn(
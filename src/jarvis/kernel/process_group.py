@@ -0,0 +1,37 @@
+# Copyright (C) 2026 Barthélemy Houot
+# This file is part of Jarvis OS, licensed under the GNU AGPL-3.0-or-later.
+# See the LICENSE file or <https://www.gnu.org/licenses/agpl-3.0.html>.
+
+"""Groupe de processus dédié pour les commandes shell, tué d'un bloc au timeout.
+
+`sh -c "a | b"` : proc.kill() ne touche que le shell, `a` et `b` continuent de
+tourner. En lançant l'enfant dans sa propre session (POSIX) ou son propre groupe
+(Windows), on peut signaler toute la pipeline.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+
+
+def new_group_kwargs() -> dict[str, object]:
+    """kwargs à passer à asyncio.create_subprocess_* pour isoler le groupe."""
+    if sys.platform == "win32":
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+
+def kill_group(proc: asyncio.subprocess.Process) -> None:
+    """Tue le process et tout son groupe ; silencieux s'il est déjà terminé."""
+    try:
+        if sys.platform == "win32":
+            proc.send_signal(signal.CTRL_BREAK_EVENT)
+            proc.kill()
+        else:
+            os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
@@ -0,0 +1,138 @@
+# Copyright (C) 2026 Barthélemy Houot
+# This file is part of Jarvis OS, licensed under the GNU AGPL-3.0-or-later.
+# See the LICENSE file or <https://www.gnu.org/licenses/agpl-3.0.html>.
+
+"""Flux texte écrit depuis un thread dédié : l'appelant ne bloque jamais sur l'I/O.
+
+Sink loguru du terminal : quand le lecteur du pipe (Electron, terminal Windows
+lent) ne suit pas, write() sur stderr bloque la boucle asyncio qui a émis le log.
+Ici write() ne fait qu'empiler ; un thread vide la file par lots (une écriture
+et un flush par lot).
+
+File bornée : si le lecteur ne suit plus du tout, les lignes en trop sont
+comptées puis jetées (le compte est écrit avec le lot suivant) plutôt que
+d'accumuler sans limite en mémoire. Après close(), write() écrit directement
+dans le flux : les logs de la fin de l'arrêt ne sont pas perdus.
+
+Pas de `enqueue=True` loguru : il sérialise l'enregistrement complet (extras
+compris) par pickle, et un kwarg non sérialisable ferait perdre la ligne.
+
+loguru n'enrobe par colorama que `sys.__stderr__` lui-même : console_writer()
+active donc les séquences ANSI de la console Windows avant d'envelopper stderr.
+"""
+
+from __future__ import annotations
+
+import atexit
+import queue
+import sys
+import threading
+from typing import TextIO
+
+_BATCH_MAX = 64
+# Lignes en attente au plus (~quelques Mo de logs) avant de jeter les suivantes.
+_QUEUE_MAX = 10_000
+
+
+class QueuedWriter:
+    """Enveloppe `stream` : write() empile, un thread daemon écrit par lots."""
+
+    def __init__(self, stream: TextIO, maxsize: int = _QUEUE_MAX) -> None:
+        self._stream = stream
+        self._queue: queue.Queue[str | None] = queue.Queue(maxsize=maxsize)
+        self._closed = False
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._drain, name="queued-writer", daemon=True)
+        self._thread.start()
+        # Vide la file à la sortie : les dernières lignes (erreur fatale) sont les utiles.
+        atexit.register(self.close)
+
+    def write(self, text: str) -> None:
+        if self._closed:
+            self._write_now(text)
+            return
+        try:
+            self._queue.put_nowait(text)
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped += 1
+
+    def flush(self) -> None:
+        """No-op : le thread flushe après chaque lot."""
+
+    @property
+    def encoding(self) -> str | None:
+        return getattr(self._stream, "encoding", None)
+
+    def isatty(self) -> bool:
+        try:
+            return self._stream.isatty()
+        except (OSError, ValueError):  # flux fermé
+            return False
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread.is_alive():
+            try:
+                self._queue.put(None, timeout=2.0)
+            except queue.Full:  # flux bloqué : le thread daemon sera abandonné
+                return
+            self._thread.join(timeout=2.0)
+        if not self._thread.is_alive():
+            # Lignes empilées pendant l'arrêt, après la sentinelle.
+            rest: list[str] = []
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    rest.append(item)
+            if rest:
+                self._write_now("".join(rest))
+
+    def _write_now(self, text: str) -> None:
+        try:
+            self._stream.write(text)
+            self._stream.flush()
+        except (OSError, ValueError):  # flux fermé / pipe cassé
+            pass
+
+    def _drain(self) -> None:
+        q = self._queue
+        while True:
+            item = q.get()
+            batch: list[str] = []
+            with self._dropped_lock:
+                dropped, self._dropped = self._dropped, 0
+            if dropped:
+                batch.append(f"[queued-writer] {dropped} ligne(s) de log perdue(s), flux saturé\n")
+            while item is not None:
+                batch.append(item)
+                if len(batch) >= _BATCH_MAX:
+                    break
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                self._write_now("".join(batch))
+            if item is None:
+                return
+
+
+def console_writer() -> QueuedWriter:
+    """QueuedWriter sur sys.stderr, couleurs ANSI rendues par la console Windows."""
+    if sys.platform == "win32":
+        try:
+            import colorama  # dépendance de loguru sous Windows
+        except ImportError:
+            pass
+        else:
+            # Active le mode VT, ou remplace sys.stderr par un flux qui traduit l'ANSI
+            # (console historique) : à faire avant de capturer sys.stderr.
+            colorama.just_fix_windows_console()
+    return QueuedWriter(sys.stderr)
@@ -18,6 +18,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import StrEnum
+from functools import lru_cache
 from typing import Any
 
 from jarvis.kernel.vocab import AccessLevel, AutonomyLevel
@@ -404,23 +405,39 @@ PRICING: dict[str, dict[str, dict[str, float]]] = {
 }
 
 
+@lru_cache(maxsize=256)
+def _pricing_key(provider: str, model: str) -> str | None:
+    """Entrée tarifaire d'un modèle : exacte, sinon par préfixe (ex. suffixe de date).
+
+    Mémoïsé : appelé à chaque usage tracké, pour une poignée de modèles distincts —
+    le scan par préfixe n'est fait qu'une fois par couple (provider, model).
+    """
+    pricing = PRICING.get(provider, {})
+    if model in pricing:
+        return model
+    for key in pricing:
+        if model.startswith(key) or key.startswith(model):
+            return key
+    return None
+
+
 def calculate_cost(provider: str, model: str, **kwargs: float) -> float:
     """Calcule le coût en USD pour un usage donné."""
-    pricing = PRICING.get(provider, {})
-    p = pricing.get(model)
-    if p is None:
-        for key in pricing:
-            if model.startswith(key) or key.startswith(model):
-                p = pricing[key]
-                break
-    if p is None:
+    key = _pricing_key(provider, model)
+    if key is None:
         return 0.0
+    p = PRICING[provider][key]
 
     cost = 0.0
     if "input_tokens" in kwargs and "input_per_1m" in p:
         cost += kwargs["input_tokens"] / 1_000_000 * p["input_per_1m"]
     if "output_tokens" in kwargs and "output_per_1m" in p:
         cost += kwargs["output_tokens"] / 1_000_000 * p["output_per_1m"]
+    # Prompt caching : écriture facturée 1,25× l'input, lecture 0,1×
+    if "cache_write_tokens" in kwargs and "input_per_1m" in p:
+        cost += kwargs["cache_write_tokens"] / 1_000_000 * p["input_per_1m"] * 1.25
+    if "cache_read_tokens" in kwargs and "input_per_1m" in p:
+        cost += kwargs["cache_read_tokens"] / 1_000_000 * p["input_per_1m"] * 0.1
     if "characters" in kwargs and "per_1k_chars" in p:
         cost += kwargs["characters"] / 1000 * p["per_1k_chars"]
     if "audio_minutes" in kwargs and "per_minute" in p:
@@ -484,6 +501,11 @@ class SkillRecord:
 from collections.abc import Callable  # noqa: E402
 from uuid import UUID, uuid4  # noqa: E402
 
+# Historique gardé en mémoire (et renvoyé au LLM à chaque tour) : au-delà de
+# _CONTEXT_MAX_MESSAGES, on redescend d'un coup aux _CONTEXT_KEEP_MESSAGES derniers.
+_CONTEXT_MAX_MESSAGES = 80
+_CONTEXT_KEEP_MESSAGES = 40
+
 
 @dataclass
 class Session:
@@ -503,5 +525,22 @@ class Session:
 
     def add_message(self, role: str, content: str) -> None:
         self.messages.append({"role": role, "content": content})
+        if len(self.messages) > _CONTEXT_MAX_MESSAGES:
+            self._trim_context()
         if self._persist:
             self._persist(role, content)
+
+    def _trim_context(self) -> None:
+        """Ne garde que les _CONTEXT_KEEP_MESSAGES derniers messages (le JSONL garde tout).
+
+        Par paliers plutôt qu'en fenêtre glissante : le préfixe envoyé au LLM reste
+        identique pendant 40 messages, donc servi par le prompt cache, au lieu de
+        changer à chaque tour. Coupe sur un message user : l'API Anthropic exige
+        que l'historique commence par lui.
+        """
+        messages = self.messages
+        start = len(messages) - _CONTEXT_KEEP_MESSAGES
+        while start < len(messages) and messages[start].get("role") != "user":
+            start += 1
+        if start < len(messages):
+            del messages[:start]
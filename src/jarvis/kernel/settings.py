@@ -32,6 +32,10 @@ _VALID_WHISPER = frozenset(
     }
 )
 
+# Identifiants LiveKit, relus dans os.environ à chaque usage (éditables depuis les
+# réglages sans redémarrage) : token vocal de l'API et garde du worker voix.
+LIVEKIT_ENV_KEYS = ("LIVEKIT_URL", "LIVEKIT_API_KEY", "LIVEKIT_API_SECRET")
+
 
 class Settings(BaseSettings):
     """Configuration centrale de Jarvis, chargée depuis .env."""
@@ -81,6 +85,14 @@ class Settings(BaseSettings):
         description="URL du serveur Ollama.",
     )
     ollama_model: str = Field(default="mistral", description="Modèle Ollama à utiliser.")
+    ollama_pool_connections: int = Field(
+        default=8,
+        ge=1,
+        description=(
+            "Connexions HTTP vers Ollama gardées ouvertes (keep-alive) et plafond du pool. "
+            "À aligner sur OLLAMA_NUM_PARALLEL côté serveur si les appels partent en rafale."
+        ),
+    )
 
     # ── Serveur ───────────────────────────────────────────────
     host: str = Field(
@@ -117,6 +129,15 @@ class Settings(BaseSettings):
             "Ne jamais laisser vide avec auth activée et exposition réseau."
         ),
     )
+    api_gzip_min_bytes: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Compresse en gzip les réponses API d'au moins N octets (0 = désactivé). "
+            "Utile quand l'UI passe par Tailscale ou un VPS : historiques de sessions "
+            "et mémoire en JSON se compressent très bien. Sans intérêt en localhost."
+        ),
+    )
 
     # ── Mémoire ───────────────────────────────────────────────
     memory_dir: str = Field(
@@ -256,6 +277,21 @@ class Settings(BaseSettings):
         default="tiny",
         description="Taille du modèle faster-whisper : tiny, base, small, medium, large.",
     )
+    whisper_device: Literal["auto", "cuda", "cpu"] = Field(
+        default="auto",
+        description=(
+            "Périphérique faster-whisper : 'auto' (GPU CUDA si détecté, sinon CPU), "
+            "'cuda' ou 'cpu' pour forcer."
+        ),
+    )
+    whisper_cpu_threads: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Threads CTranslate2 pour Whisper sur CPU. 0 = auto : un par cœur physique "
+            "(moitié des cœurs logiques), jamais moins que les 4 par défaut."
+        ),
+    )
 
     @field_validator("whisper_model", mode="before")
     @classmethod
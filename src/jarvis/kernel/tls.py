@@ -0,0 +1,25 @@
+# Copyright (C) 2026 Barthélemy Houot
+# This file is part of Jarvis OS, licensed under the GNU AGPL-3.0-or-later.
+# See the LICENSE file or <https://www.gnu.org/licenses/agpl-3.0.html>.
+
+"""Contexte TLS unique partagé par tous les clients httpx de Jarvis.
+
+Sans `verify=`, chaque httpx.AsyncClient() construit son propre ssl.SSLContext et
+relit tout le bundle de certificats (certifi) : quelques ms et une rafale
+d'allocations à chaque `async with httpx.AsyncClient()` ouvert par requête — même
+vers localhost, le transport étant créé à l'instanciation. Un SSLContext se
+partage sans risque entre clients : on le construit une fois.
+"""
+
+from __future__ import annotations
+
+import ssl
+from functools import lru_cache
+
+import httpx
+
+
+@lru_cache(maxsize=1)
+def tls_context() -> ssl.SSLContext:
+    """SSLContext partagé, mêmes réglages que le défaut httpx (certifi, SSL_CERT_FILE)."""
+    return httpx.create_ssl_context()
@@ -45,7 +45,7 @@ class ClapDetector:
         self._callback = callback
         self._threshold = settings.clap_amplitude_threshold
         self._clap_times: list[float] = []
-        self._last_trigger = 0.0
+        self._last_trigger = float("-inf")
         self._in_clap = False
         self._clap_start = 0.0
         self._running = False
@@ -109,7 +109,7 @@ class ClapDetector:
             return
 
         amplitude = float(np.abs(indata).max())
-        now = time.time()
+        now = time.monotonic()
 
         if amplitude > self._threshold:
             if not self._in_clap:
@@ -5,7 +5,10 @@
 from __future__ import annotations
 
 import asyncio
+import os
+from functools import lru_cache
 
+import ctranslate2
 import numpy as np
 from faster_whisper import WhisperModel
 from loguru import logger
@@ -16,11 +19,49 @@ from jarvis.kernel.settings import settings
 _model: WhisperModel | None = None
 
 
+@lru_cache(maxsize=1)
+def _cuda_available() -> bool:
+    """Sondé une seule fois : CTranslate2 voit-il au moins un GPU CUDA ?"""
+    try:
+        return ctranslate2.get_cuda_device_count() > 0
+    except Exception:  # noqa: BLE001
+        return False
+
+
+def _device_and_compute_type() -> tuple[str, str]:
+    """(device, compute_type) : float16 sur GPU, int8 sur CPU (float16 n'y est pas supporté)."""
+    device = settings.whisper_device
+    if device == "auto":
+        device = "cuda" if _cuda_available() else "cpu"
+    return device, "float16" if device == "cuda" else "int8"
+
+
+def _cpu_threads() -> int:
+    """Threads CPU du décodeur : CTranslate2 s'arrête à 4 par défaut, quel que soit le CPU."""
+    if settings.whisper_cpu_threads:
+        return settings.whisper_cpu_threads
+    # os.cpu_count() compte les cœurs logiques : la moitié ≈ cœurs physiques (HT/SMT).
+    return max(4, (os.cpu_count() or 4) // 2)
+
+
 def _load_model() -> WhisperModel:
     global _model
     if _model is None:
-        logger.info("Loading Whisper model", size=settings.whisper_model)
-        _model = WhisperModel(settings.whisper_model, device="auto", compute_type="float16")
+        device, compute_type = _device_and_compute_type()
+        cpu_threads = _cpu_threads()
+        logger.info(
+            "Loading Whisper model",
+            size=settings.whisper_model,
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=cpu_threads,
+        )
+        _model = WhisperModel(
+            settings.whisper_model,
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=cpu_threads,
+        )
         logger.info("Whisper model ready")
     return _model
 
@@ -7,17 +7,21 @@ from __future__ import annotations
 import asyncio
 import io
 import os
+import struct
 import wave
 from datetime import datetime
 from pathlib import Path
 
 import httpx
 from loguru import logger
-from piper import PiperVoice
 
 from jarvis.kernel.contracts import UsageTracker
 from jarvis.kernel.schemas import UsageEntry, calculate_cost
 from jarvis.kernel.settings import settings
+from jarvis.kernel.tls import tls_context
+
+# En-tête RIFF/WAVE PCM canonique (44 octets) : RIFF, fmt (16 octets), data.
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
 
 
 class TTSEngine:
@@ -29,6 +33,12 @@ class TTSEngine:
 
     def __init__(self, tracker: UsageTracker | None = None) -> None:
         self._piper_voice: object = None
+        # Client Gemini réutilisé d'une phrase à l'autre (pool HTTP conservé),
+        # recréé seulement si la clé change : (api_key, client)
+        self._gemini: tuple[str, object] | None = None
+        # Client HTTP ElevenLabs partagé : une réponse = une phrase, la connexion
+        # TLS vers api.elevenlabs.io reste ouverte (keep-alive) entre les phrases
+        self._elevenlabs_http: httpx.AsyncClient | None = None
         self._tracker = tracker
 
     def set_tracker(self, tracker: UsageTracker) -> None:
@@ -47,6 +57,21 @@ class TTSEngine:
             return await self._synthesize_gemini(text)
         return await self._synthesize_piper(text)
 
+    def _elevenlabs_client(self) -> httpx.AsyncClient:
+        if self._elevenlabs_http is None or self._elevenlabs_http.is_closed:
+            self._elevenlabs_http = httpx.AsyncClient(
+                timeout=10.0,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=4),
+                verify=tls_context(),
+            )
+        return self._elevenlabs_http
+
+    async def aclose(self) -> None:
+        """Ferme le client ElevenLabs partagé (arrêt de l'app)."""
+        if self._elevenlabs_http is not None:
+            await self._elevenlabs_http.aclose()
+        self._elevenlabs_http = None
+
     async def _synthesize_elevenlabs(self, text: str) -> bytes:
         """ElevenLabs streaming TTS — modèle turbo, latence ~300ms."""
         voice_id = (
@@ -75,28 +100,25 @@ class TTSEngine:
             "optimize_streaming_latency": 3,
         }
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(url, json=payload, headers=headers)
-                if response.status_code == 200:
-                    logger.debug(
-                        f"ElevenLabs TTS done — {len(text)} chars, {len(response.content)} bytes"
-                    )
-                    cost = calculate_cost(
-                        "elevenlabs", settings.elevenlabs_model, characters=len(text)
-                    )
-                    if self._tracker is not None:
-                        self._tracker.track(
-                            UsageEntry(
-                                timestamp=datetime.now().isoformat(),
-                                provider="elevenlabs",
-                                model=settings.elevenlabs_model,
-                                characters=len(text),
-                                cost_usd=cost,
-                                context="conversation",
-                            )
+            response = await self._elevenlabs_client().post(url, json=payload, headers=headers)
+            if response.status_code == 200:
+                logger.debug(
+                    f"ElevenLabs TTS done — {len(text)} chars, {len(response.content)} bytes"
+                )
+                cost = calculate_cost("elevenlabs", settings.elevenlabs_model, characters=len(text))
+                if self._tracker is not None:
+                    self._tracker.track(
+                        UsageEntry(
+                            timestamp=datetime.now().isoformat(),
+                            provider="elevenlabs",
+                            model=settings.elevenlabs_model,
+                            characters=len(text),
+                            cost_usd=cost,
+                            context="conversation",
                         )
-                    return response.content
-                logger.error(f"ElevenLabs error {response.status_code} — {response.text[:300]}")
+                    )
+                return response.content
+            logger.error(f"ElevenLabs error {response.status_code} — {response.text[:300]}")
         except Exception as e:
             logger.error("ElevenLabs request failed", error=str(e))
         # Fallback Piper si ElevenLabs échoue
@@ -118,7 +140,9 @@ class TTSEngine:
             from google import genai
             from google.genai import types
 
-            client = genai.Client(api_key=api_key)
+            if self._gemini is None or self._gemini[0] != api_key:
+                self._gemini = (api_key, genai.Client(api_key=api_key))
+            client = self._gemini[1]
             config = types.GenerateContentConfig(
                 response_modalities=["AUDIO"],
                 speech_config=types.SpeechConfig(
@@ -161,7 +185,9 @@ class TTSEngine:
                         context="conversation",
                     )
                 )
-            logger.debug(f"Gemini TTS done — {len(text)} chars, {len(pcm)} pcm bytes")
+            logger.debug(
+                "Gemini TTS done — {chars} chars, {pcm} pcm bytes", chars=len(text), pcm=len(pcm)
+            )
             return _pcm_to_wav(pcm, sample_rate=24000)
         except Exception as e:
             msg = str(e)
@@ -193,14 +219,17 @@ class TTSEngine:
                     "Lance : mkdir -p models/piper && "
                     "curl -L -o models/piper/fr_FR-upmc-medium.onnx <url>"
                 )
+            # Import différé : piper (~90 ms) n'est chargé qu'à la première synthèse
+            # locale — jamais si TTS_PROVIDER=elevenlabs/gemini ne retombe pas dessus.
+            from piper import PiperVoice
+
             self._piper_voice = PiperVoice.load(str(model_path))
             logger.info("Piper model loaded", model=str(model_path))
 
         buf = io.BytesIO()
         with wave.open(buf, "wb") as wf:
             self._piper_voice.synthesize_wav(text, wf)  # type: ignore[union-attr]
-        buf.seek(0)
-        return buf.read()
+        return buf.getvalue()
 
     async def warmup(self) -> None:
         """Préchauffer le moteur TTS au démarrage."""
@@ -223,15 +252,30 @@ def _extract_gemini_pcm(resp: object) -> bytes:
 
 
 def _pcm_to_wav(pcm: bytes, sample_rate: int = 24000) -> bytes:
-    """Emballe du PCM 16-bit mono en conteneur WAV (décodable par le navigateur)."""
-    buf = io.BytesIO()
-    with wave.open(buf, "wb") as wf:
-        wf.setnchannels(1)
-        wf.setsampwidth(2)  # 16-bit
-        wf.setframerate(sample_rate)
-        wf.writeframes(pcm)
-    buf.seek(0)
-    return buf.read()
+    """Emballe du PCM 16-bit mono en conteneur WAV (décodable par le navigateur).
+
+    La taille étant connue d'avance, l'en-tête est écrit juste du premier coup :
+    pas de tampon wave à réécrire en fin de flux (seek + patch de l'en-tête).
+    """
+    channels, sampwidth = 1, 2  # mono, 16-bit
+    size = len(pcm)
+    pad = b"\x00" if size % 2 else b""  # RIFF : chunk de longueur paire
+    header = _WAV_HEADER.pack(
+        b"RIFF",
+        36 + size + len(pad),
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,  # WAVE_FORMAT_PCM
+        channels,
+        sample_rate,
+        sample_rate * channels * sampwidth,
+        channels * sampwidth,
+        sampwidth * 8,
+        b"data",
+        size,
+    )
+    return b"".join((header, pcm, pad))
 
 
 tts_engine = TTSEngine()
@@ -7,9 +7,10 @@ from __future__ import annotations
 import asyncio
 import json as _json
 import os
-import uuid
+import secrets
 from collections.abc import AsyncIterator, Awaitable, Callable
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any
 
 import anthropic
@@ -17,12 +18,15 @@ from google.genai import types as _t
 from loguru import logger
 from openai import AsyncOpenAI
 
-from jarvis.kernel.contracts import UsageTracker
+from jarvis.kernel.contracts import SYSTEM_DYNAMIC_MARKER, UsageTracker
 from jarvis.kernel.schemas import ToolCapture, UsageEntry, calculate_cost
 from jarvis.kernel.settings import settings
 from jarvis.providers.llm.base import LLMProvider
 
 _MAX_TOOL_ITERATIONS = 20
+# Arguments de tool_calls réencodés à chaque tour pour tout l'historique : compact et
+# sans échappement \uXXXX (un accent = 2 octets UTF-8 au lieu de 6 en ensure_ascii)
+_ARGS_ENCODER = _json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
 
 # CYCLE 1 (CDC §C.1.3) — bouclé : aucun import depuis `jarvis.engine.*`.
 # Le tracker est reçu par constructeur (DI), typé via le Protocol
@@ -47,13 +51,15 @@ def _claude_tools_to_openai(tools: list[dict]) -> list[dict]:
     ]
 
 
-def _messages_to_openai(messages: list[dict]) -> list[dict]:
+def _messages_to_openai(messages: list[dict], system: str | None = None) -> list[dict]:
     """Convertit les messages Anthropic (tool_use / tool_result) vers le format OpenAI.
 
     Nécessaire pour la passe de synthèse où agent.py injecte des blocs Anthropic
     dans l'historique avant un appel complete() sans outils (Mistral).
+    `system` (si fourni) ouvre la liste : une seule liste construite, pas de
+    recopie `[system, *converted]` de tout l'historique à chaque requête.
     """
-    result: list[dict] = []
+    result: list[dict] = [] if system is None else [{"role": "system", "content": system}]
     for msg in messages:
         role: str = msg["role"]
         content: Any = msg.get("content", "")
@@ -73,7 +79,7 @@ def _messages_to_openai(messages: list[dict]) -> list[dict]:
                     "type": "function",
                     "function": {
                         "name": b["name"],
-                        "arguments": _json.dumps(b.get("input", {})),
+                        "arguments": _ARGS_ENCODER.encode(b.get("input", {})),
                     },
                 }
                 for b in content
@@ -107,6 +113,62 @@ def _messages_to_openai(messages: list[dict]) -> list[dict]:
 # ── Providers ─────────────────────────────────────────────────────────────────
 
 
+def _with_prefix_cache(
+    system: str, messages: list[dict], cache_messages: bool = False
+) -> tuple[str | list[dict], list[dict]]:
+    """Pose les points de cache Anthropic (prompt caching) sur le préfixe de la requête.
+
+    Breakpoints `ephemeral`, seulement là où le préfixe est réellement renvoyé (une
+    écriture de cache coûte 1,25× le prix d'entrée) :
+      - fin de la persona statique (avant SYSTEM_DYNAMIC_MARKER), identique d'un
+        appel à l'autre. Le contexte dynamique qui suit change à chaque tour : il
+        n'a pas de breakpoint propre. Un system sans marqueur (appels ponctuels :
+        consolidation, rappel, brouillons…) n'en reçoit pas ;
+      - dernier bloc du dernier message si `cache_messages` : tool_loop renvoie tout
+        ce préfixe à l'itération suivante. D'un tour de conversation à l'autre,
+        l'historique n'est pas un préfixe stable — il suit le contexte dynamique
+        (date à la minute, rappel, notifications) du system.
+    Les dicts de l'appelant ne sont pas modifiés. Sous le seuil minimal du modèle
+    (~1024 tokens), l'API ignore simplement les breakpoints.
+    """
+    cached_system: str | list[dict] = system
+    static, sep, dynamic = system.partition(SYSTEM_DYNAMIC_MARKER)
+    if sep and static:
+        cached_system = [
+            {"type": "text", "text": static, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": sep + dynamic},
+        ]
+    if not cache_messages or not messages:
+        return cached_system, messages
+
+    last = messages[-1]
+    content = last.get("content")
+    if isinstance(content, str) and content:
+        blocks = [{"type": "text", "text": content, "cache_control": {"type": "ephemeral"}}]
+    elif isinstance(content, list) and content:
+        blocks = [*content[:-1], {**content[-1], "cache_control": {"type": "ephemeral"}}]
+    else:
+        return cached_system, messages
+    return cached_system, [*messages[:-1], {**last, "content": blocks}]
+
+
+def _int_usage(usage: object, field: str) -> int:
+    value = getattr(usage, field, 0)
+    return value if isinstance(value, int) else 0
+
+
+def _anthropic_cost(model: str, usage: anthropic.types.Usage) -> float:
+    """Coût d'une réponse Anthropic, lectures/écritures de cache comprises."""
+    return calculate_cost(
+        "anthropic",
+        model,
+        input_tokens=usage.input_tokens,
+        output_tokens=usage.output_tokens,
+        cache_write_tokens=_int_usage(usage, "cache_creation_input_tokens"),
+        cache_read_tokens=_int_usage(usage, "cache_read_input_tokens"),
+    )
+
+
 class AnthropicProvider(LLMProvider):
     """Provider Anthropic Claude via SDK officiel."""
 
@@ -139,11 +201,12 @@ class AnthropicProvider(LLMProvider):
         stream: bool = False,
         context: str = "",
     ) -> str | AsyncIterator[str]:
+        cached_system, cached_messages = _with_prefix_cache(system, messages)
         kwargs: dict = {
             "model": self._model,
             "max_tokens": self._max_tokens,
-            "system": system,
-            "messages": messages,
+            "system": cached_system,
+            "messages": cached_messages,
         }
         if tools:
             kwargs["tools"] = tools
@@ -154,12 +217,7 @@ class AnthropicProvider(LLMProvider):
         response = await self._client.messages.create(**kwargs)
         text = response.content[0].text
         logger.debug("Anthropic complete", model=self._model, tokens=response.usage.output_tokens)
-        cost = calculate_cost(
-            "anthropic",
-            self._model,
-            input_tokens=response.usage.input_tokens,
-            output_tokens=response.usage.output_tokens,
-        )
+        cost = _anthropic_cost(self._model, response.usage)
         if self._tracker is not None:
             self._tracker.track(
                 UsageEntry(
@@ -190,11 +248,12 @@ class AnthropicProvider(LLMProvider):
         Le ToolCapture est populé dès que l'itérateur retourné est entièrement consommé.
         """
         capture = ToolCapture()
+        cached_system, cached_messages = _with_prefix_cache(system, messages)
         kwargs: dict = {
             "model": self._model,
             "max_tokens": 4096,
-            "system": system,
-            "messages": messages,
+            "system": cached_system,
+            "messages": cached_messages,
         }
         if tools:
             kwargs["tools"] = tools
@@ -249,19 +308,17 @@ class AnthropicProvider(LLMProvider):
         current = list(messages)
 
         for iteration in range(_MAX_TOOL_ITERATIONS):
+            cached_system, cached_messages = _with_prefix_cache(
+                system, current, cache_messages=True
+            )
             response = await self._client.messages.create(
                 model=self._model,
                 max_tokens=4096,
-                system=system,
-                messages=current,
+                system=cached_system,
+                messages=cached_messages,
                 tools=tools,
             )
-            cost = calculate_cost(
-                "anthropic",
-                self._model,
-                input_tokens=response.usage.input_tokens,
-                output_tokens=response.usage.output_tokens,
-            )
+            cost = _anthropic_cost(self._model, response.usage)
             if self._tracker is not None:
                 self._tracker.track(
                     UsageEntry(
@@ -313,14 +370,22 @@ class AnthropicProvider(LLMProvider):
                 for (tool_id, _, _), result in zip(tool_calls, results, strict=True)
             ]
 
-            current = current + [
-                {"role": "assistant", "content": assistant_content},
-                {"role": "user", "content": tool_results},
-            ]
+            current.extend(
+                (
+                    {"role": "assistant", "content": assistant_content},
+                    {"role": "user", "content": tool_results},
+                )
+            )
 
         logger.warning("Tool loop max iterations reached", max=_MAX_TOOL_ITERATIONS)
         return "Je n'ai pas pu terminer — trop d'étapes."
 
+    async def warmup(self) -> None:
+        try:
+            await self._client.models.list(limit=1)
+        except Exception as e:  # noqa: BLE001
+            logger.debug("Anthropic warmup ignoré", error=str(e))
+
     async def health_check(self) -> bool:
         try:
             await self._client.messages.create(
@@ -363,7 +428,7 @@ class MistralProvider(LLMProvider):
         stream: bool = False,
         context: str = "",
     ) -> str | AsyncIterator[str]:
-        full_messages = [{"role": "system", "content": system}, *_messages_to_openai(messages)]
+        full_messages = _messages_to_openai(messages, system)
 
         if stream:
             return self._stream(full_messages)
@@ -403,7 +468,7 @@ class MistralProvider(LLMProvider):
         appelle ensuite complete() avec l'historique Anthropic converti via _messages_to_openai.
         """
         capture = ToolCapture()
-        full_messages = [{"role": "system", "content": system}, *_messages_to_openai(messages)]
+        full_messages = _messages_to_openai(messages, system)
         openai_tools = _claude_tools_to_openai(tools) if tools else None
         return self._stream_capturing(full_messages, openai_tools, capture), capture
 
@@ -419,7 +484,8 @@ class MistralProvider(LLMProvider):
             kwargs["tools"] = tools
             kwargs["tool_choice"] = "auto"
 
-        _calls: dict[int, dict] = {}  # index → {id, name, arguments}
+        # index → {id, name, arguments} ; arguments = fragments joints une fois en fin de stream
+        _calls: dict[int, dict] = {}
 
         stream = await self._client.chat.completions.create(**kwargs)
         async for chunk in stream:
@@ -435,22 +501,23 @@ class MistralProvider(LLMProvider):
                 for tc in delta.tool_calls:
                     idx = tc.index
                     if idx not in _calls:
-                        _calls[idx] = {"id": "", "name": "", "arguments": ""}
+                        _calls[idx] = {"id": "", "name": "", "arguments": []}
                     if tc.id:
                         _calls[idx]["id"] = tc.id
                     if tc.function:
                         if tc.function.name:
                             _calls[idx]["name"] += tc.function.name
                         if tc.function.arguments:
-                            _calls[idx]["arguments"] += tc.function.arguments
+                            _calls[idx]["arguments"].append(tc.function.arguments)
 
             if choice.finish_reason:
                 capture.stop_reason = choice.finish_reason
 
         for idx in sorted(_calls.keys()):
             call = _calls[idx]
+            arguments = "".join(call["arguments"])
             try:
-                tool_input = _json.loads(call["arguments"]) if call["arguments"] else {}
+                tool_input = _json.loads(arguments) if arguments else {}
             except _json.JSONDecodeError:
                 tool_input = {}
             capture.calls.append((call["id"], call["name"], tool_input))
@@ -464,10 +531,7 @@ class MistralProvider(LLMProvider):
         context: str = "",
     ) -> str:
         """Boucle tool use Mistral (function calling OpenAI-compatible)."""
-        current: list[dict] = [
-            {"role": "system", "content": system},
-            *_messages_to_openai(messages),
-        ]
+        current: list[dict] = _messages_to_openai(messages, system)
         openai_tools = _claude_tools_to_openai(tools)
 
         for iteration in range(_MAX_TOOL_ITERATIONS):
@@ -537,6 +601,26 @@ class MistralProvider(LLMProvider):
             logger.error("Mistral health check failed", error=str(e))
             return False
 
+    async def warmup(self) -> None:
+        try:
+            await self._client.models.list()
+        except Exception as e:  # noqa: BLE001
+            logger.debug("Mistral warmup ignoré", error=str(e))
+
+
+# Types JSON Schema → types Gemini : table figée une fois pour toutes, la conversion
+# (récursive, un appel par nœud de schéma et par requête) ne fait plus qu'un lookup.
+_GEMINI_TYPES: MappingProxyType[str, Any] = MappingProxyType(
+    {
+        "string": _t.Type.STRING,
+        "number": _t.Type.NUMBER,
+        "integer": _t.Type.INTEGER,
+        "boolean": _t.Type.BOOLEAN,
+        "array": _t.Type.ARRAY,
+        "object": _t.Type.OBJECT,
+    }
+)
+
 
 class GeminiProvider(LLMProvider):
     """Provider Google Gemini via SDK google-genai.
@@ -568,16 +652,7 @@ class GeminiProvider(LLMProvider):
 
     def _json_schema_to_gemini(self, schema: dict) -> object:
         """Convertit un schéma JSON (format Claude) vers types.Schema Gemini (récursif)."""
-
-        type_map: dict[str, Any] = {
-            "string": _t.Type.STRING,
-            "number": _t.Type.NUMBER,
-            "integer": _t.Type.INTEGER,
-            "boolean": _t.Type.BOOLEAN,
-            "array": _t.Type.ARRAY,
-            "object": _t.Type.OBJECT,
-        }
-        schema_type = type_map.get(schema.get("type", "string"), _t.Type.STRING)
+        schema_type = _GEMINI_TYPES.get(schema.get("type", "string"), _t.Type.STRING)
         kwargs: dict = {"type": schema_type}
 
         if desc := schema.get("description"):
@@ -756,7 +831,7 @@ class GeminiProvider(LLMProvider):
                 for fc in chunk.function_calls:
                     if fc.name not in seen_keys:
                         seen_keys.add(fc.name)
-                        call_id = f"call_{fc.name}_{uuid.uuid4().hex[:8]}"
+                        call_id = f"call_{fc.name}_{secrets.token_hex(4)}"
                         capture.calls.append((call_id, fc.name, dict(fc.args) if fc.args else {}))
                         capture.stop_reason = "tool_use"
 
@@ -878,7 +953,7 @@ class OpenAIProvider(LLMProvider):
         stream: bool = False,
         context: str = "",
     ) -> str | AsyncIterator[str]:
-        full_messages = [{"role": "system", "content": system}, *_messages_to_openai(messages)]
+        full_messages = _messages_to_openai(messages, system)
 
         if stream:
             return self._stream(full_messages)
@@ -919,7 +994,7 @@ class OpenAIProvider(LLMProvider):
         appelle ensuite complete() avec l'historique Anthropic converti.
         """
         capture = ToolCapture()
-        full_messages = [{"role": "system", "content": system}, *_messages_to_openai(messages)]
+        full_messages = _messages_to_openai(messages, system)
         openai_tools = _claude_tools_to_openai(tools) if tools else None
         return self._stream_capturing(full_messages, openai_tools, capture), capture
 
@@ -935,7 +1010,8 @@ class OpenAIProvider(LLMProvider):
             kwargs["tools"] = tools
             kwargs["tool_choice"] = "auto"
 
-        _calls: dict[int, dict] = {}  # index → {id, name, arguments}
+        # index → {id, name, arguments} ; arguments = fragments joints une fois en fin de stream
+        _calls: dict[int, dict] = {}
 
         stream = await self._client.chat.completions.create(**kwargs)
         async for chunk in stream:
@@ -951,22 +1027,23 @@ class OpenAIProvider(LLMProvider):
                 for tc in delta.tool_calls:
                     idx = tc.index
                     if idx not in _calls:
-                        _calls[idx] = {"id": "", "name": "", "arguments": ""}
+                        _calls[idx] = {"id": "", "name": "", "arguments": []}
                     if tc.id:
                         _calls[idx]["id"] = tc.id
                     if tc.function:
                         if tc.function.name:
                             _calls[idx]["name"] += tc.function.name
                         if tc.function.arguments:
-                            _calls[idx]["arguments"] += tc.function.arguments
+                            _calls[idx]["arguments"].append(tc.function.arguments)
 
             if choice.finish_reason:
                 capture.stop_reason = choice.finish_reason
 
         for idx in sorted(_calls.keys()):
             call = _calls[idx]
+            arguments = "".join(call["arguments"])
             try:
-                tool_input = _json.loads(call["arguments"]) if call["arguments"] else {}
+                tool_input = _json.loads(arguments) if arguments else {}
             except _json.JSONDecodeError:
                 tool_input = {}
             capture.calls.append((call["id"], call["name"], tool_input))
@@ -980,10 +1057,7 @@ class OpenAIProvider(LLMProvider):
         context: str = "",
     ) -> str:
         """Boucle tool use OpenAI (function calling natif)."""
-        current: list[dict] = [
-            {"role": "system", "content": system},
-            *_messages_to_openai(messages),
-        ]
+        current: list[dict] = _messages_to_openai(messages, system)
         openai_tools = _claude_tools_to_openai(tools)
 
         for iteration in range(_MAX_TOOL_ITERATIONS):
@@ -1054,6 +1128,12 @@ class OpenAIProvider(LLMProvider):
             logger.error("OpenAI health check failed", error=str(e))
             return False
 
+    async def warmup(self) -> None:
+        try:
+            await self._client.models.list()
+        except Exception as e:  # noqa: BLE001
+            logger.debug("OpenAI warmup ignoré", error=str(e))
+
 
 def get_api_provider(
     backend: str = "anthropic",
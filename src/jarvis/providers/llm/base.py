@@ -48,3 +48,15 @@ class LLMProvider(ABC):
     @abstractmethod
     async def health_check(self) -> bool:
         """Vérifie que le provider est joignable."""
+
+    async def warmup(self) -> None:
+        """Ouvre la connexion (TCP + TLS) avant la première vraie requête.
+
+        Appel léger, sans génération : la première réponse à l'utilisateur ne paie
+        plus le handshake. Best-effort, ne lève jamais. Par défaut : rien à faire.
+        """
+        return None
+
+    async def aclose(self) -> None:
+        """Ferme les connexions gardées ouvertes (arrêt de l'app). Par défaut : rien."""
+        return None
@@ -0,0 +1,54 @@
+# Copyright (C) 2026 Barthélemy Houot
+# This file is part of Jarvis OS, licensed under the GNU AGPL-3.0-or-later.
+# See the LICENSE file or <https://www.gnu.org/licenses/agpl-3.0.html>.
+
+"""Cache mémoire exact-match pour les réponses LLM (LRU + TTL).
+
+Réservé aux appels dont le prompt embarque déjà tout son contexte : même prompt
+= même réponse attendue, un hit évite l'aller-retour réseau et l'inférence.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+
+_KEY_ENCODER = json.JSONEncoder(sort_keys=True, ensure_ascii=False, default=str)
+
+
+def cache_key(*parts: object) -> str:
+    """Empreinte SHA-256 stable de parties JSON-sérialisables (clés triées)."""
+    return hashlib.sha256(_KEY_ENCODER.encode(parts).encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """LRU borné dont les entrées expirent après `ttl_s` secondes."""
+
+    def __init__(self, max_entries: int = 256, ttl_s: float = 3600.0) -> None:
+        self._max = max_entries
+        self._ttl = ttl_s
+        self._data: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> str | None:
+        entry = self._data.get(key)
+        if entry is None or time.monotonic() - entry[0] >= self._ttl:
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: str, value: str) -> None:
+        self._data[key] = (time.monotonic(), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._max:
+            self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
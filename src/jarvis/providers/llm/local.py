@@ -13,17 +13,68 @@ import httpx
 from loguru import logger
 
 from jarvis.kernel.settings import settings
+from jarvis.kernel.tls import tls_context
 from jarvis.providers.llm.base import LLMProvider
 
 # Strip <think>...</think> au cas où Ollama les laisse passer (fallback)
 _THINK_RE = re.compile(r"<think>.*?</think>", re.DOTALL)
 _MAX_TOOL_ITERATIONS = 8
+# read=300 pour absorber le cold-start du modèle (chargement GPU/CPU ~100s+)
+_CHAT_TIMEOUT = httpx.Timeout(connect=10.0, read=300.0, write=30.0, pool=5.0)
+# Connexions inactives gardées 90 s : couvre la pause entre deux tours de conversation
+_KEEPALIVE_EXPIRY_S = 90.0
 
 
 def _strip_think(text: str) -> str:
     return _THINK_RE.sub("", text).lstrip()
 
 
+def _partial_tag_len(buf: str, tag: str) -> int:
+    """Longueur du plus long suffixe de `buf` qui commence `tag` (0 si aucun)."""
+    for n in range(min(len(buf), len(tag) - 1), 0, -1):
+        if buf.endswith(tag[:n]):
+            return n
+    return 0
+
+
+class _ThinkFilter:
+    """Retire <think>...</think> d'un flux de deltas, tags coupés entre deux chunks compris.
+
+    Un début de tag en fin de delta (`<thi`) reste en tampon jusqu'au delta suivant
+    au lieu d'être émis (ou, côté `</think>`, perdu — ce qui avalait toute la suite).
+    """
+
+    _OPEN, _CLOSE = "<think>", "</think>"
+
+    def __init__(self) -> None:
+        self._buf = ""
+        self._in_think = False
+
+    def feed(self, delta: str) -> str:
+        buf = self._buf + delta
+        out: list[str] = []
+        while buf:
+            tag = self._CLOSE if self._in_think else self._OPEN
+            idx = buf.find(tag)
+            if idx == -1:
+                keep = _partial_tag_len(buf, tag)
+                if not self._in_think:
+                    out.append(buf[: len(buf) - keep])
+                buf = buf[len(buf) - keep :] if keep else ""
+                break
+            if not self._in_think:
+                out.append(buf[:idx])
+            buf = buf[idx + len(tag) :]
+            self._in_think = not self._in_think
+        self._buf = buf
+        return "".join(out)
+
+    def flush(self) -> str:
+        """Fin de flux : un faux début de tag resté en tampon est du texte normal."""
+        rest, self._buf = ("" if self._in_think else self._buf), ""
+        return rest
+
+
 def _claude_tools_to_ollama(tools: list[dict]) -> list[dict]:
     """Convertit le schéma d'outils interne Jarvis (format Claude) vers le format Ollama/OpenAI.
 
@@ -54,6 +105,27 @@ class OllamaProvider(LLMProvider):
     def __init__(self) -> None:
         self._base_url = settings.ollama_base_url.rstrip("/")
         self._model = settings.ollama_model
+        self._http: httpx.AsyncClient | None = None
+
+    def _client(self) -> httpx.AsyncClient:
+        """Client HTTP partagé (keep-alive) : une connexion réutilisée entre les tours
+        au lieu d'un handshake TCP par requête. Timeouts passés à chaque appel.
+
+        Autant de connexions gardées que de connexions permises : une rafale d'appels
+        parallèles (brouillons d'initiatives, outils) ne referme pas ses sockets au
+        retour pour les rouvrir à la rafale suivante.
+        """
+        if self._http is None or self._http.is_closed:
+            pool = settings.ollama_pool_connections
+            self._http = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=pool,
+                    max_keepalive_connections=pool,
+                    keepalive_expiry=_KEEPALIVE_EXPIRY_S,
+                ),
+                verify=tls_context(),
+            )
+        return self._http
 
     @property
     def supports_tools(self) -> bool:
@@ -96,56 +168,40 @@ class OllamaProvider(LLMProvider):
         if stream:
             return self._stream(payload)
 
-        # read=300 pour absorber le cold-start du modèle (chargement GPU/CPU ~100s+)
-        _timeout = httpx.Timeout(connect=10.0, read=300.0, write=30.0, pool=5.0)
-        async with httpx.AsyncClient(timeout=_timeout) as client:
-            response = await client.post(f"{self._base_url}/api/chat", json=payload)
-            response.raise_for_status()
-            data = response.json()
-            text: str = data["message"]["content"]
-            logger.debug("Ollama complete", model=self._model, chars=len(text))
-            return _strip_think(text)
+        response = await self._client().post(
+            f"{self._base_url}/api/chat", json=payload, timeout=_CHAT_TIMEOUT
+        )
+        response.raise_for_status()
+        data = response.json()
+        text: str = data["message"]["content"]
+        logger.debug("Ollama complete", model=self._model, chars=len(text))
+        return _strip_think(text)
 
     async def _stream(self, payload: dict) -> AsyncIterator[str]:
-        _timeout = httpx.Timeout(connect=10.0, read=300.0, write=30.0, pool=5.0)
-        async with httpx.AsyncClient(timeout=_timeout) as client:
-            async with client.stream("POST", f"{self._base_url}/api/chat", json=payload) as resp:
-                resp.raise_for_status()
-                in_think = False
-                think_buf = ""
-
-                async for line in resp.aiter_lines():
-                    if not line:
-                        continue
-                    data = json.loads(line)
-                    delta: str = data.get("message", {}).get("content", "")
-
-                    if delta:
-                        # Filtre <think>...</think> token par token (sécurité)
-                        think_buf += delta
-                        output = ""
-                        while think_buf:
-                            if in_think:
-                                end = think_buf.find("</think>")
-                                if end == -1:
-                                    think_buf = ""
-                                    break
-                                think_buf = think_buf[end + len("</think>") :]
-                                in_think = False
-                            else:
-                                start = think_buf.find("<think>")
-                                if start == -1:
-                                    output += think_buf
-                                    think_buf = ""
-                                    break
-                                output += think_buf[:start]
-                                think_buf = think_buf[start + len("<think>") :]
-                                in_think = True
-                        if output:
-                            yield output
-
-                    if data.get("done"):
-                        break
+        async with self._client().stream(
+            "POST", f"{self._base_url}/api/chat", json=payload, timeout=_CHAT_TIMEOUT
+        ) as resp:
+            resp.raise_for_status()
+            # Filtre <think>...</think> token par token (sécurité)
+            think = _ThinkFilter()
+
+            async for line in resp.aiter_lines():
+                if not line:
+                    continue
+                data = json.loads(line)
+                delta: str = data.get("message", {}).get("content", "")
+
+                if delta:
+                    output = think.feed(delta)
+                    if output:
+                        yield output
+
+                if data.get("done"):
+                    break
+
+            tail = think.flush()
+            if tail:
+                yield tail
 
     async def tool_loop(
         self,
@@ -189,10 +245,11 @@ class OllamaProvider(LLMProvider):
                 "tools": ollama_tools,
             }
 
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                response = await client.post(f"{self._base_url}/api/chat", json=payload)
-                response.raise_for_status()
-                data = response.json()
+            response = await self._client().post(
+                f"{self._base_url}/api/chat", json=payload, timeout=120.0
+            )
+            response.raise_for_status()
+            data = response.json()
 
             msg: dict = data.get("message", {})
             raw_tool_calls: list[dict] = msg.get("tool_calls") or []
@@ -242,11 +299,21 @@ class OllamaProvider(LLMProvider):
         logger.warning("Ollama tool loop max iterations reached", max=_MAX_TOOL_ITERATIONS)
         return "Je n'ai pas pu terminer — trop d'étapes."
 
+    async def warmup(self) -> None:
+        try:
+            await self._client().get(f"{self._base_url}/api/tags", timeout=5.0)
+        except Exception as e:  # noqa: BLE001
+            logger.debug("Ollama warmup ignoré", error=str(e))
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+        self._http = None
+
     async def health_check(self) -> bool:
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self._base_url}/api/tags")
-                return response.status_code == 200
+            response = await self._client().get(f"{self._base_url}/api/tags", timeout=5.0)
+            return response.status_code == 200
         except Exception as e:
             logger.error("Ollama health check failed", error=str(e))
             return False
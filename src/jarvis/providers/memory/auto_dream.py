@@ -5,7 +5,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from pathlib import Path
 
 from loguru import logger
@@ -13,6 +12,8 @@ from loguru import logger
 from jarvis.providers.llm.base import LLMProvider
 from jarvis.providers.memory.ingest import IngestResult, MemoryIngest
 from jarvis.providers.memory.mirror import MemoryMirror
+from jarvis.providers.memory.sessions import iter_transcript
+from jarvis.providers.memory.small_talk import is_small_talk
 
 # Plafond du nombre de sessions ingérées par run deep (la plus récente d'abord).
 _MAX_SESSIONS_PER_DEEP = 5
@@ -21,6 +22,7 @@ _MAX_SESSIONS_PER_DEEP = 5
 # plus récent et le plus actionnable).
 _MAX_CHARS_PER_SESSION = 8000
 
+
 def _default_prefs(name: str) -> str:
     return f"# Préférences {name}\n\nAucune préférence enregistrée.\n"
 
@@ -101,6 +103,24 @@ class AutoDream:
             logger.exception("AutoDream micro error", error=str(e))
 
     async def _run_micro(self, user_message: str, assistant_message: str) -> None:
+        # Small talk : seule l'extraction LLM est sautée, l'ingestion Kernel reste.
+        if is_small_talk(user_message):
+            logger.debug("AutoDream micro LLM skipped — small talk")
+        else:
+            await self._update_prefs(user_message, assistant_message)
+
+        # PHASE 3 — Ingestion parallèle dans le Kernel (best-effort, ne bloque pas).
+        if self._ingest is not None:
+            try:
+                await self._ingest.ingest(
+                    content=f"{self._name} : {user_message}\nJarvis : {assistant_message}",
+                    source="auto_dream_micro",
+                    event_type="exchange",
+                )
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("AutoDream micro: ingest Kernel error", error=str(exc))
+
+    async def _update_prefs(self, user_message: str, assistant_message: str) -> None:
         prefs = self._read_prefs()
         prompt = (
             f"Préférences actuelles :\n{prefs}\n\n"
@@ -116,17 +136,6 @@ class AutoDream:
             self._write_prefs(updated)
             logger.info("AutoDream micro: préférences mises à jour")
 
-        # PHASE 3 — Ingestion parallèle dans le Kernel (best-effort, ne bloque pas).
-        if self._ingest is not None:
-            try:
-                await self._ingest.ingest(
-                    content=f"{self._name} : {user_message}\nJarvis : {assistant_message}",
-                    source="auto_dream_micro",
-                    event_type="exchange",
-                )
-            except Exception as exc:  # noqa: BLE001
-                logger.warning("AutoDream micro: ingest Kernel error", error=str(exc))
-
     # ── Deep (nocturne, appelé par le scheduler à 3h) ─────────
 
     async def deep_analyze(self) -> None:
@@ -197,25 +206,12 @@ class AutoDream:
         raisonne sur la session ENTIÈRE, pas message par message.
         """
         try:
-            lines = path.read_text(encoding="utf-8").splitlines()
+            text = "\n".join(
+                f"{name if role == 'user' else 'Jarvis'} : {content.strip()}"
+                for role, content in iter_transcript(path)
+            )
         except OSError:
             return ""
-        parts: list[str] = []
-        for raw in lines:
-            raw = raw.strip()
-            if not raw:
-                continue
-            try:
-                obj = json.loads(raw)
-            except json.JSONDecodeError:
-                continue
-            role = obj.get("role", "")
-            content = obj.get("content", "")
-            if not isinstance(content, str) or not content.strip():
-                continue
-            speaker = name if role == "user" else "Jarvis"
-            parts.append(f"{speaker} : {content.strip()}")
-        text = "\n".join(parts)
         # Tronque au tail si la session est très longue : on garde le contexte
         # le plus récent (où sont les facts les plus actionnables).
         if len(text) > _MAX_CHARS_PER_SESSION:
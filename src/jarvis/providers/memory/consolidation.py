@@ -14,14 +14,19 @@ from loguru import logger
 from jarvis.kernel.connectivity import is_offline_mode
 from jarvis.kernel.paths import PROMPTS_DIR  # noqa: E402
 from jarvis.providers.llm.base import LLMProvider
+from jarvis.providers.llm.cache import ResponseCache, cache_key
 from jarvis.providers.memory.index import MemoryIndex
 from jarvis.providers.memory.ingest import MemoryIngest
 from jarvis.providers.memory.search import FTSIndex, VectorIndex
+from jarvis.providers.memory.small_talk import is_small_talk
 from jarvis.providers.memory.topics import TopicStore
 
 _PROMPT_PATH = PROMPTS_DIR / "consolidation.md"
 _JSON_RE = re.compile(r"\{.*\}", re.DOTALL)
 _CODE_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+# Une seule passe sur le template ; les valeurs injectées ne sont jamais ré-analysées
+# (un message contenant "{assistant_message}" reste tel quel).
+_PLACEHOLDER_RE = re.compile(r"\{(existing_topics|user_message|assistant_message)\}")
 
 
 class ConsolidationAgent:
@@ -58,17 +63,36 @@ class ConsolidationAgent:
             logger.error("Consolidation error", error=str(e))
 
     async def _run(self, user_message: str, assistant_message: str) -> None:
+        # Small talk : seule l'extraction LLM est sautée, l'ingestion Kernel reste.
+        if is_small_talk(user_message):
+            logger.debug("Consolidation LLM skipped — small talk")
+        else:
+            await self._consolidate(user_message, assistant_message)
+
+        # PHASE 3 — Ingestion parallèle dans le Kernel SQLite (best-effort, ne bloque pas).
+        if self._ingest is not None:
+            try:
+                await self._ingest.ingest(
+                    content=f"{self._name} : {user_message}\nJarvis : {assistant_message}",
+                    source="consolidation_agent",
+                    event_type="exchange",
+                )
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Consolidation: ingest Kernel error", error=str(exc))
+
+    async def _consolidate(self, user_message: str, assistant_message: str) -> None:
         topics = self._topic_store.load_all()
         existing_str = (
             "\n\n---\n\n".join(f"### {name}\n{content}" for name, content in topics.items())
             or "Aucun fichier thématique existant."
         )
 
-        prompt = (
-            self._prompt_template.replace("{existing_topics}", existing_str)
-            .replace("{user_message}", user_message)
-            .replace("{assistant_message}", assistant_message)
-        )
+        values = {
+            "existing_topics": existing_str,
+            "user_message": user_message,
+            "assistant_message": assistant_message,
+        }
+        prompt = _PLACEHOLDER_RE.sub(lambda m: values[m.group(1)], self._prompt_template)
 
         response = await self._llm.complete(
             messages=[{"role": "user", "content": prompt}],
@@ -79,17 +103,6 @@ class ConsolidationAgent:
 
         self._apply(str(response))
 
-        # PHASE 3 — Ingestion parallèle dans le Kernel SQLite (best-effort, ne bloque pas).
-        if self._ingest is not None:
-            try:
-                await self._ingest.ingest(
-                    content=f"{self._name} : {user_message}\nJarvis : {assistant_message}",
-                    source="consolidation_agent",
-                    event_type="exchange",
-                )
-            except Exception as exc:  # noqa: BLE001
-                logger.warning("Consolidation: ingest Kernel error", error=str(exc))
-
     def _apply(self, raw: str) -> None:
         # Strip markdown code fences (```json ... ``` or ``` ... ```)
         fence_match = _CODE_FENCE_RE.search(raw)
@@ -111,6 +124,8 @@ class ConsolidationAgent:
             logger.debug("Consolidation: nothing to memorize")
             return
 
+        # Pointeurs collectés puis appliqués en une seule réécriture de MEMORY.md.
+        pointers: list[tuple[str, str, str, str]] = []
         for update in updates:
             file_path: str = update.get("file", "")
             content: str = update.get("content", "")
@@ -123,14 +138,12 @@ class ConsolidationAgent:
             section: str = update.get("section", "Divers")
             key: str = update.get("key", filename.replace(".md", ""))
             pointer: str = update.get("pointer", filename)
-            self._memory_index.add_pointer(
-                section=section,
-                key=key,
-                filepath=f"topics/{filename}",
-                description=pointer,
-            )
+            pointers.append((section, key, f"topics/{filename}", pointer))
             logger.info("Consolidated", file=filename, key=key)
 
+        if pointers:
+            self._memory_index.add_pointers(pointers)
+
 
 class CrossSessionRecall:
     """Rappel cross-session : FTS5 + recherche vectorielle → résumé LLM.
@@ -140,6 +153,7 @@ class CrossSessionRecall:
     """
 
     MAX_CONTEXT_CHARS = 3000
+    _SYSTEM = "Tu es un agent de rappel de mémoire. Sois concis et factuel."
 
     def __init__(
         self,
@@ -150,6 +164,9 @@ class CrossSessionRecall:
         self._llm = llm
         self._fts = fts_index
         self._vector = vector_index
+        # Le prompt embarque query + extraits : même prompt = même synthèse. Une
+        # question reposée (ou un nouvel index) change les extraits, donc la clé.
+        self._summaries = ResponseCache(max_entries=128, ttl_s=3600.0)
 
     async def recall(self, query: str, k: int = 8) -> str | None:
         """Recherche dans les sessions passées et retourne un résumé LLM.
@@ -197,14 +214,24 @@ class CrossSessionRecall:
             "Synthèse concise (2-4 phrases), uniquement les faits pertinents :"
         )
 
+        key = cache_key(type(self._llm).__name__, self._SYSTEM, prompt)
+        cached = self._summaries.get(key)
+        if cached is not None:
+            logger.debug("CrossSessionRecall cache hit", hits=self._summaries.hits)
+            return cached
+
         try:
             summary = await self._llm.complete(
                 messages=[{"role": "user", "content": prompt}],
-                system="Tu es un agent de rappel de mémoire. Sois concis et factuel.",
+                system=self._SYSTEM,
                 stream=False,
                 context="memory",
             )
-            return str(summary).strip() or None
         except Exception as e:
             logger.warning("CrossSessionRecall LLM failed", error=str(e))
             return None
+        text = str(summary).strip()
+        if not text:
+            return None
+        self._summaries.put(key, text)
+        return text
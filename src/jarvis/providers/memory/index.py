@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from pathlib import Path
 
 from loguru import logger
@@ -32,41 +33,59 @@ class MemoryIndex:
         Si la section existe, le pointeur y est ajouté.
         Sinon, une nouvelle section est créée en fin de fichier.
         """
-        content = self.read()
-        pointer_line = f"- {key}: `{filepath}` — {description}"
-        lines = content.splitlines()
-
-        # Mise à jour si le pointeur existe déjà
-        for i, line in enumerate(lines):
-            if line.strip().startswith(f"- {key}:"):
-                lines[i] = pointer_line
-                self._write("\n".join(lines))
-                logger.debug("MemoryIndex pointer updated", key=key)
-                return
-
-        # Insertion dans la bonne section
-        in_section = False
-        for i, line in enumerate(lines):
-            if line.strip() == f"## {section}":
-                in_section = True
-            elif in_section and (line.startswith("## ") or line.startswith("# ")):
-                lines.insert(i, pointer_line)
-                self._write("\n".join(lines))
-                logger.debug("MemoryIndex pointer added", key=key, section=section)
-                return
-            elif in_section and i == len(lines) - 1:
-                lines.append(pointer_line)
-                self._write("\n".join(lines))
-                logger.debug("MemoryIndex pointer added (end of section)", key=key)
-                return
-
-        # Section introuvable → créer en fin de fichier
-        lines.extend(["", f"## {section}", pointer_line])
-        self._write("\n".join(lines))
-        logger.debug("MemoryIndex new section created", section=section, key=key)
+        self.add_pointers([(section, key, filepath, description)])
+
+    def add_pointers(self, pointers: Iterable[tuple[str, str, str, str]]) -> None:
+        """Applique plusieurs `(section, key, filepath, description)` en une lecture
+        et une écriture de MEMORY.md (mêmes règles que `add_pointer`)."""
+        lines = self.read().splitlines()
+        changed = False
+        for section, key, filepath, description in pointers:
+            _apply_pointer(lines, section, key, filepath, description)
+            changed = True
+        if changed:
+            self._write("\n".join(lines))
 
     def _write(self, content: str) -> None:
         try:
             self._path.write_text(content + "\n", encoding="utf-8")
         except OSError as e:
             logger.error("MemoryIndex.write failed", error=str(e))
+
+
+def _apply_pointer(
+    lines: list[str], section: str, key: str, filepath: str, description: str
+) -> None:
+    """Insère / met à jour le pointeur `key` dans `lines` (modifiée sur place)."""
+    pointer_line = f"- {key}: `{filepath}` — {description}"
+
+    # Une seule passe : le pointeur existant (prioritaire, mis à jour sur
+    # place) et le point d'insertion en fin de section sont repérés ensemble.
+    key_prefix = f"- {key}:"
+    header = f"## {section}"
+    in_section = False
+    insert_at: int | None = None
+    for i, line in enumerate(lines):
+        if line.strip().startswith(key_prefix):
+            lines[i] = pointer_line
+            logger.debug("MemoryIndex pointer updated", key=key)
+            return
+        if insert_at is not None:
+            continue
+        if line.strip() == header:
+            in_section = True
+        elif in_section and line.startswith(("## ", "# ")):
+            insert_at = i
+
+    if insert_at is not None:
+        lines.insert(insert_at, pointer_line)
+        logger.debug("MemoryIndex pointer added", key=key, section=section)
+        return
+    if in_section:
+        lines.append(pointer_line)
+        logger.debug("MemoryIndex pointer added (end of section)", key=key)
+        return
+
+    # Section introuvable → créer en fin de fichier
+    lines.extend(["", f"## {section}", pointer_line])
+    logger.debug("MemoryIndex new section created", section=section, key=key)
@@ -21,8 +21,8 @@ Invariants :
 from __future__ import annotations
 
 import json
+import secrets
 import sqlite3
-import uuid
 from collections.abc import Iterator
 from contextlib import contextmanager
 from datetime import datetime
@@ -42,6 +42,8 @@ from jarvis.providers.memory.schemas import (
     RelationType,
 )
 
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
 # ── Schéma SQL ────────────────────────────────────────────────────────────────
 
 
@@ -136,7 +138,7 @@ def _now_iso() -> str:
 
 
 def _new_id(prefix: str) -> str:
-    return f"{prefix}_{uuid.uuid4().hex[:10]}"
+    return f"{prefix}_{secrets.token_hex(5)}"
 
 
 def normalize(s: str) -> str:
@@ -199,7 +201,7 @@ class MemoryKernel:
             source=source,
             content=content,
             created_at=datetime.now(),
-            metadata_json=json.dumps(metadata, ensure_ascii=False) if metadata else None,
+            metadata_json=_JSON_ENCODER.encode(metadata) if metadata else None,
         )
         with self._conn() as conn:
             conn.execute(
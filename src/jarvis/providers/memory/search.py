@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import os
 import sqlite3
 from pathlib import Path
 from typing import Any
@@ -14,11 +15,25 @@ import numpy as np
 from loguru import logger
 
 from jarvis.kernel.paths import PROJECT_ROOT
+from jarvis.providers.memory.sessions import iter_transcript
 from jarvis.providers.memory.topics import TopicStore
 
 _DEFAULT_MODEL = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
 _CHUNK_TOKENS = 500
 _CHUNK_OVERLAP = 80
+# Manifest compact : indent=… fait retomber json sur l'encodeur pur Python,
+# ~2,5× plus lent sur un index de quelques milliers de chunks.
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+# Au-delà de ce nombre de chunks (reindex complet), fastembed répartit l'encodage sur
+# plusieurs process ONNX. En dessous, charger le modèle dans chaque worker coûte plus
+# qu'il ne rapporte.
+_PARALLEL_MIN_TEXTS = 256
+
+
+def _embed_workers(n_texts: int) -> int | None:
+    """Nombre de process d'encodage pour `n_texts` textes (None = process courant)."""
+    workers = min((os.cpu_count() or 1) // 4, n_texts // _PARALLEL_MIN_TEXTS)
+    return workers if workers >= 2 else None
 
 
 def _chunk_text(
@@ -93,14 +108,27 @@ class VectorIndex:
         self._model = TextEmbedding(model_name=self._model_name, cache_dir=str(cache_dir))
 
     def _embed_sync(self, texts: list[str]) -> np.ndarray:
-        """Encode une liste de textes en vecteurs normalisés (synchrone)."""
+        """Encode une liste de textes en vecteurs normalisés (synchrone).
+
+        Les textes identiques (chunks répétés d'un transcript, doublons d'un reindex)
+        ne passent qu'une fois dans le modèle ; leurs lignes sont recopiées ensuite.
+        Les gros lots sont partagés entre plusieurs workers (cf. _embed_workers).
+        """
         self._ensure_model()
-        embeddings = list(self._model.embed(texts))
+        unique: dict[str, int] = {}
+        rows = [unique.setdefault(t, len(unique)) for t in texts]
+        workers = _embed_workers(len(unique))
+        if workers:
+            logger.info("VectorIndex: encodage parallèle", texts=len(unique), workers=workers)
+            embeddings = list(self._model.embed(list(unique), parallel=workers))
+        else:
+            embeddings = list(self._model.embed(list(unique)))
         arr = np.asarray(embeddings, dtype=np.float32)
         # Normalisation L2 pour permettre la similarité cosinus via produit scalaire
         norms = np.linalg.norm(arr, axis=1, keepdims=True)
         norms = np.where(norms == 0, 1.0, norms)
-        return arr / norms
+        arr = arr / norms
+        return arr if len(unique) == len(texts) else arr[rows]
 
     async def _embed(self, texts: list[str]) -> np.ndarray:
         """Wrapper async — délègue l'embedding lourd à un thread."""
@@ -113,17 +141,15 @@ class VectorIndex:
         Le document est chunké si nécessaire. Les chunks existants pour
         ce doc_id sont supprimés avant insertion.
         """
-        meta = dict(metadata or {})
-        text = text.strip()
-        if not text:
-            return
-        chunks = _chunk_text(text)
-        if not chunks:
-            return
-        async with self._lock:
-            self._remove_doc_locked(doc_id)
-            vectors = await self._embed(chunks)
-            entries = [
+        await self._add_many([(doc_id, text, metadata)])
+
+    async def _add_many(self, docs: list[tuple[str, str, dict | None]]) -> None:
+        """Ajoute plusieurs documents en un seul passage dans le modèle d'embedding."""
+        entries: list[dict] = []
+        for doc_id, text, metadata in docs:
+            meta = dict(metadata or {})
+            chunks = _chunk_text(text.strip()) if text.strip() else []
+            entries.extend(
                 {
                     "doc_id": doc_id,
                     "chunk_index": i,
@@ -131,12 +157,18 @@ class VectorIndex:
                     "metadata": meta,
                 }
                 for i, chunk in enumerate(chunks)
-            ]
+            )
+        if not entries:
+            return
+        async with self._lock:
+            for doc_id, _, _ in docs:
+                self._remove_doc_locked(doc_id)
+            vectors = await self._embed([e["text"] for e in entries])
             self._manifest.extend(entries)
             self._vectors = (
                 vectors if self._vectors is None else np.vstack([self._vectors, vectors])
             )
-        logger.debug("VectorIndex.add", doc_id=doc_id, chunks=len(chunks))
+        logger.debug("VectorIndex.add", docs=len(docs), chunks=len(entries))
 
     async def search(self, query: str, k: int = 5) -> list[dict]:
         """Recherche les k chunks les plus pertinents par similarité cosinus."""
@@ -173,7 +205,7 @@ class VectorIndex:
             return
         np.save(self._vectors_path, self._vectors)
         self._manifest_path.write_text(
-            json.dumps(self._manifest, ensure_ascii=False, indent=2),
+            _JSON_ENCODER.encode(self._manifest),
             encoding="utf-8",
         )
         logger.debug("VectorIndex persisted", entries=len(self._manifest), dir=str(self._dir))
@@ -186,7 +218,9 @@ class VectorIndex:
             return
         try:
             self._vectors = np.load(self._vectors_path)
-            self._manifest = json.loads(self._manifest_path.read_text(encoding="utf-8"))
+            # Octets bruts : json décode l'UTF-8 en une passe, sans la couche texte
+            # (décodeur incrémental + traduction des fins de ligne) de read_text.
+            self._manifest = json.loads(self._manifest_path.read_bytes())
             logger.info("VectorIndex loaded", entries=len(self._manifest), dir=str(self._dir))
         except (OSError, ValueError, json.JSONDecodeError) as e:
             logger.error("VectorIndex.load failed", error=str(e))
@@ -200,39 +234,37 @@ class VectorIndex:
     ) -> int:
         """Reconstruit l'index depuis tous les topics + transcripts JSONL.
 
-        Retourne le nombre de documents indexés (avant chunking).
+        Tous les chunks sont encodés en un seul lot (parallélisable) plutôt que
+        document par document. Retourne le nombre de documents indexés (avant chunking).
         """
         async with self._lock:
             self._vectors = None
             self._manifest = []
 
-        count = 0
+        docs: list[tuple[str, str, dict | None]] = []
         for name in topic_store.list_all():
             content = topic_store.load(name)
             if not content.strip():
                 continue
-            await self.add(
-                doc_id=f"topic:{name}",
-                text=content,
-                metadata={"source": "topic", "filename": name},
-            )
-            count += 1
+            docs.append((f"topic:{name}", content, {"source": "topic", "filename": name}))
 
         if transcripts_dir is not None and transcripts_dir.exists():
             for jsonl in sorted(transcripts_dir.glob("*.jsonl")):
                 text = VectorIndex.transcript_to_text(jsonl)
                 if not text.strip():
                     continue
-                await self.add(
-                    doc_id=f"transcript:{jsonl.name}",
-                    text=text,
-                    metadata={"source": "transcript", "filename": jsonl.name},
+                docs.append(
+                    (
+                        f"transcript:{jsonl.name}",
+                        text,
+                        {"source": "transcript", "filename": jsonl.name},
+                    )
                 )
-                count += 1
 
+        await self._add_many(docs)
         await self.persist()
-        logger.info("VectorIndex reindex done", docs=count)
-        return count
+        logger.info("VectorIndex reindex done", docs=len(docs))
+        return len(docs)
 
     def is_empty(self) -> bool:
         return self._vectors is None or len(self._manifest) == 0
@@ -256,23 +288,9 @@ class VectorIndex:
     def transcript_to_text(path: Path) -> str:
         """Concatène les messages d'un transcript JSONL en un seul texte."""
         try:
-            lines = path.read_text(encoding="utf-8").splitlines()
+            return "\n".join(f"{role}: {content}" for role, content in iter_transcript(path))
         except OSError:
             return ""
-        parts: list[str] = []
-        for raw in lines:
-            raw = raw.strip()
-            if not raw:
-                continue
-            try:
-                obj = json.loads(raw)
-            except json.JSONDecodeError:
-                continue
-            role = obj.get("role", "")
-            content = obj.get("content", "")
-            if isinstance(content, str) and content.strip():
-                parts.append(f"{role}: {content}")
-        return "\n".join(parts)
 
 
 class FTSIndex:
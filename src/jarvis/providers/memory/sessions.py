@@ -5,11 +5,49 @@
 from __future__ import annotations
 
 import json
+import re
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 
 from loguru import logger
 
+# json.dumps avec options reconstruit un encodeur à chaque appel ; celui-ci sert pour tous.
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+# Début d'une ligne non blanche : une entrée du transcript
+_ENTRY_LINE_RE = re.compile(rb"^[ \t\r\f\v]*\S", re.MULTILINE)
+
+
+def iter_transcript(path: Path) -> Iterator[tuple[str, str]]:
+    """(role, content) des messages d'un transcript JSONL, lu ligne à ligne.
+
+    Le fichier n'est jamais chargé en entier : une session longue ne coûte que
+    la ligne courante. Lignes vides, JSON invalide et contenus vides ou non
+    textuels sont ignorés. OSError remonte à l'appelant.
+    """
+    with path.open(encoding="utf-8") as f:
+        for raw in f:
+            raw = raw.strip()
+            if not raw:
+                continue
+            try:
+                obj = json.loads(raw)
+            except json.JSONDecodeError:
+                continue
+            content = obj.get("content", "")
+            if isinstance(content, str) and content.strip():
+                yield obj.get("role", ""), content
+
+
+def count_entries(path: Path) -> int:
+    """Nombre d'entrées (lignes non vides) d'un transcript JSONL.
+
+    Compte sur les octets bruts, sans décoder ni parser le JSON des lignes :
+    un listing de sessions n'a besoin que du total. OSError remonte.
+    """
+    return len(_ENTRY_LINE_RE.findall(path.read_bytes()))
+
 
 class SessionStore:
     """Stockage append-only des transcripts en JSONL.
@@ -40,12 +78,13 @@ class SessionStore:
             return []
         messages: list[dict] = []
         try:
-            for line in path.read_text(encoding="utf-8").splitlines():
-                line = line.strip()
-                if not line:
-                    continue
-                entry = json.loads(line)
-                messages.append({"role": entry["role"], "content": entry["content"]})
+            with path.open(encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    entry = json.loads(line)
+                    messages.append({"role": entry["role"], "content": entry["content"]})
         except (OSError, json.JSONDecodeError) as e:
             logger.error("SessionStore.load failed", session_id=session_id, error=str(e))
         return messages
@@ -56,7 +95,7 @@ class SessionStore:
         entry = {"ts": datetime.now(UTC).isoformat(), "role": role, "content": content}
         try:
             with path.open("a", encoding="utf-8") as f:
-                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                f.write(_JSON_ENCODER.encode(entry) + "\n")
         except OSError as e:
             logger.error("SessionStore.append failed", path=str(path), error=str(e))
 
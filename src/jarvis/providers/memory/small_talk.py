@@ -0,0 +1,32 @@
+# Copyright (C) 2026 Barthélemy Houot
+# This file is part of Jarvis OS, licensed under the GNU AGPL-3.0-or-later.
+# See the LICENSE file or <https://www.gnu.org/licenses/agpl-3.0.html>.
+
+"""Détection locale des messages sans contenu mémorisable ("merci", "salut").
+
+Après chaque échange, trois agents mémoire (consolidation, AutoDream micro,
+modèle utilisateur) font chacun un appel LLM. Sur un simple accusé de
+réception, les trois répondent "rien à retenir" : une regex décide en amont,
+le LLM ne reste sollicité que pour les messages qui peuvent porter un fait.
+"""
+
+from __future__ import annotations
+
+import re
+
+# Message composé UNIQUEMENT de formules de politesse, éventuellement suivies de
+# "Jarvis" et de ponctuation ou d'emojis. Un seul mot hors liste → LLM.
+# Pas de oui/non/ok/d'accord : en réponse à une question de Jarvis ("je note que tu
+# pars lundi ?"), ils confirment un fait que l'extraction doit voir.
+_SMALL_TALK_RE = re.compile(
+    r"^\W*(?:(?:merci(?:\s+(?:beaucoup|bien))?|"
+    r"cool|super|parfait|génial|top|nickel|bonjour|bonsoir|salut|coucou|hello|hey|"
+    r"bonne\s+(?:nuit|soirée|journée)|à\s+plus|a\+|ciao|au\s+revoir|thanks|thank\s+you"
+    r")(?:\s+jarvis)?\W*)+$",
+    re.IGNORECASE,
+)
+
+
+def is_small_talk(message: str) -> bool:
+    """True si `message` n'est qu'une formule (salut, merci…) — rien à extraire par LLM."""
+    return bool(_SMALL_TALK_RE.match(message))
@@ -17,6 +17,7 @@ from pathlib import Path
 from loguru import logger
 
 from jarvis.providers.llm.base import LLMProvider
+from jarvis.providers.memory.small_talk import is_small_talk
 
 _MAX_MODEL_WORDS = 300
 
@@ -52,6 +53,9 @@ class UserModel:
             logger.error("UserModel update error", error=str(e))
 
     async def _update(self, user_message: str, assistant_message: str) -> None:
+        if is_small_talk(user_message):
+            logger.debug("UserModel update skipped — small talk")
+            return
         current = self.load()
         prompt = (
             f"Modèle utilisateur actuel :\n{current or '(vide)'}\n\n"
@@ -87,11 +87,10 @@ async def store(
     else:
         content = content[:insert_at] + entry + content[insert_at:]
 
-    # Tronquer aux MAX_ENTRIES dernières entrées
-    parts = content.split("\n## ")
-    if len(parts) > _MAX_ENTRIES + 1:
-        parts = parts[: _MAX_ENTRIES + 1]
-        content = "\n## ".join(parts)
+    # Tronquer aux MAX_ENTRIES dernières entrées — split/join seulement au-delà du cap,
+    # un simple comptage suffit sinon.
+    if content.count("\n## ") > _MAX_ENTRIES:
+        content = "\n## ".join(content.split("\n## ")[: _MAX_ENTRIES + 1])
 
     _VISUAL_MEMORY_FILE.write_text(content, encoding="utf-8")
 
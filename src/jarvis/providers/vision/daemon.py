@@ -24,6 +24,7 @@ from loguru import logger
 
 from jarvis.kernel.permissions import permissions as _perm_store
 from jarvis.kernel.settings import settings
+from jarvis.kernel.tls import tls_context
 from jarvis.providers.vision.face_recognizer import FaceRecognizer
 from jarvis.providers.vision.object_detector import ObjectDetector
 from jarvis.providers.vision.objects_queue import get_vision_objects_queue
@@ -70,7 +71,7 @@ async def run_vision_daemon() -> None:
 
     loop = asyncio.get_running_loop()
 
-    async with httpx.AsyncClient(timeout=1.0) as client:
+    async with httpx.AsyncClient(timeout=1.0, verify=tls_context()) as client:
         while True:
             loop_start = loop.time()
 
@@ -58,7 +58,7 @@ class ObjectDetector:
         self._model = None
         self._confidence = confidence
         self._previous_labels: set[str] = set()
-        self._last_detection_time = 0.0
+        self._last_detection_time = float("-inf")
         self._DETECTION_INTERVAL = 0.5  # 2x/sec
 
     def _load_model(self) -> None:
@@ -70,7 +70,7 @@ class ObjectDetector:
 
     def process(self, frame_bgr: object) -> DetectionResult | None:
         """Analyse une frame. Retourne None si pas encore le moment."""
-        now = time.time()
+        now = time.monotonic()
         if now - self._last_detection_time < self._DETECTION_INTERVAL:
             return None
         self._last_detection_time = now
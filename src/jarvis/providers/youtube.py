@@ -17,6 +17,8 @@ from dataclasses import dataclass
 import httpx
 from loguru import logger
 
+from jarvis.kernel.tls import tls_context
+
 _API = "https://www.googleapis.com/youtube/v3"
 
 # Snapshot quotidien (delta hebdo "+47 cette semaine") : la Data API ne donne pas
@@ -48,7 +50,7 @@ async def get_youtube_snapshot() -> YouTubeSnapshot | None:
         return None
 
     try:
-        async with httpx.AsyncClient(timeout=10) as client:
+        async with httpx.AsyncClient(timeout=10, verify=tls_context()) as client:
             ch = (
                 await client.get(
                     f"{_API}/channels",
@@ -119,3 +119,9 @@ class FakeLLMProvider:
 
     async def health_check(self) -> bool:
         return True
+
+    async def warmup(self) -> None:
+        return None
+
+    async def aclose(self) -> None:
+        return None
@@ -0,0 +1,20 @@
+# Copyright (C) 2026 Barthélemy Houot
+# This file is part of Jarvis OS, licensed under the GNU AGPL-3.0-or-later.
+# See the LICENSE file or <https://www.gnu.org/licenses/agpl-3.0.html>.
+
+"""Tests de jarvis.interfaces.api.admin (commandes de mise à jour)."""
+
+from __future__ import annotations
+
+import pytest
+
+from jarvis.interfaces.api import admin
+
+
+async def test_admin_run_fusionne_les_sorties_et_garde_la_fin(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(admin, "_OUTPUT_TAIL_BYTES", 8)
+    code, detail = await admin._run("echo debut-long; echo fin 1>&2; exit 3")
+    assert code == 3
+    assert detail == "ong\nfin"
@@ -79,3 +79,14 @@ def test_audit_handles_empty_lines(tmp_path: Path) -> None:
     log.append(_make_entry(ctx="step:proj:s2"))
     entries = log.read_all()
     assert len(entries) == 2
+
+
+def test_audit_to_dict_matches_asdict() -> None:
+    """to_dict() produit la même forme qu'asdict(), timestamp sérialisé en ISO."""
+    from dataclasses import asdict
+
+    entry = _make_entry()
+    expected = asdict(entry)
+    expected["timestamp"] = entry.timestamp.isoformat()
+    assert entry.to_dict() == expected
+    assert list(entry.to_dict()) == list(expected)
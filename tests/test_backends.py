@@ -14,7 +14,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from jarvis.engine.mission.backend_factory import get_backend
-from jarvis.engine.mission.backends.base import ExecutionBackend
+from jarvis.engine.mission.backends.base import BackendResult, ExecutionBackend, read_head
 from jarvis.engine.mission.backends.docker import DockerBackend
 from jarvis.engine.mission.backends.local import LocalBackend
 from jarvis.engine.mission.backends.remote import RemoteBackend
@@ -31,6 +31,10 @@ def _ok(stdout: str = "ok") -> dict:
     return {"success": True, "stdout": stdout, "stderr": "", "returncode": 0}
 
 
+def _result(stdout: str = "ok") -> BackendResult:
+    return BackendResult(success=True, stdout=stdout, stderr="", returncode=0)
+
+
 def _fail(stderr: str = "erreur") -> dict:
     return {"success": False, "stdout": "", "stderr": stderr, "returncode": -1}
 
@@ -93,6 +97,40 @@ class TestGetBackend:
             backend = get_backend(str(tmp_path))
         assert isinstance(backend, RemoteBackend)
 
+    def test_backends_config_charge_au_premier_acces(self) -> None:
+        import jarvis.kernel.backends as mod
+
+        saved = mod.__dict__.pop("backends_config", None)
+        cfg = BackendsConfig(default_backend=BackendType.LOCAL)
+        try:
+            with patch.object(mod, "load_backends_config", return_value=cfg) as loader:
+                assert mod.backends_config is cfg
+                assert mod.backends_config is cfg
+            loader.assert_called_once()
+        finally:
+            mod.__dict__.pop("backends_config", None)
+            if saved is not None:
+                mod.backends_config = saved
+
+    def test_load_backends_config_cache_invalide_par_stat(self, tmp_path: Path) -> None:
+        import jarvis.kernel.backends as mod
+
+        config_file = tmp_path / "backends.json"
+        config_file.write_text(json.dumps({"default_backend": "local"}), encoding="utf-8")
+        with patch.object(mod, "_CONFIG_FILE", config_file), patch.object(mod, "_cache", None):
+            first = mod.load_backends_config()
+            with patch.object(Path, "read_text", side_effect=AssertionError("relu")):
+                second = mod.load_backends_config()
+            assert first == second
+            assert first is not second
+
+            config_file.write_text(
+                json.dumps({"default_backend": "ssh", "ssh": {"host": "h"}}), encoding="utf-8"
+            )
+            third = mod.load_backends_config()
+        assert third.default_backend == BackendType.SSH
+        assert third.ssh.host == "h"
+
 
 # ── 2. DockerBackend délègue à docker_executor ───────────────────────────────
 
@@ -109,15 +147,14 @@ class TestDockerBackend:
         result = await backend.execute("echo hello", timeout=10)
 
         executor.execute.assert_awaited_once_with("echo hello", 10)
-        assert result["success"] is True
-        assert result["stdout"] == "hello docker"
+        assert result == _result("hello docker")
 
     @pytest.mark.asyncio
     async def test_execute_sans_executor_retourne_erreur(self) -> None:
         backend = DockerBackend(None)
         result = await backend.execute("echo hello")
-        assert result["success"] is False
-        assert "non démarré" in result["stderr"]
+        assert result.success is False
+        assert "non démarré" in result.stderr
 
     @pytest.mark.asyncio
     async def test_is_available_respecte_docker_enabled(self) -> None:
@@ -132,6 +169,36 @@ class TestDockerBackend:
             ):
                 assert await backend.is_available() is False
 
+    @pytest.mark.asyncio
+    async def test_docker_is_available_garde_la_sonde_en_cache(self) -> None:
+        from jarvis.engine.mission import docker_executor
+        from jarvis.engine.mission.docker_executor import DockerExecutor
+
+        proc = MagicMock()
+        proc.communicate = AsyncMock(return_value=(b"", b""))
+        proc.returncode = 0
+        with (
+            patch.object(docker_executor, "_available_cache", None),
+            patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)) as spawn,
+        ):
+            assert await DockerExecutor.is_available() is True
+            assert await DockerExecutor.is_available() is True
+        assert spawn.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_docker_start_garde_les_flags_d_isolation(self, tmp_path: Path) -> None:
+        from jarvis.engine.mission.docker_executor import DockerExecutor
+
+        proc = MagicMock()
+        proc.communicate = AsyncMock(return_value=(b"abc123\n", b""))
+        proc.returncode = 0
+        with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)) as spawn:
+            await DockerExecutor(str(tmp_path), "p1").start()
+        argv = spawn.call_args.args
+        for flag in ("--rm", "--read-only", "no-new-privileges", "ALL", "--network"):
+            assert flag in argv
+        assert argv[-3:] == ("tail", "-f", "/dev/null")
+
 
 # ── 3. Refus si aucun backend sûr ────────────────────────────────────────────
 
@@ -145,8 +212,8 @@ class TestRefusSansBackendSur:
         with patch("jarvis.engine.mission.backends.local.settings") as mock_settings:
             mock_settings.allow_unsandboxed_exec = False
             result = await backend.execute("echo test")
-        assert result["success"] is False
-        assert "ALLOW_UNSANDBOXED_EXEC" in result["stderr"]
+        assert result.success is False
+        assert "ALLOW_UNSANDBOXED_EXEC" in result.stderr
 
     @pytest.mark.asyncio
     async def test_local_is_available_false_sans_optin(self, tmp_path: Path) -> None:
@@ -155,13 +222,29 @@ class TestRefusSansBackendSur:
             mock_settings.allow_unsandboxed_exec = False
             assert await backend.is_available() is False
 
+    def test_local_ne_resout_pas_un_workspace_absolu(self, tmp_path: Path) -> None:
+        with patch.object(Path, "resolve", side_effect=AssertionError("resolve() appelé")):
+            backend = LocalBackend(str(tmp_path))
+        assert backend._workspace == tmp_path
+
+    def test_local_resout_un_workspace_relatif(self) -> None:
+        assert LocalBackend("workspace")._workspace == Path("workspace").resolve()
+
+    @pytest.mark.asyncio
+    async def test_read_head_tronque_sans_tout_garder(self) -> None:
+        stream = asyncio.StreamReader()
+        stream.feed_data("é".encode() * 100_000)
+        stream.feed_eof()
+        assert await read_head(stream, 10) == "é" * 10
+        assert stream.at_eof()
+
     @pytest.mark.asyncio
     async def test_remote_toujours_indisponible(self) -> None:
         backend = RemoteBackend("modal")
         assert await backend.is_available() is False
         result = await backend.execute("echo test")
-        assert result["success"] is False
-        assert "non implémenté" in result["stderr"]
+        assert result.success is False
+        assert "non implémenté" in result.stderr
 
 
 # ── 4. spawn_subagent renvoie un résumé ──────────────────────────────────────
@@ -232,7 +315,7 @@ class TestScriptRPC:
         mock_registry.schemas = MagicMock(return_value=[])
 
         mock_backend = MagicMock(spec=ExecutionBackend)
-        mock_backend.execute = AsyncMock(return_value=_ok("Bonjour depuis le script"))
+        mock_backend.execute = AsyncMock(return_value=_result("Bonjour depuis le script"))
 
         runner = ScriptRPCRunner(mock_backend, mock_registry, tmp_path)
         result = await runner.run("print('Bonjour depuis le script')", timeout=10)
@@ -251,7 +334,7 @@ class TestScriptRPC:
 
         call_received: list[dict] = []
 
-        async def fake_execute(command: str, timeout: int = 60) -> dict:  # noqa: ASYNC109
+        async def fake_execute(command: str, timeout: int = 60) -> BackendResult:  # noqa: ASYNC109
             rpc_dir_path = tmp_path / ".jarvis_rpc"
             # Simuler le script : écrire un fichier request
             for rpc_run in sorted(rpc_dir_path.iterdir()):
@@ -261,7 +344,7 @@ class TestScriptRPC:
                 break
             # Attendre que le dispatcher traite la requête
             await asyncio.sleep(0.3)
-            return _ok("météo ok")
+            return _result("météo ok")
 
         mock_backend = MagicMock(spec=ExecutionBackend)
         mock_backend.execute = AsyncMock(side_effect=fake_execute)
@@ -280,20 +363,27 @@ class TestScriptRPC:
         assert "_call('weather'" in stub
         assert "_RPC_DIR = '/rpc/dir'" in stub
 
+    def test_build_stub_est_importable(self) -> None:
+        stub = _build_stub("/rpc/dir", ["weather"])
+        namespace: dict = {}
+        exec(compile(stub, "jarvis_tools.py", "exec"), namespace)  # noqa: S102
+        assert callable(namespace["weather"])
+        assert namespace["_POLL_MIN"] < namespace["_POLL_MAX"]
+
     @pytest.mark.asyncio
     async def test_outil_non_autorise_retourne_erreur_rpc(self, tmp_path: Path) -> None:
         mock_registry = MagicMock()
         mock_registry.schemas = MagicMock(return_value=[])
         mock_registry.call = AsyncMock()
 
-        async def fake_execute(command: str, timeout: int = 60) -> dict:  # noqa: ASYNC109
+        async def fake_execute(command: str, timeout: int = 60) -> BackendResult:  # noqa: ASYNC109
             rpc_dir_path = tmp_path / ".jarvis_rpc"
             for rpc_run in sorted(rpc_dir_path.iterdir()):
                 req = rpc_run / "req_badtool.json"
                 req.write_text(json.dumps({"tool": "rm_rf", "inputs": {}}))
                 break
             await asyncio.sleep(0.3)
-            return _ok("")
+            return _result("")
 
         mock_backend = MagicMock(spec=ExecutionBackend)
         mock_backend.execute = AsyncMock(side_effect=fake_execute)
@@ -304,6 +394,46 @@ class TestScriptRPC:
         # L'outil interdit ne doit PAS avoir été appelé
         mock_registry.call.assert_not_awaited()
 
+    @pytest.mark.asyncio
+    async def test_script_lance_par_chemin_puis_supprime(self, tmp_path: Path) -> None:
+        """user_script.py lancé par chemin (pas d'argv géant), traceback lisible, puis nettoyé."""
+        mock_registry = MagicMock()
+        mock_registry.schemas = MagicMock(return_value=[])
+        seen: dict = {}
+
+        async def fake_execute(command: str, timeout: int = 60) -> BackendResult:  # noqa: ASYNC109
+            seen["files"] = sorted(
+                p.name for p in (tmp_path / ".jarvis_rpc").rglob("*") if p.is_file()
+            )
+            seen["command"] = command
+            # Le backend voit le workspace sous /workspace : on remappe pour l'hôte.
+            proc = await asyncio.create_subprocess_shell(
+                command.replace("/workspace", str(tmp_path)),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            out, err = await proc.communicate()
+            return BackendResult(
+                success=proc.returncode == 0,
+                stdout=out.decode(),
+                stderr=err.decode(),
+                returncode=proc.returncode,
+            )
+
+        mock_backend = MagicMock(spec=ExecutionBackend)
+        mock_backend.execute = AsyncMock(side_effect=fake_execute)
+
+        runner = ScriptRPCRunner(mock_backend, mock_registry, tmp_path)
+        result = await runner.run("print(\"l'été\", '$HOME')\nraise ValueError('boum')")
+
+        assert seen["files"] == ["jarvis_tools.py", "user_script.py"]
+        assert seen["command"].endswith("/user_script.py")
+        assert result["success"] is False
+        assert result["stdout"].strip() == "l'été $HOME"
+        assert 'user_script.py", line 4' in result["stderr"]
+        assert "raise ValueError('boum')" in result["stderr"]
+        assert not any((tmp_path / ".jarvis_rpc").rglob("user_script.py"))
+
 
 # ── 6. worker_cli route via le backend ───────────────────────────────────────
 
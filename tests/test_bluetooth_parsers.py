@@ -0,0 +1,35 @@
+# Copyright (C) 2026 Barthélemy Houot
+# This file is part of Jarvis OS, licensed under the GNU AGPL-3.0-or-later.
+# See the LICENSE file or <https://www.gnu.org/licenses/agpl-3.0.html>.
+
+"""Tests de hardware.bluetooth._parsers (sortie Get-PnpDevice → devices UI)."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+from jarvis.hardware.bluetooth._parsers import parse_bt_windows
+
+
+def test_parse_bt_windows_type_filtre_et_deduplique() -> None:
+    out = json.dumps(
+        [
+            {"FriendlyName": "MX Master Mouse", "Status": "OK"},
+            {"FriendlyName": "AirPods Pro", "Status": "Unknown"},
+            {"FriendlyName": "Xbox Wireless Controller", "Status": "OK"},
+            {"FriendlyName": "Microsoft Bluetooth Enumerator", "Status": "OK"},
+            {"FriendlyName": "Capteur", "Status": "OK"},
+            {"FriendlyName": "airpods pro", "Status": "OK"},
+        ]
+    )
+    devices: list = []
+    with patch("jarvis.hardware.bluetooth._parsers.subprocess.check_output", return_value=out):
+        parse_bt_windows(devices)
+
+    assert [(d["name"], d["id"], d["status"]) for d in devices] == [
+        ("MX Master Mouse", "mouse · BT", "Connected"),
+        ("AirPods Pro", "audio · BT", "Nearby"),
+        ("Xbox Wireless Controller", "gamepad · BT", "Connected"),
+        ("Capteur", "bluetooth · BT", "Connected"),
+    ]
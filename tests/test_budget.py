@@ -382,3 +382,29 @@ def test_projet_pause_reprise_reprend_etapes_pending() -> None:
             assert all(s.status == StepStatus.PENDING for s in pending_steps)
         finally:
             ps_mod.WORKSPACE_DIR = original
+
+
+def test_monthly_totals_cumule_par_provider(monkeypatch: pytest.MonkeyPatch) -> None:
+    import json
+    from datetime import date
+
+    from jarvis.engine.tracking import UsageTracker
+
+    with tempfile.TemporaryDirectory() as tmp:
+        monkeypatch.setattr(UsageTracker, "CONSO_DIR", Path(tmp))
+        entries = [
+            {"provider": "anthropic", "cost_usd": 0.5, "input_tokens": 10, "output_tokens": 5},
+            {"provider": "elevenlabs", "cost_usd": 0.25, "characters": 40},
+            {"provider": "anthropic", "cost_usd": 0.25, "input_tokens": 1, "output_tokens": 1},
+        ]
+        (Path(tmp) / f"{date.today().isoformat()}.jsonl").write_text(
+            "".join(json.dumps(e) + "\n" for e in entries)
+        )
+
+        totals = UsageTracker().get_monthly_totals()
+
+    providers = {p["name"]: p for p in totals["providers"]}
+    assert providers["anthropic"]["cost_usd"] == 0.75
+    assert providers["anthropic"]["tokens"] == 17
+    assert providers["elevenlabs"]["chars"] == 40
+    assert totals["cost_usd"] == 1.0
@@ -125,5 +125,12 @@ def test_prerequisites_status_shape(fake_bundle: Path) -> None:
         assert key in status
 
 
+def test_prerequisites_platform_meme_vocabulaire_que_platform_system(fake_bundle: Path) -> None:
+    """`sys.platform` remplace platform.system() sans changer la valeur exposée à l'UI."""
+    import platform
+
+    assert bundle.prerequisites_status()["platform"] == platform.system().lower()
+
+
 def test_stage_models_noop_without_bundle(fake_bundle: Path) -> None:
     assert bundle.stage_models_from_bundle() == []
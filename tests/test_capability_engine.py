@@ -143,6 +143,11 @@ def test_tokenize_ignore_stop_words() -> None:
     assert "un" not in tokens
 
 
+def test_tokenize_memoise_le_texte_du_catalogue() -> None:
+    text = "spotify_control Contrôle la lecture Spotify"
+    assert _tokenize(text) is _tokenize(text)
+
+
 def test_jaccard_score() -> None:
     assert _jaccard({"a", "b", "c"}, {"a", "b", "c"}) == 1.0
     assert _jaccard({"a", "b"}, {"c", "d"}) == 0.0
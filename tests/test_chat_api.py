@@ -0,0 +1,37 @@
+# Copyright (C) 2026 Barthélemy Houot
+# This file is part of Jarvis OS, licensed under the GNU AGPL-3.0-or-later.
+# See the LICENSE file or <https://www.gnu.org/licenses/agpl-3.0.html>.
+
+"""Tests de jarvis.interfaces.api.chat (token vocal LiveKit)."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi import HTTPException
+
+from jarvis.interfaces.api import chat
+
+
+async def test_voice_token_sans_livekit_echoue_avant_le_reseau(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("LIVEKIT_URL", "wss://lk.example")
+    monkeypatch.setenv("LIVEKIT_API_KEY", "  ")
+    monkeypatch.delenv("LIVEKIT_API_SECRET", raising=False)
+    monkeypatch.setattr(chat, "LiveKitAPI", None)  # tout appel réseau casserait le test
+
+    with pytest.raises(HTTPException) as exc:
+        await chat.get_voice_token()
+    assert exc.value.status_code == 503
+    assert "LIVEKIT_API_KEY" in exc.value.detail
+    assert "LIVEKIT_API_SECRET" in exc.value.detail
+
+
+async def test_session_livekit_bornee_puis_fermee() -> None:
+    session = chat._livekit_session()
+    assert session.timeout.total == 10
+    assert chat._livekit_session() is session
+
+    await chat.close_livekit_session()
+    assert session.closed
+    assert chat._livekit_http is None
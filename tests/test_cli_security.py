@@ -6,6 +6,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -14,6 +15,17 @@ import pytest
 from jarvis.capabilities.tools.cli import ExecuteCLITool
 
 
+def _fake_proc(stdout: bytes = b"ok") -> MagicMock:
+    """Process mocké : stdout est un vrai StreamReader (la sortie est lue en flux)."""
+    proc = MagicMock()
+    proc.stdout = asyncio.StreamReader()
+    proc.stdout.feed_data(stdout)
+    proc.stdout.feed_eof()
+    proc.wait = AsyncMock(return_value=0)
+    proc.returncode = 0
+    return proc
+
+
 @pytest.fixture()
 def tool() -> ExecuteCLITool:
     return ExecuteCLITool()
@@ -109,9 +121,7 @@ async def test_osascript_confirmed_executes(
     mock_settings.allow_unsandboxed_exec = False
     monkeypatch.setattr("jarvis.capabilities.tools.cli.settings", mock_settings)
 
-    mock_proc = MagicMock()
-    mock_proc.communicate = AsyncMock(return_value=(b"result", b""))
-    mock_proc.returncode = 0
+    mock_proc = _fake_proc(b"result")
 
     with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=mock_proc)) as mock_exec:
         result = await tool.execute(command="osascript -e 'beep'", confirmed=True)
@@ -229,10 +239,7 @@ async def test_sandbox_active_by_default(
 
     async def mock_exec(*args: object, **kwargs: object) -> MagicMock:
         captured.update(kwargs)
-        proc = MagicMock()
-        proc.communicate = AsyncMock(return_value=(b"done", b""))
-        proc.returncode = 0
-        return proc
+        return _fake_proc(b"done")
 
     mock_settings = MagicMock()
     mock_settings.allow_unsandboxed_exec = False
@@ -257,10 +264,7 @@ async def test_sandbox_disabled_with_opt_in(
 
     async def mock_exec(*args: object, **kwargs: object) -> MagicMock:
         captured.update(kwargs)
-        proc = MagicMock()
-        proc.communicate = AsyncMock(return_value=(b"done", b""))
-        proc.returncode = 0
-        return proc
+        return _fake_proc(b"done")
 
     mock_settings = MagicMock()
     mock_settings.allow_unsandboxed_exec = True
@@ -287,9 +291,7 @@ async def _run_legit(
     mock_settings.allow_unsandboxed_exec = False
     monkeypatch.setattr("jarvis.capabilities.tools.cli.settings", mock_settings)
 
-    mock_proc = MagicMock()
-    mock_proc.communicate = AsyncMock(return_value=(stdout, b""))
-    mock_proc.returncode = 0
+    mock_proc = _fake_proc(stdout)
 
     with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=mock_proc)):
         result = await tool.execute(command=command)
@@ -315,3 +317,21 @@ async def test_legitimate_git_log(tool: ExecuteCLITool, monkeypatch: pytest.Monk
 
 async def test_legitimate_convert(tool: ExecuteCLITool, monkeypatch: pytest.MonkeyPatch) -> None:
     await _run_legit(tool, monkeypatch, "convert input.png output.jpg")
+
+
+# ── Verdict mémoïsé : même commande → même classification ────────────────────
+
+
+def test_classify_command_memoise_le_verdict() -> None:
+    """Le second passage (confirmed=True) réutilise le verdict du premier."""
+    from jarvis.capabilities.tools.cli import _classify_command
+
+    first = _classify_command("rm -f /tmp/testfile")
+    assert first.allowed and first.needs_approval
+    assert first.parts == ("rm", "-f", "/tmp/testfile")
+    assert _classify_command("rm -f /tmp/testfile") is first
+
+    piped = _classify_command("git log | bash")
+    assert piped.blocked
+    assert piped.rule == r"\|\s*(bash|sh|zsh|fish|dash)\b"
+    assert _classify_command("echo 'oops").parse_error is not None
@@ -51,3 +51,41 @@ def test_settings_llm_provider_is_valid() -> None:
     """llm_provider doit valoir 'api' ou 'local'."""
     s = Settings()
     assert s.llm_provider in ("api", "local")
+
+
+async def test_sondes_cloud_du_doctor_mises_en_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Deux rapports /api/health rapprochés ne refont pas les 3 handshakes cloud."""
+    import httpx
+
+    from jarvis.interfaces.api import system
+
+    calls: list[str] = []
+
+    async def _fake_get(self: httpx.AsyncClient, url: str, **_: object) -> httpx.Response:
+        calls.append(url)
+        raise httpx.ConnectError("offline")
+
+    monkeypatch.setattr(httpx.AsyncClient, "get", _fake_get)
+    monkeypatch.setattr(system, "_cloud_cache", None)
+
+    first = await system._cloud_checks()
+    second = await system._cloud_checks()
+
+    assert len(calls) == 3
+    assert first == second
+    assert first["anthropic"] == {"status": "error", "detail": "Inaccessible"}
+
+
+@pytest.mark.parametrize(
+    ("base_url", "expected"),
+    [
+        ("http://127.0.0.1:8000/", "http://127.0.0.1:8000"),
+        ("http://localhost:8000/", "http://localhost:8000"),
+        ("https://jarvis.example.com/", "https://jarvis.example.com"),
+        ("http://jarvis.example.com/", "https://jarvis.example.com"),
+    ],
+)
+def test_google_oauth_base_publique(base_url: str, expected: str) -> None:
+    from jarvis.interfaces.api.google_oauth import _public_base
+
+    assert _public_base(base_url) == expected
@@ -0,0 +1,16 @@
+# Copyright (C) 2026 Barthélemy Houot
+# This file is part of Jarvis OS, licensed under the GNU AGPL-3.0-or-later.
+# See the LICENSE file or <https://www.gnu.org/licenses/agpl-3.0.html>.
+
+"""Tests des helpers de jarvis.interfaces.api.config.devices."""
+
+from __future__ import annotations
+
+from jarvis.interfaces.api.config.devices import _ram_label
+from jarvis.interfaces.api.system import _GIB
+
+
+def test_ram_label_formate_comme_round() -> None:
+    used, total = int(7.94 * _GIB), 16 * _GIB
+    assert _ram_label(used, total) == f"{round(used / _GIB, 1)} / {round(total / _GIB, 1)} GB"
+    assert _ram_label(used, total) == "7.9 / 16.0 GB"
@@ -602,3 +602,97 @@ class TestNoAutoFire:
             assert "pending" in result["error"].lower() or "statut" in result["error"].lower()
         finally:
             _store_mod.INITIATIVES_DIR = orig_dir
+
+
+# ── Brouillons regroupés ──────────────────────────────────────────────────────
+
+
+class TestBatchDrafts:
+    """Les brouillons d'un même passage partent en un seul appel LLM."""
+
+    @pytest.mark.asyncio
+    async def test_un_appel_pour_plusieurs_brouillons(self) -> None:
+        from jarvis.engine.proactive.initiative_generator import InitiativeGenerator
+
+        llm = MagicMock()
+        llm.complete = AsyncMock(return_value='```json\n["Corps A", "Corps B"]\n```')
+        gen = InitiativeGenerator(llm=llm)
+        a, b = _make_initiative(), _make_initiative()
+
+        await gen._generate_drafts([a, b])
+
+        llm.complete.assert_awaited_once()
+        assert a.draft_content is not None and a.draft_content.endswith("---\nCorps A")
+        assert b.draft_content is not None and b.draft_content.endswith("---\nCorps B")
+
+    @pytest.mark.asyncio
+    async def test_repli_un_par_un_si_tableau_invalide(self) -> None:
+        from jarvis.engine.proactive.initiative_generator import InitiativeGenerator
+
+        llm = MagicMock()
+        llm.complete = AsyncMock(side_effect=['["un seul"]', "Corps A", "Corps B"])
+        gen = InitiativeGenerator(llm=llm)
+        a, b = _make_initiative(), _make_initiative()
+
+        await gen._generate_drafts([a, b])
+
+        assert llm.complete.await_count == 3
+        assert a.draft_content is not None and a.draft_content.endswith("---\nCorps A")
+        assert b.draft_content is not None and b.draft_content.endswith("---\nCorps B")
+
+    @pytest.mark.asyncio
+    async def test_repli_lance_les_brouillons_en_parallele(self) -> None:
+        import asyncio
+
+        from jarvis.engine.proactive.initiative_generator import InitiativeGenerator
+
+        in_flight = 0
+        both_started = asyncio.Event()
+
+        async def _complete(**kwargs: object) -> str:
+            nonlocal in_flight
+            if kwargs["system"] != gen._draft_system:
+                return "pas du JSON"
+            in_flight += 1
+            if in_flight == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1.0)
+            return "Corps"
+
+        llm = MagicMock()
+        llm.complete = AsyncMock(side_effect=_complete)
+        gen = InitiativeGenerator(llm=llm)
+        a, b = _make_initiative(), _make_initiative()
+
+        await gen._generate_drafts([a, b])
+
+        assert a.draft_content is not None and b.draft_content is not None
+
+    @pytest.mark.asyncio
+    async def test_plafond_partage_entre_lots_et_replis(self) -> None:
+        import asyncio
+
+        from jarvis.engine.proactive.initiative_generator import InitiativeGenerator
+
+        in_flight = 0
+        peak = 0
+
+        async def _complete(**kwargs: object) -> str:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return "pas du JSON" if kwargs["system"] != gen._draft_system else "Corps"
+
+        llm = MagicMock()
+        llm.complete = AsyncMock(side_effect=_complete)
+        gen = InitiativeGenerator(llm=llm)
+        batches = [[_make_initiative() for _ in range(3)] for _ in range(3)]
+
+        sem = asyncio.Semaphore(2)
+        await asyncio.gather(*(gen._generate_drafts(batch, sem) for batch in batches))
+
+        assert llm.complete.await_count == 3 + 9
+        assert peak == 2
+        assert all(i.draft_content is not None for batch in batches for i in batch)
@@ -19,3 +19,4 @@ def test_provider_has_required_methods() -> None:
     provider = get_llm_provider()
     assert callable(provider.complete)
     assert callable(provider.health_check)
+    assert callable(provider.warmup)
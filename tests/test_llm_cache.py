@@ -0,0 +1,41 @@
+# Copyright (C) 2026 Barthélemy Houot
+# This file is part of Jarvis OS, licensed under the GNU AGPL-3.0-or-later.
+# See the LICENSE file or <https://www.gnu.org/licenses/agpl-3.0.html>.
+
+"""Tests du cache exact-match des réponses LLM (providers.llm.cache)."""
+
+from __future__ import annotations
+
+import pytest
+
+from jarvis.providers.llm import cache as mod
+from jarvis.providers.llm.cache import ResponseCache, cache_key
+
+
+def test_cache_key_stable_et_ordre_des_cles_indifferent() -> None:
+    assert cache_key("m", {"a": 1, "b": 2}) == cache_key("m", {"b": 2, "a": 1})
+    assert cache_key("m", "x") != cache_key("m", "y")
+
+
+def test_lru_evince_la_plus_ancienne_entree() -> None:
+    c = ResponseCache(max_entries=2)
+    c.put("a", "1")
+    c.put("b", "2")
+    assert c.get("a") == "1"  # "a" redevient la plus récente
+    c.put("c", "3")
+    assert c.get("b") is None
+    assert c.get("a") == "1"
+    assert len(c) == 2
+    assert (c.hits, c.misses) == (2, 1)
+
+
+def test_entree_expiree_apres_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(mod.time, "monotonic", lambda: now[0])
+    c = ResponseCache(ttl_s=10.0)
+    c.put("k", "v")
+    now[0] = 109.0
+    assert c.get("k") == "v"
+    now[0] = 110.0
+    assert c.get("k") is None
+    assert len(c) == 0
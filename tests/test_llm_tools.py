@@ -33,6 +33,48 @@ def test_anthropic_supports_tools_true() -> None:
         assert provider.supports_tools is True
 
 
+def test_anthropic_prefix_cache_marque_le_dernier_message_si_renvoye() -> None:
+    """Breakpoint sur le dernier bloc seulement si le préfixe est renvoyé (tool_loop)."""
+    from jarvis.providers.llm.api import _with_prefix_cache
+
+    history = [
+        {"role": "user", "content": "Bonjour"},
+        {"role": "assistant", "content": "Salut !"},
+        {
+            "role": "user",
+            "content": [{"type": "tool_result", "tool_use_id": "t1", "content": "ok"}],
+        },
+    ]
+    system, msgs = _with_prefix_cache("Tu es Jarvis.", history, cache_messages=True)
+
+    assert system == "Tu es Jarvis."  # sans marqueur : appel ponctuel, pas de breakpoint
+    assert msgs[:2] == history[:2]
+    assert msgs[-1]["content"][-1]["cache_control"] == {"type": "ephemeral"}
+    assert "cache_control" not in history[-1]["content"][-1]
+
+    system, msgs = _with_prefix_cache("", [{"role": "user", "content": "Hello"}], True)
+    assert system == ""
+    assert msgs[0]["content"][0]["text"] == "Hello"
+
+    # Appel ponctuel : rien n'est renvoyé, donc aucune écriture de cache à payer.
+    _, msgs = _with_prefix_cache("Tu es Jarvis.", history)
+    assert msgs is history
+
+
+def test_anthropic_prefix_cache_isole_la_persona_statique() -> None:
+    """Breakpoint sur la persona seule : le contexte dynamique change à chaque tour."""
+    from jarvis.kernel.contracts import SYSTEM_DYNAMIC_MARKER
+    from jarvis.providers.llm.api import _with_prefix_cache
+
+    persona = "Tu es Jarvis.\n\n"
+    dynamic = f"{SYSTEM_DYNAMIC_MARKER}\n\n## Date et heure\n\n2026-01-01 10:00"
+    system, _ = _with_prefix_cache(persona + dynamic, [])
+
+    assert [block["text"] for block in system] == [persona, dynamic]
+    assert system[0]["cache_control"] == {"type": "ephemeral"}
+    assert "cache_control" not in system[1]
+
+
 # ── MistralProvider ───────────────────────────────────────────────────────────
 
 
@@ -167,6 +209,76 @@ async def test_mistral_stream_with_capture_detects_tool() -> None:
         assert "Je vérifie..." in text_chunks
 
 
+@pytest.mark.asyncio
+async def test_mistral_stream_with_capture_reassemble_arguments_fragmentes() -> None:
+    """Les arguments JSON répartis sur plusieurs deltas sont recollés avant parsing."""
+    with patch("jarvis.providers.llm.api.AsyncOpenAI") as mock_cls:
+        mock_client = MagicMock()
+        mock_cls.return_value = mock_client
+
+        chunks = []
+        for i, fragment in enumerate(['{"ci', 'ty":"Ly', 'on"}']):
+            tc_delta = MagicMock()
+            tc_delta.index = 0
+            tc_delta.id = "call_7" if i == 0 else None
+            tc_delta.function.name = "get_weather" if i == 0 else None
+            tc_delta.function.arguments = fragment
+
+            chunk = MagicMock()
+            chunk.choices = [MagicMock()]
+            chunk.choices[0].delta.content = None
+            chunk.choices[0].delta.tool_calls = [tc_delta]
+            chunk.choices[0].finish_reason = "tool_calls" if i == 2 else None
+            chunks.append(chunk)
+
+        async def _fake_chunks(*_args: object, **_kw: object) -> AsyncIterator[object]:
+            for c in chunks:
+                yield c
+
+        mock_client.chat.completions.create = AsyncMock(return_value=_fake_chunks())
+
+        from jarvis.providers.llm.api import MistralProvider
+
+        provider = MistralProvider()
+        stream, capture = provider.stream_with_capture(
+            messages=[{"role": "user", "content": "Météo Lyon ?"}],
+            system="Tu es Jarvis.",
+            tools=[],
+        )
+        async for _ in stream:
+            pass
+
+        assert capture.calls == [("call_7", "get_weather", {"city": "Lyon"})]
+
+
+def test_messages_to_openai_system_en_tete() -> None:
+    from jarvis.providers.llm.api import _messages_to_openai
+
+    msgs = [{"role": "user", "content": "Salut"}]
+    assert _messages_to_openai(msgs, "Tu es Jarvis.") == [
+        {"role": "system", "content": "Tu es Jarvis."},
+        {"role": "user", "content": "Salut"},
+    ]
+    assert _messages_to_openai(msgs) == msgs
+
+
+def test_messages_to_openai_arguments_compacts_utf8() -> None:
+    """Les arguments tool_use sont réémis en JSON compact, accents non échappés."""
+    from jarvis.providers.llm.api import _messages_to_openai
+
+    msgs = [
+        {
+            "role": "assistant",
+            "content": [
+                {"type": "tool_use", "id": "t1", "name": "weather", "input": {"ville": "Besançon"}}
+            ],
+        }
+    ]
+    args = _messages_to_openai(msgs)[0]["tool_calls"][0]["function"]["arguments"]
+    assert args == '{"ville":"Besançon"}'
+    assert json.loads(args) == {"ville": "Besançon"}
+
+
 # ── GeminiProvider ────────────────────────────────────────────────────────────
 
 
@@ -9,6 +9,8 @@ import sys
 from pathlib import Path
 
 import pytest
+from jeepney import Message, new_error, new_method_return
+from jeepney.low_level import HeaderFields
 
 from jarvis.interfaces.api import local_music
 
@@ -66,6 +68,12 @@ def test_resolve_art_embeds_local_file_as_data_uri(tmp_path: Path) -> None:
     assert result.startswith("data:image/png;base64,")
 
 
+def test_file_url_path_matches_urlparse() -> None:
+    assert local_music._file_url_path("file:///home/a%20b/c.jpg") == "/home/a b/c.jpg"
+    assert local_music._file_url_path("file://localhost/x/y.png?v=1#t") == "/x/y.png"
+    assert local_music._file_url_path("file://host") == ""
+
+
 def test_resolve_art_none_for_missing_file() -> None:
     assert local_music._resolve_art("file:///tmp/does-not-exist-xyz.png") is None
 
@@ -86,3 +94,154 @@ def test_state_from_mpris_joins_multiple_artists() -> None:
 def test_state_from_mpris_no_title_means_nothing_playing() -> None:
     state = local_music._state_from_mpris("Stopped", {"xesam:title": ""}, 0)
     assert state == {"connected": True, "is_playing": False, "track": None}
+
+
+class _FakeMprisConn:
+    """Bus de session minimal : ListNames + GetAll/Get, chaque appel est journalisé."""
+
+    def __init__(self, players: dict[str, dict]) -> None:
+        self._players = players
+        self.calls: list[tuple[str, str]] = []
+        self.timeouts: set[float | None] = set()
+        self.closed = False
+
+    def send_and_get_reply(self, msg: Message, timeout: float | None = None) -> Message:
+        fields = msg.header.fields
+        member, dest = fields[HeaderFields.member], fields[HeaderFields.destination]
+        self.calls.append((member, dest))
+        self.timeouts.add(timeout)
+        if member == "ListNames":
+            names = [*self._players, "org.freedesktop.Notifications"]
+            return new_method_return(msg, "as", (names,))
+        props = self._players[dest]
+        if member == "Get":
+            name = msg.body[1]
+            if name not in props:
+                return new_error(msg, "org.freedesktop.DBus.Error.InvalidArgs")
+            return new_method_return(msg, "v", (("v", props[name]),))
+        return new_method_return(msg, "a{sv}", ({k: ("v", v) for k, v in props.items()},))
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_mpris_state_un_seul_getall_par_lecteur(monkeypatch: pytest.MonkeyPatch) -> None:
+    conn = _FakeMprisConn(
+        {
+            "org.mpris.MediaPlayer2.vlc": {"PlaybackStatus": "Paused", "Metadata": {}},
+            "org.mpris.MediaPlayer2.spotify": {
+                "PlaybackStatus": "Playing",
+                "Metadata": {"xesam:title": ("s", "Song"), "mpris:length": ("x", 2_000_000)},
+                "Position": 1_000_000,
+            },
+        }
+    )
+    monkeypatch.setattr(local_music, "_bus", None)
+    monkeypatch.setattr(local_music, "open_dbus_connection", lambda bus: conn)
+
+    state = local_music._mpris_state_blocking()
+
+    assert state["track"] == "Song"
+    assert state["is_playing"] is True
+    assert state["progress_ms"] == 1000
+    assert [m for m, _ in conn.calls] == ["ListNames", "GetAll", "GetAll"]
+
+
+class _DeadMprisConn(_FakeMprisConn):
+    """Connexion dont le socket a été coupé (bus de session redémarré)."""
+
+    def send_and_get_reply(self, msg: Message, timeout: float | None = None) -> Message:
+        raise OSError("socket fermé")
+
+
+def test_mpris_garde_la_connexion_entre_deux_polls(monkeypatch: pytest.MonkeyPatch) -> None:
+    conn = _FakeMprisConn({"org.mpris.MediaPlayer2.vlc": {"PlaybackStatus": "Paused"}})
+    opened: list[str] = []
+
+    def _open(bus: str) -> _FakeMprisConn:
+        opened.append(bus)
+        return conn
+
+    monkeypatch.setattr(local_music, "_bus", None)
+    monkeypatch.setattr(local_music, "open_dbus_connection", _open)
+
+    local_music._mpris_state_blocking()
+    local_music._mpris_state_blocking()
+    local_music._mpris_control_blocking("Play")
+
+    assert opened == ["SESSION"]
+    assert conn.closed is False
+
+
+def test_mpris_rouvre_la_connexion_apres_une_erreur(monkeypatch: pytest.MonkeyPatch) -> None:
+    dead, fresh = _DeadMprisConn({}), _FakeMprisConn({})
+    conns = iter([dead, fresh])
+    monkeypatch.setattr(local_music, "_bus", None)
+    monkeypatch.setattr(local_music, "open_dbus_connection", lambda bus: next(conns))
+
+    assert local_music._mpris_state_blocking()["track"] is None
+    assert dead.closed is True
+    assert local_music._mpris_state_blocking()["connected"] is True
+    assert [m for m, _ in fresh.calls] == ["ListNames"]
+
+
+class _HungPlayerConn(_FakeMprisConn):
+    """Un lecteur ne répond plus : son GetAll dépasse le timeout."""
+
+    def send_and_get_reply(self, msg: Message, timeout: float | None = None) -> Message:
+        reply = super().send_and_get_reply(msg, timeout)
+        if self.calls[-1] == ("GetAll", "org.mpris.MediaPlayer2.vlc"):
+            raise TimeoutError
+        return reply
+
+
+def test_mpris_lecteur_fige_traite_comme_indisponible(monkeypatch: pytest.MonkeyPatch) -> None:
+    conn = _HungPlayerConn(
+        {
+            "org.mpris.MediaPlayer2.vlc": {"PlaybackStatus": "Playing"},
+            "org.mpris.MediaPlayer2.spotify": {
+                "PlaybackStatus": "Paused",
+                "Metadata": {"xesam:title": ("s", "Song")},
+            },
+        }
+    )
+    monkeypatch.setattr(local_music, "_bus", None)
+    monkeypatch.setattr(local_music, "open_dbus_connection", lambda bus: conn)
+
+    state = local_music._mpris_state_blocking()
+
+    assert state["track"] == "Song"
+    assert conn.timeouts == {local_music._DBUS_TIMEOUT_S}
+    assert conn.closed is False
+
+
+class _GetAllRefusedConn(_FakeMprisConn):
+    """Lecteur dont le GetAll échoue en bloc (une de ses propriétés lève)."""
+
+    def send_and_get_reply(self, msg: Message, timeout: float | None = None) -> Message:
+        reply = super().send_and_get_reply(msg, timeout)
+        if self.calls[-1][0] == "GetAll":
+            return new_error(msg, "org.freedesktop.DBus.Error.Failed")
+        return reply
+
+
+def test_mpris_getall_refuse_relit_propriete_par_propriete(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    conn = _GetAllRefusedConn(
+        {
+            "org.mpris.MediaPlayer2.vlc": {
+                "PlaybackStatus": "Playing",
+                "Metadata": {"xesam:title": ("s", "Song")},
+            },
+        }
+    )
+    monkeypatch.setattr(local_music, "_bus", None)
+    monkeypatch.setattr(local_music, "open_dbus_connection", lambda bus: conn)
+
+    state = local_music._mpris_state_blocking()
+
+    assert state["track"] == "Song"
+    assert state["is_playing"] is True
+    assert state["progress_ms"] == 0  # Position en erreur : absente, pas fatale
+    assert [m for m, _ in conn.calls] == ["ListNames", "GetAll", "Get", "Get", "Get"]
@@ -0,0 +1,26 @@
+# Copyright (C) 2026 Barthélemy Houot
+# This file is part of Jarvis OS, licensed under the GNU AGPL-3.0-or-later.
+# See the LICENSE file or <https://www.gnu.org/licenses/agpl-3.0.html>.
+
+"""Tests de jarvis.interfaces.api.logs (anneau de logs servi à l'UI)."""
+
+from __future__ import annotations
+
+from collections import deque
+
+import pytest
+
+from jarvis.interfaces.api import logs
+
+
+def test_log_lines_since_suit_un_anneau_plein(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(logs, "_log_buffer", deque(maxlen=3))
+    monkeypatch.setattr(logs, "_log_seq", 0)
+    for i in range(5):
+        logs._log_sink(f"l{i}")
+
+    seq, lines = logs.log_lines_since(0)
+    assert (seq, lines) == (5, ["l2", "l3", "l4"])
+    logs._log_sink("l5")
+    assert logs.log_lines_since(seq) == (6, ["l5"])
+    assert logs.log_lines_since(6) == (6, [])
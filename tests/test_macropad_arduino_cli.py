@@ -0,0 +1,40 @@
+# Copyright (C) 2026 Barthélemy Houot
+# This file is part of Jarvis OS, licensed under the GNU AGPL-3.0-or-later.
+# See the LICENSE file or <https://www.gnu.org/licenses/agpl-3.0.html>.
+
+"""Tests unitaires de hardware.macropad_2k.arduino_cli (résolution de l'exécutable)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from jarvis.hardware.macropad_2k import arduino_cli
+
+
+def test_find_arduino_cli_memorise_le_chemin(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    exe = tmp_path / "arduino-cli"
+    exe.write_text("")
+    monkeypatch.setattr(arduino_cli, "_found_cli", None)
+    monkeypatch.setenv("ARDUINO_CLI", str(exe))
+
+    calls: list[str | None] = []
+    real_resolve = arduino_cli._resolve_arduino_cli
+
+    def _counting(env: str | None) -> Path | None:
+        calls.append(env)
+        return real_resolve(env)
+
+    monkeypatch.setattr(arduino_cli, "_resolve_arduino_cli", _counting)
+
+    assert arduino_cli.find_arduino_cli() == exe
+    assert arduino_cli.find_arduino_cli() == exe
+    assert len(calls) == 1
+
+    # Exécutable supprimé → nouvelle résolution
+    exe.unlink()
+    arduino_cli.find_arduino_cli()
+    assert len(calls) == 2
@@ -6,14 +6,16 @@ from __future__ import annotations
 
 import hashlib
 from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
 
 import numpy as np
 import pytest
 
 from jarvis.capabilities.tools.memory import MemoryLoadTopicTool, MemorySearchTool
+from jarvis.providers.memory.consolidation import ConsolidationAgent
 from jarvis.providers.memory.index import MemoryIndex
 from jarvis.providers.memory.search import VectorIndex, _chunk_text
-from jarvis.providers.memory.sessions import SessionStore
+from jarvis.providers.memory.sessions import SessionStore, count_entries, iter_transcript
 from jarvis.providers.memory.topics import TopicStore
 
 # ── SessionStore ──────────────────────────────────────────────
@@ -54,6 +56,29 @@ def test_session_store_list_recent(tmp_path: Path) -> None:
     assert len(recent) == 2
 
 
+def test_iter_transcript_filtre_et_reste_paresseux(tmp_path: Path) -> None:
+    path = tmp_path / "s.jsonl"
+    path.write_text(
+        '{"role": "user", "content": "Un"}\n'
+        "\n"
+        "pas du json\n"
+        '{"role": "assistant", "content": "  "}\n'
+        '{"role": "assistant", "content": "Deux"}\n',
+        encoding="utf-8",
+    )
+    messages = iter_transcript(path)
+    assert next(messages) == ("user", "Un")
+    assert list(messages) == [("assistant", "Deux")]
+
+
+def test_count_entries_ignore_les_lignes_vides(tmp_path: Path) -> None:
+    path = tmp_path / "s.jsonl"
+    path.write_text('{"a": 1}\n\n  \r\n{"b": "é"}\n{"c": 3}', encoding="utf-8")
+    assert count_entries(path) == 3
+    path.write_bytes(b"")
+    assert count_entries(path) == 0
+
+
 # ── MemoryIndex ───────────────────────────────────────────────
 
 
@@ -102,6 +127,55 @@ def test_memory_index_add_pointer_existing_section(tmp_path: Path) -> None:
     assert "Bras robotisé" in content
 
 
+def test_memory_index_add_pointer_section_en_fin_de_fichier(tmp_path: Path) -> None:
+    md = tmp_path / "MEMORY.md"
+    md.write_text("# Index\n\n## Autre\n- x: `topics/x.md` — X\n\n## Projets actifs\n")
+    idx = MemoryIndex(tmp_path)
+    idx.add_pointer("Projets actifs", "alfred", "topics/alfred.md", "Bras robotisé")
+
+    lines = md.read_text().splitlines()
+    assert lines.count("## Projets actifs") == 1
+    assert lines[-1] == "- alfred: `topics/alfred.md` — Bras robotisé"
+
+
+def test_memory_index_update_pointer_apres_la_section_cible(tmp_path: Path) -> None:
+    md = tmp_path / "MEMORY.md"
+    md.write_text("# Index\n\n## Projets actifs\n\n## Autre\n- ipod: `topics/old.md` — Ancien\n")
+    idx = MemoryIndex(tmp_path)
+    idx.add_pointer("Projets actifs", "ipod", "topics/project_ipod.md", "Nouveau")
+
+    content = md.read_text()
+    assert content.count("- ipod:") == 1
+    assert content.rstrip().endswith("- ipod: `topics/project_ipod.md` — Nouveau")
+
+
+def test_memory_index_add_pointers_une_seule_ecriture(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    md = tmp_path / "MEMORY.md"
+    md.write_text("# Index\n\n## Projets actifs\n- ipod: `topics/old.md` — Ancien\n")
+    idx = MemoryIndex(tmp_path)
+    writes: list[str] = []
+    monkeypatch.setattr(idx, "_write", writes.append)
+
+    idx.add_pointers(
+        [
+            ("Projets actifs", "ipod", "topics/project_ipod.md", "Nouveau"),
+            ("Projets actifs", "alfred", "topics/alfred.md", "Bras robotisé"),
+            ("Santé", "sport", "topics/sport.md", "Course"),
+        ]
+    )
+
+    assert len(writes) == 1
+    assert writes[0].splitlines()[3:] == [
+        "- ipod: `topics/project_ipod.md` — Nouveau",
+        "- alfred: `topics/alfred.md` — Bras robotisé",
+        "",
+        "## Santé",
+        "- sport: `topics/sport.md` — Course",
+    ]
+
+
 # ── TopicStore ────────────────────────────────────────────────
 
 
@@ -187,15 +261,33 @@ def test_agent_build_system_lists_topics_only(tmp_path: Path) -> None:
     from jarvis.kernel.settings import settings as _settings
 
     agent = Agent(settings=_settings, llm=_DummyLLM(), memory_index=memory_index, topic_store=store)
-    system = agent._build_system()
+    system = agent._build_system(notifications=["rappel A", "rappel B"])
 
-    assert "user_prefs.md" in system
-    assert "spotify.md" in system
+    assert "- `spotify.md`\n- `user_prefs.md`" in system
+    assert "- rappel A\n- rappel B" in system
     # Le contenu détaillé ne doit PAS être présent
     assert "PCM5102A_iPod" not in system
     assert "SECRET_TOKEN_42" not in system
 
 
+def test_static_prompt_memoise_et_suit_les_editions(tmp_path: Path) -> None:
+    import os
+
+    from jarvis.engine.agent import _static_prompt
+
+    path = tmp_path / "system_static.md"
+    path.write_text("Tu es Jarvis, assistant de Barth.", encoding="utf-8")
+    first = _static_prompt(path, path.stat().st_mtime_ns, "Alice", False)
+    assert first == "Tu es Jarvis, assistant de Alice."
+    assert _static_prompt(path, path.stat().st_mtime_ns, "Alice", False) is first
+
+    path.write_text("Persona v2 pour Barth.", encoding="utf-8")
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+    edited = _static_prompt(path, path.stat().st_mtime_ns, "Alice", True)
+    assert edited.startswith("Persona v2 pour Alice.")
+    assert "Mode Québécois (ACTIF)" in edited
+
+
 async def test_memory_load_topic_reads_existing(tmp_path: Path) -> None:
     topics_dir = tmp_path / "topics"
     store = TopicStore(topics_dir)
@@ -290,6 +382,27 @@ async def test_vector_index_add_and_search(fake_vector_index: VectorIndex) -> No
     assert results[0]["score"] > results[-1]["score"]
 
 
+def test_vector_index_embed_dedupe_les_textes_identiques(
+    fake_vector_index: VectorIndex,
+) -> None:
+    seen: list[list[str]] = []
+
+    class _RecordingEmbedder(_FakeEmbedder):
+        def embed(self, texts: list[str]) -> list[np.ndarray]:
+            seen.append(list(texts))
+            return super().embed(texts)
+
+    fake_vector_index._model = _RecordingEmbedder()
+
+    vectors = fake_vector_index._embed_sync(["ipod", "dac", "ipod", "ipod"])
+
+    assert seen == [["ipod", "dac"]]
+    assert vectors.shape == (4, _FakeEmbedder._DIM)
+    assert np.array_equal(vectors[0], vectors[2])
+    assert np.array_equal(vectors[0], vectors[3])
+    assert not np.array_equal(vectors[0], vectors[1])
+
+
 async def test_vector_index_persist_and_load_roundtrip(
     tmp_path: Path,
     fake_vector_index: VectorIndex,
@@ -328,6 +441,43 @@ async def test_vector_index_reindex_from_topics(
     assert results[0]["metadata"]["filename"] == "music.md"
 
 
+async def test_vector_index_reindex_encode_en_un_seul_lot(
+    tmp_path: Path,
+    fake_vector_index: VectorIndex,
+) -> None:
+    calls: list[list[str]] = []
+
+    class _RecordingEmbedder(_FakeEmbedder):
+        def embed(self, texts: list[str]) -> list[np.ndarray]:
+            calls.append(list(texts))
+            return super().embed(texts)
+
+    fake_vector_index._model = _RecordingEmbedder()
+    store = TopicStore(tmp_path / "topics")
+    store.write("music.md", "iPod DAC")
+    store.write("ui.md", "Préférences mode sombre")
+
+    assert await fake_vector_index.reindex(topic_store=store, transcripts_dir=None) == 2
+    assert len(calls) == 1
+    assert sorted(e["doc_id"] for e in fake_vector_index._manifest) == [
+        "topic:music.md",
+        "topic:ui.md",
+    ]
+
+
+def test_embed_workers_reserve_le_parallelisme_aux_gros_lots(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from jarvis.providers.memory import search
+
+    monkeypatch.setattr(search.os, "cpu_count", lambda: 16)
+    assert search._embed_workers(10) is None
+    assert search._embed_workers(search._PARALLEL_MIN_TEXTS * 2) == 2
+    assert search._embed_workers(100_000) == 4
+    monkeypatch.setattr(search.os, "cpu_count", lambda: 4)
+    assert search._embed_workers(100_000) is None
+
+
 async def test_memory_search_tool_formats_results(
     fake_vector_index: VectorIndex,
 ) -> None:
@@ -361,3 +511,59 @@ def test_chunk_text_handles_short_and_long(tmp_path: Path) -> None:
     assert len(chunks) >= 2
     # Premier chunk : 500 mots
     assert len(chunks[0].split()) == 500
+
+
+@pytest.mark.parametrize("msg", ["merci", "Merci beaucoup !", "Salut Jarvis 👋", "bonne nuit"])
+def test_is_small_talk_formules(msg: str) -> None:
+    from jarvis.providers.memory.small_talk import is_small_talk
+
+    assert is_small_talk(msg)
+
+
+@pytest.mark.parametrize(
+    "msg",
+    [
+        "ok, je déménage à Lyon",
+        "Je préfère le thé",
+        "salut, rappelle-moi demain",
+        "oui",
+        "Non merci",
+        "ok",
+        "d'accord Jarvis",
+    ],
+)
+def test_is_small_talk_laisse_passer_le_contenu(msg: str) -> None:
+    from jarvis.providers.memory.small_talk import is_small_talk
+
+    assert not is_small_talk(msg)
+
+
+def _consolidation_agent() -> tuple[ConsolidationAgent, MagicMock, MagicMock]:
+    llm = MagicMock()
+    llm.complete = AsyncMock(return_value="{}")
+    ingest = MagicMock()
+    ingest.ingest = AsyncMock()
+    topic_store = MagicMock()
+    topic_store.load_all.return_value = {}
+    agent = ConsolidationAgent(
+        llm=llm, memory_index=MagicMock(), topic_store=topic_store, memory_ingest=ingest
+    )
+    return agent, llm, ingest
+
+
+async def test_consolidation_small_talk_ingere_sans_appel_llm() -> None:
+    agent, llm, ingest = _consolidation_agent()
+
+    await agent._run("Merci Jarvis !", "Avec plaisir")
+
+    llm.complete.assert_not_awaited()
+    ingest.ingest.assert_awaited_once()
+
+
+async def test_consolidation_oui_confirme_passe_par_le_llm() -> None:
+    agent, llm, ingest = _consolidation_agent()
+
+    await agent._run("oui", "Je note que tu pars à Lyon lundi ?")
+
+    llm.complete.assert_awaited_once()
+    ingest.ingest.assert_awaited_once()
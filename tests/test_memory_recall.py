@@ -237,6 +237,28 @@ class TestCrossSessionRecall:
         # Le prompt ne doit contenir qu'une seule occurrence de s1.jsonl
         assert captured_prompts[0].count("s1.jsonl") == 1
 
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("_force_api_mode")
+    async def test_recall_met_en_cache_un_prompt_identique(self, tmp_path: Path) -> None:
+        from jarvis.providers.memory.consolidation import CrossSessionRecall
+
+        fts = FTSIndex(db_path=tmp_path / "fts.db")
+        await fts.add("s1.jsonl", "user: Je veux du café\nassistant: Bien sûr chef")
+        mock_vector = MagicMock()
+        mock_vector.search = AsyncMock(return_value=[])
+        mock_llm = MagicMock()
+        mock_llm.complete = AsyncMock(return_value="Café le matin.")
+
+        recall = CrossSessionRecall(llm=mock_llm, fts_index=fts, vector_index=mock_vector)
+        assert await recall.recall("café") == "Café le matin."
+        assert await recall.recall("café") == "Café le matin."
+        mock_llm.complete.assert_awaited_once()
+
+        # Nouveaux extraits → nouveau prompt → nouvel appel
+        await fts.add("s2.jsonl", "user: Un café serré stp")
+        await recall.recall("café")
+        assert mock_llm.complete.await_count == 2
+
 
 # ── 4. UserModel ─────────────────────────────────────────────────────────────
 
@@ -274,6 +296,36 @@ class TestUserModel:
         assert path.exists()
         assert "café" in path.read_text(encoding="utf-8")
 
+    @pytest.mark.asyncio
+    async def test_update_ignore_les_formules_sans_appel_llm(self, tmp_path: Path) -> None:
+        from jarvis.providers.memory.user_model import UserModel
+
+        path = tmp_path / "user_model.md"
+        mock_llm = MagicMock()
+        mock_llm.complete = AsyncMock(return_value="- Modèle")
+
+        model = UserModel(llm=mock_llm, model_path=path)
+        await model._update("Merci Jarvis !", "Avec plaisir")
+
+        mock_llm.complete.assert_not_awaited()
+        assert not path.exists()
+
+    @pytest.mark.asyncio
+    async def test_update_oui_en_reponse_a_une_question_appelle_le_llm(
+        self, tmp_path: Path
+    ) -> None:
+        from jarvis.providers.memory.user_model import UserModel
+
+        path = tmp_path / "user_model.md"
+        mock_llm = MagicMock()
+        mock_llm.complete = AsyncMock(return_value="- Part à Lyon lundi")
+
+        model = UserModel(llm=mock_llm, model_path=path)
+        await model._update("Oui", "Tu pars bien à Lyon lundi ?")
+
+        mock_llm.complete.assert_awaited_once()
+        assert "Lyon" in path.read_text(encoding="utf-8")
+
     @pytest.mark.asyncio
     async def test_fire_cree_une_task(self, tmp_path: Path) -> None:
         from jarvis.providers.memory.user_model import UserModel
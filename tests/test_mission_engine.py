@@ -15,6 +15,7 @@ from __future__ import annotations
 
 import json
 from collections.abc import AsyncIterator
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
 
@@ -24,6 +25,7 @@ from jarvis.engine.audit import AuditLog
 from jarvis.engine.mission.governance import Governance
 from jarvis.engine.mission.project_store import ProjectStore
 from jarvis.engine.mission.schemas import (
+    LogEntry,
     Project,
     ProjectStatus,
     Step,
@@ -150,6 +152,36 @@ def test_persistance_step_roundtrip(tmp_path: Path) -> None:
         assert s.status == StepStatus.DONE
 
 
+@pytest.mark.parametrize("block", [7, 64 * 1024])
+def test_get_logs_lit_la_fin_du_fichier(tmp_path: Path, block: int) -> None:
+    """get_logs rend les last_n dernières entrées, même à cheval sur plusieurs blocs lus."""
+    with (
+        patch("jarvis.engine.mission.project_store.WORKSPACE_DIR", tmp_path),
+        patch("jarvis.engine.mission.project_store._TAIL_BLOCK", block),
+    ):
+        store = ProjectStore()
+        project = store.create_project(mission="Mission test", title="Test")
+        for i in range(30):
+            store.append_log(project, LogEntry(datetime.now(), "info", f"é-{i}"))
+
+        assert [e.message for e in store.get_logs(project, last_n=5)] == [
+            f"é-{i}" for i in range(25, 30)
+        ]
+        assert len(store.get_logs(project, last_n=100)) == 30
+
+
+@pytest.mark.parametrize("block", [3, 64 * 1024])
+def test_tail_lines_ignore_les_lignes_vides_finales(tmp_path: Path, block: int) -> None:
+    """Les sauts de ligne en fin de fichier ne mangent pas les `n` lignes demandées."""
+    from jarvis.engine.mission.project_store import _tail_lines
+
+    log_file = tmp_path / "logs.jsonl"
+    log_file.write_bytes(b"l1\nl2\nl3\n\n")
+    with patch("jarvis.engine.mission.project_store._TAIL_BLOCK", block):
+        assert _tail_lines(log_file, 2) == [b"l2", b"l3"]
+        assert _tail_lines(log_file, 10) == [b"l1", b"l2", b"l3"]
+
+
 def test_persistance_projet_ancien_format_compat(tmp_path: Path) -> None:
     """Un projet sauvegardé AVANT PHASE 1 (sans les nouveaux champs) se recharge sans crash."""
     with patch("jarvis.engine.mission.project_store.WORKSPACE_DIR", tmp_path):
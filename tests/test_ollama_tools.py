@@ -43,16 +43,14 @@ def _mock_response(data: dict) -> MagicMock:
 def _make_httpx_mock(*json_responses: dict) -> tuple[MagicMock, AsyncMock]:
     """Retourne (mock_ctx, mock_client) pour patcher llm.local.httpx.AsyncClient.
 
-    mock_ctx est renvoyé par httpx.AsyncClient(...) ; mock_client.post répond
-    aux requêtes dans l'ordre avec les données json_responses.
+    mock_ctx est renvoyé par httpx.AsyncClient(...) — le provider le garde comme
+    client partagé, c'est donc le même objet que mock_client ; mock_client.post
+    répond aux requêtes dans l'ordre avec les données json_responses.
     """
     mock_client = AsyncMock()
+    mock_client.is_closed = False
     mock_client.post = AsyncMock(side_effect=[_mock_response(d) for d in json_responses])
-
-    mock_ctx = AsyncMock()
-    mock_ctx.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_ctx.__aexit__ = AsyncMock(return_value=False)
-    return mock_ctx, mock_client
+    return mock_client, mock_client
 
 
 def _tool_call_response(name: str, arguments: object) -> dict:
@@ -327,3 +325,123 @@ async def test_tool_loop_max_iterations_respected() -> None:
 
     assert "étapes" in result
     assert mock_client.post.call_count == _MAX_TOOL_ITERATIONS
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        ["avant <think>secret</think> après"],
+        ["avant <thi", "nk>secret</thi", "nk> après"],
+        list("avant <think>secret</think> après"),
+    ],
+)
+def test_think_filter_handles_tags_split_across_chunks(chunks: list[str]) -> None:
+    """Les tags <think> coupés entre deux deltas ne fuient pas et ne bloquent pas la suite."""
+    from jarvis.providers.llm.local import _ThinkFilter
+
+    think = _ThinkFilter()
+    out = "".join(think.feed(c) for c in chunks) + think.flush()
+    assert out == "avant  après"
+
+
+def test_think_filter_flushes_false_tag_prefix() -> None:
+    """Un « <th » en fin de flux qui n'ouvre aucun tag est rendu tel quel."""
+    from jarvis.providers.llm.local import _ThinkFilter
+
+    think = _ThinkFilter()
+    assert think.feed("a <th") == "a "
+    assert think.flush() == "<th"
+
+
+@pytest.mark.asyncio
+async def test_tool_loop_reuses_one_http_client() -> None:
+    """Les tours successifs passent par le même client keep-alive (pas un par requête)."""
+    from jarvis.providers.llm.local import OllamaProvider
+
+    mock_ctx, mock_client = _make_httpx_mock(
+        _tool_call_response("echo", {"text": "a"}),
+        _tool_call_response("echo", {"text": "b"}),
+        _text_response("fini"),
+    )
+
+    async def mock_executor(name: str, args: dict) -> str:
+        return args["text"]
+
+    with patch("jarvis.providers.llm.local.httpx.AsyncClient", return_value=mock_ctx) as ctor:
+        provider = OllamaProvider()
+        result = await provider.tool_loop(
+            messages=[{"role": "user", "content": "go"}],
+            system="sys",
+            tools=[_ECHO_TOOL],
+            tool_executor=mock_executor,
+        )
+
+    assert result == "fini"
+    assert mock_client.post.call_count == 3
+    assert ctor.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_parallel_bursts_reuse_pooled_tcp_connections() -> None:
+    """Deux rafales d'appels parallèles : la seconde repasse par les sockets de la première."""
+    import asyncio
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    from jarvis.providers.llm.local import OllamaProvider
+
+    connections: list[int] = []
+    body = json.dumps({"message": {"content": "ok"}, "done": True}).encode()
+
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self) -> None:
+            super().setup()
+            connections.append(1)
+
+        def do_POST(self) -> None:  # noqa: N802
+            self.rfile.read(int(self.headers["Content-Length"]))
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        provider = OllamaProvider()
+        provider._base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        msgs = [{"role": "user", "content": "hi"}]
+
+        await asyncio.gather(*(provider.complete(msgs, system="s") for _ in range(6)))
+        first_burst = len(connections)
+        await asyncio.gather(*(provider.complete(msgs, system="s") for _ in range(6)))
+
+        assert 1 <= first_burst <= 6
+        assert len(connections) == first_burst
+        await provider.aclose()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.asyncio
+async def test_warmup_opens_the_shared_client_and_never_raises() -> None:
+    """warmup passe par le client partagé réutilisé ensuite ; une erreur réseau est avalée."""
+    from jarvis.providers.llm.local import OllamaProvider
+
+    mock_ctx, mock_client = _make_httpx_mock(_text_response("ok"))
+    mock_client.get = AsyncMock(side_effect=OSError("connexion refusée"))
+
+    with patch("jarvis.providers.llm.local.httpx.AsyncClient", return_value=mock_ctx) as ctor:
+        provider = OllamaProvider()
+        await provider.warmup()
+        await provider.complete(messages=[{"role": "user", "content": "hi"}], system="sys")
+
+    mock_client.get.assert_awaited_once()
+    assert ctor.call_count == 1
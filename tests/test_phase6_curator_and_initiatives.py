@@ -394,6 +394,44 @@ async def test_curator_budget_hard_stop_note_dans_rapport(
     assert any("HARD_STOP" in n for n in report.notes)
 
 
+class _FakeInitiativeStore:
+    """Fake InitiativeStore : liste fixe d'initiatives récentes."""
+
+    def __init__(self, items: list[Initiative]) -> None:
+        self._items = items
+
+    def list_recent(self, days: int = 7) -> list[Initiative]:
+        return self._items
+
+
+async def test_curator_compte_les_initiatives_par_statut(
+    tmp_path: Path,
+    kernel: MemoryKernel,
+    lifecycle: SkillLifecycle,
+) -> None:
+    """Comptage par statut + review des seules pending de plus de 3 jours."""
+    items = []
+    for i, status in enumerate(["pending", "pending", "approved", "rejected", "rejected"]):
+        ini = _make_initiative(title=f"I{i}")
+        ini.id = f"ini_{i}"
+        ini.status = status
+        items.append(ini)
+    items[0].created_at = datetime.now() - timedelta(days=5)
+    cur = Curator(
+        kernel=kernel,
+        skill_lifecycle=lifecycle,
+        initiative_store=_FakeInitiativeStore(items),
+        budget_guard=None,
+        reports_dir=tmp_path / "reports",
+    )
+    report = await cur.scan()
+    assert report.initiatives_pending == 2
+    assert report.initiatives_validated_recent == 1
+    assert report.initiatives_rejected_recent == 2
+    reviews = [p for p in report.patches if p.kind == PatchKind.REVIEW_INITIATIVE]
+    assert [p.target for p in reviews] == ["ini_0"]
+
+
 # ── 7. Command Center snapshot agrège correctement ──────────────────────────
 
 
@@ -35,6 +35,30 @@ def test_calculate_cost_elevenlabs_chars() -> None:
     assert cost == pytest.approx(0.18)
 
 
+def test_calculate_cost_model_date_suffix_matches_prefix() -> None:
+    """Un id daté retombe sur l'entrée du modèle de base ; la résolution est mémoïsée."""
+    from jarvis.kernel.schemas import _pricing_key
+
+    _pricing_key.cache_clear()
+    for _ in range(3):
+        cost = calculate_cost("anthropic", "claude-sonnet-4-6-20260101", input_tokens=1_000_000)
+        assert cost == pytest.approx(3.0)
+    assert _pricing_key.cache_info().hits == 2
+    assert calculate_cost("anthropic", "inconnu", input_tokens=1_000_000) == 0.0
+
+
+def test_calculate_cost_prompt_cache_tokens() -> None:
+    cost = calculate_cost(
+        "anthropic",
+        "claude-sonnet-4-6",
+        input_tokens=0,
+        output_tokens=0,
+        cache_write_tokens=1_000_000,
+        cache_read_tokens=1_000_000,
+    )
+    assert cost == pytest.approx(3.0 * 1.25 + 3.0 * 0.1)
+
+
 def test_calculate_cost_deepgram_minutes() -> None:
     cost = calculate_cost("deepgram", "nova-2", audio_minutes=10)
     assert cost == pytest.approx(0.059)
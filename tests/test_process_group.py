@@ -0,0 +1,58 @@
+# Copyright (C) 2026 Barthélemy Houot
+# This file is part of Jarvis OS, licensed under the GNU AGPL-3.0-or-later.
+# See the LICENSE file or <https://www.gnu.org/licenses/agpl-3.0.html>.
+
+"""Tests de kernel.process_group (kill de toute la pipeline au timeout)."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from jarvis.kernel.process_group import kill_group, new_group_kwargs
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="sémantique POSIX")
+
+
+def _alive(pid: int) -> bool:
+    """Vivant et pas zombie (l'orphelin tué attend d'être récolté par init)."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    try:
+        stat = Path(f"/proc/{pid}/stat").read_text()
+    except OSError:
+        return True
+    return stat.rsplit(")", 1)[1].split()[0] != "Z"
+
+
+@pytest.mark.asyncio
+async def test_kill_group_tue_aussi_le_cote_gauche_de_la_pipeline() -> None:
+    proc = await asyncio.create_subprocess_shell(
+        "sleep 60 & echo $!; wait",
+        stdout=asyncio.subprocess.PIPE,
+        **new_group_kwargs(),
+    )
+    assert proc.stdout is not None
+    child = int((await proc.stdout.readline()).strip())
+    assert _alive(child)
+
+    kill_group(proc)
+    await proc.wait()
+    for _ in range(50):
+        if not _alive(child):
+            break
+        await asyncio.sleep(0.02)
+    assert not _alive(child)
+
+
+@pytest.mark.asyncio
+async def test_kill_group_silencieux_si_deja_termine() -> None:
+    proc = await asyncio.create_subprocess_exec("true", **new_group_kwargs())
+    await proc.wait()
+    kill_group(proc)
@@ -0,0 +1,84 @@
+# Copyright (C) 2026 Barthélemy Houot
+# This file is part of Jarvis OS, licensed under the GNU AGPL-3.0-or-later.
+# See the LICENSE file or <https://www.gnu.org/licenses/agpl-3.0.html>.
+
+"""Tests de kernel.queued_writer (sink terminal écrit hors de la boucle asyncio)."""
+
+from __future__ import annotations
+
+import io
+import threading
+
+from loguru import logger
+
+from jarvis.kernel.queued_writer import QueuedWriter
+
+
+class _SlowStream(io.StringIO):
+    """Flux dont l'écriture reste bloquée tant que `release` n'est pas posé."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = threading.Event()
+
+    def write(self, s: str) -> int:
+        self.release.wait(timeout=5)
+        return super().write(s)
+
+
+def test_write_ne_bloque_pas_et_close_vide_la_file() -> None:
+    stream = _SlowStream()
+    writer = QueuedWriter(stream)
+    for i in range(200):
+        writer.write(f"l{i}\n")  # rendrait la main même si le flux est bloqué
+    stream.release.set()
+    writer.close()
+    assert stream.getvalue() == "".join(f"l{i}\n" for i in range(200))
+
+
+def test_sink_loguru_garde_les_extras_non_picklables() -> None:
+    stream = io.StringIO()
+    writer = QueuedWriter(stream)
+    handler = logger.add(writer, format="{message}")
+    try:
+        logger.info("verrou {lock}", lock=threading.Lock())
+    finally:
+        logger.remove(handler)
+    writer.close()
+    assert stream.getvalue().startswith("verrou <unlocked _thread.lock")
+
+
+def test_file_pleine_jette_et_compte_les_lignes() -> None:
+    stream = _SlowStream()
+    writer = QueuedWriter(stream, maxsize=4)
+    for i in range(20):
+        writer.write(f"l{i}\n")  # le flux bloqué remplit la file puis jette le reste
+    stream.release.set()
+    writer.close()  # le compte des lignes jetées part avec le dernier lot
+
+    lines = stream.getvalue().splitlines()
+    notices = [line for line in lines if line.startswith("[queued-writer]")]
+    assert len(notices) == 1
+    dropped = int(notices[0].split()[1])
+    assert dropped > 0
+    kept = [line for line in lines if line not in notices]
+    assert kept == [f"l{i}" for i in range(20 - dropped)]
+
+
+def test_write_apres_close_ecrit_directement() -> None:
+    stream = io.StringIO()
+    writer = QueuedWriter(stream)
+    writer.write("avant\n")
+    writer.close()
+    writer.write("pendant l'arrêt\n")
+    assert stream.getvalue() == "avant\npendant l'arrêt\n"
+
+
+def test_isatty_et_encoding_du_flux_enveloppe() -> None:
+    stream = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    writer = QueuedWriter(stream)
+    assert writer.isatty() is False
+    assert writer.encoding == "utf-8"
+    writer.close()
+    stream.close()
+    assert writer.isatty() is False  # flux fermé : pas de ValueError
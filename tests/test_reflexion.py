@@ -410,3 +410,15 @@ async def test_metadata_evt_contient_champs_lecon(kernel: MemoryKernel) -> None:
     assert meta["n_steps_total"] == 2
     assert meta["n_steps_failed"] == 1
     assert meta["n_steps_done"] == 1
+
+
+def test_build_prompt_detaille_chaque_etape() -> None:
+    prompt = Reflexion._build_prompt(_make_failed_project())
+
+    assert (
+        "  - [failed            ] Step KO\n"
+        "      success_criterion: 3 articles HTML\n"
+        "      ERROR: Vérification non concluante après 2 essais\n"
+        "      verif_notes: [semantic] critère non atteint"
+    ) in prompt
+    assert "      output: OK" in prompt
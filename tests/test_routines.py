@@ -155,8 +155,10 @@ async def test_concurrency_blocks_overlap(tmp_path: Path) -> None:
 # ── Test 4 : événement proactif audité ────────────────────────────────────────
 
 
-def test_proactive_audit_event() -> None:
+def test_proactive_audit_event(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """ProactiveEngine._dispatch doit enregistrer un ProactiveAuditEvent consultable."""
+    # InitiativeStore() crée son dossier : dans tmp_path, pas dans memory_data/ du repo
+    monkeypatch.setattr("jarvis.engine.proactive.store.INITIATIVES_DIR", tmp_path)
     from jarvis.engine.background.notifications import NotificationQueue
     from jarvis.engine.proactive.engine import ProactiveEngine
 
@@ -232,3 +234,22 @@ def test_next_cron_jumps_to_next_day() -> None:
     nxt = next_cron_datetime("0 9 * * *", after=base)
     assert nxt.hour == 9
     assert nxt.date() > base.date()
+
+
+def test_store_lookups_par_routine_survivent_au_rechargement(tmp_path: Path) -> None:
+    """Les runs relus depuis le JSON sont retrouvés par nom de routine."""
+    store = _make_store(tmp_path)
+    a = _interval_routine()
+    b = Routine(name="other", trigger=TriggerType.INTERVAL, action_prompt="x")
+    first = store.create_run(a)
+    first.status = RunStatus.SUCCESS
+    store.update_run(first)
+    store.create_run(b)
+    pending = store.create_run(a)
+
+    reloaded = _make_store(tmp_path)
+    assert [r.id for r in reloaded.list_runs("test_routine")] == [pending.id, first.id]
+    assert reloaded.active_run_for("test_routine").id == pending.id
+    assert reloaded.last_finished_run("test_routine").id == first.id
+    assert reloaded.active_run_for("missing") is None
+    assert len(reloaded.list_runs()) == 3
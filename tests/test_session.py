@@ -15,6 +15,22 @@ def test_session_add_message() -> None:
     assert session.messages[0] == {"role": "user", "content": "Bonjour"}
 
 
+def test_session_historique_borne_par_paliers_et_commence_par_user() -> None:
+    persisted: list[str] = []
+    session = Session()
+    session.set_persist(lambda _role, content: persisted.append(content))
+    for i in range(40):
+        session.add_message("user", f"q{i}")
+        session.add_message("assistant", f"r{i}")
+    assert len(session.messages) == 80
+
+    session.add_message("user", "q40")
+    assert len(session.messages) == 39
+    assert session.messages[0] == {"role": "user", "content": "q21"}
+    assert session.messages[-1]["content"] == "q40"
+    assert len(persisted) == 81
+
+
 def test_session_manager_create() -> None:
     mgr = SessionManager()
     session = mgr.get_or_create()
@@ -252,6 +252,8 @@ def test_elevenlabs_tts_header(secret_sentinels: dict[str, str]) -> None:
         content = b"audio_bytes_fake"
 
     class FakeClient:
+        is_closed = False
+
         def __init__(self, **kw: Any) -> None:
             pass
 
@@ -8,6 +8,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from jarvis.kernel.setup_layout import is_setup_complete, read_env_file
 
 
@@ -113,3 +115,49 @@ def test_is_setup_complete_gemini_ok(tmp_path: Path) -> None:
 
 def test_is_setup_complete_missing_file(tmp_path: Path) -> None:
     assert is_setup_complete(tmp_path / "absent.env") is False
+
+
+def test_config_read_env_reparse_seulement_si_le_fichier_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from jarvis.interfaces.api.config import _env
+
+    env = tmp_path / ".env"
+    _write(env, "FOO=bar\n")
+    monkeypatch.setattr(_env, "_ENV_PATH", env)
+    monkeypatch.setattr(_env, "_env_cache", None)
+
+    first = _env._read_env()
+    first["FOO"] = "muté"  # copie : le cache ne doit pas être touché
+    reads: list[Path] = []
+    real_read_text = Path.read_text
+    monkeypatch.setattr(
+        Path, "read_text", lambda self, *a, **k: reads.append(self) or real_read_text(self, *a, **k)
+    )
+
+    assert _env._read_env() == {"FOO": "bar"}
+    assert reads == []
+
+    _env._write_env({"FOO": "baz"})
+    assert _env._read_env() == {"FOO": "baz"}
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("true", True),
+        ("TRUE", True),
+        ("1", True),
+        ("Yes", True),
+        ("On", True),
+        ("tRuE", True),
+        ("false", False),
+        ("", False),
+        ("no", False),
+        ("2", False),
+    ],
+)
+def test_settings_parse_bool_equivaut_a_lower(raw: str, expected: bool) -> None:
+    from jarvis.interfaces.api.config.settings import _parse_bool
+
+    assert _parse_bool(raw) is expected
@@ -141,6 +141,8 @@ async def test_propose_from_event_good_skill_passes_sandbox(
     # La candidate est sur disque, PAS dans installed/
     assert (workspace / "candidates" / "batch-articles" / "skill.py").exists()
     assert not (workspace / "installed" / "batch-articles").exists()
+    # Le script de test passe par stdin : rien n'est écrit dans la candidate
+    assert not (workspace / "candidates" / "batch-articles" / "_skill_sandbox_test.py").exists()
 
 
 # ── 2. Cas REJET — skill volontairement cassée ───────────────────────────────
@@ -210,6 +210,40 @@ async def test_skill_synthetise_chargeable_par_le_registry(tmp_path: Path) -> No
     assert skill.name == skill_name
 
 
+def test_registry_reload_ne_reexecute_que_les_skill_py_modifies(tmp_path: Path) -> None:
+    """reload() réutilise la classe déjà importée tant que skill.py n'a pas changé."""
+    from jarvis.capabilities.skills import registry as registry_mod
+
+    skill_dir = tmp_path / "echo"
+    skill_dir.mkdir()
+    skill_py = skill_dir / "skill.py"
+    skill_py.write_text(
+        "from jarvis.capabilities.skills.base import SkillBase\n\n"
+        "class EchoSkill(SkillBase):\n    SYSTEM_PROMPT = 'v1'\n",
+        encoding="utf-8",
+    )
+
+    registry = registry_mod.SkillRegistry.__new__(registry_mod.SkillRegistry)
+    registry._skills = {}
+    with (
+        patch.object(registry_mod, "SKILLS_INSTALLED_DIR", tmp_path),
+        patch.object(registry_mod, "_class_cache", {}),
+    ):
+        registry.load_all()
+        first_cls = type(registry._skills["EchoSkill"])
+        registry.load_all()
+        assert type(registry._skills["EchoSkill"]) is first_cls
+
+        skill_py.write_text(
+            "from jarvis.capabilities.skills.base import SkillBase\n\n"
+            "class EchoSkill(SkillBase):\n    SYSTEM_PROMPT = 'version 2'\n",
+            encoding="utf-8",
+        )
+        registry.load_all()
+        assert type(registry._skills["EchoSkill"]) is not first_cls
+        assert registry._skills["EchoSkill"].SYSTEM_PROMPT == "version 2"
+
+
 # ── Tests AgentSkillsAdapter ──────────────────────────────────────────────────
 
 
@@ -426,3 +460,219 @@ async def test_skill_improve_tool_skill_absent() -> None:
 
     assert result.is_error
     assert "introuvable" in result.content.lower()
+
+
+# ── Tests PresetExecutor ──────────────────────────────────────────────────────
+
+
+def test_escape_notification_applescript_et_powershell() -> None:
+    """Les titres/corps de notification sont échappés pour leur langage cible."""
+    from jarvis.capabilities.skills.executor import _escape_applescript, _escape_powershell
+
+    assert _escape_applescript('Film "Dune" \\ 2') == 'Film \\"Dune\\" \\\\ 2'
+    assert _escape_powershell("L'heure") == "L''heure"
+
+
+@pytest.mark.asyncio
+async def test_notify_natif_macos_passe_par_argv_sans_shell() -> None:
+    """Sans commande dans le preset, la notification macOS est lancée en argv direct."""
+    from jarvis.capabilities.skills.base import PresetStep
+    from jarvis.capabilities.skills.executor import PresetExecutor
+
+    proc = MagicMock()
+    proc.communicate = AsyncMock(return_value=(b"", b""))
+    step = PresetStep({"type": "notify", "title": "C'est l'heure", "body": 'Dit "go"'})
+
+    with (
+        patch("jarvis.capabilities.skills.executor._SYSTEM", "darwin"),
+        patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)) as spawn,
+        patch("asyncio.create_subprocess_shell", AsyncMock()) as shell,
+    ):
+        result = await PresetExecutor()._exec_notify(step)
+
+    assert result["status"] == "done"
+    shell.assert_not_called()
+    assert spawn.call_args.args == (
+        "osascript",
+        "-e",
+        'display notification "Dit \\"go\\"" with title "C\'est l\'heure"',
+    )
+
+
+@pytest.mark.asyncio
+async def test_cli_timeout_renvoie_un_echec_et_tue_le_process() -> None:
+    """Un step CLI trop long devient un résultat 'failed' explicite, groupe tué."""
+    import asyncio
+
+    from jarvis.capabilities.skills.base import PresetStep
+    from jarvis.capabilities.skills.executor import PresetExecutor
+
+    async def _never() -> tuple[bytes, bytes]:
+        await asyncio.sleep(3600)
+        return b"", b""
+
+    proc = MagicMock()
+    proc.communicate = _never
+    proc.wait = AsyncMock(return_value=-9)
+    step = PresetStep({"type": "cli", "command": "sleep 3600"})
+
+    with (
+        patch("jarvis.capabilities.skills.executor._CLI_TIMEOUT_S", 0.01),
+        patch("asyncio.create_subprocess_shell", AsyncMock(return_value=proc)) as shell,
+        patch("jarvis.capabilities.skills.executor.kill_group") as kill,
+    ):
+        result = await PresetExecutor()._exec_cli(step)
+
+    assert result["status"] == "failed"
+    assert "Timeout" in result["message"]
+    kill.assert_called_once_with(proc)
+    assert shell.call_args.kwargs.keys() & {"start_new_session", "creationflags"}
+
+
+@pytest.mark.asyncio
+async def test_resultat_constant_rendu_en_copie() -> None:
+    """Modifier le résultat d'un step ne contamine pas les suivants."""
+    from jarvis.capabilities.skills.base import PresetStep
+    from jarvis.capabilities.skills.executor import PresetExecutor
+
+    executor = PresetExecutor()
+    step = PresetStep({"type": "tts", "text": "bonjour"})
+    first = await executor._exec_tts(step)
+    first["message"] = "modifié"
+
+    assert (await executor._exec_tts(step))["message"] == "TTS non disponible ou texte vide"
+
+
+def test_preset_get_steps_relit_le_yaml_seulement_si_modifie(tmp_path: Path) -> None:
+    """get_steps() réutilise le YAML parsé tant que skill.yaml n'a pas changé."""
+    from jarvis.capabilities.skills.base import PresetSkill
+
+    skill_yaml = tmp_path / "skill.yaml"
+    skill_yaml.write_text(yaml.safe_dump({"steps": [{"name": "a", "type": "wait"}]}))
+    preset = PresetSkill(metadata={"name": "demo", "__dir": str(tmp_path)})
+
+    with patch("jarvis.capabilities.skills.base.yaml.safe_load", wraps=yaml.safe_load) as load:
+        assert [s.name for s in preset.get_steps()] == ["a"]
+        assert [s.name for s in preset.get_steps()] == ["a"]
+        assert load.call_count == 1
+
+        skill_yaml.write_text(yaml.safe_dump({"steps": [{"name": "a"}, {"name": "bb"}]}))
+        assert [s.name for s in preset.get_steps()] == ["a", "bb"]
+        assert load.call_count == 2
+
+
+def test_preset_get_steps_ignore_un_yaml_mal_forme(tmp_path: Path) -> None:
+    """`steps` nul ou entrées non-mapping : pas d'exception, steps invalides ignorés."""
+    from jarvis.capabilities.skills.base import PresetSkill
+
+    skill_yaml = tmp_path / "skill.yaml"
+    preset = PresetSkill(metadata={"name": "demo", "__dir": str(tmp_path)})
+
+    skill_yaml.write_text("steps:\n")
+    assert preset.get_steps() == []
+
+    skill_yaml.write_text(yaml.safe_dump({"steps": ["texte", {"name": "ok"}, None]}))
+    assert [s.name for s in preset.get_steps()] == ["ok"]
+
+
+def test_preset_system_prompt_calcule_une_seule_fois() -> None:
+    from jarvis.capabilities.skills.base import PresetSkill
+
+    preset = PresetSkill({"name": "focus", "label": "Focus", "triggers": ["mode focus"]})
+    prompt = preset.SYSTEM_PROMPT
+    assert 'preset_name="focus"' in prompt
+    assert preset.SYSTEM_PROMPT is prompt
+    assert preset.is_active()
+
+
+# ── Tests ClawHub ─────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_clawhub_install_extrait_le_zip_telecharge_en_flux(tmp_path: Path) -> None:
+    import io
+    import zipfile
+
+    import httpx
+
+    from jarvis.capabilities.skills import _clawhub
+
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as z:
+        z.writestr("SKILL.md", "---\nname: demo\n---\n")
+        z.writestr("../evil.txt", "x")
+    payload = buf.getvalue()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/demo/download"):
+            return httpx.Response(200, content=payload)
+        return httpx.Response(404)
+
+    real_client = httpx.AsyncClient
+    with patch.object(
+        _clawhub.httpx,
+        "AsyncClient",
+        lambda **kw: real_client(transport=httpx.MockTransport(handler), **kw),
+    ):
+        ok, _ = await _clawhub.install_skill("demo", tmp_path)
+        missing, msg = await _clawhub.install_skill("absent", tmp_path)
+
+    assert ok is True
+    assert (tmp_path / "demo" / "SKILL.md").exists()
+    assert not (tmp_path / "evil.txt").exists()
+    assert missing is False and "introuvable" in msg
+
+
+# ── Tests app_checker ─────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_check_all_apps_sonde_en_parallele_dans_l_ordre() -> None:
+    import threading
+
+    from jarvis.capabilities.skills import app_checker
+
+    apps = [{"name": n, "required": True} for n in ("a", "b", "c")]
+    # Ne passe que si les trois sondes sont en vol en même temps
+    barrier = threading.Barrier(len(apps), timeout=5)
+
+    def fake_check(app: dict) -> dict:
+        barrier.wait()
+        return {"name": app["name"], "installed": app["name"] != "b", "required": True}
+
+    with patch.object(app_checker, "check_app_installed", fake_check):
+        status = await app_checker.check_all_apps(apps)
+
+    assert [a["name"] for a in status["apps"]] == ["a", "b", "c"]
+    assert status["all_required_installed"] is False
+
+
+def test_check_app_installed_cherche_dans_le_path_sans_process() -> None:
+    from jarvis.capabilities.skills import app_checker
+
+    app = {"name": "VLC", "linux_cmd": "vlc", "required": True, "url": "https://vlc"}
+    with (
+        patch.object(app_checker, "_SYSTEM", "linux"),
+        patch.object(app_checker.subprocess, "run", side_effect=AssertionError("spawn")),
+        patch.object(app_checker.shutil, "which", side_effect=[None, "/usr/bin/vlc"]),
+    ):
+        absent = app_checker.check_app_installed(app)
+        present = app_checker.check_app_installed(app)
+
+    assert absent["installed"] is False and absent["message"].startswith("Requis")
+    assert present["installed"] is True and present["message"] == ""
+
+
+def test_find_preset_by_trigger_un_motif_par_preset() -> None:
+    from jarvis.capabilities.skills.base import PresetSkill
+    from jarvis.capabilities.skills.registry import SkillRegistry
+
+    focus = PresetSkill({"name": "focus", "triggers": ["Mode Focus", "concentre-toi"]})
+    night = PresetSkill({"name": "night", "triggers": ["bonne nuit (jarvis)"]})
+    registry = SkillRegistry()
+    registry._skills = {"focus": focus, "night": night, "vide": PresetSkill({"name": "vide"})}
+
+    assert registry.find_preset_by_trigger("Passe en mode focus stp") is focus
+    assert registry.find_preset_by_trigger("Bonne nuit (Jarvis) !") is night
+    assert registry.find_preset_by_trigger("bonne nuit jarvis") is None
+    assert focus.trigger_pattern is focus.trigger_pattern
@@ -0,0 +1,24 @@
+# Copyright (C) 2026 Barthélemy Houot
+# This file is part of Jarvis OS, licensed under the GNU AGPL-3.0-or-later.
+# See the LICENSE file or <https://www.gnu.org/licenses/agpl-3.0.html>.
+
+"""Tests des helpers de jarvis.interfaces.api.system (stats mémoire/sessions)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from jarvis.interfaces.api.system import _dir_usage
+
+
+def test_dir_usage_compte_et_somme_le_suffixe(tmp_path: Path) -> None:
+    (tmp_path / "a.md").write_bytes(b"x" * 10)
+    (tmp_path / "b.md").write_bytes(b"x" * 5)
+    (tmp_path / "c.txt").write_bytes(b"x" * 100)
+    (tmp_path / "dir.md").mkdir()
+
+    assert _dir_usage(tmp_path, ".md") == (2, 15)
+
+
+def test_dir_usage_dossier_absent(tmp_path: Path) -> None:
+    assert _dir_usage(tmp_path / "absent", ".jsonl") == (0, 0)
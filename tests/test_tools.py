@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import os
 from collections.abc import Generator
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -110,6 +111,33 @@ async def test_registry_call_str() -> None:
     assert text == "résultat"
 
 
+def test_registry_schemas_construits_une_fois_par_etat() -> None:
+    from jarvis.capabilities.tools.base import Tool, ToolResult
+    from jarvis.capabilities.tools.registry import ToolRegistry
+
+    def _tool(tool_name: str) -> Tool:
+        class _T(Tool):
+            name = tool_name
+            description = tool_name
+
+            async def execute(self, **_: object) -> ToolResult:
+                return ToolResult(content="")
+
+        return _T()
+
+    registry = ToolRegistry()
+    registry.register(_tool("a"))
+    first = registry.schemas()
+    assert registry.schemas() is first
+
+    registry.replace_skill_tools(_tool("skill_x"))
+    assert [s["name"] for s in registry.schemas()] == ["a", "skill_x"]
+    assert [s["name"] for s in registry.core_schemas()] == ["a"]
+
+    registry.register(_tool("b"))
+    assert [s["name"] for s in registry.core_schemas()] == ["a", "b"]
+
+
 async def test_registry_call_str_error() -> None:
     from jarvis.capabilities.tools.registry import ToolRegistry
 
@@ -245,6 +273,21 @@ async def test_find_files_access_denied(tmp_path: Path) -> None:
     assert result.is_error
 
 
+async def test_mdfind_s_arrete_des_la_limite(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Sortie sans fin : la lecture ligne à ligne coupe mdfind à `limit` résultats."""
+    from jarvis.capabilities.tools.filesystem import _mdfind
+
+    fake = tmp_path / "mdfind"
+    fake.write_text("#!/bin/sh\nwhile :; do echo /x/notes.txt; echo /x/main.py; done\n")
+    fake.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ['PATH']}")
+
+    hits = await _mdfind("*.py", limit=3)
+    assert hits == ["/x/main.py"] * 3
+
+
 # ── CLIRunnerTool ─────────────────────────────────────────────
 
 
@@ -290,3 +333,44 @@ async def test_cli_runner_with_args(tmp_path: Path) -> None:
     result = await tool.execute(alias="greet", args=["Barth"])
     assert not result.is_error
     assert "Barth" in result.content
+
+
+async def test_cli_output_ne_garde_que_la_fin() -> None:
+    """Progression en \\r et sortie longue : seules les dernières lignes sont conservées."""
+    import asyncio
+
+    from jarvis.capabilities.tools.cli import _OUTPUT_TAIL_LINES, _read_output_tail
+
+    stream = asyncio.StreamReader()
+    stream.feed_data(b"".join(b"[download] %d%%\r" % i for i in range(500)))
+    stream.feed_data(b"\r\n[Merger] video.mp4\n\nfin")
+    stream.feed_eof()
+
+    out = await _read_output_tail(stream)
+    lines = out.splitlines()
+    assert lines[0].startswith("[… ")
+    assert len(lines) == _OUTPUT_TAIL_LINES + 1
+    assert lines[-3:] == ["[Merger] video.mp4", "", "fin"]
+
+
+def test_fusion_parse_sse_premier_payload_valide() -> None:
+    from jarvis.capabilities.tools.fusion import _parse_sse
+
+    body = 'event: message\r\ndata: {pas du json\r\ndata: {"id": 1}\r\ndata: {"id": 2}\r\n'
+    assert _parse_sse(body) == {"id": 1}
+    assert _parse_sse("event: ping\n") == {}
+
+
+async def test_geocode_echec_nominatim_renvoie_none() -> None:
+    from jarvis.capabilities.tools.map_control import MapControlTool
+
+    tool = MapControlTool(broadcast_event=MagicMock())
+    client = AsyncMock()
+    client.__aenter__.return_value = client
+    client.get.side_effect = httpx.ConnectError("offline")
+
+    with patch("jarvis.capabilities.tools.map_control.httpx.AsyncClient", return_value=client):
+        assert await tool._geocode("   ") is None
+        client.get.assert_not_called()
+        assert await tool._geocode("Paris") == (48.8566, 2.3522)
+        assert await tool._geocode("Atlantide") is None
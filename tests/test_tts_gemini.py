@@ -24,6 +24,18 @@ def test_pcm_to_wav_wraps_raw_pcm() -> None:
     assert w.getnframes() == 12000
 
 
+def test_pcm_to_wav_matches_wave_module_output() -> None:
+    """L'en-tête écrit d'avance est identique à celui que wave patche à la fermeture."""
+    pcm = bytes(range(256)) * 10
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(16000)
+        wf.writeframes(pcm)
+    assert mod._pcm_to_wav(pcm, sample_rate=16000) == buf.getvalue()
+
+
 def test_extract_gemini_pcm_concatenates_audio_parts() -> None:
     resp = SimpleNamespace(candidates=[SimpleNamespace(content=SimpleNamespace(parts=[
         SimpleNamespace(inline_data=SimpleNamespace(data=b"ab", mime_type="audio/pcm")),
@@ -7,6 +7,8 @@
 from __future__ import annotations
 
 import json
+import os
+from pathlib import Path
 from types import SimpleNamespace
 
 import pytest
@@ -68,3 +70,25 @@ def test_inject_defines_api_base(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(ui, "settings", _fake_settings(False, ""))
     out = ui.inject_client_config("<head></head>")
     assert "window.JARVIS_API_BASE" in out
+
+
+def test_versioned_html_versionne_tous_les_assets_en_un_passage(tmp_path: Path) -> None:
+    css, js = tmp_path / "a.css", tmp_path / "a.js"
+    css.write_text("")
+    js.write_text("")
+    os.utime(css, (1000, 1000))
+    os.utime(js, (2000, 2000))
+    html = tmp_path / "page.html"
+    html.write_text(
+        '<link href="/a.css"><script src=\'/a.js\'></script><script src="/autre.js"></script>'
+    )
+
+    out = ui._versioned_html(
+        html,
+        [("/a.css", str(css)), ("/a.js", str(js)), ("/absent.js", str(tmp_path / "nope"))],
+    )
+
+    assert out == (
+        "<link href=\"/a.css?v=1000\"><script src='/a.js?v=2000'></script>"
+        '<script src="/autre.js"></script>'
+    )
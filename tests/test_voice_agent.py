@@ -0,0 +1,29 @@
+# Copyright (C) 2026 Barthélemy Houot
+# This file is part of Jarvis OS, licensed under the GNU AGPL-3.0-or-later.
+# See the LICENSE file or <https://www.gnu.org/licenses/agpl-3.0.html>.
+
+"""Tests de la garde de lancement du worker voix (identifiants LiveKit)."""
+
+from __future__ import annotations
+
+import pytest
+
+from jarvis.interfaces.voice.agent import _missing_livekit_env
+from jarvis.kernel.settings import LIVEKIT_ENV_KEYS
+
+
+@pytest.fixture(autouse=True)
+def _sans_env_livekit(monkeypatch: pytest.MonkeyPatch) -> None:
+    for key in LIVEKIT_ENV_KEYS:
+        monkeypatch.delenv(key, raising=False)
+
+
+def test_identifiants_absents_partout() -> None:
+    assert _missing_livekit_env(["start"]) == list(LIVEKIT_ENV_KEYS)
+
+
+def test_options_cli_remplacent_l_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("LIVEKIT_URL", "wss://lk.example")
+    argv = ["start", "--api-key", "k", "--api-secret=s"]
+    assert _missing_livekit_env(argv) == []
+    assert _missing_livekit_env(["start", "--api-key", "k"]) == ["LIVEKIT_API_SECRET"]
@@ -0,0 +1,15 @@
+# Copyright (C) 2026 Barthélemy Houot
+# This file is part of Jarvis OS, licensed under the GNU AGPL-3.0-or-later.
+# See the LICENSE file or <https://www.gnu.org/licenses/agpl-3.0.html>.
+
+"""Tests du routage WebSocket de jarvis.interfaces.api.websocket."""
+
+from __future__ import annotations
+
+from jarvis.interfaces.api import websocket
+
+
+def test_route_ws_pointe_sur_websocket_chat() -> None:
+    endpoints = {route.path: route.endpoint for route in websocket.router.routes}
+    assert endpoints["/ws"] is websocket.websocket_chat
+    assert endpoints["/ws/logs"] is websocket.websocket_logs
@@ -81,6 +81,35 @@ def test_chaining_both_segments_valid(tool: WorkerCLITool) -> None:
     assert result is None
 
 
+# ── obfuscation shell ────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    "command",
+    [
+        "ls | ba''sh",
+        'ls | "bash"',
+        "ls | b\\ash",
+        "ls | b\\\nash",
+        "ls ${IFS}|${IFS}bash",
+        "ls | $'\\x62ash'",
+        "ls | $'\\142ash'",
+        "ls ; r''m -rf /",
+        "ls ; rm${IFS}-rf /",
+    ],
+)
+def test_obfuscated_blocked_pattern_refused(tool: WorkerCLITool, command: str) -> None:
+    """Quotes, backslashes, ${IFS} et $'\\x..' ne masquent pas un motif bloqué."""
+    result = tool._check(command)
+    assert result is not None
+    assert result["success"] is False
+
+
+def test_quoted_arguments_still_allowed(tool: WorkerCLITool) -> None:
+    """La normalisation n'ajoute un refus que si elle révèle un motif bloqué."""
+    assert tool._check("grep -n 'def ' README.md") is None
+
+
 # ── opt-in exécution directe ─────────────────────────────────────────────────
 
 
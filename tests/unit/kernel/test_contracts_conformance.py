@@ -43,8 +43,11 @@ sur le Protocol (l'ABC l'implémente structurellement).
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
+import pytest
+
 from jarvis.kernel import contracts
 
 if TYPE_CHECKING:
@@ -94,7 +97,7 @@ def test_conformance_static() -> None:
     assert True  # mypy a tranché statiquement — 12 couples couverts
 
 
-def test_conformance_runtime_check() -> None:
+def test_conformance_runtime_check(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Ceinture-bretelles runtime : Protocols `@runtime_checkable` valident
     l'EXISTENCE des méthodes (pas les signatures).
 
@@ -103,4 +106,6 @@ def test_conformance_runtime_check() -> None:
     """
     from jarvis.engine.tracking import UsageTracker
 
+    # UsageTracker() crée CONSO_DIR : dans tmp_path, pas dans memory_data/ du repo
+    monkeypatch.setattr(UsageTracker, "CONSO_DIR", tmp_path)
     assert isinstance(UsageTracker(), contracts.UsageTracker)